@@ -0,0 +1,156 @@
+"""
+Benchmark WSGI vs ASGI.
+
+Levanta gunicorn con gunicorn.conf.py en cada modo (SERVER_MODE=wsgi con
+workers síncronos, SERVER_MODE=asgi con uvicorn y vistas asíncronas) y lanza
+peticiones concurrentes a los endpoints públicos de lectura.
+
+Requiere gunicorn, uvicorn y uvicorn-worker instalados. Por defecto usa un
+archivo SQLite temporal; con BENCH_DB=default usa la base de settings (los
+datos de prueba se crean allí, úsese una base desechable).
+
+    python -m benchmarks.bench_asgi [--concurrency 50] [--requests 2000]
+"""
+
+import argparse
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from .utils import (
+    create_raffles,
+    create_tickets,
+    create_users,
+    print_table,
+    seed_reference_data,
+)
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+
+def prepare_database():
+    import django
+    from django.core.management import call_command
+
+    os.environ["DJANGO_SETTINGS_MODULE"] = "benchmarks.server_settings"
+    os.environ.setdefault("SECRET_KEY", "benchmark-only-secret-key")
+    django.setup()
+    call_command("migrate", run_syncdb=True, verbosity=0)
+
+    ref = seed_reference_data()
+    users, payment_methods = create_users(ref, 50)
+    raffles = create_raffles(ref, 100, users, payment_methods, number_amount=1000)
+    create_tickets(raffles[0], 300, users, payment_methods)
+    return raffles[0].pk
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(mode, port, workers):
+    env = {
+        **os.environ,
+        "SERVER_MODE": mode,
+        "GUNICORN_BIND": f"127.0.0.1:{port}",
+        "GUNICORN_WORKERS": str(workers),
+        "COMPRESSION_ENABLED": "False",
+    }
+    process = subprocess.Popen(
+        [sys.executable, "-m", "gunicorn", "--config", "gunicorn.conf.py"],
+        cwd=BACKEND_DIR,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=1):
+                return process
+        except OSError:
+            if process.poll() is not None:
+                break
+            time.sleep(0.2)
+    process.kill()
+    raise RuntimeError(f"No se pudo iniciar gunicorn en modo {mode}")
+
+
+def fetch(url):
+    start = time.perf_counter()
+    with urllib.request.urlopen(url, timeout=30) as response:
+        response.read()
+    return (time.perf_counter() - start) * 1000
+
+
+def load(urls, concurrency, total):
+    targets = [urls[i % len(urls)] for i in range(total)]
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        latencies = sorted(pool.map(fetch, targets))
+    elapsed = time.perf_counter() - start
+    return {
+        "rps": total / elapsed,
+        "median_ms": statistics.median(latencies),
+        "p95_ms": latencies[int(len(latencies) * 0.95) - 1],
+    }
+
+
+def run(concurrency, total, workers):
+    raffle_id = prepare_database()
+    paths = [
+        "/api/v1/raffle/list/",
+        f"/api/v1/raffle/{raffle_id}/",
+        f"/api/v1/raffle/{raffle_id}/available/",
+        "/api/v1/raffle-info/prizetype/",
+        "/api/v1/user-info/genders/",
+    ]
+
+    rows = []
+    for mode in ("wsgi", "asgi"):
+        port = free_port()
+        process = start_server(mode, port, workers)
+        try:
+            urls = [f"http://127.0.0.1:{port}{path}" for path in paths]
+            load(urls, concurrency, len(urls) * 5)  # Calentamiento
+            stats = load(urls, concurrency, total)
+        finally:
+            process.terminate()
+            process.wait()
+        rows.append(
+            (
+                mode,
+                f"{stats['rps']:.0f}",
+                f"{stats['median_ms']:.1f}",
+                f"{stats['p95_ms']:.1f}",
+            )
+        )
+
+    print(f"\nWorkers: {workers} | Concurrencia: {concurrency} | Peticiones: {total}\n")
+    print_table(["modo", "req/s", "mediana ms", "p95 ms"], rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--workers", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        if os.getenv("BENCH_DB", "sqlite") == "sqlite":
+            os.environ["BENCH_SQLITE_PATH"] = os.path.join(tmp, "bench.sqlite3")
+        run(args.concurrency, args.requests, args.workers)
+
+
+if __name__ == "__main__":
+    main()
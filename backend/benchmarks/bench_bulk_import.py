@@ -0,0 +1,134 @@
+"""
+Benchmark de carga masiva de usuarios.
+
+Compara la creación fila por fila (User.objects.create_user) con
+bulk_import sin pool y con el pool de procesos para el hasheo. En las tres
+variantes el costo dominante es el hasheo de contraseñas.
+
+    python -m benchmarks.bench_bulk_import [--users 200] [--batch-size 1000] [--workers 4]
+"""
+
+import argparse
+import csv
+import os
+import tempfile
+import time
+
+from .utils import benchmark_database, print_table, seed_reference_data, setup_django
+
+
+def write_users_csv(path, count):
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(
+            [
+                "email",
+                "password",
+                "first_name",
+                "last_name",
+                "document_number",
+                "city",
+                "gender",
+                "document_type",
+            ]
+        )
+        for i in range(count):
+            writer.writerow(
+                [
+                    f"bulk{i}@bench.local",
+                    f"clave{i}",
+                    f"Nombre{i}",
+                    "Apellido",
+                    f"8{i:09d}",
+                    "CAL",
+                    "M",
+                    "CC",
+                ]
+            )
+
+
+def run(count, batch_size, workers):
+    from io import StringIO
+
+    from django.core.management import call_command
+
+    from user.models import User
+
+    ref = seed_reference_data()
+    tmpdir = tempfile.mkdtemp()
+    path = os.path.join(tmpdir, "users.csv")
+    write_users_csv(path, count)
+
+    def reset():
+        User.objects.filter(email__startswith="bulk").delete()
+
+    def row_by_row():
+        for i in range(count):
+            User.objects.create_user(
+                email=f"bulk{i}@bench.local",
+                password=f"clave{i}",
+                first_name=f"Nombre{i}",
+                last_name="Apellido",
+                document_number=f"8{i:09d}",
+                city=ref["city"],
+                gender=ref["gender"],
+                document_type=ref["document_type"],
+            )
+
+    def bulk(n_workers):
+        def fn():
+            call_command(
+                "bulk_import",
+                "users",
+                path,
+                "--batch-size",
+                str(batch_size),
+                "--workers",
+                str(n_workers),
+                stdout=StringIO(),
+            )
+
+        return fn
+
+    variants = [
+        ("create_user fila por fila", row_by_row),
+        ("bulk_import --workers 0", bulk(0)),
+        (f"bulk_import --workers {workers}", bulk(workers)),
+    ]
+    rows, baseline = [], None
+    for label, fn in variants:
+        reset()
+        start = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - start
+        assert User.objects.filter(email__startswith="bulk").count() == count
+        baseline = baseline or elapsed
+        rows.append(
+            (
+                label,
+                f"{elapsed:.2f}",
+                f"{count / elapsed:.0f}",
+                f"{baseline / elapsed:.1f}x",
+            )
+        )
+    os.remove(path)
+    os.rmdir(tmpdir)
+
+    print(f"\nUsuarios: {count} | Lote: {batch_size} | Procesos: {workers}\n")
+    print_table(["variante", "segundos", "filas/s", "speedup"], rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    setup_django()
+    with benchmark_database():
+        run(args.users, args.batch_size, args.workers)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Benchmark de verificación de números de tarjeta.
+
+Compara el hash anterior (make_password/check_password, PBKDF2) con la
+huella HMAC versionada, tanto la función sola como POST verify_card.
+
+    python -m benchmarks.bench_card_fingerprint [--repeat 20]
+"""
+
+import argparse
+
+from .utils import (
+    benchmark_database,
+    create_users,
+    measure,
+    print_table,
+    seed_reference_data,
+    setup_django,
+)
+
+CARD = "4532123456789012"
+
+
+def run(repeat):
+    from django.contrib.auth.hashers import check_password, make_password
+    from django.urls import reverse
+    from rest_framework.test import APIClient
+
+    from userInfo.card_fingerprint import card_fingerprint, check_card_fingerprint
+
+    ref = seed_reference_data()
+    users, payment_methods = create_users(ref, 1)
+    method = payment_methods[0]
+    client = APIClient()
+    client.force_authenticate(users[0])
+    url = reverse("payment-method-verify-card", args=[method.pk])
+
+    legacy = make_password(CARD)
+    fingerprint = card_fingerprint(CARD)
+
+    def verify_legacy():
+        # Cada verificación vuelve a dejar el hash anterior (sin migrar)
+        type(method).objects.filter(pk=method.pk).update(
+            paymenth_method_card_number_hash=legacy
+        )
+        client.post(url, {"card_number": CARD})
+
+    def verify_hmac():
+        client.post(url, {"card_number": CARD})
+
+    rows = []
+    for label, fn in (
+        ("make_password", lambda: make_password(CARD)),
+        ("card_fingerprint", lambda: card_fingerprint(CARD)),
+        ("check_password", lambda: check_password(CARD, legacy)),
+        ("check_card_fingerprint", lambda: check_card_fingerprint(CARD, fingerprint)),
+        ("verify_card (hash anterior)", verify_legacy),
+    ):
+        stats = measure(fn, repeat=repeat)
+        rows.append((label, f"{stats['median_ms']:.3f}", f"{stats['p95_ms']:.3f}"))
+
+    method.set_card_number(CARD)
+    method.save()
+    stats = measure(verify_hmac, repeat=repeat)
+    rows.append(
+        ("verify_card (HMAC)", f"{stats['median_ms']:.3f}", f"{stats['p95_ms']:.3f}")
+    )
+
+    print(f"\nRepeticiones: {repeat}\n")
+    print_table(["operación", "mediana ms", "p95 ms"], rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    setup_django()
+    with benchmark_database():
+        run(args.repeat)
+
+
+if __name__ == "__main__":
+    main()
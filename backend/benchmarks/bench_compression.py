@@ -0,0 +1,106 @@
+"""
+Benchmark de compresión y GET condicional.
+
+Compara bytes transferidos y latencia de /raffle/list/ y
+/raffle/<pk>/available/ sin compresión, con gzip, con Brotli (si está
+instalado) y con revalidación por ETag (304).
+
+    python -m benchmarks.bench_compression [--raffles 300] [--numbers 10000]
+"""
+
+import argparse
+
+from .utils import (
+    benchmark_database,
+    create_raffles,
+    create_tickets,
+    create_users,
+    measure,
+    print_table,
+    seed_reference_data,
+    setup_django,
+)
+
+
+def run(raffles, numbers, repeat):
+    from django.test import Client
+    from django.test.utils import override_settings
+    from django.urls import reverse
+
+    from core import middleware
+
+    ref = seed_reference_data()
+    users, payment_methods = create_users(ref, 50)
+    all_raffles = create_raffles(
+        ref, raffles, users, payment_methods, number_amount=numbers
+    )
+    create_tickets(all_raffles[0], numbers // 3, users, payment_methods)
+
+    client = Client()
+    targets = [
+        ("/raffle/list/", reverse("raffle-list")),
+        (
+            "/raffle/<pk>/available/",
+            reverse("available-numbers", kwargs={"pk": all_raffles[0].pk}),
+        ),
+    ]
+    modes = [("identity", {}), ("gzip", {"HTTP_ACCEPT_ENCODING": "gzip"})]
+    if middleware.brotli is not None:
+        modes.append(("br", {"HTTP_ACCEPT_ENCODING": "br, gzip"}))
+
+    rows = []
+    for label, url in targets:
+        baseline = None
+        for mode, headers in modes:
+            with override_settings(COMPRESSION_ENABLED=mode != "identity"):
+                response = client.get(url, **headers)
+                size = len(response.content)
+                stats = measure(lambda: client.get(url, **headers), repeat=repeat)
+            baseline = baseline or (size, stats["median_ms"])
+            rows.append(
+                (
+                    label,
+                    mode,
+                    size,
+                    f"{size / baseline[0]:.1%}",
+                    f"{stats['median_ms']:.2f}",
+                    f"{stats['median_ms'] - baseline[1]:+.2f}",
+                )
+            )
+
+        etag = client.get(url)["ETag"]
+        response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+        stats = measure(lambda: client.get(url, HTTP_IF_NONE_MATCH=etag), repeat=repeat)
+        rows.append(
+            (
+                label,
+                f"etag ({response.status_code})",
+                len(response.content),
+                f"{len(response.content) / baseline[0]:.1%}",
+                f"{stats['median_ms']:.2f}",
+                f"{stats['median_ms'] - baseline[1]:+.2f}",
+            )
+        )
+
+    print(
+        f"\nRifas: {raffles} | Números por rifa: {numbers} | Repeticiones: {repeat}\n"
+    )
+    print_table(
+        ["endpoint", "modo", "bytes", "vs identity", "mediana ms", "delta ms"], rows
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--raffles", type=int, default=300)
+    parser.add_argument("--numbers", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    setup_django()
+    with benchmark_database():
+        run(args.raffles, args.numbers, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
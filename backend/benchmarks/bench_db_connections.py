@@ -0,0 +1,121 @@
+"""
+Benchmark de conexiones a la base de datos.
+
+Simula el ciclo de una petición (close_old_connections al inicio y al final,
+como hace el handler de Django) sobre /raffle/list/ con distintas
+configuraciones: una conexión por petición, conexiones persistentes (con y
+sin health checks) y el pool nativo de psycopg 3 si está instalado.
+
+Solo es representativo contra Postgres (sobre todo remoto):
+
+    BENCH_DB=default python -m benchmarks.bench_db_connections [--repeat 50]
+"""
+
+import argparse
+from importlib.util import find_spec
+
+from .utils import (
+    benchmark_database,
+    create_raffles,
+    create_users,
+    measure,
+    print_table,
+    seed_reference_data,
+    setup_django,
+)
+
+
+def run(repeat):
+    from django.db import close_old_connections, connection
+    from django.test import Client
+    from django.urls import reverse
+
+    ref = seed_reference_data()
+    users, payment_methods = create_users(ref, 20)
+    create_raffles(ref, 50, users, payment_methods)
+
+    if connection.vendor != "postgresql":
+        print(
+            f"Aviso: base de datos {connection.vendor}; "
+            "usa BENCH_DB=default con Postgres para resultados representativos"
+        )
+
+    modes = [
+        ("sin persistencia", {"CONN_MAX_AGE": 0, "CONN_HEALTH_CHECKS": False}, None),
+        ("persistente", {"CONN_MAX_AGE": 60, "CONN_HEALTH_CHECKS": False}, None),
+        (
+            "persistente + health checks",
+            {"CONN_MAX_AGE": 60, "CONN_HEALTH_CHECKS": True},
+            None,
+        ),
+    ]
+    if (
+        connection.vendor == "postgresql"
+        and find_spec("psycopg")
+        and find_spec("psycopg_pool")
+    ):
+        modes.append(
+            (
+                "pool psycopg",
+                {"CONN_MAX_AGE": 0, "CONN_HEALTH_CHECKS": False},
+                {"min_size": 2, "max_size": 4},
+            )
+        )
+
+    client = Client()
+    url = reverse("raffle-list")
+
+    def request():
+        close_old_connections()
+        client.get(url)
+        close_old_connections()
+
+    original = {
+        "CONN_MAX_AGE": connection.settings_dict["CONN_MAX_AGE"],
+        "CONN_HEALTH_CHECKS": connection.settings_dict["CONN_HEALTH_CHECKS"],
+        "OPTIONS": dict(connection.settings_dict["OPTIONS"]),
+    }
+    rows = []
+    baseline = None
+    try:
+        for label, conn_settings, pool in modes:
+            connection.close()
+            connection.settings_dict.update(conn_settings)
+            options = dict(original["OPTIONS"])
+            options.pop("pool", None)
+            if pool:
+                options["pool"] = pool
+            connection.settings_dict["OPTIONS"] = options
+
+            stats = measure(request, repeat=repeat, warmup=3)
+            baseline = baseline or stats["median_ms"]
+            rows.append(
+                (
+                    label,
+                    f"{stats['median_ms']:.2f}",
+                    f"{stats['p95_ms']:.2f}",
+                    f"{stats['median_ms'] - baseline:+.2f}",
+                )
+            )
+            connection.close()
+            if hasattr(connection, "close_pool"):
+                connection.close_pool()
+    finally:
+        connection.settings_dict.update(original)
+
+    print(f"\nBase de datos: {connection.vendor} | Repeticiones: {repeat}\n")
+    print_table(["modo", "mediana ms", "p95 ms", "vs sin persistencia"], rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    setup_django()
+    with benchmark_database():
+        run(args.repeat)
+
+
+if __name__ == "__main__":
+    main()
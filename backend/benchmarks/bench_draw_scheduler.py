@@ -0,0 +1,94 @@
+"""
+Benchmark del programador de sorteos (run_draw_scheduler).
+
+Programa rifas con fecha de sorteo repartida en los próximos segundos y mide
+el retraso con que el programador dispara cada una. También compara el costo
+del refresco incremental por raffle_updated_at con recorrer toda la tabla.
+
+    python -m benchmarks.bench_draw_scheduler [--raffles 5000] [--due 50]
+"""
+
+import argparse
+import statistics
+import time
+from datetime import timedelta
+
+from .utils import (
+    benchmark_database,
+    create_raffles,
+    create_users,
+    measure,
+    print_table,
+    seed_reference_data,
+    setup_django,
+)
+
+
+def run(raffles, due, window, refresh):
+    from django.utils import timezone
+
+    from raffle.models import Raffle
+    from raffle.scheduler import DrawScheduler
+
+    ref = seed_reference_data()
+    users, payment_methods = create_users(ref, 20)
+    all_raffles = create_raffles(ref, raffles, users, payment_methods, number_amount=10)
+
+    # Rifas creadas hace una hora; las primeras `due` vencen dentro de la ventana
+    Raffle.objects.update(raffle_updated_at=timezone.now() - timedelta(hours=1))
+    start = timezone.now() + timedelta(seconds=1)
+    for i, raffle in enumerate(all_raffles[:due]):
+        Raffle.objects.filter(pk=raffle.pk).update(
+            raffle_draw_date=start + timedelta(seconds=window * i / due)
+        )
+
+    scheduler = DrawScheduler()
+    scheduler.load()
+    lateness = []
+    deadline = time.monotonic() + window + 2
+    while time.monotonic() < deadline and len(lateness) < due:
+        for raffle_id, draw_date in scheduler.pop_due():
+            lateness.append((timezone.now() - draw_date).total_seconds() * 1000)
+            scheduler.fire(raffle_id)
+        wait = refresh
+        next_deadline = scheduler.next_deadline()
+        if next_deadline is not None:
+            until = (next_deadline - timezone.now()).total_seconds()
+            wait = max(0.0, min(wait, until))
+        time.sleep(wait)
+        scheduler.refresh()
+
+    incremental = measure(scheduler.refresh)
+    full_scan = measure(
+        lambda: list(Raffle.objects.values(*DrawScheduler.values_fields))
+    )
+
+    print(f"\nRifas: {raffles} | Sorteos en {window}s: {due} | Refresco: {refresh}s\n")
+    lateness.sort()
+    print_table(
+        ["métrica", "valor"],
+        [
+            ("sorteos disparados", len(lateness)),
+            ("retraso mediana ms", f"{statistics.median(lateness):.1f}"),
+            ("retraso máximo ms", f"{lateness[-1]:.1f}"),
+            ("refresco incremental ms", f"{incremental['median_ms']:.2f}"),
+            ("recorrido completo ms", f"{full_scan['median_ms']:.2f}"),
+        ],
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--raffles", type=int, default=5000)
+    parser.add_argument("--due", type=int, default=50)
+    parser.add_argument("--window", type=float, default=5.0)
+    parser.add_argument("--refresh", type=float, default=1.0)
+    args = parser.parse_args()
+
+    setup_django()
+    with benchmark_database():
+        run(args.raffles, args.due, args.window, args.refresh)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+Benchmark de las exportaciones en streaming.
+
+Compara el pico de memoria (tracemalloc) y el tiempo de exportar todos los
+tickets con /tickets/export/csv/ frente a cargarlos completos con
+TicketListSerializer, como haría un listado paginado recorrido de una vez.
+
+    python -m benchmarks.bench_exports [--tickets 10000,50000]
+"""
+
+import argparse
+import time
+import tracemalloc
+
+from .utils import (
+    benchmark_database,
+    create_raffles,
+    create_tickets,
+    create_users,
+    print_table,
+    seed_reference_data,
+    setup_django,
+)
+
+
+def profile(fn):
+    """Ejecuta fn y retorna (ms, pico de memoria en MB, resultado)"""
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = fn()
+    elapsed = (time.perf_counter() - start) * 1000
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / 1024 / 1024, result
+
+
+def run(ticket_counts):
+    from django.test import Client
+    from django.urls import reverse
+
+    from tickets.models import Ticket
+    from tickets.serializer import TicketListSerializer
+
+    ref = seed_reference_data()
+    users, payment_methods = create_users(ref, 50)
+    client = Client()
+    client.force_login(ref["admin"])
+    url = reverse("ticket-export", kwargs={"fmt": "csv"})
+
+    def stream():
+        size = 0
+        for chunk in client.get(url).streaming_content:
+            size += len(chunk)  # Se descarta cada bloque, como un socket
+        return size
+
+    def load_all():
+        queryset = Ticket.objects.select_related("raffle", "payment_method", "user")
+        return len(TicketListSerializer(queryset, many=True).data)
+
+    rows = []
+    created = 0
+    raffle_size = 10000
+    for count in ticket_counts:
+        while created < count:
+            raffle = create_raffles(
+                ref, 1, users, payment_methods, number_amount=raffle_size
+            )[0]
+            create_tickets(
+                raffle, min(raffle_size, count - created), users, payment_methods
+            )
+            created += min(raffle_size, count - created)
+
+        stream_ms, stream_mb, size = profile(stream)
+        load_ms, load_mb, _ = profile(load_all)
+        rows.append(
+            (
+                count,
+                f"{stream_ms:.0f}",
+                f"{stream_mb:.1f}",
+                f"{size / 1024 / 1024:.1f}",
+                f"{load_ms:.0f}",
+                f"{load_mb:.1f}",
+            )
+        )
+
+    print()
+    print_table(
+        [
+            "tickets",
+            "export ms",
+            "export pico MB",
+            "CSV MB",
+            "serializer ms",
+            "serializer pico MB",
+        ],
+        rows,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tickets", default="10000,50000")
+    args = parser.parse_args()
+
+    setup_django()
+    with benchmark_database():
+        run([int(value) for value in args.tickets.split(",")])
+
+
+if __name__ == "__main__":
+    main()
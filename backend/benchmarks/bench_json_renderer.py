@@ -0,0 +1,109 @@
+"""
+Benchmark del renderer JSON.
+
+Renderiza la salida de TicketListSerializer y RaffleListSerializer con el
+JSONRenderer de DRF y con FastJSONRenderer, y verifica que los bytes sean
+idénticos.
+
+    python -m benchmarks.bench_json_renderer [--raffles 500] [--tickets 2000]
+"""
+
+import argparse
+
+from .utils import (
+    benchmark_database,
+    create_raffles,
+    create_tickets,
+    create_users,
+    measure,
+    print_table,
+    seed_reference_data,
+    setup_django,
+)
+
+
+def run(raffles, tickets, repeat):
+    from rest_framework.renderers import JSONRenderer
+
+    from core import renderers
+    from core.renderers import FastJSONRenderer
+    from raffle.models import Raffle
+    from raffle.serializer import RaffleListSerializer
+    from tickets.models import Ticket
+    from tickets.serializer import TicketListSerializer
+
+    ref = seed_reference_data()
+    users, payment_methods = create_users(ref, 50)
+    all_raffles = create_raffles(
+        ref, raffles, users, payment_methods, number_amount=max(tickets, 100)
+    )
+    create_tickets(all_raffles[0], tickets, users, payment_methods)
+
+    payloads = [
+        (
+            "TicketListSerializer",
+            TicketListSerializer(
+                Ticket.objects.select_related("user", "payment_method"), many=True
+            ).data,
+        ),
+        (
+            "RaffleListSerializer",
+            RaffleListSerializer(
+                Raffle.objects.select_related(
+                    "raffle_prize_type", "raffle_state", "raffle_created_by"
+                ),
+                many=True,
+            ).data,
+        ),
+    ]
+
+    if renderers.orjson is None:
+        print("orjson no está instalado: FastJSONRenderer usa el renderer de DRF")
+
+    rows = []
+    for label, data in payloads:
+        drf_output = JSONRenderer().render(data)
+        fast_output = FastJSONRenderer().render(data)
+        drf = measure(lambda: JSONRenderer().render(data), repeat=repeat)
+        fast = measure(lambda: FastJSONRenderer().render(data), repeat=repeat)
+        rows.append(
+            (
+                label,
+                len(data),
+                len(drf_output),
+                "sí" if drf_output == fast_output else "NO",
+                f"{drf['median_ms']:.2f}",
+                f"{fast['median_ms']:.2f}",
+                f"{drf['median_ms'] / fast['median_ms']:.1f}x",
+            )
+        )
+
+    print(f"\nRifas: {raffles} | Tickets: {tickets} | Repeticiones: {repeat}\n")
+    print_table(
+        [
+            "serializer",
+            "filas",
+            "bytes",
+            "idéntico",
+            "DRF ms",
+            "rápido ms",
+            "aceleración",
+        ],
+        rows,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--raffles", type=int, default=500)
+    parser.add_argument("--tickets", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    setup_django()
+    with benchmark_database():
+        run(args.raffles, args.tickets, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
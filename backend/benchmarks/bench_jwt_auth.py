@@ -0,0 +1,88 @@
+"""
+Benchmark de autenticación JWT con y sin consulta del usuario.
+
+Compara JWTAuthentication (carga la fila del usuario en cada petición) con
+StatelessJWTAuthentication (claims del token + permisos en caché) en
+GET /api/v1/user-info/payment-methods/, que solo necesita el id del usuario.
+
+    python -m benchmarks.bench_jwt_auth [--repeat 200]
+"""
+
+import argparse
+
+from .utils import (
+    benchmark_database,
+    create_users,
+    measure,
+    print_table,
+    seed_reference_data,
+    setup_django,
+)
+
+
+def run(repeat):
+    from unittest.mock import patch
+
+    from django.core.cache import cache
+    from django.db import connection
+    from django.test import Client
+    from django.test.utils import override_settings
+    from django.urls import reverse
+    from rest_framework_simplejwt.authentication import JWTAuthentication
+
+    from core.authentication import StatelessJWTAuthentication
+    from user.serializer import CustomTokenObtainPairSerializer
+    from userInfo.views import PaymentMethodViewSet
+
+    ref = seed_reference_data()
+    users, _ = create_users(ref, 1)
+    token = CustomTokenObtainPairSerializer.get_token(users[0]).access_token
+    headers = {"HTTP_AUTHORIZATION": f"Bearer {token}"}
+    client = Client()
+    url = reverse("payment-method-list")
+
+    rows, baseline = [], None
+    locmem = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+    for label, auth_class in (
+        ("JWTAuthentication", JWTAuthentication),
+        ("StatelessJWTAuthentication", StatelessJWTAuthentication),
+    ):
+        with override_settings(CACHES=locmem), patch.object(
+            PaymentMethodViewSet, "authentication_classes", [auth_class]
+        ):
+            cache.clear()
+            client.get(url, **headers)
+            # CaptureQueriesContext se reinicia con request_started; se cuenta aparte
+            queries = []
+            with connection.execute_wrapper(
+                lambda execute, sql, *args: queries.append(sql) or execute(sql, *args)
+            ):
+                assert client.get(url, **headers).status_code == 200
+            stats = measure(lambda: client.get(url, **headers), repeat=repeat)
+        baseline = baseline or stats["median_ms"]
+        rows.append(
+            (
+                label,
+                len(queries),
+                f"{stats['median_ms']:.3f}",
+                f"{stats['p95_ms']:.3f}",
+                f"{stats['median_ms'] - baseline:+.3f}",
+            )
+        )
+
+    print(f"\nRepeticiones: {repeat}\n")
+    print_table(["autenticación", "queries", "mediana ms", "p95 ms", "delta ms"], rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    setup_django()
+    with benchmark_database():
+        run(args.repeat)
+
+
+if __name__ == "__main__":
+    main()
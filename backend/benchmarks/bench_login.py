@@ -0,0 +1,124 @@
+"""
+Benchmark de throughput de login según el hasher de contraseñas.
+
+Para cada configuración mide la latencia de POST /api/v1/auth/login/ y la
+verificación de contraseña sola (check_password), y estima los logins por
+segundo con --workers procesos (gunicorn). La columna "paralelo" ejecuta
+check_password en --workers hilos a la vez (hashlib libera el GIL) para ver
+cuánto escala en la máquina actual.
+
+    python -m benchmarks.bench_login [--repeat 10] [--workers 3]
+"""
+
+import argparse
+import importlib.util
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from .utils import (
+    benchmark_database,
+    measure,
+    print_table,
+    seed_reference_data,
+    setup_django,
+)
+
+PASSWORD = "ClaveSegura123"
+
+CONFIGS = [
+    ("pbkdf2 1M (default Django)", "pbkdf2", {"PASSWORD_PBKDF2_ITERATIONS": 1000000}),
+    ("pbkdf2 600k", "pbkdf2", {"PASSWORD_PBKDF2_ITERATIONS": 600000}),
+    ("scrypt N=2^14 r=8", "scrypt", {"PASSWORD_SCRYPT_WORK_FACTOR": 2**14}),
+    ("scrypt N=2^15 r=8", "scrypt", {"PASSWORD_SCRYPT_WORK_FACTOR": 2**15}),
+]
+if importlib.util.find_spec("argon2") is not None:
+    CONFIGS.append(("argon2id t=2 m=19MiB", "argon2", {}))
+
+HASHERS = {
+    "pbkdf2": "core.hashers.TunedPBKDF2PasswordHasher",
+    "scrypt": "core.hashers.TunedScryptPasswordHasher",
+    "argon2": "core.hashers.TunedArgon2PasswordHasher",
+}
+
+
+def parallel_rate(fn, workers, total):
+    """Verificaciones por segundo ejecutando fn en `workers` hilos"""
+    start = time.perf_counter()
+    with ThreadPoolExecutor(workers) as pool:
+        list(pool.map(lambda _: fn(), range(total)))
+    return total / (time.perf_counter() - start)
+
+
+def run(repeat, workers):
+    from django.contrib.auth.hashers import check_password, make_password
+    from django.test import Client
+    from django.test.utils import override_settings
+    from django.urls import reverse
+
+    from user.models import User
+
+    ref = seed_reference_data()
+    user = User.objects.create(
+        email="login@bench.local",
+        first_name="Login",
+        last_name="Bench",
+        document_number="5000000000",
+        city=ref["city"],
+        gender=ref["gender"],
+        document_type=ref["document_type"],
+    )
+    client = Client()
+    url = reverse("token_obtain_pair")
+    body = {"email": user.email, "password": PASSWORD}
+
+    rows = []
+    for label, name, params in CONFIGS:
+        hashers = [HASHERS[name]] + [h for key, h in HASHERS.items() if key != name]
+        with override_settings(PASSWORD_HASHERS=hashers, **params):
+            encoded = make_password(PASSWORD)
+            User.objects.filter(pk=user.pk).update(password=encoded)
+
+            check = measure(lambda: check_password(PASSWORD, encoded), repeat=repeat)
+            login = measure(
+                lambda: client.post(url, body, content_type="application/json"),
+                repeat=repeat,
+            )
+            rate = parallel_rate(
+                lambda: check_password(PASSWORD, encoded), workers, repeat * workers
+            )
+        rows.append(
+            (
+                label,
+                f"{check['median_ms']:.1f}",
+                f"{login['median_ms']:.1f}",
+                f"{1000 / login['median_ms'] * workers:.0f}",
+                f"{rate:.0f}",
+            )
+        )
+
+    print(f"\nRepeticiones: {repeat} | Workers: {workers}\n")
+    print_table(
+        [
+            "hasher",
+            "check ms",
+            "login ms",
+            f"logins/s estimado ({workers} workers)",
+            "check/s paralelo",
+        ],
+        rows,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--workers", type=int, default=3)
+    args = parser.parse_args()
+
+    setup_django()
+    with benchmark_database():
+        run(args.repeat, args.workers)
+
+
+if __name__ == "__main__":
+    main()
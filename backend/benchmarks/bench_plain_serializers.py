@@ -0,0 +1,126 @@
+"""
+Benchmark de los serializadores de listado sobre .values().
+
+Compara consulta + serialización con RaffleListSerializer/TicketListSerializer
+(con select_related) frente a RafflePlainListSerializer/TicketPlainListSerializer,
+y verifica que el JSON resultante sea idéntico.
+
+    python -m benchmarks.bench_plain_serializers [--rows 1000]
+"""
+
+import argparse
+
+from .utils import (
+    benchmark_database,
+    create_raffles,
+    create_tickets,
+    create_users,
+    measure,
+    print_table,
+    seed_reference_data,
+    setup_django,
+)
+
+
+def run(rows, repeat):
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+    from rest_framework.renderers import JSONRenderer
+    from rest_framework.test import APIRequestFactory
+
+    from raffle.models import Raffle
+    from raffle.serializer import RaffleListSerializer, RafflePlainListSerializer
+    from tickets.models import Ticket
+    from tickets.serializer import TicketListSerializer, TicketPlainListSerializer
+
+    ref = seed_reference_data()
+    users, payment_methods = create_users(ref, 50)
+    raffles = create_raffles(ref, rows, users, payment_methods, number_amount=rows)
+    create_tickets(raffles[0], rows, users, payment_methods)
+
+    context = {"request": APIRequestFactory().get("/")}
+    raffle_queryset = Raffle.objects.select_related(
+        "raffle_prize_type", "raffle_state", "raffle_created_by", "raffle_winner"
+    ).order_by("id")
+    ticket_queryset = (
+        Ticket.objects.filter(raffle=raffles[0])
+        .select_related("user", "payment_method__payment_method_type", "raffle")
+        .order_by("number")
+    )
+
+    cases = [
+        (
+            "rifas",
+            lambda: RaffleListSerializer(
+                raffle_queryset.all(), many=True, context=context
+            ).data,
+            lambda: RafflePlainListSerializer(
+                RafflePlainListSerializer.values_queryset(raffle_queryset.all()),
+                many=True,
+                context=context,
+            ).data,
+        ),
+        (
+            "tickets",
+            lambda: TicketListSerializer(
+                ticket_queryset.all(), many=True, context=context
+            ).data,
+            lambda: TicketPlainListSerializer(
+                TicketPlainListSerializer.values_queryset(ticket_queryset.all()),
+                many=True,
+                context=context,
+            ).data,
+        ),
+    ]
+
+    table = []
+    for label, model_fn, plain_fn in cases:
+        with CaptureQueriesContext(connection) as model_queries:
+            model_data = model_fn()
+        with CaptureQueriesContext(connection) as plain_queries:
+            plain_data = plain_fn()
+        identical = JSONRenderer().render(model_data) == JSONRenderer().render(
+            plain_data
+        )
+        model = measure(model_fn, repeat=repeat)
+        plain = measure(plain_fn, repeat=repeat)
+        table.append(
+            (
+                label,
+                len(plain_data),
+                "sí" if identical else "NO",
+                f"{len(model_queries)} / {len(plain_queries)}",
+                f"{model['median_ms']:.2f}",
+                f"{plain['median_ms']:.2f}",
+                f"{model['median_ms'] / plain['median_ms']:.1f}x",
+            )
+        )
+
+    print(f"\nFilas: {rows} | Repeticiones: {repeat}\n")
+    print_table(
+        [
+            "listado",
+            "filas",
+            "idéntico",
+            "consultas",
+            "ModelSerializer ms",
+            ".values() ms",
+            "aceleración",
+        ],
+        table,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    setup_django()
+    with benchmark_database():
+        run(args.rows, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+Benchmark del feed de rifas activas (GET /api/v1/raffle/feed/).
+
+Compara GET /raffle/list/ (resuelve los estados activos, consulta y
+serializa todas las rifas en cada petición) con el feed cacheado de
+raffle/feed.py: la lectura con el feed en la caché, su reconstrucción
+completa y la actualización incremental al vender un ticket.
+
+    python -m benchmarks.bench_raffle_feed [--raffles 5000] [--repeat 20]
+"""
+
+import argparse
+
+from .utils import (
+    benchmark_database,
+    create_raffles,
+    create_tickets,
+    create_users,
+    measure,
+    print_table,
+    seed_reference_data,
+    setup_django,
+)
+
+
+def run(raffles, repeat):
+    from django.db import connection
+    from django.test import Client
+    from django.urls import reverse
+
+    from raffle import feed
+    from tickets.models import Ticket
+
+    ref = seed_reference_data()
+    users, payment_methods = create_users(ref, 50)
+    created = create_raffles(ref, raffles, users, payment_methods, number_amount=100)
+    for raffle in created[::50]:
+        create_tickets(raffle, 60, users, payment_methods)
+
+    client = Client()
+
+    def count_queries(fn):
+        # CaptureQueriesContext se reinicia con request_started; se cuenta aparte
+        queries = []
+        with connection.execute_wrapper(
+            lambda execute, sql, *args: queries.append(sql) or execute(sql, *args)
+        ):
+            fn()
+        return len(queries)
+
+    def get(url, **params):
+        response = client.get(url, params)
+        assert response.status_code == 200, response.content
+        return response.json()
+
+    list_url = reverse("raffle-list")
+    feed_url = reverse("raffle-feed")
+    target = created[-1]
+    sold = iter(range(1, target.raffle_number_amount + 1))
+
+    def sell():
+        # Fuera de una transacción on_commit se ejecuta al instante
+        Ticket.objects.create(
+            raffle=target,
+            number=next(sold),
+            user=users[0],
+            payment_method=payment_methods[0],
+        )
+
+    def rebuild():
+        feed.invalidate_feed()
+        get(feed_url)
+
+    cases = [
+        ("/raffle/list/", lambda: get(list_url), max(3, repeat // 5)),
+        ("/raffle/feed/ (en caché)", lambda: get(feed_url), repeat),
+        ("/raffle/feed/?limit=20", lambda: get(feed_url, limit=20), repeat),
+        ("/raffle/feed/ reconstrucción", rebuild, max(3, repeat // 5)),
+        ("venta de ticket + actualización", sell, repeat),
+    ]
+    rows = []
+    for label, fn, times in cases:
+        get(feed_url)  # feed en la caché antes de contar consultas
+        queries = count_queries(fn)
+        stats = measure(fn, repeat=times)
+        rows.append(
+            (label, queries, f"{stats['median_ms']:.1f}", f"{stats['p95_ms']:.1f}")
+        )
+
+    entry = next(item for item in get(feed_url) if item["id"] == target.id)
+    assert entry["numbers_sold"] == Ticket.objects.filter(raffle=target).count()
+
+    print(f"\nRifas activas: {raffles} | Repeticiones: {repeat}\n")
+    print_table(["operación", "queries", "mediana ms", "p95 ms"], rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--raffles", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    setup_django()
+    with benchmark_database():
+        run(args.raffles, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Benchmark de las variantes WebP de las imágenes de rifas (raffle/images.py).
+
+Genera una foto sintética de --width x --height (ruido con degradado, que se
+comprime parecido a una foto real), la procesa como lo hace el worker y
+muestra el peso de cada variante frente al original, junto al tiempo de
+validación y de generación.
+
+    python -m benchmarks.bench_raffle_images [--width 4000] [--height 3000]
+"""
+
+import argparse
+from io import BytesIO
+
+from .utils import measure, print_table, setup_django
+
+
+def make_photo(width, height):
+    from PIL import Image, ImageFilter
+
+    noise = Image.effect_noise((width, height), 60).filter(ImageFilter.GaussianBlur(2))
+    gradient = Image.linear_gradient("L").resize((width, height))
+    image = Image.merge(
+        "RGB", (noise, gradient, noise.transpose(Image.FLIP_LEFT_RIGHT))
+    )
+    buffer = BytesIO()
+    image.save(buffer, "JPEG", quality=92)
+    return buffer.getvalue()
+
+
+def run(width, height, repeat):
+    from django.core.files.uploadedfile import SimpleUploadedFile
+
+    from raffle.images import render_variants, validate_raffle_image
+
+    original = make_photo(width, height)
+    upload = SimpleUploadedFile("foto.jpg", original, content_type="image/jpeg")
+    variants = render_variants(BytesIO(original))
+
+    validation = measure(lambda: validate_raffle_image(upload), repeat=repeat)
+    generation = measure(lambda: render_variants(BytesIO(original)), repeat=repeat)
+
+    rows = [("original (JPEG)", f"{len(original) / 1024:.0f}", "100%")]
+    for name, content in variants.items():
+        rows.append(
+            (
+                f"{name} (WebP)",
+                f"{len(content) / 1024:.0f}",
+                f"{len(content) * 100 / len(original):.1f}%",
+            )
+        )
+
+    print(f"\nImagen: {width}x{height} | Repeticiones: {repeat}\n")
+    print_table(["archivo", "KB", "del original"], rows)
+    print(
+        f"\nValidación en la petición: {validation['median_ms']:.2f} ms | "
+        f"Generación en el worker: {generation['median_ms']:.0f} ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--width", type=int, default=4000)
+    parser.add_argument("--height", type=int, default=3000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    setup_django()
+    run(args.width, args.height, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
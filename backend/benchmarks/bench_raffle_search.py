@@ -0,0 +1,116 @@
+"""
+Benchmark de GET /api/v1/raffle/search/ con distintos filtros.
+
+Crea --raffles rifas activas (con tickets vendidos en una de cada 50) y mide
+la latencia de una página de resultados por combinación de filtros, junto a
+las consultas SQL de cada petición. El conteo de la paginación está acotado
+(CappedPageNumberPagination), así que las búsquedas amplias no recorren
+todas las coincidencias para contar. Como referencia se incluye
+GET /raffle/list/, que devuelve todas las rifas activas sin paginar.
+
+    python -m benchmarks.bench_raffle_search [--raffles 20000] [--repeat 20]
+"""
+
+import argparse
+from datetime import timedelta
+
+from .utils import (
+    benchmark_database,
+    create_raffles,
+    create_tickets,
+    create_users,
+    measure,
+    print_table,
+    seed_reference_data,
+    setup_django,
+)
+
+
+def run(raffles, repeat):
+    from django.db import connection
+    from django.test import Client
+    from django.urls import reverse
+    from django.utils import timezone
+
+    ref = seed_reference_data()
+    users, payment_methods = create_users(ref, 50)
+    created = create_raffles(ref, raffles, users, payment_methods, number_amount=100)
+    for raffle in created[::50]:
+        create_tickets(raffle, 60, users, payment_methods)
+
+    now = timezone.now()
+    cases = [
+        ("sin filtros", {}),
+        ("search=prueba 1234", {"search": "prueba 1234"}),
+        ("search=benchmark (todas)", {"search": "benchmark"}),
+        (
+            "precio + ventana de sorteo",
+            {
+                "min_price": "1000",
+                "max_price": "6000",
+                "draw_from": (now + timedelta(days=40)).isoformat(),
+                "draw_to": (now + timedelta(days=45)).isoformat(),
+                "ordering": "draw_date",
+            },
+        ),
+        ("min_progress=100", {"min_progress": 100}),
+        ("search + min_rating", {"search": "prueba 77", "min_rating": 4}),
+    ]
+    client = Client()
+    url = reverse("raffle-search")
+
+    def count_queries(path, params):
+        # CaptureQueriesContext se reinicia con request_started; se cuenta aparte
+        queries = []
+        with connection.execute_wrapper(
+            lambda execute, sql, *args: queries.append(sql) or execute(sql, *args)
+        ):
+            response = client.get(path, params)
+        assert response.status_code == 200, response.content
+        return response.json(), len(queries)
+
+    rows = []
+    for label, params in cases:
+        data, queries = count_queries(url, params)
+        stats = measure(lambda: client.get(url, params), repeat=repeat)
+        count = f"{data['count']}{'+' if data['count_capped'] else ''}"
+        rows.append(
+            (
+                label,
+                count,
+                queries,
+                f"{stats['median_ms']:.1f}",
+                f"{stats['p95_ms']:.1f}",
+            )
+        )
+
+    list_url = reverse("raffle-list")
+    data, queries = count_queries(list_url, {})
+    stats = measure(lambda: client.get(list_url), repeat=max(3, repeat // 5))
+    rows.append(
+        (
+            "/raffle/list/ (sin paginar)",
+            len(data),
+            queries,
+            f"{stats['median_ms']:.1f}",
+            f"{stats['p95_ms']:.1f}",
+        )
+    )
+
+    print(f"\nRifas activas: {raffles} | Repeticiones: {repeat}\n")
+    print_table(["consulta", "resultados", "queries", "mediana ms", "p95 ms"], rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--raffles", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    setup_django()
+    with benchmark_database():
+        run(args.raffles, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+"""
+Benchmark de registros por segundo en POST /api/v1/auth/register/.
+
+Compara el registro anterior (UniqueValidator por campo, validate_email y
+validate_document_number, dos EXISTS de cuentas inactivas y create +
+set_password + save) con RegisterUserSerializer actual (una consulta de
+unicidad y un solo INSERT). Con el hasher configurado el costo lo domina el
+hash de la contraseña; con --fast-hasher (MD5) se ve solo el de la base.
+
+    python -m benchmarks.bench_register [--repeat 50] [--fast-hasher]
+"""
+
+import argparse
+import itertools
+
+from .utils import (
+    benchmark_database,
+    measure,
+    print_table,
+    seed_reference_data,
+    setup_django,
+)
+
+
+def legacy_serializer():
+    """RegisterUserSerializer tal como validaba y guardaba antes"""
+    from rest_framework import serializers
+
+    from user.models import User
+    from user.serializer import RegisterUserSerializer
+
+    class LegacyRegisterUserSerializer(RegisterUserSerializer):
+        class Meta(RegisterUserSerializer.Meta):
+            extra_kwargs = {"password": {"write_only": True, "min_length": 8}}
+
+        def validate(self, data):
+            if data.get("password") != data.get("confirm_password"):
+                raise serializers.ValidationError("Las contraseñas no coinciden.")
+            if User.objects.filter(email=data["email"], is_active=False).exists():
+                raise serializers.ValidationError("Cuenta desactivada.")
+            if User.objects.filter(
+                document_number=data["document_number"], is_active=False
+            ).exists():
+                raise serializers.ValidationError("Documento desactivado.")
+            return data
+
+        def validate_document_number(self, value):
+            value = super().validate_document_number(value)
+            if User.objects.filter(document_number=value).exists():
+                raise serializers.ValidationError("En uso.")
+            return value
+
+        def validate_email(self, value):
+            if User.objects.filter(email=value).exists():
+                raise serializers.ValidationError("En uso.")
+            return value
+
+        def create(self, validated_data):
+            validated_data.pop("confirm_password", None)
+            password = validated_data.pop("password")
+            user = User.objects.create(**validated_data)
+            user.set_password(password)
+            user.save()
+            return user
+
+    return LegacyRegisterUserSerializer
+
+
+def run(repeat, fast_hasher):
+    from contextlib import nullcontext
+    from unittest.mock import patch
+
+    from django.db import connection
+    from django.test import Client
+    from django.test.utils import override_settings
+    from django.urls import reverse
+
+    from user.serializer import RegisterUserSerializer
+    from user.views import RegisterUserViewSet
+
+    ref = seed_reference_data()
+    client = Client()
+    url = reverse("user_register")
+    counter = itertools.count(1)
+
+    def register():
+        n = next(counter)
+        response = client.post(
+            url,
+            {
+                "email": f"registro.{n}@bench.local",
+                "password": "ClaveSegura123",
+                "confirm_password": "ClaveSegura123",
+                "first_name": "Registro",
+                "last_name": "Bench",
+                "city": ref["city"].pk,
+                "gender": ref["gender"].pk,
+                "document_type": ref["document_type"].pk,
+                "document_number": str(6000000000 + n),
+            },
+            content_type="application/json",
+        )
+        assert response.status_code == 201, response.content
+
+    hashers = (
+        override_settings(
+            PASSWORD_HASHERS=["django.contrib.auth.hashers.MD5PasswordHasher"]
+        )
+        if fast_hasher
+        else nullcontext()
+    )
+    rows = []
+    with hashers:
+        for label, serializer_class in (
+            ("antes", legacy_serializer()),
+            ("actual", RegisterUserSerializer),
+        ):
+            with patch.object(
+                RegisterUserViewSet, "serializer_class", serializer_class
+            ):
+                # CaptureQueriesContext se reinicia con request_started; se cuenta aparte
+                queries = []
+                with connection.execute_wrapper(
+                    lambda execute, sql, *args: queries.append(sql)
+                    or execute(sql, *args)
+                ):
+                    register()
+                stats = measure(register, repeat=repeat)
+            rows.append(
+                (
+                    label,
+                    len(queries),
+                    sum(sql.startswith(("INSERT", "UPDATE")) for sql in queries),
+                    f"{stats['median_ms']:.2f}",
+                    f"{stats['p95_ms']:.2f}",
+                    f"{1000 / stats['median_ms']:.0f}",
+                )
+            )
+
+    hasher = "MD5 (solo base)" if fast_hasher else "configurado"
+    print(f"\nRepeticiones: {repeat} | Hasher: {hasher}\n")
+    print_table(
+        ["registro", "queries", "escrituras", "mediana ms", "p95 ms", "registros/s"],
+        rows,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--fast-hasher", action="store_true")
+    args = parser.parse_args()
+
+    setup_django()
+    with benchmark_database():
+        run(args.repeat, args.fast_hasher)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Benchmark del stream SSE frente al polling de /raffle/<pk>/available/.
+
+Mide cuánto cuesta repartir una venta a N clientes conectados con el broker
+en proceso y lo compara con una ronda de polling en la que cada cliente
+vuelve a pedir la lista completa de números disponibles.
+
+    python -m benchmarks.bench_sse [--clients 100,1000] [--numbers 10000]
+"""
+
+import argparse
+import asyncio
+import time
+
+from .utils import (
+    benchmark_database,
+    create_raffles,
+    create_tickets,
+    create_users,
+    measure,
+    print_table,
+    seed_reference_data,
+    setup_django,
+)
+
+
+async def fan_out(broker, raffle_id, clients, events):
+    """Publica `events` ventas y espera a que todos los clientes las reciban"""
+    subscriptions = [broker.subscribe(raffle_id)[0] for _ in range(clients)]
+    start = time.perf_counter()
+    for number in range(events):
+        broker.publish(raffle_id, "sold", {"numbers": [number]})
+    for subscription in subscriptions:
+        for _ in range(events):
+            await subscription.queue.get()
+    elapsed = (time.perf_counter() - start) * 1000
+    for subscription in subscriptions:
+        broker.unsubscribe(raffle_id, subscription)
+    return elapsed / events
+
+
+def run(client_counts, numbers, repeat):
+    from django.test import Client
+    from django.urls import reverse
+
+    from raffle.async_views import format_event
+    from raffle.events import RaffleEventBroker, format_event_id
+
+    ref = seed_reference_data()
+    users, payment_methods = create_users(ref, 50)
+    raffle = create_raffles(ref, 1, users, payment_methods, number_amount=numbers)[0]
+    create_tickets(raffle, numbers // 3, users, payment_methods)
+
+    client = Client()
+    url = reverse("available-numbers", kwargs={"pk": raffle.pk})
+    poll_bytes = len(client.get(url).content)
+    poll = measure(lambda: client.get(url), repeat=repeat)
+    event_bytes = len(format_event(1, "sold", {"numbers": [numbers]}))
+
+    rows = []
+    for clients in client_counts:
+        broker = RaffleEventBroker(queue_size=repeat + 1)
+        per_event_ms = asyncio.run(fan_out(broker, raffle.pk, clients, repeat))
+        rows.append(
+            (
+                clients,
+                f"{per_event_ms:.2f}",
+                event_bytes * clients,
+                f"{poll['median_ms'] * clients:.2f}",
+                poll_bytes * clients,
+            )
+        )
+
+    print(
+        f"\nNúmeros por rifa: {numbers} | Vendidos: {numbers // 3} | "
+        f"Eventos: {repeat} | ID de evento: {format_event_id(1)}\n"
+    )
+    print_table(
+        ["clientes", "SSE ms/venta", "SSE bytes", "polling ms/ronda", "polling bytes"],
+        rows,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--clients", default="10,100,1000")
+    parser.add_argument("--numbers", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    setup_django()
+    with benchmark_database():
+        run(
+            [int(value) for value in args.clients.split(",")],
+            args.numbers,
+            args.repeat,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Benchmark de la lista de refresh tokens revocados.
+
+Mide POST /api/v1/auth/refresh/ y la verificación de un jti no revocado
+(filtro de Bloom) con distintas cantidades de tokens revocados en la tabla,
+para comprobar que el costo no crece con el tamaño de la lista.
+
+    python -m benchmarks.bench_token_blacklist [--sizes 0 10000 100000] [--repeat 50]
+"""
+
+import argparse
+import uuid
+
+from .utils import (
+    benchmark_database,
+    create_users,
+    measure,
+    print_table,
+    seed_reference_data,
+    setup_django,
+)
+
+
+def run(sizes, repeat):
+    from datetime import timedelta
+
+    from django.test import Client
+    from django.urls import reverse
+    from django.utils import timezone
+
+    from user.models import BlacklistedToken
+    from user.serializer import CustomTokenObtainPairSerializer
+    from user.token_blacklist import blacklist
+
+    ref = seed_reference_data()
+    users, _ = create_users(ref, 1)
+    client = Client()
+    url = reverse("token_refresh")
+    expires_at = timezone.now() + timedelta(days=7)
+
+    rows = []
+    for size in sizes:
+        missing = size - BlacklistedToken.objects.count()
+        for offset in range(0, missing, 10000):
+            BlacklistedToken.objects.bulk_create(
+                BlacklistedToken(jti=uuid.uuid4().hex, expires_at=expires_at)
+                for _ in range(min(10000, missing - offset))
+            )
+        blacklist.reset()
+        blacklist.refresh()
+        bloom_kib = len(blacklist.bloom.bits) / 1024
+
+        check = measure(lambda: blacklist.is_blacklisted(uuid.uuid4().hex), repeat)
+
+        tokens = iter(
+            [
+                str(CustomTokenObtainPairSerializer.get_token(users[0]))
+                for _ in range(repeat + 2)
+            ]
+        )
+        refresh = measure(
+            lambda: client.post(
+                url, {"refresh": next(tokens)}, content_type="application/json"
+            ),
+            repeat,
+        )
+        rows.append(
+            (
+                f"{size:,}",
+                f"{bloom_kib:,.0f}",
+                f"{check['median_ms']:.4f}",
+                f"{refresh['median_ms']:.2f}",
+                f"{refresh['p95_ms']:.2f}",
+            )
+        )
+
+    print(f"\nRepeticiones: {repeat}\n")
+    print_table(
+        ["revocados", "filtro KiB", "check ms", "refresh ms", "refresh p95 ms"], rows
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[0, 10000, 100000])
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    setup_django()
+    with benchmark_database():
+        run(args.sizes, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Benchmark de búsqueda de usuarios en GET /api/v1/auth/list/?search=...
+
+Compara el SearchFilter anterior (icontains sobre first_name, last_name,
+email e id, que recorre toda la tabla) con SearchIndexFilter sobre
+search_text (FTS5 en SQLite; con BENCH_DB=default en PostgreSQL usa el
+índice trigram). Cada búsqueda se mide sobre --users usuarios.
+
+    python -m benchmarks.bench_user_search [--users 50000] [--repeat 20]
+"""
+
+import argparse
+
+from .utils import (
+    benchmark_database,
+    create_users,
+    measure,
+    print_table,
+    seed_reference_data,
+    setup_django,
+)
+
+QUERIES = [
+    "Nombre4242",
+    "apellido777",
+    "user49999@bench",
+    "nombre12345 apellido12345",
+    "NoExiste",
+]
+
+
+def run(users, repeat):
+    from unittest.mock import patch
+
+    from django.test import Client
+    from django.urls import reverse
+    from rest_framework import filters
+
+    from user.views import UserBasicListViewSet
+
+    ref = seed_reference_data()
+    create_users(ref, users)
+    client = Client()
+    url = reverse("user_basic_list")
+
+    def search(query):
+        response = client.get(url, {"search": query})
+        assert response.status_code == 200
+        return len(response.json())
+
+    legacy = {
+        "filter_backends": [filters.SearchFilter],
+        "search_fields": ["first_name", "last_name", "email", "id"],
+    }
+    rows = []
+    for query in QUERIES:
+        with patch.multiple(UserBasicListViewSet, create=True, **legacy):
+            legacy_count = search(query)
+            before = measure(lambda: search(query), repeat=repeat)
+        indexed_count = search(query)
+        after = measure(lambda: search(query), repeat=repeat)
+        rows.append(
+            (
+                query,
+                legacy_count,
+                indexed_count,
+                f"{before['median_ms']:.1f}",
+                f"{after['median_ms']:.1f}",
+                f"{before['median_ms'] / after['median_ms']:.1f}x",
+            )
+        )
+
+    print(f"\nUsuarios: {users} | Repeticiones: {repeat}\n")
+    print_table(
+        [
+            "búsqueda",
+            "filas antes",
+            "filas índice",
+            "SearchFilter ms",
+            "índice ms",
+            "mejora",
+        ],
+        rows,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--users", type=int, default=50000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    setup_django()
+    with benchmark_database():
+        run(args.users, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,20 @@
+"""
+Settings para levantar servidores reales en los benchmarks.
+
+Igual que core.settings, pero con BENCH_SQLITE_PATH usa ese archivo SQLite
+(compartido entre el proceso del benchmark y los workers de gunicorn).
+"""
+
+import os
+
+from core.settings import *  # noqa: F401,F403
+
+if os.getenv("BENCH_SQLITE_PATH"):
+    DATABASES = {
+        "default": {
+            "ENGINE": "django.db.backends.sqlite3",
+            "NAME": os.environ["BENCH_SQLITE_PATH"],
+        }
+    }
+DEBUG = False
+ALLOWED_HOSTS = ["*"]
@@ -0,0 +1,226 @@
+"""
+Utilidades comunes para los benchmarks.
+
+Los benchmarks se ejecutan desde backend/ como módulos:
+    python -m benchmarks.bench_compression
+
+Por defecto usan una base SQLite en memoria creada para la ejecución; con
+BENCH_DB=default se usa la base configurada en settings (se crea la base de
+pruebas "test_<nombre>" y se elimina al terminar).
+"""
+
+import os
+import statistics
+import time
+from contextlib import contextmanager
+from datetime import date, timedelta
+from decimal import Decimal
+
+import django
+
+
+def setup_django():
+    """Configura Django y la base de datos a usar en el benchmark"""
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "core.settings")
+    os.environ.setdefault("SECRET_KEY", "benchmark-only-secret-key")
+
+    from django.conf import settings
+
+    if os.getenv("BENCH_DB", "sqlite") == "sqlite":
+        settings.DATABASES = {
+            "default": {"ENGINE": "django.db.backends.sqlite3", "NAME": ":memory:"}
+        }
+    settings.ALLOWED_HOSTS = ["*"]
+    settings.DEBUG = False
+    django.setup()
+
+
+@contextmanager
+def benchmark_database():
+    """Crea la base de datos de pruebas y la elimina al salir"""
+    from django.test.utils import (
+        setup_databases,
+        setup_test_environment,
+        teardown_databases,
+        teardown_test_environment,
+    )
+
+    setup_test_environment()
+    old_config = setup_databases(verbosity=0, interactive=False)
+    try:
+        yield
+    finally:
+        teardown_databases(old_config, verbosity=0)
+        teardown_test_environment()
+
+
+def seed_reference_data():
+    """
+    Crea los catálogos mínimos y la cuenta conjunta del admin
+    (documento 0000000000) que usan compras, reembolsos y sorteos.
+    """
+    from django.contrib.auth.hashers import make_password
+
+    from location.models import City, Country, State
+    from raffleInfo.models import PrizeType, StateRaffle
+    from user.models import User
+    from userInfo.models import DocumentType, Gender, PaymentMethod, PaymentMethodType
+
+    country = Country.objects.create(country_name="Colombia", country_code="CO")
+    state = State.objects.create(
+        state_name="Valle", state_code="VAL", state_country=country
+    )
+    city = City.objects.create(city_name="Cali", city_code="CAL", city_state=state)
+    ref = {
+        "city": city,
+        "gender": Gender.objects.create(gender_name="Masculino", gender_code="M"),
+        "document_type": DocumentType.objects.create(
+            document_type_name="Cédula", document_type_code="CC"
+        ),
+        "payment_type": PaymentMethodType.objects.create(
+            payment_method_type_name="Tarjeta Débito", payment_method_type_code="TDEB"
+        ),
+        "prize_type": PrizeType.objects.create(
+            prize_type_name="Dinero", prize_type_code="DIN"
+        ),
+        "active_state": StateRaffle.objects.create(
+            state_raffle_name="Activa", state_raffle_code="ACT"
+        ),
+        "sorted_state": StateRaffle.objects.create(
+            state_raffle_name="Sorteada", state_raffle_code="SOR"
+        ),
+        "cancelled_state": StateRaffle.objects.create(
+            state_raffle_name="Cancelada", state_raffle_code="CAN"
+        ),
+    }
+    ref["admin"] = User.objects.create(
+        email="admin@bench.local",
+        password=make_password("admin123"),
+        first_name="Admin",
+        last_name="Bench",
+        is_admin=True,
+        is_staff=True,
+        document_number="0000000000",
+        city=city,
+        gender=ref["gender"],
+        document_type=ref["document_type"],
+    )
+    ref["admin_account"] = PaymentMethod.objects.create(
+        user=ref["admin"],
+        payment_method_type=ref["payment_type"],
+        paymenth_method_holder_name="Cuenta Conjunta",
+        paymenth_method_card_number_hash=make_password("1234567890123456"),
+        paymenth_method_expiration_date=date.today() + timedelta(days=365 * 3),
+        last_digits="3456",
+        payment_method_balance=Decimal("1000000000.00"),
+    )
+    return ref
+
+
+def create_users(ref, count, prefix="user"):
+    """Crea usuarios con método de pago en bloque (contraseña 'password123')"""
+    from django.contrib.auth.hashers import make_password
+
+    from user.models import User
+    from userInfo.models import PaymentMethod
+
+    password_hash = make_password("password123")
+    card_hash = make_password("4532123456789012")
+    users = User.objects.bulk_create(
+        User(
+            email=f"{prefix}{i}@bench.local",
+            password=password_hash,
+            first_name=f"Nombre{i}",
+            last_name=f"Apellido{i}",
+            document_number=f"9{i:09d}",
+            phone_number="3001234567",
+            rating=3.5 + (i % 3) / 2,
+            city=ref["city"],
+            gender=ref["gender"],
+            document_type=ref["document_type"],
+        )
+        for i in range(count)
+    )
+    payment_methods = PaymentMethod.objects.bulk_create(
+        PaymentMethod(
+            user=user,
+            payment_method_type=ref["payment_type"],
+            paymenth_method_holder_name=f"{user.first_name} {user.last_name}",
+            paymenth_method_card_number_hash=card_hash,
+            paymenth_method_expiration_date=date.today() + timedelta(days=365 * 3),
+            last_digits="9012",
+            payment_method_balance=Decimal("1000000.00"),
+        )
+        for user in users
+    )
+    return users, payment_methods
+
+
+def create_raffles(ref, count, creators, payment_methods, number_amount=1000):
+    """Crea rifas activas en bloque, repartidas entre los creadores"""
+    from django.utils import timezone
+
+    from raffle.models import Raffle
+
+    now = timezone.now()
+    return Raffle.objects.bulk_create(
+        Raffle(
+            raffle_name=f"Rifa de prueba {i}",
+            raffle_description="Rifa generada para benchmark " * 4,
+            raffle_start_date=now - timedelta(days=1),
+            raffle_draw_date=now + timedelta(days=30 + i % 30),
+            raffle_minimum_numbers_sold=number_amount // 2,
+            raffle_number_amount=number_amount,
+            raffle_number_price=Decimal("5000.00"),
+            raffle_prize_amount=Decimal("1000000.00"),
+            raffle_prize_type=ref["prize_type"],
+            raffle_state=ref["active_state"],
+            raffle_created_by=creators[i % len(creators)],
+            raffle_creator_payment_method=payment_methods[i % len(creators)],
+        )
+        for i in range(count)
+    )
+
+
+def create_tickets(raffle, count, users, payment_methods):
+    """Vende en bloque los primeros `count` números de una rifa"""
+    from tickets.models import Ticket
+
+    return Ticket.objects.bulk_create(
+        Ticket(
+            raffle=raffle,
+            number=number,
+            user=users[number % len(users)],
+            payment_method=payment_methods[number % len(users)],
+        )
+        for number in range(1, count + 1)
+    )
+
+
+def measure(fn, repeat=20, warmup=2):
+    """Ejecuta fn varias veces y retorna estadísticas en milisegundos"""
+    for _ in range(warmup):
+        fn()
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return {
+        "median_ms": statistics.median(samples),
+        "p95_ms": samples[min(len(samples) - 1, int(len(samples) * 0.95))],
+        "min_ms": samples[0],
+    }
+
+
+def print_table(headers, rows):
+    """Imprime una tabla de texto alineada"""
+    widths = [
+        max(len(str(value)) for value in column) for column in zip(headers, *rows)
+    ]
+    line = "  ".join(f"{{:<{width}}}" for width in widths)
+    print(line.format(*headers))
+    print(line.format(*("-" * width for width in widths)))
+    for row in rows:
+        print(line.format(*row))
@@ -9,6 +9,9 @@ pip install -r requirements.txt
 echo "🗄️ Ejecutando migraciones..."
 python manage.py migrate --noinput
 
+echo "🔎 Actualizando índices de búsqueda..."
+python manage.py rebuild_search_index
+
 echo "📁 Recolectando archivos estáticos..."
 python manage.py collectstatic --noinput --clear
 
@@ -0,0 +1,15 @@
+from django.apps import AppConfig
+from django.db.models.signals import post_migrate
+
+
+class CoreConfig(AppConfig):
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "core"
+
+    def ready(self):
+        import core.checks  # Caché compartida en despliegue (check --deploy)
+        import core.signals  # Invalidación de catálogos y usuarios cacheados
+        from core.search import install_search_indexes
+
+        # Índices de búsqueda (trigram en PostgreSQL, FTS5 en SQLite)
+        post_migrate.connect(install_search_indexes, dispatch_uid="core.search")
@@ -0,0 +1,129 @@
+"""
+Vistas asíncronas de solo lectura para el modo ASGI.
+
+Atienden GET con el ORM asíncrono de Django y devuelven el mismo JSON que la
+vista DRF equivalente. El resto de métodos se delegan a la vista DRF síncrona
+con sync_to_async, así que permisos, validaciones y errores no cambian.
+"""
+
+from asgiref.sync import sync_to_async
+from django.http import HttpResponse
+from django.urls import path
+from django.views import View
+
+from .renderers import FastJSONRenderer
+
+
+class AsyncReadView(View):
+    """
+    Base de las vistas asíncronas. Las subclases implementan get_data();
+    si retorna None se responde 404 igual que DRF.
+    """
+
+    # Vista DRF (resultado de as_view()) que atiende los demás métodos
+    sync_view = None
+    # Modelo para el mensaje de 404
+    model = None
+    renderer = FastJSONRenderer()
+
+    @classmethod
+    def as_view(cls, **initkwargs):
+        view = super().as_view(**initkwargs)
+        # La vista DRF delegada aplica su propia protección CSRF
+        view.csrf_exempt = True
+        return view
+
+    async def get(self, request, *args, **kwargs):
+        data = await self.get_data(request, *args, **kwargs)
+        if data is None:
+            return self.not_found()
+        return self.render(data)
+
+    async def get_data(self, request, *args, **kwargs):
+        raise NotImplementedError
+
+    def render(self, data, status=200):
+        response = HttpResponse(
+            self.renderer.render(data),
+            status=status,
+            content_type=self.renderer.media_type,
+        )
+        # Igual que en Response de DRF, para quien inspecciona la respuesta
+        response.data = data
+        return response
+
+    def not_found(self):
+        """Mismo cuerpo que el 404 de get_object_or_404 en DRF"""
+        message = f"No {self.model._meta.object_name} matches the given query."
+        return self.render({"detail": message}, status=404)
+
+    async def delegate(self, request, *args, **kwargs):
+        return await sync_to_async(self.sync_view)(request, *args, **kwargs)
+
+    post = put = patch = delete = options = delegate
+
+
+class AsyncCatalogView(AsyncReadView):
+    """
+    Listado y detalle de un catálogo simple (campos sin relaciones), con la
+    misma salida que su ModelSerializer.
+    """
+
+    fields = ()
+
+    async def get_data(self, request, pk=None):
+        queryset = self.model.objects.values(*self.fields)
+        if pk is None:
+            return [row async for row in queryset]
+        try:
+            return await queryset.filter(pk=pk).afirst()
+        except (TypeError, ValueError):
+            return None
+
+
+def async_catalog_urls(router, basenames):
+    """
+    Rutas asíncronas de listado/detalle para los viewsets del router indicados,
+    con los mismos nombres de URL. Deben ir antes de include(router.urls).
+    """
+    urls = []
+    for prefix, viewset, basename in router.registry:
+        if basename not in basenames:
+            continue
+        model = viewset.queryset.model
+        fields = viewset.serializer_class.Meta.fields
+        if fields == "__all__":
+            fields = [field.name for field in model._meta.concrete_fields]
+        initkwargs = {"basename": basename}
+        urls += [
+            path(
+                f"{prefix}/",
+                AsyncCatalogView.as_view(
+                    model=model,
+                    fields=fields,
+                    sync_view=viewset.as_view(
+                        {"get": "list", "post": "create"}, detail=False, **initkwargs
+                    ),
+                ),
+                name=f"{basename}-list",
+            ),
+            path(
+                f"{prefix}/<str:pk>/",
+                AsyncCatalogView.as_view(
+                    model=model,
+                    fields=fields,
+                    sync_view=viewset.as_view(
+                        {
+                            "get": "retrieve",
+                            "put": "update",
+                            "patch": "partial_update",
+                            "delete": "destroy",
+                        },
+                        detail=True,
+                        **initkwargs,
+                    ),
+                ),
+                name=f"{basename}-detail",
+            ),
+        ]
+    return urls
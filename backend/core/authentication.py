@@ -0,0 +1,147 @@
+"""
+Autenticación JWT sin consultar la tabla de usuarios en cada petición.
+
+JWTAuthentication carga la fila del usuario en cada request autenticado.
+StatelessJWTAuthentication, para GET/HEAD/OPTIONS, arma el usuario con los
+claims del token (id, email, first_name) y con los permisos (is_active,
+is_staff, is_admin) de una caché de vida corta (JWT_USER_CACHE_TIMEOUT),
+que se invalida al guardar o borrar el usuario. Los demás campos quedan
+diferidos: si una vista usa alguno, se cargan todos en una sola consulta
+(ver User.refresh_from_db).
+
+Las peticiones que modifican datos (POST, PUT, PATCH, DELETE) y los tokens
+emitidos sin los claims siguen el camino normal de JWTAuthentication.
+
+Se activa con JWT_STATELESS_AUTH=True.
+
+También se cachean los nombres de grupos de cada usuario que devuelve el
+login (get_group_names), invalidados con los cambios de grupos.
+"""
+
+import time
+
+from django.conf import settings
+from django.contrib.auth.models import Group
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.settings import api_settings
+
+CACHE_KEY = "auth:user:{}"
+# Campos que se leen de la caché; los claims del token pueden estar desactualizados
+CACHED_FIELDS = ("is_active", "is_staff", "is_admin")
+TOKEN_CLAIMS = ("email", "first_name")
+
+
+def user_state_key(user_id):
+    return CACHE_KEY.format(user_id)
+
+
+def get_user_state(user_id):
+    """
+    Permisos del usuario desde la caché (o la base si no están). Retorna
+    None si el usuario no existe.
+    """
+    key = user_state_key(user_id)
+    state = cache.get(key)
+    if state is None:
+        row = (
+            get_user_model()
+            .objects.filter(pk=user_id)
+            .values_list(*CACHED_FIELDS)
+            .first()
+        )
+        # Un usuario borrado también se cachea (False) para no consultar de nuevo
+        state = dict(zip(CACHED_FIELDS, row)) if row else False
+        cache.set(key, state, settings.JWT_USER_CACHE_TIMEOUT)
+    return state or None
+
+
+def invalidate_user_state(user_id):
+    cache.delete(user_state_key(user_id))
+
+
+GROUPS_KEY = "auth:groups:{}:{}"
+GROUPS_GENERATION_KEY = "auth:groups:generation"
+
+
+def _groups_generation():
+    generation = cache.get(GROUPS_GENERATION_KEY)
+    if generation is None:
+        generation = time.time_ns()
+        cache.set(GROUPS_GENERATION_KEY, generation, None)
+    return generation
+
+
+def get_group_names(user_id):
+    """Nombres de los grupos del usuario, cacheados por AUTH_GROUPS_CACHE_TIMEOUT"""
+    key = GROUPS_KEY.format(user_id, _groups_generation())
+    names = cache.get(key)
+    if names is None:
+        names = list(
+            Group.objects.filter(user__pk=user_id)
+            .order_by("name")
+            .values_list("name", flat=True)
+        )
+        cache.set(key, names, settings.AUTH_GROUPS_CACHE_TIMEOUT)
+    return names
+
+
+def invalidate_group_names(user_ids=None):
+    """Invalida los grupos cacheados de esos usuarios, o de todos si es None"""
+    if user_ids is None:
+        # Renombrar o borrar un grupo afecta a todos sus usuarios
+        cache.set(GROUPS_GENERATION_KEY, time.time_ns(), None)
+        return
+    generation = _groups_generation()
+    cache.delete_many([GROUPS_KEY.format(pk, generation) for pk in user_ids])
+
+
+class StatelessJWTAuthentication(JWTAuthentication):
+    def authenticate(self, request):
+        if request.method not in SAFE_METHODS:
+            return super().authenticate(request)
+
+        header = self.get_header(request)
+        if header is None:
+            return None
+        raw_token = self.get_raw_token(header)
+        if raw_token is None:
+            return None
+
+        validated_token = self.get_validated_token(raw_token)
+        if not all(claim in validated_token for claim in TOKEN_CLAIMS):
+            # Token emitido sin los claims: usuario completo desde la base
+            return self.get_user(validated_token), validated_token
+        return self.get_token_user(validated_token), validated_token
+
+    def get_token_user(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise AuthenticationFailed(
+                "El token no contiene identificación de usuario",
+                code="token_not_valid",
+            )
+
+        User = get_user_model()
+        user_id = User._meta.pk.to_python(user_id)  # simplejwt guarda el id como texto
+        state = get_user_state(user_id)
+        if state is None:
+            raise AuthenticationFailed("Usuario no encontrado", code="user_not_found")
+        if not state["is_active"]:
+            raise AuthenticationFailed("El usuario está inactivo", code="user_inactive")
+
+        values = {
+            "id": user_id,
+            **{claim: validated_token[claim] for claim in TOKEN_CLAIMS},
+            **state,
+        }
+        # Instancia con el resto de campos diferidos (se cargan al accederlos);
+        # from_db espera los valores en el orden de los campos del modelo
+        names = [f.attname for f in User._meta.concrete_fields if f.attname in values]
+        user = User.from_db(None, names, [values[name] for name in names])
+        user._from_token = True
+        return user
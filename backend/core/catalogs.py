@@ -0,0 +1,113 @@
+"""
+Catálogos de referencia usados por los formularios de registro y perfil.
+
+Reúne países, estados, ciudades, géneros y tipos de documento en un solo
+payload cacheado. Cada payload lleva un hash de versión calculado sobre su
+contenido para que los clientes puedan evitar descargas repetidas.
+"""
+
+import hashlib
+import json
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+
+from location.services import get_location_tree
+from userInfo.models import DocumentType, Gender
+
+GENERATION_KEY = "catalogs:generation"
+
+
+def get_generation():
+    """Generación actual de los catálogos (cambia con cada modificación)"""
+    generation = cache.get(GENERATION_KEY)
+    if generation is None:
+        generation = time.time_ns()
+        cache.set(GENERATION_KEY, generation, None)
+    return generation
+
+
+def bump_generation():
+    """Invalida todos los payloads cacheados de catálogos"""
+    cache.set(GENERATION_KEY, time.time_ns(), None)
+
+
+def compute_version(payload):
+    """Hash estable del contenido del payload"""
+    raw = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:16]
+
+
+def build_bootstrap_payload(country_id=None, state_id=None):
+    """
+    Construye el payload con todos los catálogos activos.
+    - country_id: limita estados (y sus ciudades) a ese país
+    - state_id: limita ciudades a ese estado
+    """
+    tree = get_location_tree()
+    states = [
+        state
+        for state in tree["states"].values()
+        if state["state_is_active"]
+        and (country_id is None or state["state_country_id"] == country_id)
+    ]
+    state_countries = {state["id"]: state["state_country_id"] for state in states}
+    cities = [
+        city
+        for city in tree["cities"].values()
+        if city["city_is_active"]
+        and city["city_state_id"] in state_countries
+        and (state_id is None or city["city_state_id"] == state_id)
+    ]
+
+    payload = {
+        "countries": [
+            {
+                "id": country["id"],
+                "country_name": country["country_name"],
+                "country_code": country["country_code"],
+            }
+            for country in tree["countries"].values()
+            if country["country_is_active"]
+        ],
+        "states": [
+            {
+                "id": state["id"],
+                "state_name": state["state_name"],
+                "state_code": state["state_code"],
+                "country_id": state["state_country_id"],
+            }
+            for state in states
+        ],
+        "cities": [
+            {
+                "id": city["id"],
+                "city_name": city["city_name"],
+                "city_code": city["city_code"],
+                "state_id": city["city_state_id"],
+            }
+            for city in cities
+        ],
+        "genders": list(
+            Gender.objects.filter(gender_is_active=True)
+            .order_by("gender_name")
+            .values("id", "gender_name", "gender_code")
+        ),
+        "document_types": list(
+            DocumentType.objects.filter(document_type_is_active=True)
+            .order_by("document_type_name")
+            .values("id", "document_type_name", "document_type_code")
+        ),
+    }
+    return {"version": compute_version(payload), **payload}
+
+
+def get_bootstrap_payload(country_id=None, state_id=None):
+    """Payload de catálogos desde caché, construyéndolo si no existe"""
+    key = f"catalogs:bootstrap:{get_generation()}:{country_id}:{state_id}"
+    payload = cache.get(key)
+    if payload is None:
+        payload = build_bootstrap_payload(country_id, state_id)
+        cache.set(key, payload, settings.CATALOG_CACHE_TIMEOUT)
+    return payload
@@ -0,0 +1,51 @@
+"""
+Checks de despliegue propios (manage.py check --deploy).
+"""
+
+from django.conf import settings
+from django.core.checks import Error, Tags, register
+
+# Backends cuyo contenido vive en cada proceso: con varios workers cada uno
+# tendría su propia copia del feed de rifas, los catálogos y los usuarios
+PER_PROCESS_CACHES = (
+    "django.core.cache.backends.locmem.LocMemCache",
+    "django.core.cache.backends.dummy.DummyCache",
+)
+
+
+@register(Tags.caches, deploy=True)
+def check_shared_cache(app_configs, **kwargs):
+    backend = settings.CACHES["default"]["BACKEND"]
+    if backend not in PER_PROCESS_CACHES:
+        return []
+    return [
+        Error(
+            f"La caché por defecto ({backend}) no se comparte entre procesos.",
+            hint=(
+                "Configure CACHE_BACKEND y CACHE_LOCATION con una caché "
+                "compartida, p. ej. django.core.cache.backends.redis.RedisCache "
+                "y redis://redis:6379/0 (ver docker-compose.yml)."
+            ),
+            id="core.E001",
+        )
+    ]
+
+
+@register(Tags.security, deploy=True)
+def check_card_fingerprint_keys(app_configs, **kwargs):
+    keys = settings.CARD_FINGERPRINT_KEYS
+    # Sin CARD_FINGERPRINT_KEYS se usa SECRET_KEY (ver settings.py)
+    invalid = [key for key in keys.values() if not key or key == settings.SECRET_KEY]
+    if keys and not invalid and settings.CARD_FINGERPRINT_VERSION in keys:
+        return []
+    return [
+        Error(
+            "CARD_FINGERPRINT_KEYS no está configurada: las huellas de tarjeta "
+            "quedarían sin clave o atadas a SECRET_KEY.",
+            hint=(
+                "Defina CARD_FINGERPRINT_KEYS (p. ej. 1:<clave aleatoria>), distinta "
+                "de SECRET_KEY y con una clave para CARD_FINGERPRINT_VERSION."
+            ),
+            id="core.E002",
+        )
+    ]
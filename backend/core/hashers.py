@@ -0,0 +1,66 @@
+"""
+Hashers de contraseñas con parámetros configurables por entorno.
+
+El primer hasher de PASSWORD_HASHERS (ver settings.PASSWORD_HASHER) es el
+que se usa para las contraseñas nuevas; los demás solo verifican hashes
+existentes. Cuando un usuario inicia sesión con un hash de otro algoritmo o
+con parámetros distintos a los configurados, Django lo vuelve a hashear y
+lo guarda (AbstractBaseUser.check_password), así que cambiar el algoritmo o
+subir/bajar el costo no requiere migrar datos.
+
+Para elegir los parámetros según los workers disponibles ver
+benchmarks/bench_login.py.
+"""
+
+from django.conf import settings
+from django.contrib.auth.hashers import (
+    Argon2PasswordHasher,
+    PBKDF2PasswordHasher,
+    ScryptPasswordHasher,
+)
+
+
+class TunedScryptPasswordHasher(ScryptPasswordHasher):
+    """scrypt con N, r y p de PASSWORD_SCRYPT_* (memoria ≈ 128 · N · r bytes)"""
+
+    @property
+    def work_factor(self):
+        return settings.PASSWORD_SCRYPT_WORK_FACTOR
+
+    @property
+    def block_size(self):
+        return settings.PASSWORD_SCRYPT_BLOCK_SIZE
+
+    @property
+    def parallelism(self):
+        return settings.PASSWORD_SCRYPT_PARALLELISM
+
+    @property
+    def maxmem(self):
+        # El límite de OpenSSL (32 MiB) no alcanza desde N=2^15; se deja margen
+        # para verificar hashes creados con un N mayor al actual
+        return 4 * 128 * self.work_factor * self.block_size
+
+
+class TunedArgon2PasswordHasher(Argon2PasswordHasher):
+    """Argon2id con costos de PASSWORD_ARGON2_* (requiere argon2-cffi)"""
+
+    @property
+    def time_cost(self):
+        return settings.PASSWORD_ARGON2_TIME_COST
+
+    @property
+    def memory_cost(self):
+        return settings.PASSWORD_ARGON2_MEMORY_COST
+
+    @property
+    def parallelism(self):
+        return settings.PASSWORD_ARGON2_PARALLELISM
+
+
+class TunedPBKDF2PasswordHasher(PBKDF2PasswordHasher):
+    """PBKDF2-SHA256 con PASSWORD_PBKDF2_ITERATIONS iteraciones"""
+
+    @property
+    def iterations(self):
+        return settings.PASSWORD_PBKDF2_ITERATIONS
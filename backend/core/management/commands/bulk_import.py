@@ -0,0 +1,411 @@
+"""
+Carga masiva de usuarios, métodos de pago y rifas desde CSV o JSON Lines.
+
+    python manage.py bulk_import users usuarios.csv
+    python manage.py bulk_import payment_methods tarjetas.jsonl --batch-size 5000
+    python manage.py bulk_import raffles rifas.csv --workers 8
+
+Columnas por tipo (los catálogos se referencian por código):
+- users: email, password, first_name, last_name, document_number, city,
+  gender, document_type [, phone_number, address, is_admin]
+- payment_methods: user_email, payment_method_type, holder_name,
+  card_number, expiration_date (AAAA-MM-DD) [, balance]
+- raffles: name, draw_date (ISO 8601), minimum_numbers_sold, number_amount,
+  number_price, prize_amount, prize_type, created_by_email
+  [, description, start_date, state]
+
+Cada lote se inserta con bulk_create en su propia transacción y después se
+guarda un checkpoint con la cantidad de registros procesados; si la carga se
+interrumpe, al volver a ejecutarla continúa desde ahí. Las contraseñas se
+hashean en un pool de procesos; los números de tarjeta se guardan como huella
+HMAC, que es barata y no necesita el pool.
+
+bulk_create no llama a save() ni dispara signals: no se ejecutan las
+validaciones de los modelos ni las tareas asociadas a post_save.
+"""
+
+import csv
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+from decimal import Decimal, InvalidOperation
+
+import django
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from location.models import City
+from raffle.models import Raffle
+from raffleInfo.models import PrizeType, StateRaffle
+from user.models import User
+from userInfo.card_fingerprint import card_fingerprint
+from userInfo.models import DocumentType, Gender, PaymentMethod, PaymentMethodType
+
+KINDS = ("users", "payment_methods", "raffles")
+
+
+def _init_hasher():
+    """Inicializa Django en los procesos del pool (necesario con spawn)"""
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "core.settings")
+    django.setup()
+
+
+def hash_secret(raw):
+    return make_password(raw)
+
+
+def read_records(path, fmt):
+    """Itera los registros del archivo como diccionarios"""
+    with open(path, encoding="utf-8", newline="") as source:
+        if fmt == "csv":
+            yield from csv.DictReader(source)
+        else:
+            for line in source:
+                if line.strip():
+                    yield json.loads(line)
+
+
+class RecordError(ValueError):
+    pass
+
+
+def _required(record, field):
+    value = record.get(field)
+    if value in (None, ""):
+        raise RecordError(f"falta el campo '{field}'")
+    return value
+
+
+def _lookup(mapping, record, field, label):
+    code = _required(record, field)
+    try:
+        return mapping[str(code).upper()]
+    except KeyError:
+        raise RecordError(f"{label} con código '{code}' no existe")
+
+
+def _decimal(record, field, default=None):
+    value = record.get(field)
+    if value in (None, ""):
+        if default is None:
+            raise RecordError(f"falta el campo '{field}'")
+        return default
+    try:
+        return Decimal(str(value))
+    except InvalidOperation:
+        raise RecordError(f"'{field}' no es un número: {value}")
+
+
+def _datetime(record, field, default=None):
+    value = record.get(field)
+    if value in (None, ""):
+        if default is None:
+            raise RecordError(f"falta el campo '{field}'")
+        return default
+    parsed = parse_datetime(str(value))
+    if parsed is None:
+        raise RecordError(f"'{field}' no es una fecha válida: {value}")
+    if timezone.is_naive(parsed):
+        parsed = timezone.make_aware(parsed)
+    return parsed
+
+
+def _flag(record, field):
+    return str(record.get(field, "")).strip().lower() in ("1", "true", "si", "sí")
+
+
+class Command(BaseCommand):
+    help = "Carga masiva de usuarios, métodos de pago o rifas desde CSV/JSONL"
+
+    def add_arguments(self, parser):
+        parser.add_argument("kind", choices=KINDS, help="Tipo de registros")
+        parser.add_argument("path", help="Archivo .csv o .jsonl")
+        parser.add_argument(
+            "--format",
+            choices=("csv", "jsonl"),
+            help="Formato del archivo (por defecto según la extensión)",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Registros por lote de bulk_create (default: 1000)",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=os.cpu_count() or 1,
+            help="Procesos para hashear contraseñas (0 = sin pool)",
+        )
+        parser.add_argument(
+            "--checkpoint",
+            help="Archivo de checkpoint (default: <path>.checkpoint)",
+        )
+        parser.add_argument(
+            "--restart",
+            action="store_true",
+            help="Ignorar el checkpoint existente y empezar desde el inicio",
+        )
+        parser.add_argument(
+            "--ignore-conflicts",
+            action="store_true",
+            help="Omitir registros duplicados (email, documento...) en lugar de fallar",
+        )
+
+    def handle(self, *args, **options):
+        path = options["path"]
+        if not os.path.exists(path):
+            raise CommandError(f"No existe el archivo {path}")
+        if options["batch_size"] < 1:
+            raise CommandError("--batch-size debe ser al menos 1")
+        fmt = options["format"] or (
+            "jsonl" if path.endswith((".jsonl", ".ndjson")) else "csv"
+        )
+        kind = options["kind"]
+        self.ignore_conflicts = options["ignore_conflicts"]
+        self.checkpoint_path = options["checkpoint"] or f"{path}.checkpoint"
+
+        skip = 0 if options["restart"] else self.load_checkpoint(kind, path)
+        if skip:
+            self.stdout.write(f"↪️  Reanudando desde el registro {skip}")
+
+        self.build = getattr(self, f"build_{kind}")
+        self.load_catalogs()
+
+        pool = None
+        if options["workers"] > 0:
+            pool = ProcessPoolExecutor(options["workers"], initializer=_init_hasher)
+
+        processed, created = skip, 0
+        start = time.perf_counter()
+        try:
+            batch = []
+            for index, record in enumerate(read_records(path, fmt)):
+                if index < skip:
+                    continue
+                batch.append((index + 1, record))
+                if len(batch) >= options["batch_size"]:
+                    created += self.import_batch(kind, batch, pool)
+                    processed += len(batch)
+                    self.save_checkpoint(kind, path, processed)
+                    self.report(kind, processed, created, start)
+                    batch = []
+            if batch:
+                created += self.import_batch(kind, batch, pool)
+                processed += len(batch)
+                self.save_checkpoint(kind, path, processed)
+        finally:
+            if pool is not None:
+                pool.shutdown()
+
+        if os.path.exists(self.checkpoint_path):
+            os.remove(self.checkpoint_path)
+        self.report(kind, processed, created, start)
+        self.stdout.write(
+            self.style.SUCCESS(f"✅ Importación completa: {processed} registros")
+        )
+
+    # Checkpoints
+
+    def load_checkpoint(self, kind, path):
+        if not os.path.exists(self.checkpoint_path):
+            return 0
+        with open(self.checkpoint_path, encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("kind") != kind or data.get("source") != os.path.abspath(path):
+            raise CommandError(
+                f"El checkpoint {self.checkpoint_path} es de otra importación; "
+                "usa --restart o --checkpoint"
+            )
+        return data["processed"]
+
+    def save_checkpoint(self, kind, path, processed):
+        # Escribir y renombrar para no dejar un checkpoint a medias
+        tmp_path = f"{self.checkpoint_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "kind": kind,
+                    "source": os.path.abspath(path),
+                    "processed": processed,
+                },
+                f,
+            )
+        os.replace(tmp_path, self.checkpoint_path)
+
+    def report(self, kind, processed, created, start):
+        elapsed = time.perf_counter() - start
+        rate = created / elapsed if elapsed else 0
+        self.stdout.write(
+            f"  {kind}: {processed} procesados, {created} creados ({rate:.0f}/s)"
+        )
+
+    # Lotes
+
+    def load_catalogs(self):
+        """Catálogos por código en memoria para resolver las FKs sin consultas"""
+
+        def by_code(model, field):
+            return {
+                code.upper(): pk for pk, code in model.objects.values_list("pk", field)
+            }
+
+        self.cities = by_code(City, "city_code")
+        self.genders = by_code(Gender, "gender_code")
+        self.document_types = by_code(DocumentType, "document_type_code")
+        self.payment_types = by_code(PaymentMethodType, "payment_method_type_code")
+        self.prize_types = by_code(PrizeType, "prize_type_code")
+        self.raffle_states = by_code(StateRaffle, "state_raffle_code")
+
+    def import_batch(self, kind, batch, pool):
+        hashes = None
+        if kind == "users":
+            passwords = [str(record.get("password") or "") for _, record in batch]
+            if pool is not None:
+                chunksize = max(1, len(passwords) // (pool._max_workers * 4))
+                hashes = list(pool.map(hash_secret, passwords, chunksize=chunksize))
+            else:
+                hashes = [hash_secret(password) for password in passwords]
+
+        objects = self.build(batch, hashes)
+        model = type(objects[0]) if objects else None
+        if model is None:
+            return 0
+        with transaction.atomic():
+            model.objects.bulk_create(
+                objects,
+                batch_size=len(objects),
+                ignore_conflicts=self.ignore_conflicts,
+            )
+        return len(objects)
+
+    def fail(self, line, error):
+        raise CommandError(
+            f"Registro {line}: {error}. Los lotes anteriores quedaron guardados; "
+            "corrige el archivo y vuelve a ejecutar para continuar."
+        )
+
+    def build_users(self, batch, hashes):
+        users = []
+        for (line, record), password_hash in zip(batch, hashes):
+            try:
+                _required(record, "password")
+                users.append(
+                    User(
+                        email=User.objects.normalize_email(_required(record, "email")),
+                        password=password_hash,
+                        first_name=_required(record, "first_name"),
+                        last_name=_required(record, "last_name"),
+                        document_number=_required(record, "document_number"),
+                        phone_number=record.get("phone_number") or "",
+                        address=record.get("address") or "",
+                        is_admin=_flag(record, "is_admin"),
+                        city_id=_lookup(self.cities, record, "city", "Ciudad"),
+                        gender_id=_lookup(self.genders, record, "gender", "Género"),
+                        document_type_id=_lookup(
+                            self.document_types,
+                            record,
+                            "document_type",
+                            "Tipo de documento",
+                        ),
+                    )
+                )
+            except RecordError as e:
+                self.fail(line, e)
+        return users
+
+    def build_payment_methods(self, batch, hashes):
+        emails = {record.get("user_email") for _, record in batch}
+        user_ids = dict(
+            User.objects.filter(email__in=emails).values_list("email", "pk")
+        )
+        methods = []
+        for line, record in batch:
+            try:
+                email = _required(record, "user_email")
+                if email not in user_ids:
+                    raise RecordError(f"no existe el usuario {email}")
+                card_number = str(_required(record, "card_number"))
+                try:
+                    expiration = date.fromisoformat(
+                        _required(record, "expiration_date")
+                    )
+                except ValueError:
+                    raise RecordError("'expiration_date' debe ser AAAA-MM-DD")
+                methods.append(
+                    PaymentMethod(
+                        user_id=user_ids[email],
+                        payment_method_type_id=_lookup(
+                            self.payment_types,
+                            record,
+                            "payment_method_type",
+                            "Tipo de método de pago",
+                        ),
+                        paymenth_method_holder_name=_required(record, "holder_name"),
+                        paymenth_method_card_number_hash=card_fingerprint(card_number),
+                        paymenth_method_expiration_date=expiration,
+                        last_digits=card_number[-4:],
+                        payment_method_balance=_decimal(
+                            record, "balance", Decimal("0.00")
+                        ),
+                    )
+                )
+            except RecordError as e:
+                self.fail(line, e)
+        return methods
+
+    def build_raffles(self, batch, hashes):
+        emails = {record.get("created_by_email") for _, record in batch}
+        # Método de pago activo más antiguo de cada creador
+        creators = {}
+        for email, user_id, method_id in (
+            PaymentMethod.objects.filter(
+                user__email__in=emails, payment_method_is_active=True
+            )
+            .order_by("-created_at")
+            .values_list("user__email", "user_id", "pk")
+        ):
+            creators[email] = (user_id, method_id)
+
+        now = timezone.now()
+        raffles = []
+        for line, record in batch:
+            try:
+                email = _required(record, "created_by_email")
+                if email not in creators:
+                    raise RecordError(
+                        f"el usuario {email} no existe o no tiene método de pago activo"
+                    )
+                user_id, method_id = creators[email]
+                if not record.get("state"):
+                    record = {**record, "state": "ACT"}
+                raffles.append(
+                    Raffle(
+                        raffle_name=_required(record, "name"),
+                        raffle_description=record.get("description") or None,
+                        raffle_start_date=_datetime(record, "start_date", now),
+                        raffle_draw_date=_datetime(record, "draw_date"),
+                        raffle_minimum_numbers_sold=int(
+                            _required(record, "minimum_numbers_sold")
+                        ),
+                        raffle_number_amount=int(_required(record, "number_amount")),
+                        raffle_number_price=_decimal(record, "number_price"),
+                        raffle_prize_amount=_decimal(record, "prize_amount"),
+                        raffle_prize_type_id=_lookup(
+                            self.prize_types, record, "prize_type", "Tipo de premio"
+                        ),
+                        raffle_state_id=_lookup(
+                            self.raffle_states, record, "state", "Estado de rifa"
+                        ),
+                        raffle_created_by_id=user_id,
+                        raffle_creator_payment_method_id=method_id,
+                    )
+                )
+            except (RecordError, ValueError) as e:
+                self.fail(line, e)
+        return raffles
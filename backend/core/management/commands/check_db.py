@@ -0,0 +1,59 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, OperationalError, connections
+
+
+class Command(BaseCommand):
+    help = "Verifica la conexión a la base de datos, esperando a que esté disponible"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--database",
+            default=DEFAULT_DB_ALIAS,
+            help="Alias de la base de datos a verificar",
+        )
+        parser.add_argument(
+            "--wait",
+            type=float,
+            default=0,
+            help="Segundos máximos a esperar a que la base de datos responda",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=2,
+            help="Segundos entre reintentos",
+        )
+
+    def handle(self, *args, **options):
+        connection = connections[options["database"]]
+        deadline = time.monotonic() + options["wait"]
+
+        while True:
+            try:
+                start = time.perf_counter()
+                with connection.cursor() as cursor:
+                    cursor.execute("SELECT 1")
+                elapsed_ms = (time.perf_counter() - start) * 1000
+                break
+            except OperationalError as e:
+                connection.close()
+                if time.monotonic() + options["interval"] > deadline:
+                    raise CommandError(f"Base de datos no disponible: {e}")
+                self.stdout.write(
+                    "⏳ Base de datos no disponible - reintentando en "
+                    f"{options['interval']:g} segundos..."
+                )
+                time.sleep(options["interval"])
+
+        settings_dict = connection.settings_dict
+        pool = settings_dict.get("OPTIONS", {}).get("pool")
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"✅ Base de datos conectada ({connection.vendor}, {elapsed_ms:.1f} ms) - "
+                f"CONN_MAX_AGE={settings_dict['CONN_MAX_AGE']}, "
+                f"CONN_HEALTH_CHECKS={settings_dict['CONN_HEALTH_CHECKS']}, "
+                f"pool={'sí' if pool else 'no'}"
+            )
+        )
@@ -0,0 +1,450 @@
+"""
+Generador de datos sintéticos a escala de producción.
+
+Crea usuarios (con un método de pago cada uno), rifas, tickets e
+interacciones sobre los catálogos de seed_data, para reproducir localmente
+los planes de consulta con volúmenes reales:
+
+    python manage.py seed_data
+    python manage.py generate_load_data --users 100000 --raffles 3500 --seed 42
+
+Con la misma semilla y los mismos parámetros se generan los mismos datos.
+Las filas se insertan por lotes con bulk_create; en PostgreSQL los tickets
+(la tabla más grande) se cargan con COPY.
+
+Distribución de las rifas:
+- 70% activas con fecha futura, venta Beta(1.5, 3) (~33% vendido en promedio)
+- 20% sorteadas con fecha pasada, venta Beta(5, 2) y al menos el mínimo,
+  con ticket ganador
+- 10% canceladas sin tickets (los reembolsos eliminan los tickets)
+
+Los compradores siguen una distribución sesgada: pocos usuarios compran
+mucho y la mayoría compra poco.
+
+bulk_create y COPY no disparan signals: no se encolan sorteos ni recálculos
+de rating; el rating de los usuarios se calcula al final con un UPDATE.
+"""
+
+import csv
+import io
+import random
+import time
+from datetime import date, timedelta
+from decimal import Decimal
+
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.db.models import Avg, Case, OuterRef, Subquery, Value, When
+from django.utils import timezone
+
+from interactions.models import Interaction
+from location.models import City
+from raffle.models import Raffle
+from raffleInfo.models import PrizeType, StateRaffle
+from tickets.models import Ticket
+from user.models import User
+from userInfo.card_fingerprint import card_fingerprint
+from userInfo.models import DocumentType, Gender, PaymentMethod, PaymentMethodType
+
+# (cantidad de números, peso)
+NUMBER_AMOUNTS = ((100, 40), (1000, 35), (10000, 20), (100000, 5))
+NUMBER_PRICES = (1000, 2000, 5000, 10000, 20000)
+# El premio es precio x mínimo, acotado a lo que cabe en raffle_prize_amount
+_prize_field = Raffle._meta.get_field("raffle_prize_amount")
+MAX_PRIZE = 10 ** (_prize_field.max_digits - _prize_field.decimal_places) - 1
+# (código de estado, fragmento del nombre, peso, parámetros Beta de la venta)
+RAFFLE_PROFILES = (
+    ("ACT", "activ", 70, (1.5, 3)),
+    ("SOR", "sorte", 20, (5, 2)),
+    ("CAN", "cancel", 10, None),
+)
+COMMENTS = (
+    None,
+    "Todo perfecto",
+    "Entrega rápida del premio",
+    "Buena comunicación",
+    "Tardó en responder",
+)
+
+
+class Command(BaseCommand):
+    help = "Generar usuarios, rifas, tickets e interacciones sintéticos para pruebas de carga"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--users", type=int, default=1000)
+        parser.add_argument("--raffles", type=int, default=200)
+        parser.add_argument(
+            "--max-numbers",
+            type=int,
+            help="Tope de números por rifa (limita los tamaños de NUMBER_AMOUNTS)",
+        )
+        parser.add_argument(
+            "--interactions-per-user",
+            type=float,
+            default=2.0,
+            help="Calificaciones promedio emitidas por usuario (default: 2)",
+        )
+        parser.add_argument(
+            "--seed", type=int, default=42, help="Semilla aleatoria (default: 42)"
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=10000,
+            help="Filas por lote de inserción (default: 10000)",
+        )
+        parser.add_argument(
+            "--prefix",
+            default="load",
+            help="Prefijo de emails y documentos generados (default: load)",
+        )
+        parser.add_argument(
+            "--no-copy",
+            action="store_true",
+            help="No usar COPY en PostgreSQL (solo bulk_create)",
+        )
+
+    def handle(self, *args, **options):
+        self.rng = random.Random(options["seed"])
+        self.batch_size = options["batch_size"]
+        self.prefix = options["prefix"]
+        self.use_copy = connection.vendor == "postgresql" and not options["no_copy"]
+        self.now = timezone.now()
+        self.number_amounts = [
+            (amount, weight)
+            for amount, weight in NUMBER_AMOUNTS
+            if not options["max_numbers"] or amount <= options["max_numbers"]
+        ] or [(options["max_numbers"], 1)]
+
+        if User.objects.filter(email__startswith=f"{self.prefix}.").exists():
+            raise CommandError(
+                f"Ya existen usuarios con el prefijo '{self.prefix}'; usa otro --prefix"
+            )
+        self.load_catalogs()
+
+        start = time.perf_counter()
+        users, methods = self.step("usuarios", self.create_users, options["users"])
+        if len(users) < 2:
+            raise CommandError("Se necesitan al menos 2 usuarios")
+        raffles = self.step(
+            "rifas", self.create_raffles, options["raffles"], users, methods
+        )
+        self.step("tickets", self.create_tickets, raffles, users, methods)
+        self.step("ganadores", self.assign_winners, raffles)
+        self.step(
+            "interacciones",
+            self.create_interactions,
+            users,
+            options["interactions_per_user"],
+        )
+        self.step("ratings", self.update_ratings)
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"✅ Datos generados en {time.perf_counter() - start:.1f}s "
+                f"(semilla {options['seed']})"
+            )
+        )
+
+    def step(self, label, fn, *args):
+        start = time.perf_counter()
+        result = fn(*args)
+        self.stdout.write(f"  {label}: {time.perf_counter() - start:.1f}s")
+        return result
+
+    def load_catalogs(self):
+        self.cities = list(City.objects.filter(city_is_active=True))
+        self.genders = list(Gender.objects.filter(gender_is_active=True))
+        self.document_types = list(
+            DocumentType.objects.filter(document_type_is_active=True)
+        )
+        self.payment_types = list(
+            PaymentMethodType.objects.filter(payment_method_type_is_active=True)
+        )
+        self.prize_types = list(PrizeType.objects.filter(prize_type_is_active=True))
+        # Por código o por nombre, como en Raffle (seed_data usa ACTV/SORT/CANC)
+        self.states = {
+            code: StateRaffle.objects.filter(state_raffle_code__iexact=code).first()
+            or StateRaffle.objects.filter(state_raffle_name__icontains=name).first()
+            for code, name, _, _ in RAFFLE_PROFILES
+        }
+        catalogs = (
+            self.cities,
+            self.genders,
+            self.document_types,
+            self.payment_types,
+            self.prize_types,
+        )
+        if not all(catalogs) or not all(self.states.values()):
+            raise CommandError(
+                "Faltan catálogos base; ejecuta primero python manage.py seed_data"
+            )
+
+    def buyer_index(self, count):
+        """Índice de usuario sesgado hacia los primeros (compradores frecuentes)"""
+        return int(count * self.rng.random() ** 3)
+
+    # Usuarios y métodos de pago
+
+    def create_users(self, count):
+        # Un solo hash para todos: hashear millones de contraseñas no aporta
+        password = make_password("password123")
+        card_hash = card_fingerprint("4532123456789012")
+        rng = self.rng
+
+        users, methods = [], []
+        for offset in range(0, count, self.batch_size):
+            size = min(self.batch_size, count - offset)
+            batch = [
+                User(
+                    email=f"{self.prefix}.{i}@load.local",
+                    password=password,
+                    first_name=f"Nombre{i}",
+                    last_name=f"Apellido{i % 997}",
+                    document_number=f"{self.prefix}{i:010d}"[-20:],
+                    phone_number=f"3{rng.randrange(10**9):09d}",
+                    city=rng.choice(self.cities),
+                    gender=rng.choice(self.genders),
+                    document_type=rng.choice(self.document_types),
+                    date_joined=self.now - timedelta(days=rng.randrange(730)),
+                )
+                for i in range(offset, offset + size)
+            ]
+            with transaction.atomic():
+                User.objects.bulk_create(batch)
+                method_batch = [
+                    PaymentMethod(
+                        user=user,
+                        payment_method_type=rng.choice(self.payment_types),
+                        paymenth_method_holder_name=user.get_full_name(),
+                        paymenth_method_card_number_hash=card_hash,
+                        paymenth_method_expiration_date=date.today()
+                        + timedelta(days=rng.randrange(30, 1800)),
+                        last_digits=f"{rng.randrange(10000):04d}",
+                        payment_method_balance=Decimal(rng.randrange(0, 5000000)),
+                    )
+                    for user in batch
+                ]
+                PaymentMethod.objects.bulk_create(method_batch)
+            users.extend(user.pk for user in batch)
+            methods.extend(method.pk for method in method_batch)
+        return users, methods
+
+    # Rifas
+
+    def create_raffles(self, count, users, methods):
+        rng = self.rng
+        amounts, amount_weights = zip(*self.number_amounts)
+        profiles = [(code, beta) for code, _, _, beta in RAFFLE_PROFILES]
+        profile_weights = [weight for _, _, weight, _ in RAFFLE_PROFILES]
+
+        raffles = []
+        for offset in range(0, count, self.batch_size):
+            size = min(self.batch_size, count - offset)
+            batch, plans = [], []
+            for i in range(offset, offset + size):
+                code, beta = rng.choices(profiles, profile_weights)[0]
+                number_amount = rng.choices(amounts, amount_weights)[0]
+                minimum = max(1, int(number_amount * rng.uniform(0.2, 0.6)))
+                price = rng.choice(NUMBER_PRICES)
+
+                if code == "ACT":
+                    draw_date = self.now + timedelta(minutes=rng.randrange(60, 86400))
+                    sold = int(number_amount * rng.betavariate(*beta))
+                elif code == "SOR":
+                    draw_date = self.now - timedelta(minutes=rng.randrange(60, 525600))
+                    sold = max(minimum, int(number_amount * rng.betavariate(*beta)))
+                else:
+                    draw_date = self.now - timedelta(minutes=rng.randrange(60, 525600))
+                    sold = 0
+                start_date = draw_date - timedelta(days=rng.randrange(7, 90))
+
+                creator = rng.randrange(len(users))
+                batch.append(
+                    Raffle(
+                        raffle_name=f"Rifa {self.prefix} {i}",
+                        raffle_description=f"Rifa sintética número {i}",
+                        raffle_start_date=start_date,
+                        raffle_draw_date=draw_date,
+                        raffle_minimum_numbers_sold=minimum,
+                        raffle_number_amount=number_amount,
+                        raffle_number_price=Decimal(price),
+                        raffle_prize_amount=Decimal(min(price * minimum, MAX_PRIZE)),
+                        raffle_prize_type=rng.choice(self.prize_types),
+                        raffle_state=self.states[code],
+                        raffle_created_by_id=users[creator],
+                        raffle_creator_payment_method_id=methods[creator],
+                    )
+                )
+                plans.append((code, number_amount, sold))
+            with transaction.atomic():
+                Raffle.objects.bulk_create(batch)
+            raffles.extend(
+                (raffle.pk, code, number_amount, sold)
+                for raffle, (code, number_amount, sold) in zip(batch, plans)
+            )
+        return raffles
+
+    # Tickets
+
+    def ticket_rows(self, raffles, users, methods):
+        """(user_id, raffle_id, number, is_winner, payment_method_id) por ticket"""
+        rng = self.rng
+        user_count = len(users)
+        for raffle_id, code, number_amount, sold in raffles:
+            if not sold:
+                continue
+            numbers = rng.sample(range(1, number_amount + 1), sold)
+            winner = numbers[0] if code == "SOR" else None
+            for number in numbers:
+                buyer = self.buyer_index(user_count)
+                yield (
+                    users[buyer],
+                    raffle_id,
+                    number,
+                    number == winner,
+                    methods[buyer],
+                )
+
+    def create_tickets(self, raffles, users, methods):
+        rows = self.ticket_rows(raffles, users, methods)
+        insert = self.copy_tickets if self.use_copy else self.bulk_create_tickets
+        total, batch = 0, []
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= self.batch_size:
+                insert(batch)
+                total += len(batch)
+                batch = []
+        if batch:
+            insert(batch)
+            total += len(batch)
+        self.stdout.write(f"  {total} tickets")
+        return total
+
+    def bulk_create_tickets(self, rows):
+        with transaction.atomic():
+            Ticket.objects.bulk_create(
+                [
+                    Ticket(
+                        user_id=user_id,
+                        raffle_id=raffle_id,
+                        number=number,
+                        is_winner=is_winner,
+                        payment_method_id=method_id,
+                    )
+                    for user_id, raffle_id, number, is_winner, method_id in rows
+                ]
+            )
+
+    def copy_tickets(self, rows):
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        created_at = self.now.isoformat()
+        for user_id, raffle_id, number, is_winner, method_id in rows:
+            writer.writerow(
+                (
+                    user_id,
+                    raffle_id,
+                    number,
+                    "t" if is_winner else "f",
+                    method_id,
+                    created_at,
+                )
+            )
+        buffer.seek(0)
+
+        meta = Ticket._meta
+        columns = ", ".join(
+            meta.get_field(name).column
+            for name in (
+                "user",
+                "raffle",
+                "number",
+                "is_winner",
+                "payment_method",
+                "created_at",
+            )
+        )
+        sql = f"COPY {meta.db_table} ({columns}) FROM STDIN WITH (FORMAT csv)"
+        with transaction.atomic(), connection.cursor() as cursor:
+            if hasattr(cursor, "copy_expert"):  # psycopg2
+                cursor.copy_expert(sql, buffer)
+            else:  # psycopg 3
+                with cursor.copy(sql) as copy:
+                    copy.write(buffer.getvalue())
+
+    def assign_winners(self, raffles):
+        # Con .update(): instanciar Raffle(pk=...) dispararía check_raffle_on_load
+        sorted_ids = [raffle_id for raffle_id, code, _, _ in raffles if code == "SOR"]
+        updated = 0
+        for offset in range(0, len(sorted_ids), 500):
+            winners = Ticket.objects.filter(
+                raffle_id__in=sorted_ids[offset : offset + 500], is_winner=True
+            ).values_list("raffle_id", "pk", "user_id")
+            winner_user, winner_ticket = [], []
+            for raffle_id, ticket_id, user_id in winners:
+                winner_user.append(When(pk=raffle_id, then=Value(user_id)))
+                winner_ticket.append(When(pk=raffle_id, then=Value(ticket_id)))
+            if not winner_user:
+                continue
+            updated += Raffle.objects.filter(
+                pk__in=sorted_ids[offset : offset + 500]
+            ).update(
+                raffle_winner_id=Case(*winner_user),
+                raffle_winner_ticket_id=Case(*winner_ticket),
+            )
+        return updated
+
+    # Interacciones
+
+    def create_interactions(self, users, per_user):
+        rng = self.rng
+        user_count = len(users)
+        target = int(user_count * per_user)
+        seen = set()
+        batch, created = [], 0
+        # Límite de intentos por si la densidad pedida es imposible
+        for _ in range(target * 3):
+            if created + len(batch) >= target:
+                break
+            source = rng.randrange(user_count)
+            # Se califica sobre todo a organizadores frecuentes
+            dest = self.buyer_index(user_count)
+            if source == dest or (source, dest) in seen:
+                continue
+            seen.add((source, dest))
+            batch.append(
+                Interaction(
+                    interaction_source_user_id=users[source],
+                    interaction_target_user_id=users[dest],
+                    interaction_rating=float(
+                        rng.choices((1, 2, 3, 4, 5), (5, 5, 15, 35, 40))[0]
+                    ),
+                    interaction_comment=rng.choice(COMMENTS),
+                )
+            )
+            if len(batch) >= self.batch_size:
+                with transaction.atomic():
+                    Interaction.objects.bulk_create(batch)
+                created += len(batch)
+                batch = []
+        if batch:
+            with transaction.atomic():
+                Interaction.objects.bulk_create(batch)
+            created += len(batch)
+        return created
+
+    def update_ratings(self):
+        average = (
+            Interaction.objects.filter(
+                interaction_target_user=OuterRef("pk"), Interaction_is_active=True
+            )
+            .values("interaction_target_user")
+            .annotate(avg=Avg("interaction_rating"))
+            .values("avg")
+        )
+        return User.objects.filter(email__startswith=f"{self.prefix}.").update(
+            rating=Subquery(average)
+        )
@@ -0,0 +1,39 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from core.search import registry
+
+
+class Command(BaseCommand):
+    help = (
+        "Recalcular search_text y crear los índices de búsqueda "
+        "(trigram en PostgreSQL, FTS5 en SQLite)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "models",
+            nargs="*",
+            help=f"Modelos a reindexar (default: todos: {', '.join(registry)})",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=2000,
+            help="Filas actualizadas por consulta (default: 2000)",
+        )
+        parser.add_argument("--database", default="default")
+
+    def handle(self, *args, **options):
+        labels = options["models"] or list(registry)
+        unknown = [label for label in labels if label not in registry]
+        if unknown:
+            raise CommandError(f"Modelos sin índice de búsqueda: {', '.join(unknown)}")
+
+        for label in labels:
+            index = registry[label]
+            changed = index.rebuild(options["batch_size"], using=options["database"])
+            # Después de llenar la columna, para que FTS5 la indexe completa
+            index.install(options["database"])
+            self.stdout.write(
+                self.style.SUCCESS(f"✅ {label}: {changed} filas actualizadas")
+            )
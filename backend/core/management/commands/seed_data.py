@@ -299,7 +299,7 @@ class Command(BaseCommand):
 
         # Importar módulos necesarios
         from datetime import date, timedelta
-        from django.contrib.auth.hashers import make_password
+        from userInfo.card_fingerprint import card_fingerprint
         from userInfo.models import PaymentMethod
 
         card_number = "1234567890123456"
@@ -309,7 +309,7 @@ class Command(BaseCommand):
             user=admin_user,
             payment_method_type=debit_card_type,
             paymenth_method_holder_name="Cuenta Conjunta Sistema",
-            paymenth_method_card_number_hash=make_password(card_number),
+            paymenth_method_card_number_hash=card_fingerprint(card_number),
             paymenth_method_expiration_date=expiration,
             last_digits=card_number[-4:],
             payment_method_balance=10000000.00,  # 10 millones de saldo inicial
@@ -405,7 +405,7 @@ class Command(BaseCommand):
 
         # Importar módulos necesarios
         from datetime import date, timedelta
-        from django.contrib.auth.hashers import make_password
+        from userInfo.card_fingerprint import card_fingerprint
         from userInfo.models import PaymentMethod
 
         card_number = "4532123456789012"  # Número de tarjeta visa de prueba
@@ -415,7 +415,7 @@ class Command(BaseCommand):
             user=regular_user,
             payment_method_type=debit_card_type,
             paymenth_method_holder_name="Juan Carlos Pérez González",
-            paymenth_method_card_number_hash=make_password(card_number),
+            paymenth_method_card_number_hash=card_fingerprint(card_number),
             paymenth_method_expiration_date=expiration,
             last_digits=card_number[-4:],
             payment_method_balance=5000000.00,  # 5 millones de saldo inicial
@@ -0,0 +1,117 @@
+"""
+Compresión de respuestas de la API.
+
+Similar a django.middleware.gzip.GZipMiddleware pero configurable desde
+settings: umbral mínimo de tamaño, prefijos de ruta a los que se aplica y
+soporte opcional de Brotli (solo si el paquete ``brotli`` está instalado).
+
+Debe ir por encima de ConditionalGetMiddleware en MIDDLEWARE para que el ETag
+se calcule sobre el contenido sin comprimir.
+"""
+
+from django.conf import settings
+from django.utils.cache import patch_vary_headers
+from django.utils.deprecation import MiddlewareMixin
+from django.utils.regex_helper import _lazy_re_compile
+from django.utils.text import compress_sequence, compress_string
+
+try:
+    import brotli
+except ImportError:  # Brotli es opcional
+    brotli = None
+
+re_accepts_gzip = _lazy_re_compile(r"\bgzip\b")
+re_accepts_br = _lazy_re_compile(r"\bbr\b")
+
+# Nunca comprimir flujos en vivo: el compresor retendría los eventos
+UNCOMPRESSIBLE_CONTENT_TYPES = ("text/event-stream",)
+
+
+def _brotli_sequence(sequence, quality):
+    compressor = brotli.Compressor(quality=quality)
+    for chunk in sequence:
+        data = compressor.process(chunk)
+        if data:
+            yield data
+    yield compressor.finish()
+
+
+class CompressionMiddleware(MiddlewareMixin):
+    """
+    Comprime con Brotli o gzip las respuestas que:
+    - pertenecen a alguna ruta de COMPRESSION_PATH_PREFIXES
+    - tienen al menos COMPRESSION_MIN_SIZE bytes (las de streaming siempre)
+    - no traen ya un Content-Encoding
+    """
+
+    max_random_bytes = 100  # Mitigación BREACH, igual que GZipMiddleware
+
+    def process_response(self, request, response):
+        if not settings.COMPRESSION_ENABLED:
+            return response
+
+        if not request.path.startswith(tuple(settings.COMPRESSION_PATH_PREFIXES)):
+            return response
+
+        if response.get("Content-Type", "").startswith(UNCOMPRESSIBLE_CONTENT_TYPES):
+            return response
+
+        if (
+            not response.streaming
+            and len(response.content) < settings.COMPRESSION_MIN_SIZE
+        ):
+            return response
+
+        if response.has_header("Content-Encoding"):
+            return response
+
+        patch_vary_headers(response, ("Accept-Encoding",))
+
+        encoding = self._select_encoding(request.META.get("HTTP_ACCEPT_ENCODING", ""))
+        if encoding is None:
+            return response
+
+        if response.streaming:
+            if response.is_async:
+                # Los flujos asíncronos se dejan sin comprimir
+                return response
+            if encoding == "br":
+                response.streaming_content = _brotli_sequence(
+                    response.streaming_content, settings.COMPRESSION_BROTLI_QUALITY
+                )
+            else:
+                response.streaming_content = compress_sequence(
+                    response.streaming_content,
+                    max_random_bytes=self.max_random_bytes,
+                )
+            del response.headers["Content-Length"]
+        else:
+            compressed_content = self._compress(response.content, encoding)
+            # Solo si realmente reduce el tamaño
+            if len(compressed_content) >= len(response.content):
+                return response
+            response.content = compressed_content
+            response.headers["Content-Length"] = str(len(response.content))
+
+        etag = response.get("ETag")
+        if etag and etag.startswith('"'):
+            response.headers["ETag"] = "W/" + etag
+        response.headers["Content-Encoding"] = encoding
+
+        return response
+
+    def _select_encoding(self, accept_encoding):
+        if (
+            brotli is not None
+            and settings.COMPRESSION_BROTLI
+            and re_accepts_br.search(accept_encoding)
+        ):
+            return "br"
+        if re_accepts_gzip.search(accept_encoding):
+            return "gzip"
+        return None
+
+    def _compress(self, content, encoding):
+        if encoding == "br":
+            return brotli.compress(content, quality=settings.COMPRESSION_BROTLI_QUALITY)
+        return compress_string(content, max_random_bytes=self.max_random_bytes)
@@ -0,0 +1,71 @@
+"""
+Paginación con conteo acotado.
+
+PageNumberPagination cuenta todas las filas que cumplen el filtro en cada
+página; con búsquedas amplias sobre tablas grandes ese COUNT(*) cuesta más
+que la propia página. CappedPageNumberPagination cuenta como máximo
+max_count filas (COUNT sobre una subconsulta sin orden y con LIMIT) y lo
+informa en count_capped, así que el costo por página no depende del total.
+
+El límite del conteo llega al menos a una fila después de la página pedida:
+las páginas más allá de max_count siguen existiendo (con next mientras
+queden filas), y contar hasta ahí cuesta lo mismo que el OFFSET de la página.
+"""
+
+from django.core.paginator import Paginator
+from django.utils.functional import cached_property
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.response import Response
+
+
+class CappedPaginator(Paginator):
+    max_count = 1000
+    # Filas que cuenta como máximo; page() lo amplía según la página pedida
+    count_limit = None
+
+    @cached_property
+    def count(self):
+        # Sin ORDER BY la subconsulta se detiene al llegar al límite
+        limit = self.count_limit or self.max_count
+        return self.object_list.order_by()[:limit].count()
+
+    def page(self, number):
+        try:
+            depth = int(number) * self.per_page + 1
+        except (TypeError, ValueError):
+            depth = 0  # validate_number() responde el error
+        self.count_limit = max(self.max_count, depth)
+        # El conteo pudo calcularse antes con otro límite (page=last)
+        self.__dict__.pop("count", None)
+        self.__dict__.pop("num_pages", None)
+        return super().page(number)
+
+
+class CappedPageNumberPagination(PageNumberPagination):
+    page_size = 20
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    max_count = 1000
+
+    def django_paginator_class(self, object_list, per_page):
+        paginator = CappedPaginator(object_list, per_page)
+        paginator.max_count = self.max_count
+        return paginator
+
+    def get_paginated_response(self, data):
+        paginator = self.page.paginator
+        count = paginator.count
+        return Response(
+            {
+                "count": count,
+                "count_capped": count >= paginator.count_limit,
+                "next": self.get_next_link(),
+                "previous": self.get_previous_link(),
+                "results": data,
+            }
+        )
+
+    def get_paginated_response_schema(self, schema):
+        response = super().get_paginated_response_schema(schema)
+        response["properties"]["count_capped"] = {"type": "boolean"}
+        return response
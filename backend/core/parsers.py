@@ -0,0 +1,49 @@
+"""
+Parser JSON rápido para DRF.
+
+Usa orjson cuando está instalado; ante cualquier error delega en el módulo
+json estándar para devolver exactamente los mismos mensajes que JSONParser.
+"""
+
+from django.conf import settings
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.utils import json
+
+from .renderers import FastJSONRenderer
+
+try:
+    import orjson
+except ImportError:  # orjson es opcional
+    orjson = None
+
+
+class FastJSONParser(JSONParser):
+    """JSONParser basado en orjson (solo cuerpos UTF-8 y modo estricto)"""
+
+    renderer_class = FastJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get("encoding", settings.DEFAULT_CHARSET)
+
+        if (
+            orjson is None
+            or not self.strict
+            or encoding.lower().replace("_", "-") not in ("utf-8", "utf8")
+        ):
+            return super().parse(stream, media_type, parser_context)
+
+        data = stream.read()
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+
+        # orjson rechaza algunos JSON válidos (p. ej. enteros de más de 64 bits)
+        try:
+            return json.loads(
+                data.decode(encoding), parse_constant=json.strict_constant
+            )
+        except ValueError as exc:
+            raise ParseError("JSON parse error - %s" % str(exc))
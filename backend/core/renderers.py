@@ -0,0 +1,53 @@
+"""
+Renderer JSON rápido para DRF.
+
+Usa orjson cuando está instalado y, si no, el JSONRenderer de DRF. La salida
+es idéntica byte a byte a la de JSONRenderer: los tipos que DRF formatea de
+forma particular (datetime con "Z", Decimal, timedelta, cadenas perezosas...)
+se delegan al mismo JSONEncoder de DRF. La única diferencia es la notación de
+floats con exponente (1e16 en lugar de 1e+16), que representa el mismo valor.
+"""
+
+from rest_framework.renderers import JSONRenderer
+
+try:
+    import orjson
+except ImportError:  # orjson es opcional
+    orjson = None
+
+if orjson is not None:
+    # Las fechas pasan por el encoder de DRF para conservar su formato
+    ORJSON_OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    JSONRenderer basado en orjson.
+    Las respuestas indentadas (API navegable, ?indent) y los valores que
+    orjson no soporta (p. ej. enteros de más de 64 bits) usan el renderer de DRF.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+
+        renderer_context = renderer_context or {}
+        if (
+            orjson is None
+            or self.ensure_ascii
+            or not self.compact
+            or self.get_indent(accepted_media_type, renderer_context)
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = orjson.dumps(
+                data, default=self.encoder_class().default, option=ORJSON_OPTIONS
+            )
+        except (orjson.JSONEncodeError, TypeError):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # Igual que DRF: escapar los separadores de línea de JavaScript
+        return ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(
+            b"\xe2\x80\xa9", b"\\u2029"
+        )
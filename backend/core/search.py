@@ -0,0 +1,308 @@
+"""
+Búsqueda de texto sobre una columna normalizada (search_text).
+
+Cada modelo con búsqueda guarda en search_text sus campos de texto en
+minúsculas, sin tildes y con los espacios colapsados (search_document), y
+registra un SearchIndex con los campos de origen. La búsqueda exige que
+todos los términos aparezcan en search_text y ordena por relevancia:
+
+- PostgreSQL: LIKE '%término%' sobre un índice GIN gin_trgm_ops (pg_trgm) y
+  orden por word_similarity(). El índice se crea en post_migrate.
+- SQLite: tabla virtual FTS5 con tokenizador trigram, sincronizada con
+  triggers, y orden por coincidencia al inicio de palabra. Los términos de
+  menos de 3 letras se buscan con LIKE (el tokenizador trigram no los
+  indexa).
+- Sin índice (extensión o FTS5 no disponibles): LIKE con el mismo orden.
+
+Para llenar search_text en filas existentes: manage.py rebuild_search_index.
+"""
+
+import logging
+import unicodedata
+
+from django.apps import apps
+from django.db import DatabaseError, connections
+from django.db.models import Case, F, FloatField, Func, Q, TextField, Value, When
+from django.db.models.expressions import RawSQL
+from django.utils.functional import cached_property
+from rest_framework.filters import BaseFilterBackend
+from rest_framework.settings import api_settings
+
+logger = logging.getLogger(__name__)
+
+MAX_TERMS = 8
+FTS_MIN_TERM = 3  # El tokenizador trigram no indexa términos más cortos
+
+# Índices registrados (label del modelo -> SearchIndex)
+registry = {}
+
+
+def normalize(value):
+    """Texto en minúsculas, sin tildes ni espacios repetidos"""
+    text = unicodedata.normalize("NFKD", str(value))
+    text = "".join(char for char in text if not unicodedata.combining(char))
+    return " ".join(text.casefold().split())
+
+
+def search_document(*values):
+    """Contenido de search_text para los valores dados (omite los vacíos)"""
+    return " ".join(normalize(value) for value in values if value not in (None, ""))
+
+
+def search_terms(query):
+    return normalize(query).split()[:MAX_TERMS]
+
+
+class WordSimilarity(Func):
+    """word_similarity(búsqueda, texto) de pg_trgm"""
+
+    function = "WORD_SIMILARITY"
+    output_field = FloatField()
+
+
+class SearchIndex:
+    """
+    Índice de búsqueda de un modelo sobre su columna search_text.
+    - source_fields: campos que forman el documento
+    - match_pk: si la búsqueda es un número, también coincide con ese id
+    """
+
+    column = "search_text"
+
+    def __init__(self, model_label, source_fields, match_pk=False):
+        self.model_label = model_label
+        self.source_fields = tuple(source_fields)
+        self.match_pk = match_pk
+        # Capacidades detectadas por alias de conexión ("trgm", "fts" o None)
+        self.backends = {}
+        registry[model_label] = self
+
+    @cached_property
+    def model(self):
+        return apps.get_model(self.model_label)
+
+    @property
+    def table(self):
+        return self.model._meta.db_table
+
+    @property
+    def fts_table(self):
+        return f"{self.table}_fts"
+
+    def document(self, instance):
+        return search_document(
+            *(getattr(instance, field) for field in self.source_fields)
+        )
+
+    def prepare_save(self, instance, update_fields=None):
+        """
+        Recalcula search_text antes de save(). Retorna update_fields con la
+        columna agregada si cambió alguno de los campos de origen.
+        """
+        if update_fields is None:
+            setattr(instance, self.column, self.document(instance))
+        elif set(update_fields) & set(self.source_fields):
+            setattr(instance, self.column, self.document(instance))
+            update_fields = {*update_fields, self.column}
+        return update_fields
+
+    def fill(self, instances):
+        """search_text de instancias que no pasan por save() (bulk_create)"""
+        instances = list(instances)
+        for instance in instances:
+            setattr(instance, self.column, self.document(instance))
+        return instances
+
+    # Instalación
+
+    def install(self, using="default"):
+        """Crea el índice según el motor (idempotente)"""
+        connection = connections[using]
+        self.backends.pop(using, None)
+        try:
+            if connection.vendor == "postgresql":
+                self._install_postgresql(connection)
+            elif connection.vendor == "sqlite":
+                self._install_sqlite(connection)
+        except DatabaseError as exc:
+            logger.warning(
+                "No se pudo crear el índice de búsqueda de %s: %s",
+                self.model_label,
+                exc,
+            )
+
+    def _install_postgresql(self, connection):
+        with connection.cursor() as cursor:
+            cursor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+            cursor.execute(
+                f'CREATE INDEX IF NOT EXISTS "{self.table}_search_trgm" '
+                f'ON "{self.table}" USING gin ("{self.column}" gin_trgm_ops)'
+            )
+
+    def _install_sqlite(self, connection):
+        table, fts, column = self.table, self.fts_table, self.column
+        pk = self.model._meta.pk.column
+        delete_old = (
+            f'INSERT INTO "{fts}"("{fts}", rowid, "{column}") '
+            f'VALUES (\'delete\', old."{pk}", old."{column}");'
+        )
+        insert_new = (
+            f'INSERT INTO "{fts}"(rowid, "{column}") '
+            f'VALUES (new."{pk}", new."{column}");'
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'CREATE VIRTUAL TABLE IF NOT EXISTS "{fts}" USING fts5('
+                f"\"{column}\", content='{table}', content_rowid='{pk}', "
+                f"tokenize='trigram')"
+            )
+            cursor.execute(
+                f'CREATE TRIGGER IF NOT EXISTS "{fts}_ai" AFTER INSERT ON "{table}" '
+                f"BEGIN {insert_new} END"
+            )
+            cursor.execute(
+                f'CREATE TRIGGER IF NOT EXISTS "{fts}_ad" AFTER DELETE ON "{table}" '
+                f"BEGIN {delete_old} END"
+            )
+            cursor.execute(
+                f'CREATE TRIGGER IF NOT EXISTS "{fts}_au" '
+                f'AFTER UPDATE OF "{column}" ON "{table}" '
+                f"BEGIN {delete_old} {insert_new} END"
+            )
+            cursor.execute(f'INSERT INTO "{fts}"("{fts}") VALUES (\'rebuild\')')
+
+    def rebuild(self, batch_size=2000, using="default"):
+        """Recalcula search_text de todas las filas. Retorna cuántas cambiaron"""
+        manager = self.model._default_manager.using(using)
+        # values_list: sin instanciar modelos (ni sus señales post_init)
+        rows = manager.values_list("pk", self.column, *self.source_fields)
+        changed, batch = 0, {}
+        for pk, current, *values in rows.iterator(chunk_size=batch_size):
+            document = search_document(*values)
+            if current != document:
+                batch[pk] = document
+            if len(batch) >= batch_size:
+                changed += self._save_batch(manager, batch)
+                batch = {}
+        return changed + self._save_batch(manager, batch)
+
+    def _save_batch(self, manager, batch):
+        if batch:
+            manager.filter(pk__in=batch).update(
+                **{
+                    self.column: Case(
+                        *(When(pk=pk, then=Value(doc)) for pk, doc in batch.items()),
+                        output_field=TextField(),
+                    )
+                }
+            )
+        return len(batch)
+
+    # Consulta
+
+    def backend(self, using):
+        """Índice disponible en la conexión: "trgm", "fts" o None"""
+        if using not in self.backends:
+            connection = connections[using]
+            backend = None
+            if connection.vendor == "postgresql":
+                with connection.cursor() as cursor:
+                    cursor.execute(
+                        "SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'"
+                    )
+                    backend = "trgm" if cursor.fetchone() else None
+            elif connection.vendor == "sqlite":
+                if self.fts_table in connection.introspection.table_names():
+                    backend = "fts"
+            self.backends[using] = backend
+        return self.backends[using]
+
+    def prefix_rank(self, term):
+        """
+        Relevancia sin pg_trgm: primero los documentos que empiezan con el
+        término, luego los que tienen una palabra que empieza con él. (bm25
+        de FTS5 obliga a una subconsulta por fila y no escala.)
+        """
+        return Case(
+            When(**{f"{self.column}__startswith": term}, then=Value(2.0)),
+            When(**{f"{self.column}__contains": f" {term}"}, then=Value(1.0)),
+            default=Value(0.0),
+            output_field=FloatField(),
+        )
+
+    def search(self, queryset, query, match_fields=()):
+        """
+        Filtra el queryset por la búsqueda y lo ordena por relevancia
+        (anotación search_rank, mayor es mejor) y luego por su orden actual.
+        match_fields: campos fuera de search_text que también coinciden si
+        son exactamente iguales a la búsqueda (p. ej. datos privados que solo
+        un administrador puede buscar).
+        """
+        terms = search_terms(query)
+        if not terms:
+            return queryset
+
+        backend = self.backend(queryset.db)
+        contains = [
+            Q(**{f"{self.column}__contains": term})
+            for term in terms
+            if backend != "fts" or len(term) < FTS_MIN_TERM
+        ]
+        condition = Q()
+        for term_condition in contains:
+            condition &= term_condition
+
+        if backend == "fts":
+            match = " ".join(
+                '"{}"'.format(term.replace('"', '""'))
+                for term in terms
+                if len(term) >= FTS_MIN_TERM
+            )
+            if match:
+                fts = self.fts_table
+                condition &= Q(
+                    pk__in=RawSQL(
+                        f'SELECT rowid FROM "{fts}" WHERE "{fts}" MATCH %s', (match,)
+                    )
+                )
+
+        if backend == "trgm":
+            rank = WordSimilarity(Value(" ".join(terms)), F(self.column))
+        else:
+            rank = self.prefix_rank(terms[0])
+
+        if self.match_pk and len(terms) == 1 and terms[0].isdecimal():
+            condition |= Q(pk=int(terms[0]))
+        for field in match_fields:
+            condition |= Q(**{field: query.strip()})
+
+        ordering = queryset.query.order_by or self.model._meta.ordering
+        return (
+            queryset.filter(condition)
+            .annotate(search_rank=rank)
+            .order_by("-search_rank", *ordering)
+        )
+
+
+def install_search_indexes(sender, using="default", **kwargs):
+    """Receptor de post_migrate: crea los índices de los modelos de la app"""
+    for index in registry.values():
+        if index.model._meta.app_label == sender.label:
+            index.install(using)
+
+
+class SearchIndexFilter(BaseFilterBackend):
+    """
+    Reemplazo de SearchFilter que usa el SearchIndex de la vista
+    (atributo search_index) con el mismo parámetro ?search=. La vista puede
+    agregar coincidencias exactas con search_match_fields.
+    """
+
+    search_param = api_settings.SEARCH_PARAM
+
+    def filter_queryset(self, request, queryset, view):
+        query = request.query_params.get(self.search_param, "")
+        index = getattr(view, "search_index", None)
+        if index is None or not query.strip():
+            return queryset
+        return index.search(queryset, query, getattr(view, "search_match_fields", ()))
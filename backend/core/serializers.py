@@ -0,0 +1,66 @@
+"""
+Serializadores de solo lectura sobre filas de QuerySet.values().
+
+Pensados para listados públicos con muchas filas: no instancian modelos ni
+serializadores anidados por fila. Los formatos de Decimal, fechas y URLs de
+archivos se delegan a los campos de DRF, de modo que el JSON es idéntico al
+del ModelSerializer equivalente.
+"""
+
+from rest_framework import serializers
+
+_datetime_field = serializers.DateTimeField()
+_date_field = serializers.DateField()
+
+
+def format_datetime(value):
+    return None if value is None else _datetime_field.to_representation(value)
+
+
+def format_date(value):
+    return None if value is None else _date_field.to_representation(value)
+
+
+def decimal_formatter(model, field_name):
+    """Formato del DecimalField que generaría un ModelSerializer para el campo"""
+    model_field = model._meta.get_field(field_name)
+    field = serializers.DecimalField(
+        max_digits=model_field.max_digits, decimal_places=model_field.decimal_places
+    )
+
+    def format_decimal(value):
+        return None if value is None else field.to_representation(value)
+
+    return format_decimal
+
+
+class PlainSerializer(serializers.BaseSerializer):
+    """
+    Base para serializadores sobre .values().
+
+    Las subclases declaran en `values_fields` los campos que necesitan e
+    implementan to_representation(row, prefix=""). El prefijo permite
+    anidarlos: con prefix="raffle_winner__" se leen las claves
+    "raffle_winner__id", "raffle_winner__email", etc. de la misma fila.
+    """
+
+    values_fields = ()
+
+    @classmethod
+    def prefixed_fields(cls, prefix=""):
+        return tuple(f"{prefix}{name}" for name in cls.values_fields)
+
+    @classmethod
+    def values_queryset(cls, queryset):
+        """Aplica .values() con los campos que requiere el serializador"""
+        return queryset.values(*cls.prefixed_fields())
+
+    def file_url(self, name, storage):
+        """Igual que FileField.to_representation, a partir del nombre guardado"""
+        if not name:
+            return None
+        url = storage.url(name)
+        request = self.context.get("request")
+        if request is not None:
+            return request.build_absolute_uri(url)
+        return url
@@ -10,8 +10,10 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.2/ref/settings/
 """
 
+import importlib.util
 from pathlib import Path
 from dotenv import load_dotenv
+from django.core.exceptions import ImproperlyConfigured
 import os
 
 load_dotenv()  # take environment variables from .env.
@@ -30,6 +32,11 @@ DEBUG = os.getenv("DEBUG", "True") == "True"
 
 ALLOWED_HOSTS = ["*"]
 
+# Modo de servidor: "wsgi" (workers síncronos) o "asgi" (workers uvicorn), ver gunicorn.conf.py
+SERVER_MODE = os.getenv("SERVER_MODE", "wsgi")
+# Vistas asíncronas para los GET públicos de lectura (por defecto solo en modo ASGI)
+ASYNC_VIEWS = os.getenv("ASYNC_VIEWS", str(SERVER_MODE == "asgi")) == "True"
+
 
 # Application definition
 
@@ -50,14 +57,17 @@ INSTALLED_APPS = [
     "raffleInfo",
     "raffle",
     "tickets",
+    "jobs",
 ]
 
 AUTH_USER_MODEL = "user.User"
 
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
+    "core.middleware.CompressionMiddleware",  # Antes de ConditionalGet (ETag sin comprimir)
     "django.contrib.sessions.middleware.SessionMiddleware",
-    "corsheaders.middleware.CorsMiddleware",
+    "corsheaders.middleware.CorsMiddleware",  # Antes de ConditionalGet para que los 304 lleven CORS
+    "django.middleware.http.ConditionalGetMiddleware",  # ETag + 304 para respuestas GET
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
@@ -65,11 +75,36 @@ MIDDLEWARE = [
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
 
+# Compresión de respuestas (core.middleware.CompressionMiddleware)
+COMPRESSION_ENABLED = os.getenv("COMPRESSION_ENABLED", "True") == "True"
+COMPRESSION_MIN_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", "1024"))  # bytes
+COMPRESSION_PATH_PREFIXES = ("/api/",)
+COMPRESSION_BROTLI = os.getenv("COMPRESSION_BROTLI", "True") == "True"  # Si brotli está instalado
+COMPRESSION_BROTLI_QUALITY = int(os.getenv("COMPRESSION_BROTLI_QUALITY", "5"))
+
+# JWT sin consulta del usuario en peticiones de lectura (core/authentication.py)
+JWT_STATELESS_AUTH = os.getenv("JWT_STATELESS_AUTH", "False") == "True"
+JWT_USER_CACHE_TIMEOUT = int(os.getenv("JWT_USER_CACHE_TIMEOUT", "30"))  # segundos
+# Grupos de cada usuario devueltos en el login (se invalidan al cambiar)
+AUTH_GROUPS_CACHE_TIMEOUT = int(os.getenv("AUTH_GROUPS_CACHE_TIMEOUT", "3600"))
+
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "core.authentication.StatelessJWTAuthentication"
+        if JWT_STATELESS_AUTH
+        else "rest_framework_simplejwt.authentication.JWTAuthentication",
         "rest_framework.authentication.SessionAuthentication",
     ),
+    # Renderer y parser JSON basados en orjson (con fallback al de DRF)
+    "DEFAULT_RENDERER_CLASSES": (
+        "core.renderers.FastJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ),
+    "DEFAULT_PARSER_CLASSES": (
+        "core.parsers.FastJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ),
 }
 
 # Configuración de JWT
@@ -81,8 +116,16 @@ SIMPLE_JWT = {
     "ROTATE_REFRESH_TOKENS": True,  # Genera nuevo refresh token al refrescar
     "BLACKLIST_AFTER_ROTATION": True,  # Invalida el refresh token viejo
     "AUTH_HEADER_TYPES": ("Bearer",),  # Tipo de header: "Bearer <token>"
+    # Revocación con user/token_blacklist.py (no usa la app token_blacklist de simplejwt)
+    "TOKEN_REFRESH_SERIALIZER": "user.serializer.BlacklistTokenRefreshSerializer",
 }
 
+# Lista de refresh tokens revocados: filtro de Bloom por proceso delante de la base
+TOKEN_BLACKLIST_BLOOM_CAPACITY = int(os.getenv("TOKEN_BLACKLIST_BLOOM_CAPACITY", "1000000"))
+TOKEN_BLACKLIST_BLOOM_ERROR_RATE = float(os.getenv("TOKEN_BLACKLIST_BLOOM_ERROR_RATE", "0.001"))
+TOKEN_BLACKLIST_SYNC_INTERVAL = int(os.getenv("TOKEN_BLACKLIST_SYNC_INTERVAL", "5"))  # segundos
+TOKEN_BLACKLIST_REBUILD_INTERVAL = int(os.getenv("TOKEN_BLACKLIST_REBUILD_INTERVAL", "3600"))
+
 ROOT_URLCONF = "core.urls"
 
 TEMPLATES = [
@@ -113,9 +156,87 @@ DATABASES = {
         'PASSWORD': os.getenv('MYSQL_PASSWORD'),
         'HOST': os.getenv('MYSQL_HOST'),
         'PORT': os.getenv('MYSQL_PORT', '5432'),
+        # Conexiones persistentes: segundos que se reutiliza una conexión (0 = una por petición)
+        'CONN_MAX_AGE': int(os.getenv('DB_CONN_MAX_AGE', '60')),
+        # Verificar la conexión reutilizada al inicio de cada petición
+        'CONN_HEALTH_CHECKS': os.getenv('DB_CONN_HEALTH_CHECKS', 'True') == 'True',
+        'OPTIONS': {
+            'connect_timeout': int(os.getenv('DB_CONNECT_TIMEOUT', '10')),
+        },
     }
 }
 
+# Pool de conexiones nativo de Django 5 (requiere psycopg 3 con psycopg_pool)
+DB_POOL = os.getenv('DB_POOL', 'False') == 'True'
+if DB_POOL:
+    missing = [
+        module for module in ('psycopg', 'psycopg_pool')
+        if importlib.util.find_spec(module) is None
+    ]
+    if missing:
+        raise ImproperlyConfigured(
+            f"DB_POOL=True requiere {' y '.join(missing)} "
+            "(pip install 'psycopg[binary,pool]')"
+        )
+    DATABASES['default']['OPTIONS']['pool'] = {
+        'min_size': int(os.getenv('DB_POOL_MIN_SIZE', '2')),
+        'max_size': int(os.getenv('DB_POOL_MAX_SIZE', '10')),
+        'timeout': int(os.getenv('DB_POOL_TIMEOUT', '10')),
+    }
+    # Django no permite combinar el pool con conexiones persistentes
+    DATABASES['default']['CONN_MAX_AGE'] = 0
+
+# Caché
+# Por defecto en memoria del proceso (desarrollo). En producción debe ser compartida
+# entre procesos, p. ej. CACHE_BACKEND=django.core.cache.backends.redis.RedisCache y
+# CACHE_LOCATION=redis://redis:6379/0; manage.py check --deploy falla si no lo es
+CACHES = {
+    "default": {
+        "BACKEND": os.getenv(
+            "CACHE_BACKEND", "django.core.cache.backends.locmem.LocMemCache"
+        ),
+        "LOCATION": os.getenv("CACHE_LOCATION", "rifasplus"),
+        "TIMEOUT": int(os.getenv("CACHE_TIMEOUT", "300")),
+    }
+}
+
+# Tiempo de vida (segundos) de los catálogos de referencia cacheados
+CATALOG_CACHE_TIMEOUT = int(os.getenv("CATALOG_CACHE_TIMEOUT", "3600"))
+
+# Feed de rifas activas de la página de inicio (raffle/feed.py); se actualiza
+# con cada cambio, el tiempo de vida solo acota los cambios hechos sin signals
+RAFFLE_FEED_CACHE_TIMEOUT = int(os.getenv("RAFFLE_FEED_CACHE_TIMEOUT", "300"))
+
+# Eventos en vivo de las rifas (SSE, requiere SERVER_MODE=asgi)
+SSE_ENABLED = os.getenv("SSE_ENABLED", str(SERVER_MODE == "asgi")) == "True"  # si no, /events/ responde 501
+SSE_HEARTBEAT_INTERVAL = int(os.getenv("SSE_HEARTBEAT_INTERVAL", "15"))  # segundos
+SSE_HISTORY_SIZE = int(os.getenv("SSE_HISTORY_SIZE", "100"))  # eventos por rifa para reconexiones
+SSE_QUEUE_SIZE = int(os.getenv("SSE_QUEUE_SIZE", "1000"))  # eventos pendientes por cliente
+SSE_SNAPSHOT_INTERVAL = int(os.getenv("SSE_SNAPSHOT_INTERVAL", "60"))  # segundos entre snapshots de resincronización (0 = nunca)
+# Redis pub/sub para repartir los eventos entre procesos (web, worker, programador); vacío = solo en proceso
+SSE_REDIS_URL = os.getenv("SSE_REDIS_URL", "")
+
+# Cola de tareas en segundo plano (manage.py run_worker)
+JOB_RETRY_BACKOFF = int(os.getenv("JOB_RETRY_BACKOFF", "10"))  # segundos, se duplica en cada reintento
+JOB_RETRY_BACKOFF_MAX = int(os.getenv("JOB_RETRY_BACKOFF_MAX", "3600"))
+# Segundos en "running" tras los que una tarea se da por abandonada y vuelve a
+# la cola; debe superar la duración de la tarea más larga
+JOB_LEASE_TIMEOUT = int(os.getenv("JOB_LEASE_TIMEOUT", "900"))
+JOB_RETENTION_DAYS = int(os.getenv("JOB_RETENTION_DAYS", "7"))  # tareas terminadas
+
+# Huellas HMAC de números de tarjeta (userInfo/card_fingerprint.py)
+# CARD_FINGERPRINT_KEYS="1:clave-vieja,2:clave-nueva". Sin configurar se usa SECRET_KEY
+# (desarrollo y tests); manage.py check --deploy lo rechaza (core.E002)
+CARD_FINGERPRINT_KEYS = dict(
+    item.split(":", 1) for item in os.getenv("CARD_FINGERPRINT_KEYS", "").split(",") if ":" in item
+) or {"1": SECRET_KEY}
+# Versión con la que se generan las huellas nuevas (por defecto la última de la lista)
+CARD_FINGERPRINT_VERSION = os.getenv("CARD_FINGERPRINT_VERSION", list(CARD_FINGERPRINT_KEYS)[-1])
+
+# Exportaciones en streaming (CSV/JSONL)
+EXPORT_CHUNK_SIZE = int(os.getenv("EXPORT_CHUNK_SIZE", "2000"))  # filas por lectura del cursor
+EXPORT_BATCH_SIZE = int(os.getenv("EXPORT_BATCH_SIZE", "500"))  # filas por bloque de respuesta
+
 # Usar SQLite en memoria para tests (mucho más rápido)
 import sys
 if 'test' in sys.argv or 'pytest' in sys.modules:
@@ -125,6 +246,37 @@ if 'test' in sys.argv or 'pytest' in sys.modules:
             'NAME': ':memory:',
         }
     }
+    # Sin caché compartida entre tests (los rollbacks no disparan señales)
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.dummy.DummyCache",
+        }
+    }
+
+# Hasher de contraseñas (core/hashers.py): "scrypt" (por defecto), "argon2" o "pbkdf2".
+# El primero de la lista hashea las contraseñas nuevas; los demás solo verifican y,
+# al iniciar sesión, los hashes viejos o con otros parámetros se rehashean.
+PASSWORD_HASHER = os.getenv("PASSWORD_HASHER", "scrypt")
+PASSWORD_SCRYPT_WORK_FACTOR = int(os.getenv("PASSWORD_SCRYPT_WORK_FACTOR", str(2**14)))  # N, potencia de 2
+PASSWORD_SCRYPT_BLOCK_SIZE = int(os.getenv("PASSWORD_SCRYPT_BLOCK_SIZE", "8"))  # r
+PASSWORD_SCRYPT_PARALLELISM = int(os.getenv("PASSWORD_SCRYPT_PARALLELISM", "1"))  # p
+PASSWORD_ARGON2_TIME_COST = int(os.getenv("PASSWORD_ARGON2_TIME_COST", "2"))
+PASSWORD_ARGON2_MEMORY_COST = int(os.getenv("PASSWORD_ARGON2_MEMORY_COST", "19456"))  # KiB
+PASSWORD_ARGON2_PARALLELISM = int(os.getenv("PASSWORD_ARGON2_PARALLELISM", "1"))
+PASSWORD_PBKDF2_ITERATIONS = int(os.getenv("PASSWORD_PBKDF2_ITERATIONS", "1000000"))
+
+_PASSWORD_HASHERS = {
+    "scrypt": "core.hashers.TunedScryptPasswordHasher",
+    "pbkdf2": "core.hashers.TunedPBKDF2PasswordHasher",
+}
+# Argon2 solo si argon2-cffi está instalado
+if importlib.util.find_spec("argon2") is not None:
+    _PASSWORD_HASHERS["argon2"] = "core.hashers.TunedArgon2PasswordHasher"
+if PASSWORD_HASHER not in _PASSWORD_HASHERS:
+    PASSWORD_HASHER = "scrypt"
+PASSWORD_HASHERS = [_PASSWORD_HASHERS.pop(PASSWORD_HASHER), *_PASSWORD_HASHERS.values()] + [
+    "django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher",
+]
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
@@ -166,6 +318,14 @@ STATIC_ROOT = os.path.join(BASE_DIR, "staticfiles")
 # Media files (User uploaded content)
 MEDIA_URL = "/media/"
 MEDIA_ROOT = os.path.join(BASE_DIR, "media")
+# Servir MEDIA_URL desde Django (por defecto solo con DEBUG)
+SERVE_MEDIA = os.getenv("SERVE_MEDIA", str(DEBUG)) == "True"
+
+# Imágenes de las rifas (raffle/images.py): validación de la subida y
+# calidad de las variantes WebP que genera el worker
+RAFFLE_IMAGE_MAX_UPLOAD_SIZE = int(os.getenv("RAFFLE_IMAGE_MAX_UPLOAD_SIZE", "10485760"))  # bytes (10 MB)
+RAFFLE_IMAGE_MAX_PIXELS = int(os.getenv("RAFFLE_IMAGE_MAX_PIXELS", "40000000"))
+RAFFLE_IMAGE_WEBP_QUALITY = int(os.getenv("RAFFLE_IMAGE_WEBP_QUALITY", "80"))
 
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
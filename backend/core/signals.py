@@ -0,0 +1,57 @@
+from django.contrib.auth.models import Group
+from django.db.models.signals import m2m_changed, post_delete, post_save
+
+from location.models import City, Country, State
+from user.models import User
+from userInfo.models import DocumentType, Gender
+
+from .authentication import invalidate_group_names, invalidate_user_state
+from .catalogs import bump_generation
+
+CATALOG_MODELS = (Country, State, City, Gender, DocumentType)
+
+
+def invalidate_catalogs(sender, **kwargs):
+    """
+    Invalida los catálogos cacheados cuando cambia cualquiera de sus modelos
+    """
+    bump_generation()
+
+
+for model in CATALOG_MODELS:
+    post_save.connect(invalidate_catalogs, sender=model)
+    post_delete.connect(invalidate_catalogs, sender=model)
+
+
+def invalidate_user(sender, instance, **kwargs):
+    """
+    Descarta los permisos cacheados del usuario (StatelessJWTAuthentication)
+    para que una desactivación se aplique de inmediato
+    """
+    invalidate_user_state(instance.pk)
+
+
+post_save.connect(invalidate_user, sender=User)
+post_delete.connect(invalidate_user, sender=User)
+
+
+def invalidate_user_groups(sender, instance, action, reverse, pk_set, **kwargs):
+    """Invalida los grupos cacheados al agregar o quitar usuarios de grupos"""
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    if not reverse:
+        invalidate_group_names([instance.pk])
+    elif pk_set:
+        invalidate_group_names(pk_set)
+    else:
+        # group.user_set.clear() no informa qué usuarios tenía
+        invalidate_group_names()
+
+
+def invalidate_all_groups(sender, **kwargs):
+    invalidate_group_names()
+
+
+m2m_changed.connect(invalidate_user_groups, sender=User.groups.through)
+post_save.connect(invalidate_all_groups, sender=Group)
+post_delete.connect(invalidate_all_groups, sender=Group)
@@ -0,0 +1,62 @@
+"""
+Almacenamiento de archivos direccionado por contenido.
+
+ContentAddressedStorage guarda cada archivo con el SHA-256 de su contenido
+como nombre, conservando solo el primer directorio y la extensión del nombre
+propuesto por upload_to:
+
+    raffles/upload.jpg -> raffles/3f/3fa4...9c.jpg
+
+Subir dos veces la misma imagen no crea otra copia: si el archivo ya existe
+se reutiliza. Como el contenido de una URL nunca cambia, se puede cachear
+sin revalidar (serve_media agrega Cache-Control immutable). Por lo mismo un
+archivo puede estar referenciado por varias filas: no se borra al reemplazar
+la imagen, sino cuando ya nadie lo usa (manage.py gc_raffle_images).
+"""
+
+import hashlib
+import os
+import re
+import uuid
+
+from django.core.files.storage import FileSystemStorage
+from django.views.static import serve
+
+HASH_NAME = re.compile(r"^[^/]+/([0-9a-f]{2})/\1[0-9a-f]{62}(\.\w+)?$")
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+class ContentAddressedStorage(FileSystemStorage):
+    def content_name(self, name, content):
+        """Nombre final del archivo: <directorio>/<hash[:2]>/<hash>.<ext>"""
+        digest = hashlib.sha256()
+        for chunk in content.chunks():
+            digest.update(chunk)
+        digest = digest.hexdigest()
+        directory = name.replace("\\", "/").split("/", 1)[0]
+        ext = os.path.splitext(name)[1].lower()
+        return f"{directory}/{digest[:2]}/{digest}{ext}"
+
+    def _save(self, name, content):
+        name = self.content_name(name, content)
+        if self.exists(name):
+            # Se renueva la fecha para que la limpieza de archivos sin uso no
+            # lo borre justo cuando vuelve a referenciarse
+            os.utime(self.path(name))
+            return name
+        # Se escribe aparte y se renombra: nadie ve el archivo a medio escribir
+        # y si otro proceso sube el mismo contenido, el reemplazo es idéntico
+        temp_name = super()._save(f"{name}.{uuid.uuid4().hex}.tmp", content)
+        os.replace(self.path(temp_name), self.path(name))
+        return name
+
+
+def serve_media(request, path, document_root=None):
+    """
+    Sirve MEDIA_ROOT; los archivos direccionados por contenido se marcan
+    como inmutables para que el navegador y los proxies no los revaliden.
+    """
+    response = serve(request, path, document_root=document_root)
+    if HASH_NAME.match(path):
+        response["Cache-Control"] = IMMUTABLE_CACHE_CONTROL
+    return response
@@ -15,17 +15,22 @@ Including another URLconf
     2. Add a URL to urlpatterns:  path('blog/', include('blog.urls'))
 """
 
+import re
+
 from django.contrib import admin
-from django.urls import path, include
+from django.urls import path, include, re_path
 from django.conf import settings
-from django.conf.urls.static import static
 from rest_framework_simplejwt.views import (
     TokenObtainPairView,
     TokenRefreshView,
 )
 
+from .storage import serve_media
+from .views import BootstrapView
+
 urlpatterns = [
     path("admin/", admin.site.urls),
+    path("api/v1/bootstrap/", BootstrapView.as_view(), name="bootstrap"),
     path("api/v1/auth/", include("user.urls")),
     path("api/v1/location/", include("location.urls")),
     path("api/v1/user-info/", include("userInfo.urls")),
@@ -35,6 +40,13 @@ urlpatterns = [
     path("api/v1/tickets/", include("tickets.urls")),
 ]
 
-# Servir archivos media en desarrollo
-if settings.DEBUG:
-    urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
+# Servir archivos media en desarrollo (o sin otro servidor delante, SERVE_MEDIA);
+# los direccionados por contenido se sirven con caché inmutable
+if settings.SERVE_MEDIA:
+    urlpatterns += [
+        re_path(
+            rf"^{re.escape(settings.MEDIA_URL.lstrip('/'))}(?P<path>.*)$",
+            serve_media,
+            {"document_root": settings.MEDIA_ROOT},
+        )
+    ]
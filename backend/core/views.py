@@ -0,0 +1,41 @@
+from rest_framework.exceptions import ValidationError
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from .catalogs import get_bootstrap_payload
+
+
+def _parse_id(params, name):
+    value = params.get(name)
+    if not value:
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        raise ValidationError({name: f"Invalid {name} ID format"})
+
+
+class BootstrapView(APIView):
+    """
+    Catálogos de referencia para los formularios de registro y perfil
+    GET /api/v1/bootstrap/?country=<id>&state=<id>
+
+    La respuesta incluye un hash de versión que también se envía como ETag;
+    ConditionalGetMiddleware responde 304 si el cliente manda If-None-Match
+    con esa versión.
+    """
+
+    permission_classes = [AllowAny]
+    authentication_classes = []
+
+    def get(self, request, *args, **kwargs):
+        country_id = _parse_id(request.query_params, "country")
+        state_id = _parse_id(request.query_params, "state")
+
+        payload = get_bootstrap_payload(country_id, state_id)
+
+        response = Response(payload)
+        response["ETag"] = f'"{payload["version"]}"'
+        response["Cache-Control"] = "public, max-age=0, must-revalidate"
+        return response
@@ -0,0 +1,15 @@
+#!/bin/bash
+# Entrypoint del worker y del programador: solo esperan la base de datos y
+# las migraciones (las aplica el contenedor backend con docker-entrypoint.sh)
+set -e
+
+echo "🔄 Esperando a que la base de datos esté lista..."
+python manage.py check_db --wait "${DB_WAIT_TIMEOUT:-120}"
+
+echo "🔄 Esperando a que el backend aplique las migraciones..."
+until python manage.py migrate --check > /dev/null 2>&1; do
+    sleep 2
+done
+
+echo "🚀 Iniciando: $*"
+exec "$@"
@@ -2,32 +2,17 @@
 set -e
 
 echo "🔄 Esperando a que la base de datos esté lista..."
-until python << END
-import sys
-import psycopg2
-try:
-    conn = psycopg2.connect(
-        dbname="${MYSQL_DATABASE}",
-        user="${MYSQL_USER}",
-        password="${MYSQL_PASSWORD}",
-        host="${MYSQL_HOST}",
-        port="${MYSQL_PORT}"
-    )
-    conn.close()
-    sys.exit(0)
-except psycopg2.OperationalError:
-    sys.exit(1)
-END
-do
-  echo "⏳ Base de datos no disponible - reintentando en 2 segundos..."
-  sleep 2
-done
+python manage.py check_db --wait "${DB_WAIT_TIMEOUT:-120}"
 
-echo "✅ Base de datos conectada"
+echo "🔄 Verificando la configuración de despliegue..."
+python manage.py check --deploy --fail-level ERROR
 
 echo "🔄 Ejecutando migraciones..."
 python manage.py migrate --noinput
 
+echo "🔄 Actualizando índices de búsqueda..."
+python manage.py rebuild_search_index
+
 echo "🔄 Recolectando archivos estáticos..."
 python manage.py collectstatic --noinput --clear
 
@@ -0,0 +1,20 @@
+"""
+Configuración de gunicorn.
+
+SERVER_MODE=wsgi (por defecto): workers síncronos sobre core.wsgi.
+SERVER_MODE=asgi: workers de uvicorn sobre core.asgi; las vistas públicas de
+lectura pasan a ser asíncronas (ASYNC_VIEWS) y los clientes lentos no ocupan
+un worker completo.
+"""
+
+import os
+
+bind = os.getenv("GUNICORN_BIND", "0.0.0.0:8000")
+workers = int(os.getenv("GUNICORN_WORKERS", "3"))
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "30"))
+
+if os.getenv("SERVER_MODE", "wsgi") == "asgi":
+    wsgi_app = "core.asgi:application"
+    worker_class = "uvicorn_worker.UvicornWorker"
+else:
+    wsgi_app = "core.wsgi:application"
@@ -0,0 +1,40 @@
+"""
+Tareas en segundo plano de las interacciones.
+"""
+
+from django.db.models import Avg
+
+from jobs.registry import enqueue, job
+from raffle.feed import schedule_organizer_update
+from user.models import User
+
+UPDATE_USER_RATING = "interactions.update_user_rating"
+
+
+def enqueue_update_user_rating(user_id):
+    """
+    Encola el recálculo del rating; varios cambios seguidos se agrupan en uno.
+    Si el recálculo ya está corriendo se repite al terminar, para no perder
+    un cambio que llegó después de leer las calificaciones.
+    """
+    return enqueue(
+        UPDATE_USER_RATING,
+        {"user_id": user_id},
+        key=f"{UPDATE_USER_RATING}:{user_id}",
+        requeue_running=True,
+    )
+
+
+@job(UPDATE_USER_RATING)
+def update_user_rating(user_id):
+    """Recalcula el promedio de calificaciones activas del usuario"""
+    from .models import Interaction
+
+    # Puede ser None si no hay calificaciones activas
+    avg_rating = Interaction.objects.filter(
+        interaction_target_user_id=user_id, Interaction_is_active=True
+    ).aggregate(Avg("interaction_rating"))["interaction_rating__avg"]
+
+    User.objects.filter(pk=user_id).update(rating=avg_rating)
+    # update() no dispara post_save: la calificación del feed se actualiza aquí
+    schedule_organizer_update(user_id)
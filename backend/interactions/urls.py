@@ -1,11 +1,16 @@
 from django.urls import include, path
 from rest_framework.routers import DefaultRouter
 
-from .views import InteractionViewSet
+from .views import InteractionExportView, InteractionViewSet
 
 router = DefaultRouter()
 router.register(r"", InteractionViewSet)
 
 urlpatterns = [
+    path(
+        "export/<str:fmt>/",
+        InteractionExportView.as_view(),
+        name="interaction-export",
+    ),  # GET - Exportar calificaciones CSV/JSONL (admin)
     path("", include(router.urls)),
 ]
@@ -4,6 +4,7 @@ from rest_framework import status, viewsets
 from rest_framework.decorators import action
 from rest_framework.response import Response
 
+from core.exports import StreamingExportView
 from permissions.permissions import IsOwnerOrReadOnly
 
 from .models import Interaction
@@ -65,3 +66,25 @@ class InteractionViewSet(viewsets.ModelViewSet):
         Asigna el usuario actual como fuente de la interacción
         """
         serializer.save(interaction_source_user=self.request.user)
+
+
+class InteractionExportView(StreamingExportView):
+    """
+    Exportación de calificaciones para administradores (CSV o JSONL en streaming)
+    """
+
+    filename = "interactions"
+    export_fields = (
+        ("id", "id"),
+        ("source_user_id", "interaction_source_user_id"),
+        ("source_user_email", "interaction_source_user__email"),
+        ("target_user_id", "interaction_target_user_id"),
+        ("target_user_email", "interaction_target_user__email"),
+        ("rating", "interaction_rating"),
+        ("comment", "interaction_comment"),
+        ("is_active", "Interaction_is_active"),
+        ("created_at", "interaction_created_at"),
+    )
+
+    def get_queryset(self):
+        return Interaction.objects.order_by("pk")
@@ -0,0 +1,104 @@
+import logging
+import threading
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DatabaseError, connections
+
+from jobs.worker import housekeeping, run_pending
+
+logger = logging.getLogger(__name__)
+
+# Segundos entre dos pasadas de mantenimiento de la cola
+HOUSEKEEPING_INTERVAL = 60
+
+
+class Command(BaseCommand):
+    help = "Ejecutar las tareas en segundo plano encoladas en la base de datos"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=1,
+            help="Cantidad de hilos que ejecutan tareas en paralelo (default: 1)",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Vaciar la cola una vez y terminar",
+        )
+        parser.add_argument(
+            "--sleep",
+            type=float,
+            default=1.0,
+            help="Segundos de espera cuando no hay tareas (default: 1)",
+        )
+        parser.add_argument(
+            "--max-jobs",
+            type=int,
+            default=None,
+            help="Terminar después de ejecutar esta cantidad de tareas (por hilo)",
+        )
+
+    def handle(self, *args, **options):
+        concurrency = options["concurrency"]
+        if concurrency < 1:
+            raise CommandError("--concurrency debe ser al menos 1")
+
+        stop = threading.Event()
+        totals = [0] * concurrency
+
+        if concurrency == 1:
+            self.work(0, totals, stop, options)
+        else:
+            threads = [
+                threading.Thread(
+                    target=self.work,
+                    args=(index, totals, stop, options),
+                    name=f"run_worker-{index}",
+                )
+                for index in range(concurrency)
+            ]
+            for thread in threads:
+                thread.start()
+            try:
+                for thread in threads:
+                    thread.join()
+            except KeyboardInterrupt:
+                # Terminar las tareas en curso antes de salir
+                stop.set()
+                for thread in threads:
+                    thread.join()
+
+        self.stdout.write(self.style.SUCCESS(f"Tareas ejecutadas: {sum(totals)}"))
+
+    def work(self, index, totals, stop, options):
+        """Bucle de un hilo: ejecuta tareas y espera cuando la cola está vacía"""
+        max_jobs = options["max_jobs"]
+        next_housekeeping = 0
+        try:
+            while not stop.is_set():
+                remaining = None if max_jobs is None else max_jobs - totals[index]
+                try:
+                    # Solo el primer hilo hace el mantenimiento de la cola
+                    if index == 0 and time.monotonic() >= next_housekeeping:
+                        housekeeping()
+                        next_housekeeping = time.monotonic() + HOUSEKEEPING_INTERVAL
+                    totals[index] += run_pending(limit=remaining, stop=stop)
+                except DatabaseError as e:
+                    # Caída de la base de datos: reconectar en la siguiente vuelta
+                    logger.error(f"Error de base de datos en el worker: {e}")
+                    connections.close_all()
+                    stop.wait(options["sleep"])
+                    continue
+                if options["once"] or (
+                    max_jobs is not None and totals[index] >= max_jobs
+                ):
+                    break
+                stop.wait(options["sleep"])
+        except KeyboardInterrupt:
+            stop.set()
+        finally:
+            if threading.current_thread() is not threading.main_thread():
+                connections.close_all()
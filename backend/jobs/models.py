@@ -0,0 +1,68 @@
+from django.db import models
+from django.utils import timezone
+
+
+class Job(models.Model):
+    """
+    Tarea en segundo plano guardada en la base de datos.
+    Se crea en la misma transacción que el cambio que la origina y la
+    ejecuta el comando run_worker.
+    """
+
+    PENDING = "pending"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+    STATUS_CHOICES = [
+        (PENDING, "Pendiente"),
+        (RUNNING, "En ejecución"),
+        (DONE, "Terminada"),
+        (FAILED, "Fallida"),
+    ]
+    ACTIVE_STATUSES = (PENDING, RUNNING)
+
+    name = models.CharField(max_length=100, verbose_name="Tarea")
+    payload = models.JSONField(default=dict, blank=True, verbose_name="Argumentos")
+    idempotency_key = models.CharField(
+        max_length=200,
+        blank=True,
+        null=True,
+        verbose_name="Clave de idempotencia",
+        help_text="Evita encolar dos veces la misma tarea mientras esté pendiente",
+    )
+    status = models.CharField(
+        max_length=10, choices=STATUS_CHOICES, default=PENDING, verbose_name="Estado"
+    )
+    run_again = models.BooleanField(
+        default=False,
+        verbose_name="Repetir al terminar",
+        help_text="Se volvió a encolar mientras se ejecutaba: vuelve a la cola al terminar",
+    )
+    attempts = models.PositiveIntegerField(default=0, verbose_name="Intentos")
+    max_attempts = models.PositiveIntegerField(
+        default=3, verbose_name="Máximo de intentos"
+    )
+    run_at = models.DateTimeField(default=timezone.now, verbose_name="Ejecutar desde")
+    last_error = models.TextField(blank=True, default="", verbose_name="Último error")
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name="Creada")
+    updated_at = models.DateTimeField(auto_now=True, verbose_name="Actualizada")
+
+    class Meta:
+        verbose_name = "Tarea"
+        verbose_name_plural = "Tareas"
+        ordering = ["run_at", "id"]
+        constraints = [
+            # Solo una tarea activa por clave; las terminadas no bloquean
+            models.UniqueConstraint(
+                fields=["idempotency_key"],
+                condition=models.Q(status__in=("pending", "running")),
+                name="unique_active_job_key",
+            )
+        ]
+        indexes = [
+            models.Index(fields=["status", "run_at"]),
+            models.Index(fields=["idempotency_key", "status"]),
+        ]
+
+    def __str__(self):
+        return f"{self.name} #{self.pk} ({self.status})"
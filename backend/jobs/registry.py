@@ -0,0 +1,96 @@
+"""
+Registro de tareas en segundo plano y API para encolarlas.
+
+    from jobs.registry import enqueue, job
+
+    @job("raffle.process_expired")
+    def process_expired_raffle(raffle_id):
+        ...
+
+    enqueue("raffle.process_expired", {"raffle_id": 1}, key="raffle:1")
+    enqueue("raffle.process_expired", {"raffle_id": 2}, delay=60)
+
+Los handlers reciben el payload como argumentos con nombre y deben ser
+idempotentes: una tarea puede reintentarse tras un fallo parcial.
+"""
+
+from datetime import timedelta
+
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+
+from .models import Job
+
+_registry = {}
+
+
+def job(name, max_attempts=3):
+    """Decorador que registra un handler con el nombre de la tarea"""
+
+    def decorator(func):
+        _registry[name] = (func, max_attempts)
+        return func
+
+    return decorator
+
+
+def get_handler(name):
+    """Retorna (handler, max_attempts). Lanza KeyError si no está registrada"""
+    return _registry[name]
+
+
+def enqueue(
+    name,
+    payload=None,
+    key=None,
+    run_at=None,
+    delay=None,
+    retry_failed=True,
+    requeue_running=False,
+):
+    """
+    Encola una tarea. Dentro de una transacción la tarea solo será visible
+    para el worker cuando esta se confirme.
+    Con `run_at` (datetime) o `delay` (segundos o timedelta) se programa para
+    más tarde.
+    Con `key`, si ya hay una tarea activa con esa clave no se crea otra y se
+    retorna la existente. Con retry_failed=False tampoco se crea si una tarea
+    con esa clave falló definitivamente: se retorna la fallida.
+    Con requeue_running=True, si la tarea activa ya se está ejecutando se
+    marca para que vuelva a la cola al terminar: sus datos pudieron leerse
+    antes del cambio que motivó este enqueue.
+    """
+    _, max_attempts = get_handler(name)
+    if run_at is None:
+        run_at = timezone.now()
+    if delay is not None:
+        if not isinstance(delay, timedelta):
+            delay = timedelta(seconds=delay)
+        run_at += delay
+    fields = {
+        "name": name,
+        "payload": payload or {},
+        "max_attempts": max_attempts,
+        "run_at": run_at,
+    }
+    if key is None:
+        return Job.objects.create(**fields)
+
+    statuses = Job.ACTIVE_STATUSES
+    if not retry_failed:
+        statuses += (Job.FAILED,)
+    while True:
+        existing = Job.objects.filter(idempotency_key=key, status__in=statuses).first()
+        if existing is None:
+            try:
+                with transaction.atomic():
+                    return Job.objects.create(idempotency_key=key, **fields)
+            except IntegrityError:  # Otro proceso la encoló al mismo tiempo
+                continue
+        if not requeue_running or existing.status != Job.RUNNING:
+            return existing
+        if Job.objects.filter(pk=existing.pk, status=Job.RUNNING).update(
+            run_again=True
+        ):
+            return existing
+        # Terminó mientras tanto: se encola de nuevo
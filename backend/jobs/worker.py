@@ -0,0 +1,170 @@
+"""
+Ejecución de las tareas encoladas.
+
+Cada tarea se reclama con SELECT ... FOR UPDATE SKIP LOCKED (en motores que
+lo soportan) y un UPDATE condicional a "running", de modo que varios workers
+o hilos no ejecuten la misma. El handler corre dentro de una transacción: si
+falla, sus cambios se revierten y la tarea se reprograma con espera
+exponencial hasta agotar max_attempts. Si se volvió a encolar mientras
+corría (enqueue con requeue_running), al terminar vuelve a la cola.
+
+Si un worker muere a mitad de una tarea, esta queda en "running" y bloquea
+su clave de idempotencia; housekeeping() la devuelve a "pending" cuando
+pasan JOB_LEASE_TIMEOUT segundos desde que se reclamó, y borra las tareas
+terminadas hace más de JOB_RETENTION_DAYS días. run_worker la llama
+periódicamente.
+"""
+
+import logging
+import traceback
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Case, F, PositiveIntegerField, Value, When
+from django.utils import timezone
+
+from .models import Job
+from .registry import get_handler
+
+logger = logging.getLogger(__name__)
+
+
+def claim_next():
+    """Reclama la siguiente tarea pendiente cuyo run_at ya pasó, o None"""
+    while True:
+        with transaction.atomic():
+            candidate = (
+                Job.objects.select_for_update(skip_locked=True)
+                .filter(status=Job.PENDING, run_at__lte=timezone.now())
+                .order_by("run_at", "id")
+                .values_list("pk", flat=True)
+                .first()
+            )
+            if candidate is None:
+                return None
+            claimed = Job.objects.filter(pk=candidate, status=Job.PENDING).update(
+                status=Job.RUNNING,
+                attempts=F("attempts") + 1,
+                updated_at=timezone.now(),
+            )
+        if claimed:
+            return Job.objects.get(pk=candidate)
+        # Sin SKIP LOCKED (SQLite) otro worker pudo tomarla primero
+
+
+def run_now(job):
+    """
+    Reclama y ejecuta de inmediato una tarea pendiente concreta, sin esperar
+    a un worker. Retorna None si otro proceso ya la reclamó.
+    """
+    claimed = Job.objects.filter(pk=job.pk, status=Job.PENDING).update(
+        status=Job.RUNNING, attempts=F("attempts") + 1, updated_at=timezone.now()
+    )
+    if not claimed:
+        return None
+    job.refresh_from_db()
+    return run_job(job)
+
+
+def retry_delay(attempts):
+    """Espera antes del siguiente intento: JOB_RETRY_BACKOFF * 2^(intentos-1)"""
+    seconds = settings.JOB_RETRY_BACKOFF * 2 ** (attempts - 1)
+    return timedelta(seconds=min(seconds, settings.JOB_RETRY_BACKOFF_MAX))
+
+
+def run_job(job):
+    """Ejecuta una tarea reclamada y registra el resultado"""
+    try:
+        handler, _ = get_handler(job.name)
+        with transaction.atomic():
+            handler(**job.payload)
+    except Exception as e:
+        job.last_error = "".join(traceback.format_exception(e))
+        if job.attempts < job.max_attempts:
+            job.status = Job.PENDING
+            job.run_at = timezone.now() + retry_delay(job.attempts)
+            logger.warning(
+                f"Tarea {job} falló (intento {job.attempts}/{job.max_attempts}), "
+                f"se reintentará a las {job.run_at}: {e}"
+            )
+        else:
+            job.status = Job.FAILED
+            logger.error(f"Tarea {job} falló definitivamente: {e}")
+    else:
+        # En un solo UPDATE, para no perder un enqueue(requeue_running=True)
+        # que llegue justo ahora: si la marcaron, vuelve a la cola
+        now = timezone.now()
+        Job.objects.filter(pk=job.pk).update(
+            status=Case(
+                When(run_again=True, then=Value(Job.PENDING)), default=Value(Job.DONE)
+            ),
+            run_at=Case(When(run_again=True, then=Value(now)), default=F("run_at")),
+            attempts=Case(
+                When(run_again=True, then=Value(0)),
+                default=F("attempts"),
+                output_field=PositiveIntegerField(),
+            ),
+            run_again=False,
+            last_error="",
+            updated_at=now,
+        )
+        job.refresh_from_db()
+        return True
+    job.run_again = False
+    job.save(
+        update_fields=["status", "run_at", "run_again", "last_error", "updated_at"]
+    )
+    return False
+
+
+def reclaim_stale():
+    """
+    Devuelve a pendientes las tareas en ejecución reclamadas hace más de
+    JOB_LEASE_TIMEOUT segundos (las que agotaron sus intentos quedan fallidas).
+    Retorna la cantidad de tareas recuperadas.
+    """
+    now = timezone.now()
+    stale = Job.objects.filter(
+        status=Job.RUNNING,
+        updated_at__lt=now - timedelta(seconds=settings.JOB_LEASE_TIMEOUT),
+    )
+    error = "El worker no terminó la tarea a tiempo (lease vencido)"
+    stale.filter(attempts__gte=F("max_attempts")).update(
+        status=Job.FAILED, last_error=error, updated_at=now
+    )
+    reclaimed = stale.update(
+        status=Job.PENDING, run_at=now, last_error=error, updated_at=now
+    )
+    if reclaimed:
+        logger.warning(f"{reclaimed} tareas con lease vencido vuelven a la cola")
+    return reclaimed
+
+
+def purge_finished():
+    """Borra las tareas terminadas hace más de JOB_RETENTION_DAYS días"""
+    cutoff = timezone.now() - timedelta(days=settings.JOB_RETENTION_DAYS)
+    deleted, _ = Job.objects.filter(status=Job.DONE, updated_at__lt=cutoff).delete()
+    return deleted
+
+
+def housekeeping():
+    """Mantenimiento de la cola: recupera tareas abandonadas y purga terminadas"""
+    return reclaim_stale(), purge_finished()
+
+
+def run_pending(limit=None, stop=None):
+    """
+    Ejecuta tareas pendientes hasta vaciar la cola, hasta `limit` o hasta que
+    se active el evento `stop`. Retorna la cantidad de tareas ejecutadas.
+    """
+    processed = 0
+    while limit is None or processed < limit:
+        if stop is not None and stop.is_set():
+            break
+        job = claim_next()
+        if job is None:
+            break
+        run_job(job)
+        processed += 1
+    return processed
@@ -0,0 +1,128 @@
+"""
+Servicio de búsqueda en cascada país → estado → ciudad.
+
+Mantiene el árbol completo de ubicaciones en caché para validar los IDs de
+los filtros sin consultas adicionales a la base de datos.
+"""
+
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework.exceptions import ValidationError
+
+from .models import City, Country, State
+
+TREE_KEY = "location:tree"
+
+
+def build_location_tree():
+    """
+    Construye el árbol de ubicaciones con tres consultas planas.
+    Retorna diccionarios indexados por ID para países, estados y ciudades;
+    cada nodo guarda los IDs de sus hijos en orden alfabético.
+    """
+    countries = {
+        row["id"]: {**row, "states": []}
+        for row in Country.objects.order_by("country_name").values(
+            "id", "country_name", "country_code", "country_is_active"
+        )
+    }
+    states = {}
+    for row in State.objects.order_by("state_name").values(
+        "id", "state_name", "state_code", "state_is_active", "state_country_id"
+    ):
+        states[row["id"]] = {**row, "cities": []}
+        countries[row["state_country_id"]]["states"].append(row["id"])
+
+    cities = {}
+    for row in City.objects.order_by("city_name").values(
+        "id", "city_name", "city_code", "city_is_active", "city_state_id"
+    ):
+        cities[row["id"]] = row
+        states[row["city_state_id"]]["cities"].append(row["id"])
+
+    return {"countries": countries, "states": states, "cities": cities}
+
+
+def get_location_tree():
+    """Árbol de ubicaciones desde caché, construyéndolo si no existe"""
+    tree = cache.get(TREE_KEY)
+    if tree is None:
+        tree = build_location_tree()
+        cache.set(TREE_KEY, tree, settings.CATALOG_CACHE_TIMEOUT)
+    return tree
+
+
+def invalidate_location_tree():
+    cache.delete(TREE_KEY)
+
+
+def _resolve(value, nodes, model, field, label):
+    try:
+        node_id = int(value)
+    except (TypeError, ValueError):
+        raise ValidationError({field: f"Invalid {label} ID format"})
+    if node_id not in nodes:
+        # El árbol cacheado en este proceso puede no tener lo creado en otro:
+        # se confirma en la base antes de rechazar y se descarta el árbol
+        if not model.objects.filter(pk=node_id).exists():
+            raise ValidationError({field: f"{label.capitalize()} not found"})
+        invalidate_location_tree()
+    return node_id
+
+
+def resolve_country_id(value, tree=None):
+    """Valida un ID de país contra el árbol. Lanza ValidationError si no existe"""
+    tree = tree or get_location_tree()
+    return _resolve(value, tree["countries"], Country, "country", "country")
+
+
+def resolve_state_id(value, tree=None):
+    """Valida un ID de estado contra el árbol. Lanza ValidationError si no existe"""
+    tree = tree or get_location_tree()
+    return _resolve(value, tree["states"], State, "state", "state")
+
+
+def nested_location_tree(include_inactive=False, tree=None):
+    """
+    Jerarquía completa anidada país → estados → ciudades.
+    Por defecto omite los nodos inactivos (y todo lo que cuelga de ellos).
+    """
+    tree = tree or get_location_tree()
+    result = []
+    for country in tree["countries"].values():
+        if not include_inactive and not country["country_is_active"]:
+            continue
+        states = []
+        for state_id in country["states"]:
+            state = tree["states"][state_id]
+            if not include_inactive and not state["state_is_active"]:
+                continue
+            cities = [
+                {
+                    "id": city["id"],
+                    "city_name": city["city_name"],
+                    "city_code": city["city_code"],
+                    "city_is_active": city["city_is_active"],
+                }
+                for city in (tree["cities"][city_id] for city_id in state["cities"])
+                if include_inactive or city["city_is_active"]
+            ]
+            states.append(
+                {
+                    "id": state["id"],
+                    "state_name": state["state_name"],
+                    "state_code": state["state_code"],
+                    "state_is_active": state["state_is_active"],
+                    "cities": cities,
+                }
+            )
+        result.append(
+            {
+                "id": country["id"],
+                "country_name": country["country_name"],
+                "country_code": country["country_code"],
+                "country_is_active": country["country_is_active"],
+                "states": states,
+            }
+        )
+    return result
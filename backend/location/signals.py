@@ -0,0 +1,15 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import City, Country, State
+from .services import invalidate_location_tree
+
+
+@receiver([post_save, post_delete], sender=Country)
+@receiver([post_save, post_delete], sender=State)
+@receiver([post_save, post_delete], sender=City)
+def invalidate_tree_on_change(sender, **kwargs):
+    """
+    Invalida el árbol de ubicaciones cacheado cuando cambia un país, estado o ciudad
+    """
+    invalidate_location_tree()
@@ -1,12 +1,19 @@
+from django.conf import settings
 from django.urls import include, path
 from rest_framework import routers
 
-from .views import CityViewSet, CountryViewSet, StateViewSet
+from .views import CityViewSet, CountryViewSet, LocationTreeView, StateViewSet
 
 router = routers.DefaultRouter()
 router.register(r"states", StateViewSet, basename="state")
 router.register(r"countries", CountryViewSet, basename="country")
 router.register(r"cities", CityViewSet, basename="city")
 urlpatterns = [
+    path("tree/", LocationTreeView.as_view(), name="location-tree"),
     path("", include(router.urls)),
 ]
+
+if settings.ASYNC_VIEWS:
+    from core.async_views import async_catalog_urls
+
+    urlpatterns = async_catalog_urls(router, ("country",)) + urlpatterns
@@ -1,11 +1,14 @@
 from django.shortcuts import render
 from rest_framework import viewsets
-from rest_framework.exceptions import ValidationError
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+from rest_framework.views import APIView
 
 from permissions.permissions import IsAdminOrReadOnly
 
 from .models import City, Country, State
 from .serializer import CitySerializer, CountrySerializer, StateSerializer
+from .services import nested_location_tree, resolve_country_id, resolve_state_id
 
 
 class BaseUserInfoViewSet(viewsets.ModelViewSet):
@@ -21,43 +24,40 @@ class CountryViewSet(BaseUserInfoViewSet):
 
 class StateViewSet(BaseUserInfoViewSet):
     serializer_class = StateSerializer
-    queryset = State.objects.all()
+    queryset = State.objects.select_related("state_country")
 
     def get_queryset(self):
         queryset = super().get_queryset()
         country_id = self.request.query_params.get("country")
         if country_id:
-            try:
-                # Intentar convertir a entero
-                int(country_id)
-                Country.objects.get(id=country_id)
-                queryset = queryset.filter(state_country_id=country_id)
-            except ValueError:
-                # ID no es numérico
-                raise ValidationError({"country": "Invalid country ID format"})
-            except Country.DoesNotExist:
-                # País no existe
-                raise ValidationError({"country": "Country not found"})
+            # Validación contra el árbol cacheado: sin consulta extra a Country
+            queryset = queryset.filter(state_country_id=resolve_country_id(country_id))
         return queryset
 
 
 class CityViewSet(BaseUserInfoViewSet):
     serializer_class = CitySerializer
-    queryset = City.objects.all()
+    queryset = City.objects.select_related("city_state")
 
     def get_queryset(self):
         queryset = super().get_queryset()
         state_id = self.request.query_params.get("state")
         if state_id:
-            try:
-                # Intentar convertir a entero
-                int(state_id)
-                State.objects.get(id=state_id)
-                queryset = queryset.filter(city_state_id=state_id)
-            except ValueError:
-                # ID no es numérico
-                raise ValidationError({"state": "Invalid state ID format"})
-            except Country.DoesNotExist:
-                # País no existe
-                raise ValidationError({"state": "State not found"})
+            # Validación contra el árbol cacheado: sin consulta extra a State
+            queryset = queryset.filter(city_state_id=resolve_state_id(state_id))
         return queryset
+
+
+class LocationTreeView(APIView):
+    """
+    Jerarquía completa de ubicaciones país → estado → ciudad
+    GET /api/v1/location/tree/?include_inactive=true
+    """
+
+    permission_classes = [AllowAny]
+
+    def get(self, request, *args, **kwargs):
+        include_inactive = (
+            request.query_params.get("include_inactive", "false").lower() == "true"
+        )
+        return Response(nested_location_tree(include_inactive=include_inactive))
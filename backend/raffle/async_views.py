@@ -0,0 +1,216 @@
+"""
+Versiones asíncronas de las vistas públicas de rifas (modo ASGI) y stream
+SSE de disponibilidad de números.
+
+Leen con el ORM asíncrono sobre .values() para no instanciar Raffle: su
+post_init hace trabajo síncrono en la base de datos. Las rifas vencidas que
+ese post_init procesaría se cargan explícitamente con sync_to_async.
+"""
+
+import asyncio
+import json
+from datetime import timedelta
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.http import StreamingHttpResponse
+from django.utils import timezone
+
+from core.async_views import AsyncReadView
+from core.serializers import decimal_formatter
+from raffleInfo.models import StateRaffle
+from tickets.models import Ticket
+
+from .events import broker, format_event_id, relay
+from .models import Raffle
+from .serializer import RafflePlainListSerializer
+from .views import _overdue_raffles
+
+format_price = decimal_formatter(Raffle, "raffle_number_price")
+
+
+def _is_overdue(row):
+    """Misma condición que check_raffle_on_load, sobre una fila de .values()"""
+    code = row["raffle_state__state_raffle_code"] or ""
+    name = row["raffle_state__state_raffle_name"] or ""
+    return (
+        row["raffle_winner_id"] is None
+        and row["raffle_draw_date"] <= timezone.now() - timedelta(hours=1)
+        and (code.upper() == "ACT" or "activa" in name.lower())
+    )
+
+
+async def _process_if_overdue(pk, row):
+    """Encola el procesamiento de la rifa si está vencida"""
+    if row is not None and _is_overdue(row):
+        # Cargar la instancia dispara el post_init que encola la tarea
+        await sync_to_async(Raffle.objects.get)(pk=pk)
+
+
+class AsyncRaffleListView(AsyncReadView):
+    """Versión asíncrona de RaffleListView"""
+
+    model = Raffle
+
+    async def get_data(self, request):
+        active_states = StateRaffle.objects.filter(state_raffle_code__iexact="ACT")
+        if not await active_states.aexists():
+            active_states = StateRaffle.objects.filter(
+                state_raffle_name__icontains="activ"
+            )
+
+        queryset = Raffle.objects.filter(raffle_state__in=active_states)
+        overdue = _overdue_raffles(queryset)
+        if await overdue.aexists():
+            await sync_to_async(list)(overdue)
+
+        serializer = RafflePlainListSerializer(context={"request": request})
+        return [
+            serializer.to_representation(row)
+            async for row in RafflePlainListSerializer.values_queryset(queryset)
+        ]
+
+
+class AsyncRaffleDetailView(AsyncReadView):
+    """Versión asíncrona de RaffleDetailView"""
+
+    model = Raffle
+
+    async def get_data(self, request, pk):
+        queryset = Raffle.objects.filter(pk=pk).values(
+            *RafflePlainListSerializer.values_fields, "raffle_winner_id"
+        )
+        row = await queryset.afirst()
+        await _process_if_overdue(pk, row)
+        if row is None:
+            return None
+        return RafflePlainListSerializer(
+            context={"request": request}
+        ).to_representation(row)
+
+
+class AsyncAvailableNumbersView(AsyncReadView):
+    """Versión asíncrona de AvailableNumbersView"""
+
+    model = Raffle
+
+    async def get_data(self, request, pk):
+        queryset = Raffle.objects.filter(pk=pk).values(
+            "id",
+            "raffle_name",
+            "raffle_number_amount",
+            "raffle_number_price",
+            "raffle_draw_date",
+            "raffle_state__state_raffle_name",
+            "raffle_state__state_raffle_code",
+            "raffle_winner_id",
+        )
+        row = await queryset.afirst()
+        await _process_if_overdue(pk, row)
+        if row is None:
+            return None
+
+        sold = {
+            number
+            async for number in Ticket.objects.filter(raffle_id=pk).values_list(
+                "number", flat=True
+            )
+        }
+        amount = row["raffle_number_amount"]
+        return {
+            "id": row["id"],
+            "raffle_name": row["raffle_name"],
+            "raffle_number_amount": amount,
+            "raffle_number_price": format_price(row["raffle_number_price"]),
+            "numbers": [n for n in range(1, amount + 1) if n not in sold],
+            "numbers_sold": len(sold),
+            "numbers_available": amount - len(sold),
+        }
+
+
+class RaffleEventsView(AsyncReadView):
+    """
+    Stream SSE de los números vendidos y liberados de una rifa
+    GET /api/v1/raffle/<pk>/events/
+
+    Eventos: "snapshot" (números vendidos al conectar y cada
+    SSE_SNAPSHOT_INTERVAL), "sold" y "refunded" (deltas). Soporta reconexión
+    con Last-Event-ID.
+    """
+
+    model = Raffle
+    http_method_names = ["get"]
+
+    async def get(self, request, pk):
+        raffle = (
+            await Raffle.objects.filter(pk=pk).values("raffle_number_amount").afirst()
+        )
+        if raffle is None:
+            return self.not_found()
+
+        if relay is not None:
+            relay.start()
+        subscription, backlog, sequence = broker.subscribe(
+            pk, request.headers.get("Last-Event-ID")
+        )
+        response = StreamingHttpResponse(
+            self.stream(
+                pk, raffle["raffle_number_amount"], subscription, backlog, sequence
+            ),
+            content_type="text/event-stream",
+        )
+        response["Cache-Control"] = "no-cache"
+        response["X-Accel-Buffering"] = "no"  # Sin buffer en nginx
+        return response
+
+    async def stream(self, pk, number_amount, subscription, backlog, sequence):
+        loop = asyncio.get_running_loop()
+        interval = settings.SSE_SNAPSHOT_INTERVAL
+        try:
+            yield "retry: 3000\n\n"
+            if backlog is None:
+                yield await self.snapshot(pk, number_amount, sequence)
+            else:
+                for record in backlog:
+                    sequence = record[0]
+                    yield format_event(*record)
+            resync_at = loop.time() + interval
+
+            while True:
+                # Resincroniza si el cliente se atrasó o, cada tanto, por los
+                # eventos que el broker de este proceso no llegó a ver
+                if subscription.overflowed or (interval and loop.time() >= resync_at):
+                    # Se descartan los pendientes y se reenvía el estado completo
+                    while not subscription.queue.empty():
+                        sequence = subscription.queue.get_nowait()[0]
+                    subscription.overflowed = False
+                    resync_at = loop.time() + interval
+                    yield await self.snapshot(pk, number_amount, sequence)
+                timeout = settings.SSE_HEARTBEAT_INTERVAL
+                if interval:
+                    timeout = max(min(timeout, resync_at - loop.time()), 0)
+                try:
+                    record = await asyncio.wait_for(subscription.queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    yield ": ping\n\n"
+                    continue
+                sequence = record[0]
+                yield format_event(*record)
+        finally:
+            broker.unsubscribe(pk, subscription)
+
+    async def snapshot(self, pk, number_amount, sequence):
+        sold = [
+            number
+            async for number in Ticket.objects.filter(raffle_id=pk)
+            .order_by("number")
+            .values_list("number", flat=True)
+        ]
+        return format_event(
+            sequence, "snapshot", {"number_amount": number_amount, "sold": sold}
+        )
+
+
+def format_event(sequence, event, data):
+    payload = json.dumps(data, separators=(",", ":"))
+    return f"id: {format_event_id(sequence)}\nevent: {event}\ndata: {payload}\n\n"
@@ -0,0 +1,237 @@
+"""
+Pub/sub en proceso para los eventos en vivo de las rifas (SSE).
+
+Los eventos se numeran con una secuencia única del broker y cada rifa con
+suscriptores guarda un historial corto en memoria para reanudar conexiones
+con Last-Event-ID. Cuando una rifa se queda sin suscriptores su historial se
+descarta: sin nadie escuchando no hay nada que guardar, y como la secuencia
+no se reinicia, un ID viejo nunca se confunde con uno nuevo. Los suscriptores
+son colas asyncio; la publicación puede hacerse desde cualquier hilo.
+
+El broker vive en el proceso. Con SSE_REDIS_URL los eventos se publican en
+un canal de Redis y cada proceso web los reenvía a su broker, así que llegan
+también las compras de otros workers y los reembolsos de run_worker y
+run_draw_scheduler. Sin Redis cada proceso solo reparte sus propios eventos;
+en ambos casos el stream reenvía un snapshot cada SSE_SNAPSHOT_INTERVAL.
+"""
+
+import asyncio
+import json
+import logging
+import secrets
+import threading
+import time
+from collections import deque
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.db import transaction
+
+try:
+    import redis
+except ImportError:  # redis solo se necesita con SSE_REDIS_URL
+    redis = None
+
+logger = logging.getLogger(__name__)
+
+# Identifica esta instancia del broker en los IDs de evento
+BROKER_TOKEN = secrets.token_hex(4)
+
+
+class Subscription:
+    """Cola de eventos de un cliente conectado"""
+
+    def __init__(self, loop, maxsize):
+        self.loop = loop
+        self.queue = asyncio.Queue(maxsize=maxsize)
+        # El cliente no consumió a tiempo: debe recibir un snapshot nuevo
+        self.overflowed = False
+
+    def push(self, event):
+        self.loop.call_soon_threadsafe(self._put, event)
+
+    def _put(self, event):
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.overflowed = True
+
+    def resync(self):
+        """Marca al cliente para recibir un snapshot nuevo"""
+        self.loop.call_soon_threadsafe(setattr, self, "overflowed", True)
+
+
+class RaffleEventBroker:
+    def __init__(self, history_size=100, queue_size=1000):
+        self.history_size = history_size
+        self.queue_size = queue_size
+        self._lock = threading.Lock()
+        self._sequence = 0
+        # Solo para rifas con suscriptores. _history tiene todos los eventos
+        # de la rifa con secuencia mayor a _since
+        self._history = {}
+        self._since = {}
+        self._subscribers = {}
+
+    def publish(self, raffle_id, event, data):
+        """Publica un evento a todos los suscriptores de la rifa"""
+        with self._lock:
+            # La secuencia avanza aunque nadie escuche: así un cliente que
+            # vuelve con un ID anterior sabe que se perdió este evento
+            self._sequence += 1
+            subscribers = list(self._subscribers.get(raffle_id, ()))
+            if not subscribers:
+                return
+            record = (self._sequence, event, data)
+            history = self._history[raffle_id]
+            if len(history) == history.maxlen:
+                self._since[raffle_id] = history[0][0]
+            history.append(record)
+
+        for subscription in subscribers:
+            try:
+                subscription.push(record)
+            except RuntimeError:  # El event loop del cliente ya se cerró
+                self.unsubscribe(raffle_id, subscription)
+
+    def subscribe(self, raffle_id, last_event_id=None):
+        """
+        Registra un suscriptor en el event loop actual.
+        Retorna (subscription, backlog, sequence): backlog es None si no se
+        puede reanudar desde last_event_id y el cliente necesita un snapshot;
+        sequence es la secuencia del broker al momento de suscribirse.
+        """
+        subscription = Subscription(asyncio.get_running_loop(), self.queue_size)
+        with self._lock:
+            if raffle_id not in self._subscribers:
+                self._subscribers[raffle_id] = set()
+                self._history[raffle_id] = deque(maxlen=self.history_size)
+                self._since[raffle_id] = self._sequence
+            self._subscribers[raffle_id].add(subscription)
+            backlog = self._backlog(raffle_id, last_event_id)
+            sequence = self._sequence
+        return subscription, backlog, sequence
+
+    def unsubscribe(self, raffle_id, subscription):
+        with self._lock:
+            subscribers = self._subscribers.get(raffle_id)
+            if subscribers is None:
+                return
+            subscribers.discard(subscription)
+            if not subscribers:
+                del self._subscribers[raffle_id]
+                del self._history[raffle_id]
+                del self._since[raffle_id]
+
+    def resync(self):
+        """Pide un snapshot a todos los suscriptores (p. ej. tras perder eventos)"""
+        with self._lock:
+            subscriptions = [s for group in self._subscribers.values() for s in group]
+        for subscription in subscriptions:
+            try:
+                subscription.resync()
+            except RuntimeError:  # El event loop del cliente ya se cerró
+                pass
+
+    def subscriber_count(self, raffle_id):
+        return len(self._subscribers.get(raffle_id, ()))
+
+    def _backlog(self, raffle_id, last_event_id):
+        sequence = parse_event_id(last_event_id)
+        if sequence is None or sequence > self._sequence:
+            return None
+        if sequence < self._since[raffle_id]:
+            return None  # Faltan eventos que no están en el historial
+        return [record for record in self._history[raffle_id] if record[0] > sequence]
+
+
+def format_event_id(sequence):
+    return f"{BROKER_TOKEN}-{sequence}"
+
+
+def parse_event_id(event_id):
+    """Secuencia de un Last-Event-ID de este broker, o None"""
+    token, _, sequence = (event_id or "").partition("-")
+    if token != BROKER_TOKEN or not sequence.isdigit():
+        return None
+    return int(sequence)
+
+
+broker = RaffleEventBroker(
+    history_size=settings.SSE_HISTORY_SIZE, queue_size=settings.SSE_QUEUE_SIZE
+)
+
+
+class RedisRelay:
+    """
+    Reparte los eventos entre procesos por Redis pub/sub. publish() envía al
+    canal; el hilo de start() escucha el canal y publica en el broker local.
+    """
+
+    def __init__(self, url, broker, channel="raffle:events", retry_delay=1):
+        if redis is None:
+            raise ImproperlyConfigured("SSE_REDIS_URL requiere el paquete redis")
+        self.client = redis.Redis.from_url(url)
+        self.broker = broker
+        self.channel = channel
+        self.retry_delay = retry_delay
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def publish(self, raffle_id, event, data):
+        message = json.dumps({"raffle": raffle_id, "event": event, "data": data})
+        try:
+            self.client.publish(self.channel, message)
+        except redis.RedisError:
+            # Los clientes se ponen al día con el siguiente snapshot
+            logger.exception(
+                "No se pudo publicar el evento %s de la rifa %s", event, raffle_id
+            )
+
+    def start(self):
+        """Arranca el hilo que escucha el canal (una vez por proceso)"""
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._listen, name="raffle-events-relay", daemon=True
+                )
+                self._thread.start()
+
+    def dispatch(self, message):
+        """Publica en el broker local un mensaje recibido del canal"""
+        payload = json.loads(message["data"])
+        self.broker.publish(payload["raffle"], payload["event"], payload["data"])
+
+    def _listen(self):
+        while True:
+            try:
+                with self.client.pubsub(ignore_subscribe_messages=True) as pubsub:
+                    pubsub.subscribe(self.channel)
+                    # Lo publicado mientras no se escuchaba se recupera con un snapshot
+                    self.broker.resync()
+                    for message in pubsub.listen():
+                        self.dispatch(message)
+            except Exception:
+                # Sin este hilo el proceso dejaría de recibir eventos
+                logger.exception("Falló el relay de eventos, reintentando")
+                time.sleep(self.retry_delay)
+
+
+relay = RedisRelay(settings.SSE_REDIS_URL, broker) if settings.SSE_REDIS_URL else None
+
+
+def publish_numbers(raffle_id, event, numbers):
+    """
+    Publica números vendidos ("sold") o liberados ("refunded") de una rifa
+    cuando la transacción actual se confirma.
+    """
+    numbers = sorted(numbers)
+    if numbers:
+        transaction.on_commit(lambda: _publish(raffle_id, event, {"numbers": numbers}))
+
+
+def _publish(raffle_id, event, data):
+    if relay is not None:
+        relay.publish(raffle_id, event, data)
+    else:
+        broker.publish(raffle_id, event, data)
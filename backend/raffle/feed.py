@@ -0,0 +1,319 @@
+"""
+Feed de rifas activas para la página de inicio, guardado en la caché.
+
+GET /raffle/feed/ responde desde la caché sin consultar la base de datos: un
+índice con el orden de las rifas activas (más recientes primero) y una
+entrada por rifa con los campos de presentación ya calculados (URL de
+imagen, números vendidos, avance hacia el mínimo, organizador y su
+calificación), leídas con un get_many. Solo el tiempo restante se calcula al
+leer, a partir de la fecha del sorteo guardada.
+
+El feed se actualiza por rifa: al guardar o borrar una rifa o un ticket, y al
+cambiar el nombre o la calificación de un organizador, se vuelve a leer solo
+esa rifa (o las de ese organizador) y se reemplaza su entrada. El índice solo
+se reescribe si cambia qué rifas están o su orden, así que vender un ticket
+escribe una sola entrada. Releer en vez de sumar o restar hace que aplicar
+dos veces el mismo cambio no lo duplique.
+
+Las escrituras se serializan con un lock en la caché. Si no se obtiene a
+tiempo, el feed se marca como desactualizado: las lecturas siguen sirviendo
+el que hay y la primera que obtiene el lock lo reconstruye y lo guarda.
+RAFFLE_FEED_CACHE_TIMEOUT acota cuánto puede durar un cambio que no pasó por
+signals (QuerySet.update()).
+
+Con varios procesos la caché debe ser compartida (CACHE_BACKEND, ver
+docker-compose.yml); en la caché en memoria de cada proceso, los cambios
+atendidos por un proceso no llegarían a los demás.
+
+Las rifas activas vencidas las procesa el programador de sorteos
+(run_draw_scheduler); el feed no carga instancias ni dispara post_init.
+"""
+
+import threading
+import time
+from bisect import insort
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, IntegerField, OuterRef, Q, Subquery, Value
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from core.serializers import decimal_formatter, format_datetime
+
+from .images import variant_urls
+from .models import Raffle
+
+INDEX_KEY = "raffle:feed:index"
+ENTRY_KEY = "raffle:feed:entry:{}"
+STALE_KEY = "raffle:feed:stale"
+LOCK_KEY = "raffle:feed:lock"
+LOCK_TIMEOUT = 10  # segundos; por si el proceso muere con el lock tomado
+LOCK_ATTEMPTS = 20
+LOCK_WAIT = 0.005
+
+DEFAULT_IMAGE = "raffles/defaults/default_raffle.jpg"
+
+VALUES_FIELDS = (
+    "id",
+    "raffle_name",
+    "raffle_image",
+    "raffle_image_variants",
+    "raffle_number_price",
+    "raffle_prize_amount",
+    "raffle_draw_date",
+    "raffle_created_at",
+    "raffle_number_amount",
+    "raffle_minimum_numbers_sold",
+    "raffle_prize_type__prize_type_name",
+    "raffle_created_by_id",
+    "raffle_created_by__first_name",
+    "raffle_created_by__last_name",
+    "raffle_created_by__rating",
+)
+
+_format_price = decimal_formatter(Raffle, "raffle_number_price")
+_format_prize = decimal_formatter(Raffle, "raffle_prize_amount")
+_image_storage = Raffle._meta.get_field("raffle_image").storage
+
+
+def _active_filter():
+    """Misma regla que RaffleListView: estado con código ACT o nombre 'activ'"""
+    from raffleInfo.models import StateRaffle
+
+    states = StateRaffle.objects.filter(state_raffle_code__iexact="ACT")
+    if not states.exists():
+        states = StateRaffle.objects.filter(state_raffle_name__icontains="activ")
+    return Q(raffle_state_id__in=list(states.values_list("pk", flat=True)))
+
+
+def _rows(queryset):
+    from tickets.models import Ticket
+
+    sold = (
+        Ticket.objects.filter(raffle=OuterRef("pk"))
+        .order_by()
+        .values("raffle")
+        .annotate(total=Count("pk"))
+        .values("total")
+    )
+    return queryset.annotate(
+        numbers_sold=Coalesce(Subquery(sold), Value(0), output_field=IntegerField())
+    ).values(*VALUES_FIELDS, "numbers_sold")
+
+
+def _image_url(row):
+    """Variante "card" de la imagen (el original mientras no exista)"""
+    variants = variant_urls(
+        _image_storage, row["raffle_image"], row["raffle_image_variants"]
+    )
+    return variants["card"] if variants else _image_storage.url(DEFAULT_IMAGE)
+
+
+def build_entry(row):
+    """Entrada del feed con los campos de presentación ya calculados"""
+    sold = row["numbers_sold"]
+    minimum = row["raffle_minimum_numbers_sold"]
+    first_name = row["raffle_created_by__first_name"] or ""
+    last_name = row["raffle_created_by__last_name"] or ""
+    return {
+        "id": row["id"],
+        "raffle_name": row["raffle_name"],
+        "image_url": _image_url(row),
+        "raffle_number_price": _format_price(row["raffle_number_price"]),
+        "raffle_prize_amount": _format_prize(row["raffle_prize_amount"]),
+        "prize_type": row["raffle_prize_type__prize_type_name"],
+        "raffle_draw_date": format_datetime(row["raffle_draw_date"]),
+        "draw_timestamp": row["raffle_draw_date"].timestamp(),
+        "numbers_sold": sold,
+        "numbers_available": row["raffle_number_amount"] - sold,
+        "raffle_number_amount": row["raffle_number_amount"],
+        "raffle_minimum_numbers_sold": minimum,
+        "progress": min(100, round(sold * 100 / minimum, 1)) if minimum else 100,
+        "minimum_reached": sold >= minimum,
+        "organizer": {
+            "id": row["raffle_created_by_id"],
+            "full_name": f"{first_name} {last_name}".strip(),
+            "rating": row["raffle_created_by__rating"],
+        },
+        # Orden del feed: más recientes primero (invertido para insort)
+        "_sort": (-row["raffle_created_at"].timestamp(), -row["id"]),
+    }
+
+
+def build_feed():
+    """Feed completo desde la base de datos"""
+    queryset = Raffle.objects.filter(_active_filter()).order_by(
+        "-raffle_created_at", "-id"
+    )
+    return [build_entry(row) for row in _rows(queryset).iterator(chunk_size=2000)]
+
+
+def _index_item(entry):
+    """Elemento del índice: (orden, id de la rifa, id del organizador)"""
+    return (entry["_sort"], entry["id"], entry["organizer"]["id"])
+
+
+def _acquire():
+    for _ in range(LOCK_ATTEMPTS):
+        if cache.add(LOCK_KEY, 1, LOCK_TIMEOUT):
+            return True
+        time.sleep(LOCK_WAIT)
+    return False
+
+
+def _rebuild():
+    """Reconstruye y guarda el feed completo; None si otro proceso tiene el lock"""
+    if not _acquire():
+        return None
+    try:
+        # Antes de leer: un cambio que no obtenga el lock mientras tanto lo
+        # vuelve a marcar y la siguiente lectura reconstruye otra vez
+        cache.delete(STALE_KEY)
+        feed = build_feed()
+        timeout = settings.RAFFLE_FEED_CACHE_TIMEOUT
+        cache.set_many(
+            {ENTRY_KEY.format(entry["id"]): entry for entry in feed}, timeout
+        )
+        cache.set(INDEX_KEY, [_index_item(entry) for entry in feed], timeout)
+    finally:
+        cache.delete(LOCK_KEY)
+    return feed
+
+
+def _entries(index):
+    """Entradas de los elementos del índice, releyendo las que expiraron"""
+    keys = [ENTRY_KEY.format(raffle_id) for _, raffle_id, _ in index]
+    entries = cache.get_many(keys)
+    missing = [
+        raffle_id for (_, raffle_id, _), key in zip(index, keys) if key not in entries
+    ]
+    if missing:
+        queryset = Raffle.objects.filter(_active_filter(), pk__in=missing)
+        found = {
+            ENTRY_KEY.format(row["id"]): build_entry(row) for row in _rows(queryset)
+        }
+        cache.set_many(found, settings.RAFFLE_FEED_CACHE_TIMEOUT)
+        entries.update(found)
+    # Las que ya no están activas salen con la próxima actualización del índice
+    return [entries[key] for key in keys if key in entries]
+
+
+def get_feed(limit=None):
+    """Entradas del feed, las primeras `limit` (reconstruido si hace falta)"""
+    cached = cache.get_many([INDEX_KEY, STALE_KEY])
+    index = cached.get(INDEX_KEY)
+    if index is None or STALE_KEY in cached:
+        feed = _rebuild()
+        if feed is not None:
+            return feed[:limit]
+        if index is None:
+            # Otro proceso lo está reconstruyendo: se responde sin guardar
+            return build_feed()[:limit]
+    return _entries(index[:limit])
+
+
+def _apply(queryset, matches):
+    """
+    Reemplaza en el feed cacheado las rifas del índice que cumplen `matches`
+    por las filas activas del queryset. Si el feed no está cacheado no hace
+    nada.
+    """
+    if cache.get(INDEX_KEY) is None:
+        return
+    if not _acquire():
+        cache.set(STALE_KEY, True, settings.RAFFLE_FEED_CACHE_TIMEOUT)
+        return
+    try:
+        index = cache.get(INDEX_KEY)
+        if index is None:
+            return
+        timeout = settings.RAFFLE_FEED_CACHE_TIMEOUT
+        entries = [build_entry(row) for row in _rows(queryset.filter(_active_filter()))]
+        updated = [item for item in index if not matches(item)]
+        for entry in entries:
+            insort(updated, _index_item(entry))
+        cache.set_many(
+            {ENTRY_KEY.format(entry["id"]): entry for entry in entries}, timeout
+        )
+        if updated != index:
+            cache.set(INDEX_KEY, updated, timeout)
+            kept = {raffle_id for _, raffle_id, _ in updated}
+            removed = [
+                ENTRY_KEY.format(raffle_id)
+                for _, raffle_id, _ in index
+                if raffle_id not in kept
+            ]
+            if removed:
+                cache.delete_many(removed)
+    finally:
+        cache.delete(LOCK_KEY)
+
+
+def update_raffles(raffle_ids):
+    """Vuelve a leer esas rifas (las que ya no están activas salen del feed)"""
+    raffle_ids = set(raffle_ids)
+    _apply(
+        Raffle.objects.filter(pk__in=raffle_ids),
+        lambda item: item[1] in raffle_ids,
+    )
+
+
+def update_organizer(user_id):
+    """Vuelve a leer las rifas del organizador (nombre o calificación)"""
+    _apply(
+        Raffle.objects.filter(raffle_created_by_id=user_id),
+        lambda item: item[2] == user_id,
+    )
+
+
+# Cambios pendientes hasta el commit, por hilo. Borrar los tickets de una
+# rifa dispara un post_delete por ticket: se acumulan y se aplican una vez.
+_pending = threading.local()
+
+
+def _flush_pending():
+    raffle_ids = _pending.__dict__.pop("raffles", None)
+    organizer_ids = _pending.__dict__.pop("organizers", None)
+    if raffle_ids:
+        update_raffles(raffle_ids)
+    for user_id in organizer_ids or ():
+        update_organizer(user_id)
+
+
+def _schedule(kind, value):
+    _pending.__dict__.setdefault(kind, set()).add(value)
+    # Si la transacción se revierte, lo pendiente se aplica en el próximo
+    # commit; releer la rifa es inofensivo
+    transaction.on_commit(_flush_pending)
+
+
+def schedule_raffle_update(raffle_id):
+    """Actualiza la entrada de la rifa al confirmar la transacción"""
+    _schedule("raffles", raffle_id)
+
+
+def schedule_organizer_update(user_id):
+    """Actualiza las entradas del organizador al confirmar la transacción"""
+    _schedule("organizers", user_id)
+
+
+def invalidate_feed():
+    cache.delete(INDEX_KEY)
+
+
+def render_feed(feed, request=None, limit=None):
+    """Entradas listas para responder, con el tiempo restante al sorteo"""
+    now = timezone.now().timestamp()
+    # build_absolute_uri por entrada cuesta más que el resto del render
+    base = request.build_absolute_uri("/")[:-1] if request is not None else ""
+    items = []
+    for entry in feed[:limit]:
+        item = dict(entry)
+        del item["_sort"]
+        item["seconds_remaining"] = max(0, int(item.pop("draw_timestamp") - now))
+        if base and item["image_url"].startswith("/"):
+            item["image_url"] = base + item["image_url"]
+        items.append(item)
+    return items
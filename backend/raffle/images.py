@@ -0,0 +1,126 @@
+"""
+Procesamiento de las imágenes de las rifas.
+
+La subida se valida en la petición (tamaño, formato y dimensiones, sin
+decodificar la imagen completa) y el resto se hace en el worker
+(raffle.process_image): corrige la orientación EXIF, descarta los metadatos
+(EXIF, GPS, XMP) y genera las variantes WebP junto al original. Como el
+original, se guardan por el hash de su contenido (core/storage.py):
+
+    raffles/3f/3fa4...9c.jpg     original
+    raffles/a1/a1b2...07.webp    thumbnail, card y full
+
+Las rutas se guardan en Raffle.raffle_image_variants junto con el nombre del
+original del que salieron ("source"); si el original cambia, las variantes
+se regeneran. Los archivos pueden compartirse entre rifas con la misma
+imagen, así que los que quedan sin uso los borra gc_raffle_images. Mientras
+no existan, las URLs de las variantes apuntan al original.
+"""
+
+import os
+from io import BytesIO
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.core.files.base import ContentFile
+from PIL import Image, ImageOps, UnidentifiedImageError
+
+# Nombre -> lado máximo en píxeles (se conserva la proporción)
+VARIANTS = {
+    "thumbnail": 240,
+    "card": 640,
+    "full": 1600,
+}
+ALLOWED_FORMATS = {"JPEG", "PNG", "WEBP", "GIF"}
+
+
+def validate_raffle_image(file):
+    """
+    Valida la imagen subida sin decodificarla completa: tamaño del archivo,
+    formato y cantidad de píxeles (evita "bombas" de descompresión).
+    """
+    max_size = settings.RAFFLE_IMAGE_MAX_UPLOAD_SIZE
+    if file.size > max_size:
+        raise ValidationError(
+            f"La imagen no puede superar {max_size // (1024 * 1024)} MB."
+        )
+    position = file.tell()
+    try:
+        with Image.open(file) as image:
+            image_format = image.format
+            width, height = image.size
+    except (UnidentifiedImageError, OSError, Image.DecompressionBombError):
+        raise ValidationError("El archivo no es una imagen válida.")
+    finally:
+        file.seek(position)
+    if image_format not in ALLOWED_FORMATS:
+        raise ValidationError("Formato no permitido. Use JPEG, PNG, WebP o GIF.")
+    if width * height > settings.RAFFLE_IMAGE_MAX_PIXELS:
+        raise ValidationError("La imagen tiene demasiados píxeles.")
+
+
+def variant_name(source, name):
+    """Nombre propuesto para la variante `name` del original `source`"""
+    directory, filename = os.path.split(source)
+    stem = os.path.splitext(filename)[0]
+    return os.path.join(directory, "variants", f"{stem}_{name}.webp")
+
+
+def render_variants(file):
+    """
+    Decodifica el original y retorna {nombre: bytes WebP} sin metadatos.
+    Lanza OSError / UnidentifiedImageError si la imagen no se puede leer.
+    """
+    with Image.open(file) as image:
+        # JPEG: decodifica directamente a una escala cercana a la mayor variante
+        image.draft("RGB", (VARIANTS["full"], VARIANTS["full"]))
+        icc_profile = image.info.get("icc_profile")
+        image = ImageOps.exif_transpose(image)
+        has_alpha = image.mode in ("RGBA", "LA") or "transparency" in image.info
+        image = image.convert("RGBA" if has_alpha else "RGB")
+
+    # Una imagen nueva solo con los píxeles: no arrastra EXIF ni XMP. El perfil
+    # ICC se conserva porque sin él cambian los colores
+    clean = Image.new(image.mode, image.size)
+    clean.paste(image)
+
+    rendered = {}
+    for name, size in sorted(VARIANTS.items(), key=lambda item: -item[1]):
+        clean.thumbnail((size, size), Image.Resampling.LANCZOS)
+        buffer = BytesIO()
+        clean.save(
+            buffer,
+            "WEBP",
+            quality=settings.RAFFLE_IMAGE_WEBP_QUALITY,
+            method=4,
+            icc_profile=icc_profile,
+        )
+        rendered[name] = buffer.getvalue()
+    return rendered
+
+
+def generate_variants(storage, source):
+    """Genera y guarda las variantes de `source`; retorna raffle_image_variants"""
+    with storage.open(source, "rb") as file:
+        rendered = render_variants(file)
+
+    variants = {"source": source}
+    for name, content in rendered.items():
+        variants[name] = storage.save(variant_name(source, name), ContentFile(content))
+    return variants
+
+
+def variant_urls(storage, source, variants, request=None):
+    """
+    URLs de las variantes para los serializadores. Si aún no se generaron
+    para el original actual, todas apuntan al original; sin imagen, None.
+    """
+    if not source:
+        return None
+    if not variants or variants.get("source") != source:
+        variants = {}
+    urls = {}
+    for name in VARIANTS:
+        url = storage.url(variants.get(name) or source)
+        urls[name] = request.build_absolute_uri(url) if request else url
+    return urls
@@ -0,0 +1,82 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from raffle.models import Raffle
+
+IMAGE_DIR = "raffles"
+KEEP_DIRS = {"defaults"}  # Imagen por defecto y otros archivos estáticos
+
+
+class Command(BaseCommand):
+    help = (
+        "Borrar las imágenes de rifas (originales y variantes) que ya no "
+        "referencia ninguna rifa"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Mostrar qué se borraría sin borrar nada",
+        )
+        parser.add_argument(
+            "--min-age",
+            type=float,
+            default=24,
+            help=(
+                "Horas mínimas desde la última escritura: protege las subidas "
+                "cuya rifa aún no se guardó o cuyas variantes no se registraron"
+            ),
+        )
+
+    def referenced(self):
+        names = set()
+        for image, variants in (
+            Raffle.objects.exclude(raffle_image="")
+            .values_list("raffle_image", "raffle_image_variants")
+            .iterator()
+        ):
+            if image:
+                names.add(image)
+            names.update(variants.values())
+        return names
+
+    def walk(self, storage, path):
+        if not storage.exists(path):
+            return
+        directories, files = storage.listdir(path)
+        for name in files:
+            yield f"{path}/{name}"
+        for directory in directories:
+            if path == IMAGE_DIR and directory in KEEP_DIRS:
+                continue
+            yield from self.walk(storage, f"{path}/{directory}")
+
+    def handle(self, *args, **options):
+        storage = Raffle._meta.get_field("raffle_image").storage
+        # Primero los archivos y luego las referencias: una imagen subida
+        # entre ambos pasos queda protegida por --min-age
+        files = list(self.walk(storage, IMAGE_DIR))
+        referenced = self.referenced()
+        cutoff = timezone.now() - timedelta(hours=options["min_age"])
+
+        deleted = freed = 0
+        for name in files:
+            if name in referenced or storage.get_modified_time(name) > cutoff:
+                continue
+            freed += storage.size(name)
+            deleted += 1
+            if options["dry_run"]:
+                self.stdout.write(f"  {name}")
+            else:
+                storage.delete(name)
+
+        action = "se borrarían" if options["dry_run"] else "borrados"
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"✅ {deleted} archivos sin uso {action} "
+                f"({freed / (1024 * 1024):.1f} MB) de {len(files)} revisados"
+            )
+        )
@@ -0,0 +1,38 @@
+from django.core.management.base import BaseCommand
+
+from raffle.models import Raffle
+from raffle.tasks import enqueue_process_image, process_raffle_image
+
+
+class Command(BaseCommand):
+    help = (
+        "Generar las variantes WebP de las imágenes de rifas que aún no las "
+        "tienen (por ejemplo, las subidas antes de raffle/images.py)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--now",
+            action="store_true",
+            help="Procesarlas en este proceso en vez de encolarlas para run_worker",
+        )
+
+    def handle(self, *args, **options):
+        pending = [
+            pk
+            for pk, source, variants in Raffle.objects.exclude(raffle_image="")
+            .exclude(raffle_image__isnull=True)
+            .values_list("pk", "raffle_image", "raffle_image_variants")
+            .iterator()
+            if variants.get("source") != source
+        ]
+        for pk in pending:
+            if options["now"]:
+                process_raffle_image(pk)
+            else:
+                enqueue_process_image(pk)
+
+        action = "procesadas" if options["now"] else "encoladas"
+        self.stdout.write(
+            self.style.SUCCESS(f"✅ {len(pending)} imágenes de rifas {action}")
+        )
@@ -0,0 +1,82 @@
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+from django.utils import timezone
+
+from raffle.scheduler import DrawScheduler
+
+
+class Command(BaseCommand):
+    help = "Ejecutar los sorteos de las rifas en su fecha exacta (proceso continuo)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--refresh",
+            type=float,
+            default=1.0,
+            help="Segundos entre consultas de rifas nuevas o modificadas (default: 1)",
+        )
+        parser.add_argument(
+            "--overlap",
+            type=float,
+            default=5.0,
+            help="Ventana de solape en segundos al buscar cambios (default: 5)",
+        )
+        parser.add_argument(
+            "--resync",
+            type=float,
+            default=3600.0,
+            help="Segundos entre recargas completas del heap (default: 3600)",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Cargar, procesar las rifas ya vencidas y terminar",
+        )
+
+    def handle(self, *args, **options):
+        scheduler = DrawScheduler(overlap=timedelta(seconds=options["overlap"]))
+        pending = scheduler.load()
+        self.stdout.write(f"📅 Rifas pendientes de sorteo: {pending}")
+        last_resync = time.monotonic()
+
+        try:
+            while True:
+                self.fire_due(scheduler)
+                if options["once"]:
+                    break
+
+                # Dormir hasta el próximo sorteo o el próximo refresco
+                wait = options["refresh"]
+                deadline = scheduler.next_deadline()
+                if deadline is not None:
+                    until = (deadline - timezone.now()).total_seconds()
+                    wait = max(0.0, min(wait, until))
+                time.sleep(wait)
+
+                close_old_connections()
+                if time.monotonic() - last_resync >= options["resync"]:
+                    scheduler.load()
+                    last_resync = time.monotonic()
+                else:
+                    scheduler.refresh()
+        except KeyboardInterrupt:
+            self.stdout.write("Programador detenido")
+
+    def fire_due(self, scheduler):
+        for raffle_id, draw_date in scheduler.pop_due():
+            lateness = (timezone.now() - draw_date).total_seconds() * 1000
+            if scheduler.fire(raffle_id):
+                self.stdout.write(
+                    self.style.SUCCESS(
+                        f"✅ Rifa {raffle_id}: procesada con {lateness:.0f} ms de retraso"
+                    )
+                )
+            else:
+                self.stdout.write(
+                    self.style.WARNING(
+                        f"⚠️ Rifa {raffle_id}: no se pudo procesar, queda en la cola de tareas"
+                    )
+                )
@@ -7,30 +7,33 @@ from django.core.validators import MinValueValidator
 from django.db import models
 from django.utils import timezone
 
+from core.search import SearchIndex
+from core.storage import ContentAddressedStorage
 from raffleInfo.models import PrizeType, StateRaffle
 from user.models import User
 from userInfo.models import PaymentMethod
 
+from .events import publish_numbers
+
 
 def raffle_image_upload_path(instance, filename):
-    # Obtener la fecha actual
-    now = timezone.now()
-    # Obtener la extensión del archivo y limpiar el nombre
-    ext = filename.split(".")[-1].lower()
-    # Limpiar el nombre original para evitar caracteres problemáticos
-    clean_name = "".join(
-        c for c in filename.split(".")[0] if c.isalnum() or c in (" ", "-", "_")
-    ).rstrip()
-    clean_name = clean_name.replace(" ", "_")[:50]  # Limitar longitud
-
-    # Crear nombre único basado en el ID de la rifa (si existe) o timestamp
-    if instance.pk:
-        filename = f"raffle_{instance.pk}_{clean_name}.{ext}"
-    else:
-        # Usar microsegundos para mayor unicidad en rifas nuevas
-        filename = f"raffle_new_{now.strftime('%Y%m%d_%H%M%S_%f')}.{ext}"
-
-    return os.path.join("raffles", str(now.year), str(now.month), filename)
+    # El archivo se guarda con el hash de su contenido (core/storage.py):
+    # del nombre propuesto solo se conservan el directorio y la extensión
+    ext = os.path.splitext(filename)[1].lower()
+    return os.path.join("raffles", f"upload{ext}")
+
+
+# Búsqueda de rifas por nombre y descripción (core/search.py)
+raffle_search_index = SearchIndex(
+    "raffle.Raffle", ("raffle_name", "raffle_description")
+)
+
+
+class RaffleManager(models.Manager):
+    def bulk_create(self, objs, *args, **kwargs):
+        # bulk_create no llama a save(): search_text se calcula aquí
+        objs = raffle_search_index.fill(objs)
+        return super().bulk_create(objs, *args, **kwargs)
 
 
 class Raffle(models.Model):
@@ -73,11 +76,19 @@ class Raffle(models.Model):
     # Imagen subida al servidor (recomendada)
     raffle_image = models.ImageField(
         upload_to=raffle_image_upload_path,
+        storage=ContentAddressedStorage(),
         blank=True,
         null=True,
         verbose_name="Imagen de la rifa",
         help_text="Imagen promocional de la rifa (opcional)",
     )
+    # Variantes WebP de raffle_image generadas por el worker (raffle/images.py)
+    raffle_image_variants = models.JSONField(
+        default=dict,
+        blank=True,
+        editable=False,
+        verbose_name="Variantes de la imagen",
+    )
     raffle_prize_amount = models.DecimalField(
         max_digits=10,
         decimal_places=2,
@@ -130,6 +141,12 @@ class Raffle(models.Model):
         verbose_name="Método de pago del creador",
         help_text="Método de pago donde se depositará el dinero recaudado",
     )
+    # Nombre y descripción normalizados para /raffle/search/
+    search_text = models.TextField(
+        blank=True, default="", editable=False, verbose_name="Texto de búsqueda"
+    )
+
+    objects = RaffleManager()
 
     class Meta:
         verbose_name = "Rifa"
@@ -143,6 +160,12 @@ class Raffle(models.Model):
             models.Index(fields=["raffle_winner"]),
             models.Index(fields=["raffle_name"]),
             models.Index(fields=["raffle_prize_type"]),
+            # Refresco incremental del programador de sorteos
+            models.Index(fields=["raffle_updated_at"]),
+            # Filtros de /raffle/search/ sobre rifas activas
+            models.Index(fields=["raffle_state", "raffle_draw_date"]),
+            models.Index(fields=["raffle_state", "raffle_number_price"]),
+            models.Index(fields=["raffle_state", "raffle_created_at", "id"]),
         ]
 
     def clean(self):  # Validaciones personalizadas
@@ -182,6 +205,9 @@ class Raffle(models.Model):
         if not self.pk and not self.raffle_state_id:
             self._assign_default_active_state()
         self.clean()
+        kwargs["update_fields"] = raffle_search_index.prepare_save(
+            self, kwargs.get("update_fields")
+        )
         super().save(*args, **kwargs)
 
     def _assign_default_active_state(self):  # Asignar estado "Activo" por defecto
@@ -384,6 +410,7 @@ class Raffle(models.Model):
         # Eliminar tickets si había
         if tickets:
             self.sold_tickets.all().delete()
+            publish_numbers(self.id, "refunded", [t.number for t in tickets])
 
         # Cambiar estado a cancelado si corresponde
         if cancelled_state:
@@ -448,6 +475,7 @@ class Raffle(models.Model):
 
         if tickets:
             self.sold_tickets.all().delete()
+            publish_numbers(self.id, "refunded", [t.number for t in tickets])
 
         if cancelled_state:
             self.raffle_state = cancelled_state
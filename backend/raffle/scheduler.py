@@ -0,0 +1,133 @@
+"""
+Programador de sorteos por fecha límite.
+
+Mantiene en memoria un min-heap con las fechas de sorteo de las rifas
+activas sin ganador y dispara cada una al llegar su raffle_draw_date.
+
+Para enterarse de rifas nuevas o modificadas no recorre toda la tabla: cada
+refresco consulta solo las filas con raffle_updated_at posterior a la última
+vista (índice sobre raffle_updated_at), con una ventana de solape para no
+perder transacciones que confirmaron tarde. Los cambios hechos con
+QuerySet.update() no tocan raffle_updated_at; para esos está la
+resincronización completa periódica.
+"""
+
+import heapq
+import logging
+from datetime import timedelta
+
+from django.db.models import Max
+from django.utils import timezone
+
+from jobs.worker import run_now
+
+from .models import Raffle
+from .tasks import enqueue_process_expired
+
+logger = logging.getLogger(__name__)
+
+
+def _is_pending(row):
+    """Rifa en estado activo y sin ganador (misma regla que _is_in_active_state)"""
+    if row["raffle_winner_id"]:
+        return False
+    code = row["raffle_state__state_raffle_code"] or ""
+    if code.upper() == "ACT":
+        return True
+    return "activa" in (row["raffle_state__state_raffle_name"] or "").lower()
+
+
+class DrawScheduler:
+    """
+    Heap de (raffle_draw_date, raffle_id). Las entradas obsoletas (rifa
+    reprogramada, sorteada o cancelada) se descartan al salir del heap
+    comparando con `deadlines`, que guarda la fecha vigente de cada rifa.
+    """
+
+    values_fields = (
+        "id",
+        "raffle_draw_date",
+        "raffle_updated_at",
+        "raffle_winner_id",
+        "raffle_state__state_raffle_code",
+        "raffle_state__state_raffle_name",
+    )
+
+    def __init__(self, overlap=timedelta(seconds=5)):
+        self.overlap = overlap
+        self.heap = []
+        self.deadlines = {}
+        self.last_seen = None
+
+    def load(self):
+        """Carga completa: reconstruye el heap con todas las rifas pendientes"""
+        self.heap = []
+        self.deadlines = {}
+        self.last_seen = Raffle.objects.aggregate(latest=Max("raffle_updated_at"))[
+            "latest"
+        ]
+        queryset = Raffle.objects.filter(raffle_winner__isnull=True).values(
+            *self.values_fields
+        )
+        for row in queryset.iterator(chunk_size=2000):
+            self._track(row)
+        heapq.heapify(self.heap)
+        return len(self.deadlines)
+
+    def refresh(self):
+        """Aplica las rifas guardadas desde el último refresco. Retorna cuántas"""
+        if self.last_seen is None:
+            return self.load()
+
+        rows = list(
+            Raffle.objects.filter(
+                raffle_updated_at__gt=self.last_seen - self.overlap
+            ).values(*self.values_fields)
+        )
+        for row in rows:
+            self._track(row, push=True)
+            self.last_seen = max(self.last_seen, row["raffle_updated_at"])
+        return len(rows)
+
+    def _track(self, row, push=False):
+        raffle_id, draw_date = row["id"], row["raffle_draw_date"]
+        if not _is_pending(row):
+            self.deadlines.pop(raffle_id, None)
+            return
+        if self.deadlines.get(raffle_id) == draw_date:
+            return
+        self.deadlines[raffle_id] = draw_date
+        if push:
+            heapq.heappush(self.heap, (draw_date, raffle_id))
+        else:
+            self.heap.append((draw_date, raffle_id))
+
+    def next_deadline(self):
+        """Fecha del próximo sorteo vigente, o None si no hay pendientes"""
+        while self.heap:
+            draw_date, raffle_id = self.heap[0]
+            if self.deadlines.get(raffle_id) == draw_date:
+                return draw_date
+            heapq.heappop(self.heap)  # Entrada obsoleta
+        return None
+
+    def pop_due(self, now=None):
+        """Saca del heap las rifas cuya fecha de sorteo ya llegó"""
+        now = now or timezone.now()
+        due = []
+        while True:
+            draw_date = self.next_deadline()
+            if draw_date is None or draw_date > now:
+                return due
+            _, raffle_id = heapq.heappop(self.heap)
+            del self.deadlines[raffle_id]
+            due.append((raffle_id, draw_date))
+
+    def fire(self, raffle_id):
+        """
+        Procesa la rifa de inmediato a través de la cola de tareas, para
+        conservar idempotencia y reintentos si el sorteo falla.
+        Retorna True si terminó, False si falló o la tomó otro worker.
+        """
+        job = enqueue_process_expired(raffle_id)
+        return bool(run_now(job))
@@ -2,15 +2,24 @@ from django.core.exceptions import ValidationError
 from django.utils import timezone
 from rest_framework import serializers
 
-from raffleInfo.serializer import PrizeTypeSerializer, StateRaffleSerializer
-from user.serializer import UserBasicSerializer
-
+from core.serializers import PlainSerializer, decimal_formatter, format_datetime
+from raffleInfo.serializer import (
+    PrizeTypePlainSerializer,
+    PrizeTypeSerializer,
+    StateRafflePlainSerializer,
+    StateRaffleSerializer,
+)
+from user.serializer import UserBasicPlainSerializer, UserBasicSerializer
+
+from .images import validate_raffle_image, variant_urls
 from .models import Raffle
 
 
 class RaffleCreateSerializer(serializers.ModelSerializer):
 
-    raffle_image = serializers.ImageField(required=False)
+    raffle_image = serializers.ImageField(
+        required=False, validators=[validate_raffle_image]
+    )
 
     class Meta:
         model = Raffle
@@ -56,6 +65,7 @@ class RaffleListSerializer(serializers.ModelSerializer):
     raffle_state = StateRaffleSerializer(read_only=True)
     raffle_created_by = UserBasicSerializer(read_only=True)
     raffle_winner = UserBasicSerializer(read_only=True)
+    raffle_image_variants = serializers.SerializerMethodField()
 
     class Meta:
         model = Raffle
@@ -68,6 +78,7 @@ class RaffleListSerializer(serializers.ModelSerializer):
             "raffle_number_amount",
             "raffle_number_price",
             "raffle_image",
+            "raffle_image_variants",
             "raffle_prize_amount",
             "raffle_prize_type",
             "raffle_state",
@@ -75,10 +86,80 @@ class RaffleListSerializer(serializers.ModelSerializer):
             "raffle_winner",
         ]
 
+    def get_raffle_image_variants(self, obj):
+        """URLs de las variantes WebP (thumbnail, card, full)"""
+        return variant_urls(
+            obj.raffle_image.storage,
+            obj.raffle_image.name,
+            obj.raffle_image_variants,
+            self.context.get("request"),
+        )
+
+
+class RafflePlainListSerializer(PlainSerializer):
+    """
+    Misma salida que RaffleListSerializer, construida desde .values() en una
+    sola consulta sin instanciar modelos ni serializadores anidados por fila.
+    """
+
+    values_fields = (
+        "id",
+        "raffle_name",
+        "raffle_description",
+        "raffle_draw_date",
+        "raffle_minimum_numbers_sold",
+        "raffle_number_amount",
+        "raffle_number_price",
+        "raffle_image",
+        "raffle_image_variants",
+        "raffle_prize_amount",
+        *PrizeTypePlainSerializer.prefixed_fields("raffle_prize_type__"),
+        *StateRafflePlainSerializer.prefixed_fields("raffle_state__"),
+        *UserBasicPlainSerializer.prefixed_fields("raffle_created_by__"),
+        *UserBasicPlainSerializer.prefixed_fields("raffle_winner__"),
+    )
+
+    format_price = staticmethod(decimal_formatter(Raffle, "raffle_number_price"))
+    format_prize = staticmethod(decimal_formatter(Raffle, "raffle_prize_amount"))
+    image_storage = Raffle._meta.get_field("raffle_image").storage
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.prize_type = PrizeTypePlainSerializer()
+        self.state = StateRafflePlainSerializer()
+        self.user = UserBasicPlainSerializer()
+
+    def to_representation(self, row):
+        return {
+            "id": row["id"],
+            "raffle_name": row["raffle_name"],
+            "raffle_description": row["raffle_description"],
+            "raffle_draw_date": format_datetime(row["raffle_draw_date"]),
+            "raffle_minimum_numbers_sold": row["raffle_minimum_numbers_sold"],
+            "raffle_number_amount": row["raffle_number_amount"],
+            "raffle_number_price": self.format_price(row["raffle_number_price"]),
+            "raffle_image": self.file_url(row["raffle_image"], self.image_storage),
+            "raffle_image_variants": variant_urls(
+                self.image_storage,
+                row["raffle_image"],
+                row["raffle_image_variants"],
+                self.context.get("request"),
+            ),
+            "raffle_prize_amount": self.format_prize(row["raffle_prize_amount"]),
+            "raffle_prize_type": self.prize_type.to_representation(
+                row, "raffle_prize_type__"
+            ),
+            "raffle_state": self.state.to_representation(row, "raffle_state__"),
+            "raffle_created_by": self.user.to_representation(
+                row, "raffle_created_by__"
+            ),
+            "raffle_winner": self.user.to_representation(row, "raffle_winner__"),
+        }
+
 
 class RaffleUpdateSerializer(serializers.ModelSerializer):
     raffle_image = serializers.ImageField(
-        required=False
+        required=False, validators=[validate_raffle_image]
     )  # Opcional para actualizaciones
 
     class Meta:
@@ -144,7 +225,7 @@ class RaffleUpdateSerializer(serializers.ModelSerializer):
 class AdminRaffleUpdateSerializer(serializers.ModelSerializer):
 
     raffle_image = serializers.ImageField(
-        required=False
+        required=False, validators=[validate_raffle_image]
     )  # Opcional para actualizaciones
 
     class Meta:
@@ -347,3 +428,43 @@ class AvailableNumbersSerializer(serializers.ModelSerializer):
     def get_numbers(self, obj):
         # Usar el método del modelo para obtener los números disponibles
         return obj.available_numbers
+
+
+class RaffleSearchParamsSerializer(serializers.Serializer):
+    """Parámetros de GET /raffle/search/ (todos opcionales)"""
+
+    ORDERINGS = ("relevance", "newest", "draw_date", "-draw_date", "price", "-price")
+
+    search = serializers.CharField(required=False, allow_blank=True, max_length=100)
+    prize_type = serializers.IntegerField(required=False)
+    min_price = serializers.DecimalField(
+        max_digits=10, decimal_places=2, min_value=0, required=False
+    )
+    max_price = serializers.DecimalField(
+        max_digits=10, decimal_places=2, min_value=0, required=False
+    )
+    draw_from = serializers.DateTimeField(required=False)
+    draw_to = serializers.DateTimeField(required=False)
+    # Porcentaje vendido del mínimo para sortear (100 = mínimo alcanzado)
+    min_progress = serializers.IntegerField(min_value=0, max_value=100, required=False)
+    min_rating = serializers.FloatField(min_value=1, max_value=5, required=False)
+    ordering = serializers.ChoiceField(choices=ORDERINGS, required=False)
+
+    def validate(self, data):
+        if (
+            "min_price" in data
+            and "max_price" in data
+            and data["min_price"] > data["max_price"]
+        ):
+            raise serializers.ValidationError(
+                {"min_price": "El precio mínimo no puede ser mayor al máximo."}
+            )
+        if (
+            "draw_from" in data
+            and "draw_to" in data
+            and data["draw_from"] > data["draw_to"]
+        ):
+            raise serializers.ValidationError(
+                {"draw_from": "La fecha inicial no puede ser posterior a la final."}
+            )
+        return data
@@ -11,8 +11,10 @@ logger = logging.getLogger(__name__)
 @receiver(post_save, sender="raffle.Raffle")
 def auto_process_expired_raffle(sender, instance, created, **kwargs):
     """
-    Procesar rifa automáticamente si pasó su fecha.
-    Se ejecuta cada vez que se guarda una rifa (creación o actualización).
+    Encolar el procesamiento de la rifa si pasó su fecha.
+    Se ejecuta cada vez que se guarda una rifa (creación o actualización);
+    el sorteo o la cancelación con reembolsos los hace el worker (run_worker)
+    para no alargar la petición que guardó la rifa.
     """
     # Evitar procesamiento en creación inicial o si ya tiene ganador
     if created or instance.raffle_winner:
@@ -26,50 +28,10 @@ def auto_process_expired_raffle(sender, instance, created, **kwargs):
         and not instance.raffle_winner
         and instance._is_in_active_state()
     ):
+        from .tasks import enqueue_process_expired
 
-        logger.info(f"Procesando rifa vencida: {instance.id} - {instance.raffle_name}")
-
-        if instance.minimum_reached:
-            try:
-                # Ejecutar sorteo automáticamente
-                result = instance.execute_raffle_draw()
-                logger.info(
-                    f"✅ Sorteo automático exitoso para rifa {instance.id}: {result.get('winner_user', 'N/A')}"
-                )
-            except Exception as e:
-                logger.error(f"❌ Error auto-sorteo rifa {instance.id}: {e}")
-        else:
-            try:
-                # Auto-cancelar si no alcanzó mínimo CON REEMBOLSOS
-                from raffleInfo.models import StateRaffle
-
-                cancelled_state = (
-                    StateRaffle.objects.filter(state_raffle_code__iexact="CAN").first()
-                    or StateRaffle.objects.filter(
-                        state_raffle_name__icontains="cancel"
-                    ).first()
-                )
-
-                if cancelled_state and instance.raffle_state != cancelled_state:
-                    # Usar método de cancelación con reembolsos
-                    result = instance.cancel_raffle_and_refund(
-                        admin_reason="Cancelación automática: mínimo no alcanzado"
-                    )
-
-                    logger.info(
-                        f"📋 Rifa {instance.id} cancelada automáticamente con reembolsos - "
-                        f"Tickets reembolsados: {result['tickets_refunded']}, "
-                        f"Monto total: ${result['total_amount_refunded']}"
-                    )
-                else:
-                    logger.warning(
-                        f"⚠️ No se encontró estado cancelado o la rifa {instance.id} ya está cancelada"
-                    )
-
-            except Exception as e:
-                logger.error(
-                    f"❌ Error auto-cancelación con reembolsos rifa {instance.id}: {e}"
-                )
+        logger.info(f"Encolando rifa vencida: {instance.id} - {instance.raffle_name}")
+        enqueue_process_expired(instance.pk)
 
 
 # Signal adicional para verificar rifas cuando se consultan
@@ -79,8 +41,9 @@ from django.db.models.signals import post_init
 @receiver(post_init, sender="raffle.Raffle")
 def check_raffle_on_load(sender, instance, **kwargs):
     """
-    Verificar y procesar rifa cuando se carga desde la base de datos.
-    Útil para casos donde la rifa no se ha actualizado en mucho tiempo.
+    Verificar la rifa cuando se carga desde la base de datos.
+    Útil para casos donde la rifa no se ha actualizado en mucho tiempo:
+    encola su procesamiento sin guardarla durante la consulta.
     """
     if not instance.pk:  # Solo para instancias existentes
         return
@@ -90,14 +53,54 @@ def check_raffle_on_load(sender, instance, **kwargs):
     # Solo verificar si la rifa pasó su fecha hace más de 1 hora (para evitar spam)
     if (
         instance.raffle_draw_date <= now
-        and not instance.raffle_winner
+        and not instance.raffle_winner_id
         and instance._is_in_active_state()
         and (now - instance.raffle_draw_date).total_seconds() > 3600
     ):  # 1 hora
+        from .tasks import enqueue_process_expired
 
-        # Trigger un save para activar el signal de post_save
         try:
-            instance._allow_past_date = True  # Permitir guardar con fecha pasada
-            instance.save()
+            # Si ya falló definitivamente no se reintenta en cada consulta;
+            # se reintenta al guardar la rifa o desde el admin de tareas
+            enqueue_process_expired(instance.pk, retry_failed=False)
         except Exception as e:
-            logger.error(f"Error al procesar rifa en carga: {e}")
+            logger.error(f"Error al encolar rifa en carga: {e}")
+
+
+# Feed de rifas activas cacheado (raffle/feed.py)
+from django.db.models.signals import post_delete
+
+from .feed import schedule_organizer_update, schedule_raffle_update
+
+ORGANIZER_FEED_FIELDS = {"first_name", "last_name", "rating"}
+
+
+@receiver([post_save, post_delete], sender="raffle.Raffle")
+def update_feed_on_raffle_change(sender, instance, **kwargs):
+    """Actualiza la entrada de la rifa en el feed (o la quita si ya no está activa)"""
+    schedule_raffle_update(instance.pk)
+
+
+@receiver([post_save, post_delete], sender="tickets.Ticket")
+def update_feed_on_ticket_change(sender, instance, **kwargs):
+    """Actualiza los números vendidos de la rifa en el feed"""
+    schedule_raffle_update(instance.raffle_id)
+
+
+@receiver(post_save, sender="user.User")
+def update_feed_on_organizer_change(sender, instance, created, update_fields, **kwargs):
+    """Actualiza nombre y calificación del organizador en sus rifas del feed"""
+    if created or (update_fields and not ORGANIZER_FEED_FIELDS & set(update_fields)):
+        return
+    schedule_organizer_update(instance.pk)
+
+
+# Variantes WebP de la imagen, generadas por el worker (raffle/images.py)
+@receiver(post_save, sender="raffle.Raffle")
+def process_image_on_change(sender, instance, **kwargs):
+    """Encola la generación de variantes si la imagen cambió"""
+    source = instance.raffle_image.name or ""
+    if instance.raffle_image_variants.get("source", "") != source:
+        from .tasks import enqueue_process_image
+
+        enqueue_process_image(instance.pk)
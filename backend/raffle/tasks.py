@@ -0,0 +1,148 @@
+"""
+Tareas en segundo plano de las rifas.
+"""
+
+import logging
+
+from django.db.models import Q
+from django.utils import timezone
+
+from jobs.registry import enqueue, job
+
+logger = logging.getLogger(__name__)
+
+PROCESS_EXPIRED = "raffle.process_expired"
+
+
+def enqueue_process_expired(raffle_id, retry_failed=True):
+    """
+    Encola el sorteo/cancelación de una rifa vencida (una sola vez por rifa).
+    Con retry_failed=False no se vuelve a encolar si ya falló definitivamente.
+    """
+    return enqueue(
+        PROCESS_EXPIRED,
+        {"raffle_id": raffle_id},
+        key=f"{PROCESS_EXPIRED}:{raffle_id}",
+        retry_failed=retry_failed,
+    )
+
+
+@job(PROCESS_EXPIRED)
+def process_expired_raffle(raffle_id):
+    """
+    Sortea la rifa si alcanzó el mínimo de números vendidos; si no, la cancela
+    con reembolsos. No hace nada si la rifa ya fue procesada.
+    """
+    from raffleInfo.models import StateRaffle
+
+    from .models import Raffle
+
+    raffle = Raffle.objects.select_for_update().filter(pk=raffle_id).first()
+    if (
+        raffle is None
+        or raffle.raffle_winner_id
+        or raffle.raffle_draw_date > timezone.now()
+        or not raffle._is_in_active_state()
+    ):
+        return
+
+    logger.info(f"Procesando rifa vencida: {raffle.id} - {raffle.raffle_name}")
+
+    if raffle.minimum_reached:
+        result = raffle.execute_raffle_draw()
+        logger.info(
+            f"✅ Sorteo automático exitoso para rifa {raffle.id}: {result.get('winner_user', 'N/A')}"
+        )
+        return
+
+    cancelled_state = (
+        StateRaffle.objects.filter(state_raffle_code__iexact="CAN").first()
+        or StateRaffle.objects.filter(state_raffle_name__icontains="cancel").first()
+    )
+    if not cancelled_state or raffle.raffle_state == cancelled_state:
+        logger.warning(
+            f"⚠️ No se encontró estado cancelado o la rifa {raffle.id} ya está cancelada"
+        )
+        return
+
+    # Auto-cancelar si no alcanzó mínimo CON REEMBOLSOS
+    result = raffle.cancel_raffle_and_refund(
+        admin_reason="Cancelación automática: mínimo no alcanzado"
+    )
+    logger.info(
+        f"📋 Rifa {raffle.id} cancelada automáticamente con reembolsos - "
+        f"Tickets reembolsados: {result['tickets_refunded']}, "
+        f"Monto total: ${result['total_amount_refunded']}"
+    )
+
+
+PROCESS_IMAGE = "raffle.process_image"
+
+
+def enqueue_process_image(raffle_id):
+    """Encola la generación de las variantes de la imagen de la rifa"""
+    return enqueue(
+        PROCESS_IMAGE,
+        {"raffle_id": raffle_id},
+        key=f"{PROCESS_IMAGE}:{raffle_id}",
+    )
+
+
+@job(PROCESS_IMAGE)
+def process_raffle_image(raffle_id):
+    """
+    Genera las variantes WebP de la imagen actual de la rifa (o las quita si
+    ya no tiene imagen). No hace nada si ya están al día. Los archivos que
+    quedan sin uso los borra gc_raffle_images.
+    """
+    from PIL import Image, UnidentifiedImageError
+
+    from .feed import schedule_raffle_update
+    from .images import generate_variants
+    from .models import Raffle
+
+    storage = Raffle._meta.get_field("raffle_image").storage
+    # Si el original cambia mientras se procesa, enqueue() devuelve esta misma
+    # tarea (sigue activa): se vuelve a leer hasta guardar las del actual
+    while True:
+        row = Raffle.objects.filter(pk=raffle_id).values_list(
+            "raffle_image", "raffle_image_variants"
+        )
+        if not row:
+            return
+        source, previous = row[0]
+        source = source or ""
+        if previous.get("source", "") == source:
+            return
+
+        # Misma imagen en otra rifa (mismo hash): se reutilizan sus variantes
+        variants = (
+            Raffle.objects.filter(
+                raffle_image=source, raffle_image_variants__source=source
+            )
+            .values_list("raffle_image_variants", flat=True)
+            .first()
+            if source
+            else {}
+        )
+        if variants is None:
+            try:
+                variants = generate_variants(storage, source)
+            except (UnidentifiedImageError, OSError, Image.DecompressionBombError) as e:
+                # Reintentar no ayuda: se sigue sirviendo el original
+                logger.warning(
+                    f"No se pudo procesar la imagen de la rifa {raffle_id}: {e}"
+                )
+                return
+
+        image_filter = (
+            Q(raffle_image=source)
+            if source
+            else Q(raffle_image="") | Q(raffle_image__isnull=True)
+        )
+        if Raffle.objects.filter(image_filter, pk=raffle_id).update(
+            raffle_image_variants=variants
+        ):
+            # update() no dispara post_save: la imagen del feed se actualiza aquí
+            schedule_raffle_update(raffle_id)
+            return
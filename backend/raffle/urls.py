@@ -1,26 +1,57 @@
+from django.conf import settings
 from django.urls import path
 
+from .async_views import (
+    AsyncAvailableNumbersView,
+    AsyncRaffleDetailView,
+    AsyncRaffleListView,
+    RaffleEventsView,
+)
 from .views import (
     AdminRaffleCancelView,
     AvailableNumbersView,
+    PayoutExportView,
     RaffleCreateView,
     RaffleDetailView,
     RaffleDrawView,
+    RaffleEventsUnavailableView,
+    RaffleExportView,
+    RaffleFeedView,
     RaffleListView,
+    RaffleSearchView,
     RaffleSoftDeleteView,
     RaffleUpdateView,
     RaffleUserListView,
 )
 
+list_view = RaffleListView.as_view()
+detail_view = RaffleDetailView.as_view()
+available_view = AvailableNumbersView.as_view()
+# El stream SSE solo tiene sentido con workers asíncronos
+events_view = (
+    RaffleEventsView.as_view()
+    if settings.SSE_ENABLED
+    else RaffleEventsUnavailableView.as_view()
+)
+
+if settings.ASYNC_VIEWS:
+    list_view = AsyncRaffleListView.as_view(sync_view=list_view)
+    detail_view = AsyncRaffleDetailView.as_view(sync_view=detail_view)
+    available_view = AsyncAvailableNumbersView.as_view(sync_view=available_view)
+
 urlpatterns = [
     # CRUD básico
     path("create/", RaffleCreateView.as_view(), name="raffle-create"),  # POST - Crear
     path(
-        "list/", RaffleListView.as_view(), name="raffle-list"
+        "list/", list_view, name="raffle-list"
     ),  # GET - Listar todas (públicas activas)
     path(
-        "<int:pk>/", RaffleDetailView.as_view(), name="raffle-detail"
-    ),  # GET - Detalle individual
+        "search/", RaffleSearchView.as_view(), name="raffle-search"
+    ),  # GET - Búsqueda con filtros (paginada)
+    path(
+        "feed/", RaffleFeedView.as_view(), name="raffle-feed"
+    ),  # GET - Feed de rifas activas (caché)
+    path("<int:pk>/", detail_view, name="raffle-detail"),  # GET - Detalle individual
     path(
         "<int:pk>/update/", RaffleUpdateView.as_view(), name="raffle-update"
     ),  # PUT/PATCH - Actualizar
@@ -36,9 +67,20 @@ urlpatterns = [
         "<int:pk>/draw/", RaffleDrawView.as_view(), name="raffle-draw"
     ),  # PATCH - Ejecutar sorteo
     path(
-        "<int:pk>/available/", AvailableNumbersView.as_view(), name="available-numbers"
+        "<int:pk>/available/", available_view, name="available-numbers"
     ),  # GET - Números disponibles
+    path(
+        "<int:pk>/events/", events_view, name="raffle-events"
+    ),  # GET - Stream SSE de números vendidos/liberados (501 fuera de ASGI)
     path(
         "user/<int:user_id>/", RaffleUserListView.as_view(), name="user-raffles"
     ),  # GET - Rifas de usuario (público)
+    path(
+        "export/<str:fmt>/", RaffleExportView.as_view(), name="raffle-export"
+    ),  # GET - Exportar rifas CSV/JSONL (admin)
+    path(
+        "payouts/export/<str:fmt>/",
+        PayoutExportView.as_view(),
+        name="payout-export",
+    ),  # GET - Exportar premios pagados CSV/JSONL (admin)
 ]
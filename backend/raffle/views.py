@@ -1,22 +1,49 @@
+from datetime import timedelta
+
+from django.db.models import Count, F, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from django.utils import timezone
 from rest_framework import generics, status
+from rest_framework.exceptions import ValidationError
 from rest_framework.parsers import FormParser, MultiPartParser
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 
+from core.exports import StreamingExportView
+from core.pagination import CappedPageNumberPagination
 from permissions.permissions import IsAdminUser
 from raffleInfo.serializer import PrizeTypeSerializer, StateRaffleSerializer
 
-from .models import Raffle
+from .feed import get_feed, render_feed
+from .models import Raffle, raffle_search_index
 from .serializer import (
     AvailableNumbersSerializer,
     RaffleCreateSerializer,
     RaffleDrawSerializer,
     RaffleListSerializer,
+    RafflePlainListSerializer,
+    RaffleSearchParamsSerializer,
     RaffleSoftDeleteSerializer,
     RaffleUpdateSerializer,
 )
 
 
+def _overdue_raffles(queryset):
+    """Rifas vencidas hace más de 1 hora y sin ganador (las que procesa post_init)"""
+    return queryset.filter(
+        raffle_draw_date__lte=timezone.now() - timedelta(hours=1),
+        raffle_winner__isnull=True,
+    )
+
+
+def _process_overdue_raffles(queryset):
+    """
+    Las filas de .values() no pasan por el post_init que encola las rifas
+    vencidas, así que solo esas se cargan como instancias antes de listar.
+    """
+    list(_overdue_raffles(queryset))
+
+
 class RaffleCreateView(generics.CreateAPIView):
 
     serializer_class = RaffleCreateSerializer
@@ -48,7 +75,7 @@ class RaffleCreateView(generics.CreateAPIView):
 
 class RaffleListView(generics.ListAPIView):
 
-    serializer_class = RaffleListSerializer
+    serializer_class = RafflePlainListSerializer
     permission_classes = [AllowAny]  # Acceso público
 
     def get_queryset(self):
@@ -66,10 +93,109 @@ class RaffleListView(generics.ListAPIView):
                 state_raffle_name__icontains="activ"
             )
 
-        return Raffle.objects.filter(raffle_state__in=active_states).select_related(
-            "raffle_prize_type", "raffle_state"
+        queryset = Raffle.objects.filter(raffle_state__in=active_states)
+        _process_overdue_raffles(queryset)
+        return RafflePlainListSerializer.values_queryset(queryset)
+
+
+class RaffleFeedView(generics.GenericAPIView):
+    """
+    Feed de rifas activas para la página de inicio, más recientes primero
+    GET /api/v1/raffle/feed/?limit=20
+
+    Se lee de la caché sin consultar la base de datos (raffle/feed.py), con
+    imagen, números vendidos, avance, tiempo restante y organizador ya
+    calculados.
+    """
+
+    permission_classes = [AllowAny]
+
+    def get(self, request, *args, **kwargs):
+        limit = request.query_params.get("limit")
+        if limit is not None:
+            if not limit.isdigit() or int(limit) < 1:
+                raise ValidationError({"limit": "Debe ser un entero positivo."})
+            limit = int(limit)
+        return Response(render_feed(get_feed(limit), request))
+
+
+class RaffleSearchView(generics.ListAPIView):
+    """
+    Búsqueda pública de rifas activas, paginada
+    GET /api/v1/raffle/search/?search=moto&min_price=1000&ordering=draw_date
+
+    - search: texto en nombre y descripción (core/search.py)
+    - prize_type, min_price/max_price, draw_from/draw_to, min_rating (organizador)
+    - min_progress: porcentaje vendido del mínimo para sortear
+    - ordering: relevance (por defecto con search), newest, draw_date, price
+    """
+
+    serializer_class = RafflePlainListSerializer
+    permission_classes = [AllowAny]
+    pagination_class = CappedPageNumberPagination
+
+    ORDERINGS = {
+        "newest": ("-raffle_created_at", "-id"),
+        "draw_date": ("raffle_draw_date", "id"),
+        "-draw_date": ("-raffle_draw_date", "-id"),
+        "price": ("raffle_number_price", "id"),
+        "-price": ("-raffle_number_price", "-id"),
+    }
+
+    def get_queryset(self):
+        from raffleInfo.models import StateRaffle
+        from tickets.models import Ticket
+
+        params = RaffleSearchParamsSerializer(data=self.request.query_params)
+        params.is_valid(raise_exception=True)
+        params = params.validated_data
+
+        active_states = StateRaffle.objects.filter(state_raffle_code__iexact="ACT")
+        if not active_states.exists():
+            active_states = StateRaffle.objects.filter(
+                state_raffle_name__icontains="activ"
+            )
+        # Ids resueltos antes: con un solo estado la consulta usa los índices
+        # (raffle_state, ...) también para el orden
+        active_ids = list(active_states.values_list("pk", flat=True))
+        queryset = Raffle.objects.filter(raffle_state_id__in=active_ids)
+        _process_overdue_raffles(queryset)
+
+        filters = {
+            "raffle_prize_type_id": params.get("prize_type"),
+            "raffle_number_price__gte": params.get("min_price"),
+            "raffle_number_price__lte": params.get("max_price"),
+            "raffle_draw_date__gte": params.get("draw_from"),
+            "raffle_draw_date__lte": params.get("draw_to"),
+            "raffle_created_by__rating__gte": params.get("min_rating"),
+        }
+        queryset = queryset.filter(
+            **{lookup: value for lookup, value in filters.items() if value is not None}
         )
 
+        if params.get("min_progress"):
+            # Conteo de tickets solo de las rifas que pasaron los demás filtros
+            sold = (
+                Ticket.objects.filter(raffle=OuterRef("pk"))
+                .order_by()
+                .values("raffle")
+                .annotate(total=Count("pk"))
+                .values("total")
+            )
+            queryset = queryset.alias(
+                sold_percent=Coalesce(Subquery(sold), 0) * 100
+            ).filter(
+                sold_percent__gte=F("raffle_minimum_numbers_sold")
+                * params["min_progress"]
+            )
+
+        ordering = params.get("ordering", "relevance")
+        if params.get("search"):
+            queryset = raffle_search_index.search(queryset, params["search"])
+        if ordering != "relevance" or not params.get("search"):
+            queryset = queryset.order_by(*self.ORDERINGS.get(ordering, ("-id",)))
+        return RafflePlainListSerializer.values_queryset(queryset)
+
 
 class RaffleSoftDeleteView(generics.UpdateAPIView):
 
@@ -181,7 +307,7 @@ class RaffleUpdateView(generics.UpdateAPIView):
 
 class RaffleUserListView(generics.ListAPIView):
 
-    serializer_class = RaffleListSerializer
+    serializer_class = RafflePlainListSerializer
     permission_classes = [AllowAny]
 
     def get_queryset(self):
@@ -192,9 +318,7 @@ class RaffleUserListView(generics.ListAPIView):
         )
 
         # Base queryset
-        queryset = Raffle.objects.filter(raffle_created_by_id=user_id).select_related(
-            "raffle_prize_type", "raffle_state", "raffle_created_by"
-        )
+        queryset = Raffle.objects.filter(raffle_created_by_id=user_id)
 
         # Si no se solicitan inactivas, filtrar solo activas
         if not include_inactive:
@@ -210,7 +334,10 @@ class RaffleUserListView(generics.ListAPIView):
 
             queryset = queryset.filter(raffle_state__in=active_states)
 
-        return queryset.order_by("-raffle_created_at")
+        _process_overdue_raffles(queryset)
+        return RafflePlainListSerializer.values_queryset(
+            queryset.order_by("-raffle_created_at")
+        )
 
     def _is_same_user(self, user_id):
 
@@ -309,3 +436,77 @@ class AvailableNumbersView(generics.RetrieveAPIView):
     serializer_class = AvailableNumbersSerializer
     permission_classes = [AllowAny]
     lookup_field = "pk"
+
+
+class RaffleEventsUnavailableView(generics.GenericAPIView):
+    """
+    GET /api/v1/raffle/<pk>/events/ cuando el servidor no corre en modo ASGI.
+
+    Con workers síncronos cada conexión SSE ocuparía un worker completo, así
+    que se responde 501 y el cliente consulta /available/ periódicamente.
+    """
+
+    permission_classes = [AllowAny]
+
+    def get(self, request, *args, **kwargs):
+        return Response(
+            {"detail": "Eventos en vivo no disponibles; consulte /available/."},
+            status=status.HTTP_501_NOT_IMPLEMENTED,
+        )
+
+
+class RaffleExportView(StreamingExportView):
+    """
+    Exportación de rifas para administradores (CSV o JSONL en streaming).
+    Filtro opcional: ?state=<código de estado>
+    """
+
+    filename = "raffles"
+    export_fields = (
+        ("id", "id"),
+        ("raffle_name", "raffle_name"),
+        ("state_code", "raffle_state__state_raffle_code"),
+        ("start_date", "raffle_start_date"),
+        ("draw_date", "raffle_draw_date"),
+        ("number_amount", "raffle_number_amount"),
+        ("minimum_numbers_sold", "raffle_minimum_numbers_sold"),
+        ("number_price", "raffle_number_price"),
+        ("prize_type", "raffle_prize_type__prize_type_name"),
+        ("prize_amount", "raffle_prize_amount"),
+        ("created_by_id", "raffle_created_by_id"),
+        ("created_by_email", "raffle_created_by__email"),
+        ("winner_id", "raffle_winner_id"),
+        ("created_at", "raffle_created_at"),
+    )
+
+    def get_queryset(self):
+        queryset = Raffle.objects.order_by("pk")
+        state = self.request.query_params.get("state")
+        if state:
+            queryset = queryset.filter(raffle_state__state_raffle_code__iexact=state)
+        return queryset
+
+
+class PayoutExportView(StreamingExportView):
+    """
+    Exportación de premios pagados: una fila por rifa sorteada con su ganador
+    """
+
+    filename = "payouts"
+    export_fields = (
+        ("raffle_id", "id"),
+        ("raffle_name", "raffle_name"),
+        ("draw_date", "raffle_draw_date"),
+        ("prize_type", "raffle_prize_type__prize_type_name"),
+        ("prize_amount", "raffle_prize_amount"),
+        ("winner_id", "raffle_winner_id"),
+        ("winner_email", "raffle_winner__email"),
+        ("winner_number", "raffle_winner_ticket__number"),
+        ("winner_payment_method_id", "raffle_winner_ticket__payment_method_id"),
+        ("creator_payment_method_id", "raffle_creator_payment_method_id"),
+    )
+
+    def get_queryset(self):
+        return Raffle.objects.filter(raffle_winner__isnull=False).order_by(
+            "raffle_draw_date", "pk"
+        )
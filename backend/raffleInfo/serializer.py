@@ -1,5 +1,7 @@
 from rest_framework import serializers
 
+from core.serializers import PlainSerializer
+
 from .models import PrizeType, StateRaffle
 
 
@@ -13,3 +15,33 @@ class StateRaffleSerializer(serializers.ModelSerializer):
     class Meta:
         model = StateRaffle
         fields = "__all__"
+
+
+class PrizeTypePlainSerializer(PlainSerializer):
+    """PrizeTypeSerializer sobre filas de .values()"""
+
+    values_fields = (
+        "id",
+        "prize_type_name",
+        "prize_type_code",
+        "prize_type_description",
+        "prize_type_is_active",
+    )
+
+    def to_representation(self, row, prefix=""):
+        return {name: row[prefix + name] for name in self.values_fields}
+
+
+class StateRafflePlainSerializer(PlainSerializer):
+    """StateRaffleSerializer sobre filas de .values()"""
+
+    values_fields = (
+        "id",
+        "state_raffle_name",
+        "state_raffle_code",
+        "state_raffle_description",
+        "state_raffle_is_active",
+    )
+
+    def to_representation(self, row, prefix=""):
+        return {name: row[prefix + name] for name in self.values_fields}
@@ -1,3 +1,4 @@
+from django.conf import settings
 from django.urls import include, path
 from rest_framework import routers
 
@@ -10,3 +11,10 @@ router.register(r"stateraffle", StateRaffleViewSet, basename="state-raffle")
 urlpatterns = [
     path("", include(router.urls)),
 ]
+
+if settings.ASYNC_VIEWS:
+    from core.async_views import async_catalog_urls
+
+    urlpatterns = (
+        async_catalog_urls(router, ("prize-type", "state-raffle")) + urlpatterns
+    )
@@ -0,0 +1,208 @@
+import json
+from datetime import date, timedelta
+from decimal import Decimal
+from io import StringIO
+
+from asgiref.sync import sync_to_async
+from django.core.management import call_command
+from django.test import AsyncRequestFactory, TestCase
+from django.utils import timezone
+from rest_framework.test import APIRequestFactory
+
+from core.async_views import AsyncCatalogView
+from jobs.models import Job
+from location.models import City, Country, State
+from raffle.async_views import (
+    AsyncAvailableNumbersView,
+    AsyncRaffleDetailView,
+    AsyncRaffleListView,
+)
+from raffle.models import Raffle
+from raffle.views import AvailableNumbersView, RaffleDetailView, RaffleListView
+from raffleInfo.models import PrizeType, StateRaffle
+from raffleInfo.views import PrizeTypeViewSet
+from tickets.models import Ticket
+from user.models import User
+from userInfo.models import DocumentType, Gender, PaymentMethod, PaymentMethodType
+
+
+class AsyncViewsTestCase(TestCase):
+    """Las vistas asíncronas (modo ASGI) deben responder igual que las de DRF"""
+
+    @classmethod
+    def setUpTestData(cls):
+        country = Country.objects.create(country_name="Colombia", country_code="CO")
+        state = State.objects.create(
+            state_name="Valle", state_code="VAL", state_country=country
+        )
+        city = City.objects.create(city_name="Cali", city_code="CAL", city_state=state)
+        gender = Gender.objects.create(gender_name="Masculino", gender_code="M")
+        document_type = DocumentType.objects.create(
+            document_type_name="Cédula", document_type_code="CC"
+        )
+        payment_type = PaymentMethodType.objects.create(
+            payment_method_type_name="Tarjeta", payment_method_type_code="TC"
+        )
+        cls.prize_type = PrizeType.objects.create(
+            prize_type_name="Dinero", prize_type_code="DIN"
+        )
+        cls.active = StateRaffle.objects.create(
+            state_raffle_name="Activa", state_raffle_code="ACT"
+        )
+        cls.cancelled = StateRaffle.objects.create(
+            state_raffle_name="Cancelada", state_raffle_code="CAN"
+        )
+
+        users = []
+        for i, document in enumerate(("0000000000", "11111111", "22222222")):
+            user = User.objects.create_user(
+                email=f"user{i}@test.com",
+                password="testpass123",
+                first_name=f"Usuario{i}",
+                last_name="Test",
+                gender=gender,
+                document_type=document_type,
+                document_number=document,
+                city=city,
+            )
+            payment_method = PaymentMethod.objects.create(
+                user=user,
+                payment_method_type=payment_type,
+                paymenth_method_holder_name="Titular",
+                paymenth_method_card_number_hash="hash",
+                paymenth_method_expiration_date=date(2030, 12, 31),
+                last_digits="1234",
+                payment_method_balance=Decimal("100000.00"),
+            )
+            users.append((user, payment_method))
+        (organizer, organizer_pm), (buyer, buyer_pm) = users[1:]
+
+        raffle_data = {
+            "raffle_description": "Descripción",
+            "raffle_start_date": timezone.now() - timedelta(days=1),
+            "raffle_minimum_numbers_sold": 5,
+            "raffle_number_amount": 20,
+            "raffle_number_price": Decimal("5000"),
+            "raffle_prize_amount": Decimal("100000"),
+            "raffle_prize_type": cls.prize_type,
+            "raffle_created_by": organizer,
+            "raffle_creator_payment_method": organizer_pm,
+        }
+        cls.raffle = Raffle.objects.create(
+            raffle_name="Rifa activa",
+            raffle_draw_date=timezone.now() + timedelta(days=10),
+            **raffle_data,
+        )
+        cls.overdue = Raffle.objects.create(
+            raffle_name="Rifa vencida",
+            raffle_draw_date=timezone.now() + timedelta(days=10),
+            **raffle_data,
+        )
+        Raffle.objects.filter(pk=cls.overdue.pk).update(
+            raffle_draw_date=timezone.now() - timedelta(hours=2)
+        )
+        for number in (3, 7):
+            Ticket.objects.create(
+                raffle=cls.raffle, number=number, user=buyer, payment_method=buyer_pm
+            )
+
+    def sync_get(self, view, **kwargs):
+        response = view(APIRequestFactory().get("/"), **kwargs)
+        response.render()
+        return response
+
+    async def sync_to(self, view, **kwargs):
+        """Respuesta renderizada de la vista DRF síncrona equivalente"""
+        return await sync_to_async(self.sync_get)(view, **kwargs)
+
+    async def async_get(self, view, **kwargs):
+        return await view(AsyncRequestFactory().get("/"), **kwargs)
+
+    async def test_raffle_list_matches_drf(self):
+        """El listado asíncrono coincide con RaffleListView y encola las vencidas"""
+        response = await self.async_get(AsyncRaffleListView.as_view())
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "application/json")
+        # La rifa vencida sigue listada hasta que el worker la procese
+        names = [raffle["raffle_name"] for raffle in json.loads(response.content)]
+        self.assertEqual(names, ["Rifa vencida", "Rifa activa"])
+        self.assertTrue(
+            await Job.objects.filter(payload={"raffle_id": self.overdue.pk}).aexists()
+        )
+        expected = await self.sync_to(RaffleListView.as_view())
+        self.assertEqual(response.content, expected.content)
+
+    async def test_raffle_detail_matches_drf(self):
+        view = AsyncRaffleDetailView.as_view()
+        response = await self.async_get(view, pk=self.raffle.pk)
+        expected = await self.sync_to(RaffleDetailView.as_view(), pk=self.raffle.pk)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.content, expected.content)
+
+    async def test_raffle_detail_not_found(self):
+        """Un ID inexistente responde 404 con el mismo cuerpo que DRF"""
+        response = await self.async_get(AsyncRaffleDetailView.as_view(), pk=999)
+        expected = await self.sync_to(RaffleDetailView.as_view(), pk=999)
+
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(response.content, expected.content)
+
+    async def test_overdue_raffle_processed_on_detail(self):
+        """La rifa vencida se encola igual que al cargarla como instancia"""
+        view = AsyncRaffleDetailView.as_view()
+        await self.async_get(view, pk=self.overdue.pk)
+        await sync_to_async(call_command)("run_worker", "--once", stdout=StringIO())
+
+        response = await self.async_get(view, pk=self.overdue.pk)
+        data = json.loads(response.content)
+        self.assertEqual(data["raffle_state"]["state_raffle_code"], "CAN")
+
+    async def test_available_numbers_matches_drf(self):
+        view = AsyncAvailableNumbersView.as_view()
+        response = await self.async_get(view, pk=self.raffle.pk)
+        expected = await self.sync_to(AvailableNumbersView.as_view(), pk=self.raffle.pk)
+
+        self.assertEqual(response.content, expected.content)
+        data = json.loads(response.content)
+        self.assertNotIn(3, data["numbers"])
+        self.assertEqual(data["numbers_available"], 18)
+
+    async def test_catalog_list_and_detail(self):
+        """Los catálogos asíncronos devuelven lo mismo que el viewset"""
+        fields = [f.name for f in PrizeType._meta.concrete_fields]
+        list_view = AsyncCatalogView.as_view(model=PrizeType, fields=fields)
+        detail_view = AsyncCatalogView.as_view(model=PrizeType, fields=fields)
+
+        response = await self.async_get(list_view)
+        expected = await self.sync_to(PrizeTypeViewSet.as_view({"get": "list"}))
+        self.assertEqual(response.content, expected.content)
+
+        response = await self.async_get(detail_view, pk=str(self.prize_type.pk))
+        expected = await self.sync_to(
+            PrizeTypeViewSet.as_view({"get": "retrieve"}), pk=self.prize_type.pk
+        )
+        self.assertEqual(response.content, expected.content)
+
+        response = await self.async_get(detail_view, pk="abc")
+        self.assertEqual(response.status_code, 404)
+
+    async def test_write_methods_delegated_to_drf(self):
+        """POST se delega a la vista DRF con sus permisos"""
+        view = AsyncCatalogView.as_view(
+            model=PrizeType,
+            sync_view=PrizeTypeViewSet.as_view({"get": "list", "post": "create"}),
+        )
+        request = AsyncRequestFactory().post(
+            "/", {"prize_type_name": "Carro"}, content_type="application/json"
+        )
+
+        response = await view(request)
+        if hasattr(response, "render"):
+            response.render()
+
+        self.assertEqual(response.status_code, 401)
+        self.assertFalse(
+            await PrizeType.objects.filter(prize_type_name="Carro").aexists()
+        )
@@ -15,8 +15,10 @@ from django.test import TestCase, TransactionTestCase
 from django.utils import timezone
 from rest_framework.test import APITestCase
 
+from jobs.models import Job
 from location.models import City, Country, State
 from raffle.models import Raffle
+from raffle.tasks import enqueue_process_expired
 from raffleInfo.models import PrizeType, StateRaffle
 from tickets.models import Ticket
 from user.models import User
@@ -189,6 +191,7 @@ class AutoRaffleProcessingTestCase(TransactionTestCase):
         # Simular carga desde BD (trigger del signal post_init)
         with transaction.atomic():
             loaded_raffle = Raffle.objects.get(id=raffle.id)
+        call_command("run_worker", "--once", stdout=StringIO())
 
         # Verificar que se canceló automáticamente
         loaded_raffle.refresh_from_db()
@@ -228,6 +231,8 @@ class AutoRaffleProcessingTestCase(TransactionTestCase):
             number=2,
             payment_method=self.payment_method2,
         )
+        # Lo recaudado queda en la cuenta conjunta, como en una compra real
+        self.admin_payment_method.add_balance(2 * raffle.raffle_number_price)
 
         # Ahora vencer la rifa manualmente usando update (bypass validation)
         past_date = timezone.now() - timedelta(hours=2)
@@ -240,6 +245,7 @@ class AutoRaffleProcessingTestCase(TransactionTestCase):
         # Simular carga desde BD
         with transaction.atomic():
             loaded_raffle = Raffle.objects.get(id=raffle.id)
+        call_command("run_worker", "--once", stdout=StringIO())
 
         # Verificar que se sorteó automáticamente
         loaded_raffle.refresh_from_db()
@@ -270,6 +276,7 @@ class AutoRaffleProcessingTestCase(TransactionTestCase):
 
         with transaction.atomic():
             loaded_raffle = Raffle.objects.get(id=raffle.id)
+        call_command("run_worker", "--once", stdout=StringIO())
 
         # Verificar que no se procesó
         loaded_raffle.refresh_from_db()
@@ -288,6 +295,7 @@ class AutoRaffleProcessingTestCase(TransactionTestCase):
         # Simular carga
         with transaction.atomic():
             loaded_raffle = Raffle.objects.get(id=raffle.id)
+        call_command("run_worker", "--once", stdout=StringIO())
 
         # Verificar que no cambió
         loaded_raffle.refresh_from_db()
@@ -317,7 +325,39 @@ class AutoRaffleProcessingTestCase(TransactionTestCase):
         # Simular carga desde BD
         with transaction.atomic():
             loaded_raffle = Raffle.objects.get(id=raffle.id)
+        call_command("run_worker", "--once", stdout=StringIO())
 
         # Verificar que NO se procesó (muy reciente)
         loaded_raffle.refresh_from_db()
         self.assertEqual(loaded_raffle.raffle_state, self.active_state)
+
+    def test_load_enqueues_without_saving(self):
+        """Test: Cargar una rifa vencida solo encola la tarea, sin guardarla"""
+        raffle = self.create_expired_raffle(minimum_sold=3)
+        updated_at = Raffle.objects.filter(id=raffle.id).values_list(
+            "raffle_updated_at", flat=True
+        )[0]
+
+        Raffle.objects.get(id=raffle.id)
+        Raffle.objects.get(id=raffle.id)
+
+        jobs = Job.objects.filter(payload={"raffle_id": raffle.id})
+        self.assertEqual(jobs.count(), 1)
+        self.assertEqual(jobs.get().status, Job.PENDING)
+        raffle.refresh_from_db()
+        self.assertEqual(raffle.raffle_updated_at, updated_at)
+        self.assertEqual(raffle.raffle_state, self.active_state)
+
+    def test_failed_job_not_reenqueued_on_load(self):
+        """Test: Si la tarea falló definitivamente, cargar la rifa no la reencola"""
+        raffle = self.create_expired_raffle(minimum_sold=3)
+        Raffle.objects.get(id=raffle.id)
+        Job.objects.filter(payload={"raffle_id": raffle.id}).update(status=Job.FAILED)
+
+        Raffle.objects.get(id=raffle.id)
+        jobs = Job.objects.filter(payload={"raffle_id": raffle.id})
+        self.assertEqual(list(jobs.values_list("status", flat=True)), [Job.FAILED])
+
+        # Encolarla explícitamente (guardado, programador) sí la reintenta
+        enqueue_process_expired(raffle.id)
+        self.assertEqual(jobs.filter(status=Job.PENDING).count(), 1)
@@ -0,0 +1,120 @@
+from django.core.cache import cache
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from location.models import City, Country, State
+from userInfo.models import DocumentType, Gender
+
+LOCMEM_CACHE = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+
+class BootstrapViewTestCase(APITestCase):
+    """Tests para el endpoint combinado de catálogos"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.colombia = Country.objects.create(
+            country_name="Colombia", country_code="CO"
+        )
+        cls.peru = Country.objects.create(country_name="Perú", country_code="PE")
+        Country.objects.create(
+            country_name="Inactivo", country_code="IN", country_is_active=False
+        )
+
+        cls.valle = State.objects.create(
+            state_name="Valle", state_code="VAL", state_country=cls.colombia
+        )
+        cls.antioquia = State.objects.create(
+            state_name="Antioquia", state_code="ANT", state_country=cls.colombia
+        )
+        cls.lima = State.objects.create(
+            state_name="Lima", state_code="LIM", state_country=cls.peru
+        )
+
+        City.objects.create(city_name="Cali", city_code="CAL", city_state=cls.valle)
+        City.objects.create(
+            city_name="Medellín", city_code="MED", city_state=cls.antioquia
+        )
+        City.objects.create(
+            city_name="Miraflores", city_code="MIR", city_state=cls.lima
+        )
+
+        Gender.objects.create(gender_name="Masculino", gender_code="M")
+        DocumentType.objects.create(
+            document_type_name="Cédula de Ciudadanía", document_type_code="CC"
+        )
+
+        cls.url = reverse("bootstrap")
+
+    def test_returns_all_catalogs(self):
+        """Devuelve todos los catálogos activos con hash de versión"""
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn("version", response.data)
+        self.assertEqual(len(response.data["countries"]), 2)
+        self.assertEqual(len(response.data["states"]), 3)
+        self.assertEqual(len(response.data["cities"]), 3)
+        self.assertEqual(len(response.data["genders"]), 1)
+        self.assertEqual(len(response.data["document_types"]), 1)
+        self.assertEqual(response["ETag"], f'"{response.data["version"]}"')
+
+    def test_filter_by_country(self):
+        """Filtrar por país limita estados y ciudades"""
+        response = self.client.get(self.url, {"country": self.colombia.id})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            {s["id"] for s in response.data["states"]},
+            {self.valle.id, self.antioquia.id},
+        )
+        self.assertEqual(len(response.data["cities"]), 2)
+        # Los países se devuelven completos para poder cambiar de selección
+        self.assertEqual(len(response.data["countries"]), 2)
+
+    def test_filter_by_state(self):
+        """Filtrar por estado limita las ciudades"""
+        response = self.client.get(self.url, {"state": self.lima.id})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data["cities"]), 1)
+        self.assertEqual(response.data["cities"][0]["state_id"], self.lima.id)
+
+    def test_invalid_filter_returns_400(self):
+        """Un ID no numérico retorna error de validación"""
+        response = self.client.get(self.url, {"country": "abc"})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("country", response.data)
+
+    def test_if_none_match_returns_304(self):
+        """Con la versión vigente el cliente recibe 304 sin cuerpo"""
+        etag = self.client.get(self.url)["ETag"]
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    @override_settings(COMPRESSION_MIN_SIZE=0)
+    def test_response_is_compressed(self):
+        """La respuesta se comprime si el cliente acepta gzip"""
+        response = self.client.get(self.url, HTTP_ACCEPT_ENCODING="gzip")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Encoding"], "gzip")
+
+    @override_settings(CACHES=LOCMEM_CACHE)
+    def test_cache_invalidated_on_catalog_change(self):
+        """Modificar un catálogo cambia la versión del payload cacheado"""
+        cache.clear()
+        first = self.client.get(self.url).data["version"]
+        self.assertEqual(self.client.get(self.url).data["version"], first)
+
+        Gender.objects.create(gender_name="Femenino", gender_code="F")
+
+        response = self.client.get(self.url)
+        self.assertNotEqual(response.data["version"], first)
+        self.assertEqual(len(response.data["genders"]), 2)
+        cache.clear()
@@ -0,0 +1,181 @@
+import json
+import os
+import shutil
+import tempfile
+from datetime import date, timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+from django.utils import timezone
+
+from location.models import City, Country, State
+from raffle.models import Raffle
+from raffleInfo.models import PrizeType, StateRaffle
+from user.models import User
+from userInfo.models import DocumentType, Gender, PaymentMethod, PaymentMethodType
+
+USER_HEADER = (
+    "email,password,first_name,last_name,document_number,city,gender,document_type\n"
+)
+
+
+class BulkImportTestCase(TestCase):
+    """Tests para el comando bulk_import"""
+
+    @classmethod
+    def setUpTestData(cls):
+        country = Country.objects.create(country_name="Colombia", country_code="CO")
+        state = State.objects.create(
+            state_name="Valle", state_code="VAL", state_country=country
+        )
+        City.objects.create(city_name="Cali", city_code="CAL", city_state=state)
+        Gender.objects.create(gender_name="Masculino", gender_code="M")
+        DocumentType.objects.create(
+            document_type_name="Cédula", document_type_code="CC"
+        )
+        PaymentMethodType.objects.create(
+            payment_method_type_name="Tarjeta", payment_method_type_code="TC"
+        )
+        PrizeType.objects.create(prize_type_name="Dinero", prize_type_code="DIN")
+        StateRaffle.objects.create(state_raffle_name="Activa", state_raffle_code="ACT")
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmpdir)
+
+    def write(self, name, content):
+        path = os.path.join(self.tmpdir, name)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(content)
+        return path
+
+    def users_csv(self, count, start=0):
+        rows = [
+            f"bulk{i}@test.com,clave{i},Nombre{i},Apellido,2000{i:04d},cal,M,CC\n"
+            for i in range(start, start + count)
+        ]
+        return self.write("users.csv", USER_HEADER + "".join(rows))
+
+    def run_import(self, *args):
+        out = StringIO()
+        call_command("bulk_import", *args, stdout=out)
+        return out.getvalue()
+
+    def test_import_users_csv(self):
+        """Crea los usuarios por lotes con la contraseña hasheada"""
+        path = self.users_csv(5)
+        output = self.run_import("users", path, "--batch-size", "2", "--workers", "0")
+
+        self.assertEqual(User.objects.filter(email__startswith="bulk").count(), 5)
+        user = User.objects.get(email="bulk3@test.com")
+        self.assertTrue(user.check_password("clave3"))
+        self.assertEqual(user.city.city_code, "CAL")
+        self.assertIn("5 procesados", output)
+        self.assertFalse(os.path.exists(f"{path}.checkpoint"))
+
+    def test_import_users_with_process_pool(self):
+        """El hasheo en el pool de procesos produce contraseñas válidas"""
+        path = self.users_csv(4)
+        self.run_import("users", path, "--workers", "2")
+
+        user = User.objects.get(email="bulk0@test.com")
+        self.assertTrue(user.check_password("clave0"))
+
+    def test_import_payment_methods_jsonl(self):
+        """Asocia los métodos de pago al usuario por email"""
+        self.run_import("users", self.users_csv(1), "--workers", "0")
+        record = {
+            "user_email": "bulk0@test.com",
+            "payment_method_type": "TC",
+            "holder_name": "Titular",
+            "card_number": "4111111111111111",
+            "expiration_date": "2030-12-31",
+            "balance": "2500.50",
+        }
+        path = self.write("methods.jsonl", json.dumps(record) + "\n")
+        self.run_import("payment_methods", path, "--workers", "0")
+
+        method = PaymentMethod.objects.get(user__email="bulk0@test.com")
+        self.assertEqual(method.last_digits, "1111")
+        self.assertEqual(method.paymenth_method_expiration_date, date(2030, 12, 31))
+        self.assertEqual(str(method.payment_method_balance), "2500.50")
+        self.assertNotEqual(method.paymenth_method_card_number_hash, "4111111111111111")
+
+    def test_import_raffles(self):
+        """Las rifas toman el método de pago activo del creador y el estado ACT"""
+        self.run_import("users", self.users_csv(1), "--workers", "0")
+        user = User.objects.get(email="bulk0@test.com")
+        method = PaymentMethod.objects.create(
+            user=user,
+            payment_method_type=PaymentMethodType.objects.get(),
+            paymenth_method_holder_name="Titular",
+            paymenth_method_card_number_hash="hash",
+            paymenth_method_expiration_date=date(2030, 12, 31),
+            last_digits="1234",
+        )
+        draw_date = (timezone.now() + timedelta(days=10)).isoformat()
+        path = self.write(
+            "raffles.csv",
+            "name,draw_date,minimum_numbers_sold,number_amount,number_price,"
+            "prize_amount,prize_type,created_by_email\n"
+            f"Rifa masiva,{draw_date},5,100,5000,100000,DIN,bulk0@test.com\n",
+        )
+        self.run_import("raffles", path)
+
+        raffle = Raffle.objects.get(raffle_name="Rifa masiva")
+        self.assertEqual(raffle.raffle_created_by, user)
+        self.assertEqual(raffle.raffle_creator_payment_method, method)
+        self.assertEqual(raffle.raffle_state.state_raffle_code, "ACT")
+
+    def test_resume_from_checkpoint(self):
+        """Con un checkpoint existente solo se importan los registros pendientes"""
+        path = self.users_csv(5)
+        self.write(
+            "users.csv.checkpoint",
+            json.dumps(
+                {"kind": "users", "source": os.path.abspath(path), "processed": 3}
+            ),
+        )
+        output = self.run_import("users", path, "--workers", "0")
+
+        self.assertIn("Reanudando desde el registro 3", output)
+        self.assertEqual(
+            sorted(
+                User.objects.filter(email__startswith="bulk").values_list(
+                    "email", flat=True
+                )
+            ),
+            ["bulk3@test.com", "bulk4@test.com"],
+        )
+
+    def test_invalid_record_keeps_checkpoint(self):
+        """Un registro inválido detiene la carga y conserva los lotes anteriores"""
+        path = self.write(
+            "users.csv",
+            USER_HEADER
+            + "bulk0@test.com,clave,N,A,20000000,CAL,M,CC\n"
+            + "bulk1@test.com,clave,N,A,20000001,XXX,M,CC\n",
+        )
+        with self.assertRaisesMessage(CommandError, "Registro 2"):
+            self.run_import("users", path, "--batch-size", "1", "--workers", "0")
+
+        self.assertTrue(User.objects.filter(email="bulk0@test.com").exists())
+        with open(f"{path}.checkpoint", encoding="utf-8") as f:
+            self.assertEqual(json.load(f)["processed"], 1)
+
+    def test_checkpoint_from_other_import_is_rejected(self):
+        """No se reutiliza un checkpoint de otro tipo de importación"""
+        path = self.users_csv(1)
+        self.write(
+            "users.csv.checkpoint",
+            json.dumps(
+                {"kind": "raffles", "source": os.path.abspath(path), "processed": 1}
+            ),
+        )
+        with self.assertRaisesMessage(CommandError, "--restart"):
+            self.run_import("users", path, "--workers", "0")
+
+        self.run_import("users", path, "--workers", "0", "--restart")
+        self.assertTrue(User.objects.filter(email="bulk0@test.com").exists())
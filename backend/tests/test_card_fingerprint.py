@@ -0,0 +1,125 @@
+from datetime import date
+
+from django.contrib.auth.hashers import make_password
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from core.checks import check_card_fingerprint_keys
+from location.models import City, Country, State
+from user.models import User
+from userInfo.card_fingerprint import card_fingerprint, check_card_fingerprint
+from userInfo.models import DocumentType, Gender, PaymentMethod, PaymentMethodType
+
+CARD = "4532123456789012"
+ROTATED_KEYS = {"1": "clave-anterior", "2": "clave-nueva"}
+
+
+class CardFingerprintTestCase(TestCase):
+    """Tests para las huellas HMAC de números de tarjeta"""
+
+    @classmethod
+    def setUpTestData(cls):
+        country = Country.objects.create(country_name="Colombia", country_code="CO")
+        state = State.objects.create(
+            state_name="Valle", state_code="VAL", state_country=country
+        )
+        city = City.objects.create(city_name="Cali", city_code="CAL", city_state=state)
+        cls.user = User.objects.create_user(
+            email="tarjeta@test.com",
+            password="testpass123",
+            first_name="Tarjeta",
+            last_name="Test",
+            gender=Gender.objects.create(gender_name="Masculino", gender_code="M"),
+            document_type=DocumentType.objects.create(
+                document_type_name="Cédula", document_type_code="CC"
+            ),
+            document_number="12345678",
+            city=city,
+        )
+        cls.payment_type = PaymentMethodType.objects.create(
+            payment_method_type_name="Tarjeta", payment_method_type_code="TC"
+        )
+
+    def create_method(self, card_hash):
+        return PaymentMethod.objects.create(
+            user=self.user,
+            payment_method_type=self.payment_type,
+            paymenth_method_holder_name="Titular",
+            paymenth_method_card_number_hash=card_hash,
+            paymenth_method_expiration_date=date(2030, 12, 31),
+            last_digits=CARD[-4:],
+        )
+
+    def stored_hash(self, method):
+        method.refresh_from_db()
+        return method.paymenth_method_card_number_hash
+
+    def test_set_card_number_stores_versioned_hmac(self):
+        """set_card_number guarda la huella HMAC con la versión vigente, sin el número"""
+        method = PaymentMethod(user=self.user)
+        method.set_card_number(CARD)
+
+        self.assertTrue(method.paymenth_method_card_number_hash.startswith("hmac$1$"))
+        self.assertNotIn(CARD, method.paymenth_method_card_number_hash)
+        self.assertEqual(method.last_digits, "9012")
+        self.assertTrue(method.check_card_number(CARD))
+        self.assertFalse(method.check_card_number("4532123456789013"))
+
+    def test_legacy_hash_is_upgraded_on_verify(self):
+        """Un hash de make_password se acepta y se reemplaza por la huella vigente"""
+        method = self.create_method(make_password(CARD))
+
+        self.assertTrue(method.check_card_number(CARD))
+        self.assertEqual(self.stored_hash(method), card_fingerprint(CARD))
+        self.assertTrue(method.check_card_number(CARD))
+
+    def test_wrong_number_does_not_upgrade_legacy_hash(self):
+        """Con un número incorrecto el hash anterior no se modifica"""
+        legacy = make_password(CARD)
+        method = self.create_method(legacy)
+
+        self.assertFalse(method.check_card_number("0000000000000000"))
+        self.assertEqual(self.stored_hash(method), legacy)
+
+    def test_old_key_version_is_rotated_on_verify(self):
+        """Las huellas de una clave anterior se migran a la versión vigente"""
+        with override_settings(
+            CARD_FINGERPRINT_KEYS=ROTATED_KEYS, CARD_FINGERPRINT_VERSION="1"
+        ):
+            method = self.create_method(card_fingerprint(CARD))
+
+        with override_settings(
+            CARD_FINGERPRINT_KEYS=ROTATED_KEYS, CARD_FINGERPRINT_VERSION="2"
+        ):
+            self.assertTrue(method.check_card_number(CARD))
+            self.assertTrue(self.stored_hash(method).startswith("hmac$2$"))
+            self.assertEqual(
+                check_card_fingerprint(CARD, self.stored_hash(method)), (True, False)
+            )
+
+    def test_unknown_key_version_never_matches(self):
+        """Una huella de una versión sin clave configurada no coincide"""
+        with override_settings(CARD_FINGERPRINT_KEYS={"9": "retirada"}):
+            stored = card_fingerprint(CARD, version="9")
+
+        self.assertEqual(check_card_fingerprint(CARD, stored), (False, False))
+
+
+class CardFingerprintKeysCheckTestCase(SimpleTestCase):
+    """Tests para el check de despliegue core.E002"""
+
+    def errors(self, keys, version="1"):
+        with override_settings(
+            CARD_FINGERPRINT_KEYS=keys, CARD_FINGERPRINT_VERSION=version
+        ):
+            return [error.id for error in check_card_fingerprint_keys(None)]
+
+    def test_requires_explicit_keys(self):
+        """Sin claves, con una vacía o con la de SECRET_KEY el despliegue falla"""
+        self.assertEqual(self.errors({}), ["core.E002"])
+        self.assertEqual(self.errors({"1": ""}), ["core.E002"])
+        with override_settings(SECRET_KEY="secreta"):
+            self.assertEqual(self.errors({"1": "secreta"}), ["core.E002"])
+
+    def test_version_must_have_key(self):
+        self.assertEqual(self.errors(ROTATED_KEYS, version="3"), ["core.E002"])
+        self.assertEqual(self.errors(ROTATED_KEYS, version="2"), [])
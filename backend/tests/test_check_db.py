@@ -0,0 +1,34 @@
+from io import StringIO
+from itertools import count
+from unittest import mock
+
+from django.core.management import CommandError, call_command
+from django.db import OperationalError
+from django.test import TestCase
+
+
+class CheckDbCommandTestCase(TestCase):
+    """Tests para el chequeo de conexión a la base de datos al iniciar"""
+
+    def test_database_available(self):
+        """Con la base de datos disponible termina sin error"""
+        out = StringIO()
+        call_command("check_db", stdout=out)
+
+        self.assertIn("Base de datos conectada", out.getvalue())
+        self.assertIn("CONN_MAX_AGE", out.getvalue())
+
+    def test_database_unavailable(self):
+        """Si no hay conexión al agotar la espera falla con CommandError"""
+        with mock.patch(
+            "django.db.backends.base.base.BaseDatabaseWrapper.cursor",
+            side_effect=OperationalError("connection refused"),
+        ), mock.patch("core.management.commands.check_db.time") as clock:
+            clock.monotonic.side_effect = count()
+            with self.assertRaises(CommandError):
+                call_command(
+                    "check_db", "--wait", "3", "--interval", "1", stdout=StringIO()
+                )
+
+        # Reintenta mientras quede tiempo de espera
+        self.assertEqual(clock.sleep.call_count, 2)
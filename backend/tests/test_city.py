@@ -100,3 +100,23 @@ class CityViewSetTestCase(BaseApiTest):
 
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertIn("non_field_errors", response.data)  # Error de unicidad combinada
+
+    def test_filter_by_state(self):
+        """Filtrar ciudades por estado"""
+        City.objects.create(
+            city_name="Medellín", city_code="MED", city_state=self.other_state
+        )
+
+        response = self.client.get(
+            self.list_url, {"state": self.test_state_for_city.id}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([c["id"] for c in response.data], [self.test_object.id])
+
+    def test_filter_by_nonexistent_state(self):
+        """Un estado inexistente retorna 400 (no error de servidor)"""
+        response = self.client.get(self.list_url, {"state": 99999})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data["state"], "State not found")
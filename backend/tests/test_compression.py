@@ -0,0 +1,82 @@
+import gzip
+import json
+
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from location.models import Country
+
+
+class CompressionAndConditionalGetTestCase(APITestCase):
+    """Tests para la compresión de respuestas y los GET condicionales"""
+
+    @classmethod
+    def setUpTestData(cls):
+        for i in range(40):
+            Country.objects.create(
+                country_name=f"País de prueba {i}",
+                country_code=f"P{i:02d}",
+                country_description="Descripción " * 5,
+            )
+        cls.url = reverse("country-list")
+
+    def test_large_response_is_gzipped(self):
+        """Las respuestas grandes de la API se comprimen con gzip"""
+        response = self.client.get(self.url, HTTP_ACCEPT_ENCODING="gzip")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertIn("Accept-Encoding", response["Vary"])
+        data = json.loads(gzip.decompress(response.content))
+        self.assertEqual(len(data), 40)
+
+    def test_not_compressed_without_accept_encoding(self):
+        """Sin Accept-Encoding la respuesta va sin comprimir"""
+        response = self.client.get(self.url)
+
+        self.assertFalse(response.has_header("Content-Encoding"))
+        self.assertEqual(len(response.json()), 40)
+
+    @override_settings(COMPRESSION_MIN_SIZE=10**9)
+    def test_below_threshold_not_compressed(self):
+        """Las respuestas por debajo del umbral no se comprimen"""
+        response = self.client.get(self.url, HTTP_ACCEPT_ENCODING="gzip")
+
+        self.assertFalse(response.has_header("Content-Encoding"))
+
+    @override_settings(COMPRESSION_PATH_PREFIXES=("/otra-ruta/",))
+    def test_only_configured_prefixes_compressed(self):
+        """Solo se comprimen las rutas configuradas"""
+        response = self.client.get(self.url, HTTP_ACCEPT_ENCODING="gzip")
+
+        self.assertFalse(response.has_header("Content-Encoding"))
+
+    def test_etag_and_not_modified(self):
+        """Las respuestas GET llevan ETag y responden 304 si no cambiaron"""
+        response = self.client.get(self.url)
+        etag = response["ETag"]
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response.content, b"")
+
+    def test_weak_etag_matches_after_compression(self):
+        """El ETag débil de la respuesta comprimida sigue validando"""
+        response = self.client.get(self.url, HTTP_ACCEPT_ENCODING="gzip")
+        etag = response["ETag"]
+        self.assertTrue(etag.startswith("W/"))
+
+        response = self.client.get(
+            self.url, HTTP_ACCEPT_ENCODING="gzip", HTTP_IF_NONE_MATCH=etag
+        )
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_etag_changes_when_data_changes(self):
+        """Modificar datos invalida el ETag previo"""
+        etag = self.client.get(self.url)["ETag"]
+        Country.objects.create(country_name="Nuevo", country_code="NEW")
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
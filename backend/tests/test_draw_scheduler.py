@@ -0,0 +1,155 @@
+from datetime import date, timedelta
+from decimal import Decimal
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+
+from jobs.models import Job
+from location.models import City, Country, State
+from raffle.models import Raffle
+from raffle.scheduler import DrawScheduler
+from raffleInfo.models import PrizeType, StateRaffle
+from user.models import User
+from userInfo.models import DocumentType, Gender, PaymentMethod, PaymentMethodType
+
+
+class DrawSchedulerTestCase(TestCase):
+    """Tests para el programador de sorteos por fecha límite"""
+
+    @classmethod
+    def setUpTestData(cls):
+        country = Country.objects.create(country_name="Colombia", country_code="CO")
+        state = State.objects.create(
+            state_name="Valle", state_code="VAL", state_country=country
+        )
+        city = City.objects.create(city_name="Cali", city_code="CAL", city_state=state)
+        cls.active_state = StateRaffle.objects.create(
+            state_raffle_name="Activa", state_raffle_code="ACT"
+        )
+        cls.cancelled_state = StateRaffle.objects.create(
+            state_raffle_name="Cancelada", state_raffle_code="CAN"
+        )
+        gender = Gender.objects.create(gender_name="Masculino", gender_code="M")
+        document_type = DocumentType.objects.create(
+            document_type_name="Cédula", document_type_code="CC"
+        )
+        payment_type = PaymentMethodType.objects.create(
+            payment_method_type_name="Tarjeta", payment_method_type_code="TC"
+        )
+        # Usuario organizador y cuenta conjunta del admin (para cancelaciones)
+        accounts = []
+        for email, document in (
+            ("organizer@test.com", "12345678"),
+            ("admin@test.com", "0000000000"),
+        ):
+            user = User.objects.create_user(
+                email=email,
+                password="testpass123",
+                first_name="Usuario",
+                last_name="Test",
+                gender=gender,
+                document_type=document_type,
+                document_number=document,
+                city=city,
+            )
+            accounts.append(
+                PaymentMethod.objects.create(
+                    user=user,
+                    payment_method_type=payment_type,
+                    paymenth_method_holder_name="Titular",
+                    paymenth_method_card_number_hash="hash",
+                    paymenth_method_expiration_date=date(2030, 12, 31),
+                    last_digits="1234",
+                    payment_method_balance=Decimal("1000.00"),
+                )
+            )
+        cls.payment_method = accounts[0]
+        cls.user = cls.payment_method.user
+        cls.prize_type = PrizeType.objects.create(
+            prize_type_name="Dinero", prize_type_code="DIN"
+        )
+
+    def create_raffle(self, name, draw_in):
+        """Crea una rifa activa; con draw_in negativo la deja vencida"""
+        raffle = Raffle.objects.create(
+            raffle_name=name,
+            raffle_start_date=timezone.now() - timedelta(days=1),
+            raffle_draw_date=timezone.now() + timedelta(days=1),
+            raffle_minimum_numbers_sold=5,
+            raffle_number_amount=10,
+            raffle_number_price=Decimal("10.00"),
+            raffle_prize_amount=Decimal("50.00"),
+            raffle_prize_type=self.prize_type,
+            raffle_state=self.active_state,
+            raffle_created_by=self.user,
+            raffle_creator_payment_method=self.payment_method,
+        )
+        Raffle.objects.filter(pk=raffle.pk).update(
+            raffle_draw_date=timezone.now() + draw_in
+        )
+        return raffle
+
+    def test_load_orders_by_draw_date(self):
+        """La carga inicial solo incluye rifas pendientes, ordenadas por fecha"""
+        later = self.create_raffle("Después", timedelta(days=3))
+        sooner = self.create_raffle("Antes", timedelta(days=2))
+        Raffle.objects.filter(
+            pk=self.create_raffle("Cancelada", timedelta(days=1)).pk
+        ).update(raffle_state=self.cancelled_state)
+
+        scheduler = DrawScheduler()
+
+        self.assertEqual(scheduler.load(), 2)
+        self.assertEqual(
+            scheduler.next_deadline(), Raffle.objects.get(pk=sooner.pk).raffle_draw_date
+        )
+        self.assertIn(later.pk, scheduler.deadlines)
+
+    def test_refresh_applies_saved_changes(self):
+        """El refresco incremental agrega rifas nuevas y descarta las reprogramadas"""
+        scheduler = DrawScheduler()
+        scheduler.load()
+
+        raffle = self.create_raffle("Nueva", timedelta(days=2))
+        raffle.refresh_from_db()
+        raffle.raffle_name = "Nueva (editada)"
+        raffle.save()
+        self.assertEqual(scheduler.refresh(), 1)
+        self.assertEqual(scheduler.next_deadline(), raffle.raffle_draw_date)
+
+        raffle.raffle_draw_date = timezone.now() + timedelta(days=5)
+        raffle.save()
+        scheduler.refresh()
+        self.assertEqual(scheduler.next_deadline(), raffle.raffle_draw_date)
+
+        raffle.raffle_state = self.cancelled_state
+        raffle.save()
+        scheduler.refresh()
+        self.assertIsNone(scheduler.next_deadline())
+
+    def test_pop_due_and_fire(self):
+        """Solo salen las rifas vencidas y se procesan a través de la cola"""
+        due = self.create_raffle("Vencida", timedelta(seconds=-1))
+        self.create_raffle("Futura", timedelta(days=2))
+        scheduler = DrawScheduler()
+        scheduler.load()
+
+        popped = scheduler.pop_due()
+
+        self.assertEqual([raffle_id for raffle_id, _ in popped], [due.pk])
+        self.assertTrue(scheduler.fire(due.pk))
+        due.refresh_from_db()
+        self.assertEqual(due.raffle_state, self.cancelled_state)
+        self.assertEqual(Job.objects.get().status, Job.DONE)
+
+    def test_command_once(self):
+        due = self.create_raffle("Vencida", timedelta(minutes=-5))
+        out = StringIO()
+
+        call_command("run_draw_scheduler", "--once", stdout=out)
+
+        due.refresh_from_db()
+        self.assertEqual(due.raffle_state, self.cancelled_state)
+        self.assertIn(f"Rifa {due.pk}: procesada", out.getvalue())
@@ -0,0 +1,213 @@
+import asyncio
+import csv
+import io
+import json
+import warnings
+from datetime import date, timedelta
+from decimal import Decimal
+
+from django.core.handlers.asgi import ASGIHandler
+from django.test import override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import AccessToken
+
+from interactions.models import Interaction
+from location.models import City, Country, State
+from raffle.models import Raffle
+from raffleInfo.models import PrizeType, StateRaffle
+from tickets.models import Ticket
+from user.models import User
+from userInfo.models import DocumentType, Gender, PaymentMethod, PaymentMethodType
+
+
+class ExportViewsTestCase(APITestCase):
+    """Tests para las exportaciones CSV/JSONL en streaming"""
+
+    @classmethod
+    def setUpTestData(cls):
+        country = Country.objects.create(country_name="Colombia", country_code="CO")
+        state = State.objects.create(
+            state_name="Valle", state_code="VAL", state_country=country
+        )
+        city = City.objects.create(city_name="Cali", city_code="CAL", city_state=state)
+        gender = Gender.objects.create(gender_name="Masculino", gender_code="M")
+        document_type = DocumentType.objects.create(
+            document_type_name="Cédula", document_type_code="CC"
+        )
+        payment_type = PaymentMethodType.objects.create(
+            payment_method_type_name="Tarjeta", payment_method_type_code="TC"
+        )
+        StateRaffle.objects.create(state_raffle_name="Activa", state_raffle_code="ACT")
+
+        users, payment_methods = [], []
+        for i, is_admin in enumerate((True, False, False)):
+            user = User.objects.create_user(
+                email=f"user{i}@test.com",
+                password="testpass123",
+                first_name=f"Usuario{i}",
+                last_name="Test",
+                gender=gender,
+                document_type=document_type,
+                document_number=f"1000000{i}",
+                city=city,
+                is_admin=is_admin,
+            )
+            pm = PaymentMethod.objects.create(
+                user=user,
+                payment_method_type=payment_type,
+                paymenth_method_holder_name="Titular",
+                paymenth_method_card_number_hash="hash",
+                paymenth_method_expiration_date=date(2030, 12, 31),
+                last_digits="1234",
+                payment_method_balance=Decimal("1000.00"),
+            )
+            users.append(user)
+            payment_methods.append(pm)
+        cls.admin, cls.organizer, cls.buyer = users
+        _, organizer_pm, buyer_pm = payment_methods
+
+        cls.raffles = [
+            Raffle.objects.create(
+                raffle_name=name,
+                raffle_draw_date=timezone.now() + timedelta(days=10),
+                raffle_minimum_numbers_sold=5,
+                raffle_number_amount=20,
+                raffle_number_price=Decimal("5000"),
+                raffle_prize_amount=Decimal("100000"),
+                raffle_prize_type=PrizeType.objects.get_or_create(
+                    prize_type_name="Dinero", prize_type_code="DIN"
+                )[0],
+                raffle_created_by=cls.organizer,
+                raffle_creator_payment_method=organizer_pm,
+            )
+            for name in ("=Rifa uno", "Rifa dos")
+        ]
+        for raffle in cls.raffles:
+            for number in (1, 2, 3):
+                ticket = Ticket.objects.create(
+                    raffle=raffle,
+                    number=number,
+                    user=cls.buyer,
+                    payment_method=buyer_pm,
+                )
+        # La segunda rifa queda sorteada con su último ticket
+        Raffle.objects.filter(pk=raffle.pk).update(
+            raffle_winner=cls.buyer, raffle_winner_ticket=ticket
+        )
+        Interaction.objects.create(
+            interaction_source_user=cls.buyer,
+            interaction_target_user=cls.organizer,
+            interaction_rating=4.0,
+            interaction_comment="Muy buena",
+        )
+
+    def export(self, name, fmt, **params):
+        self.client.force_authenticate(user=self.admin)
+        response = self.client.get(reverse(name, kwargs={"fmt": fmt}), params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        return response, b"".join(response.streaming_content).decode()
+
+    def test_requires_admin(self):
+        url = reverse("ticket-export", kwargs={"fmt": "csv"})
+        self.assertEqual(self.client.get(url).status_code, status.HTTP_401_UNAUTHORIZED)
+
+        self.client.force_authenticate(user=self.buyer)
+        self.assertEqual(self.client.get(url).status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_tickets_csv(self):
+        """El CSV trae encabezado, una fila por ticket y respeta los filtros"""
+        response, body = self.export("ticket-export", "csv", raffle=self.raffles[1].pk)
+
+        rows = list(csv.DictReader(io.StringIO(body)))
+        self.assertTrue(response["Content-Type"].startswith("text/csv"))
+        self.assertIn("attachment;", response["Content-Disposition"])
+        self.assertEqual(len(rows), 3)
+        self.assertEqual({row["raffle_name"] for row in rows}, {"Rifa dos"})
+        self.assertEqual(rows[0]["user_email"], "user2@test.com")
+
+    def test_invalid_filter(self):
+        self.client.force_authenticate(user=self.admin)
+        url = reverse("ticket-export", kwargs={"fmt": "csv"})
+
+        response = self.client.get(url, {"user": "abc"})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_csv_formula_escaped(self):
+        """Los textos que empiezan como fórmula se escapan en el CSV"""
+        _, body = self.export("raffle-export", "csv")
+
+        names = [row["raffle_name"] for row in csv.DictReader(io.StringIO(body))]
+        self.assertEqual(names, ["'=Rifa uno", "Rifa dos"])
+
+    def test_raffles_jsonl(self):
+        response, body = self.export("raffle-export", "jsonl", state="ACT")
+
+        records = [json.loads(line) for line in body.splitlines()]
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        self.assertEqual([r["raffle_name"] for r in records], ["=Rifa uno", "Rifa dos"])
+        self.assertEqual(records[0]["number_price"], "5000.00")
+        self.assertEqual(records[0]["state_code"], "ACT")
+
+    def test_payouts_and_interactions(self):
+        _, payouts = self.export("payout-export", "jsonl")
+        _, interactions = self.export("interaction-export", "csv")
+
+        records = [json.loads(line) for line in payouts.splitlines()]
+        self.assertEqual(len(records), 1)
+        self.assertEqual(records[0]["raffle_name"], "Rifa dos")
+        self.assertEqual(records[0]["winner_email"], "user2@test.com")
+        self.assertEqual(records[0]["winner_number"], 3)
+        rows = list(csv.DictReader(io.StringIO(interactions)))
+        self.assertEqual(rows[0]["comment"], "Muy buena")
+        self.assertEqual(rows[0]["rating"], "4.0")
+
+    def test_unknown_format(self):
+        self.client.force_authenticate(user=self.admin)
+
+        response = self.client.get(reverse("ticket-export", kwargs={"fmt": "xml"}))
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    @override_settings(EXPORT_BATCH_SIZE=1)
+    async def test_asgi_streams_by_batch(self):
+        """Bajo ASGI cada bloque se envía apenas se lee, sin cargar todo en memoria"""
+        token = str(AccessToken.for_user(self.admin))
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": reverse("ticket-export", kwargs={"fmt": "csv"}),
+            "query_string": b"",
+            "headers": [
+                (b"host", b"testserver"),
+                (b"authorization", f"Bearer {token}".encode()),
+            ],
+            "server": ("testserver", 80),
+        }
+        requests, messages = asyncio.Queue(), []
+        requests.put_nowait({"type": "http.request", "body": b""})
+
+        async def send(message):
+            messages.append(message)
+
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            await ASGIHandler()(scope, requests.get, send)
+
+        # Django advierte cuando tiene que consumir un iterador síncrono
+        self.assertFalse([w for w in caught if "synchronous" in str(w.message)])
+        self.assertEqual(messages[0]["status"], status.HTTP_200_OK)
+        bodies = [
+            m.get("body", b"") for m in messages if m["type"] == "http.response.body"
+        ]
+        # Encabezado y 6 tickets, cada uno en su propio mensaje, más el cierre
+        self.assertEqual(len(bodies), 8)
+        rows = list(csv.DictReader(io.StringIO(b"".join(bodies).decode())))
+        self.assertEqual(len(rows), 6)
@@ -0,0 +1,114 @@
+from decimal import Decimal
+from io import StringIO
+from unittest import mock
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db.models import Count, DecimalField
+from django.test import TestCase
+
+from interactions.models import Interaction
+from raffle.models import Raffle
+from tickets.models import Ticket
+from user.models import User
+from userInfo.models import PaymentMethod
+
+
+class GenerateLoadDataTestCase(TestCase):
+    """Tests para el generador de datos sintéticos"""
+
+    @classmethod
+    def setUpTestData(cls):
+        call_command("seed_data", stdout=StringIO())
+
+    def generate(self, *args):
+        call_command(
+            "generate_load_data",
+            "--users",
+            "30",
+            "--raffles",
+            "20",
+            "--max-numbers",
+            "100",
+            *args,
+            stdout=StringIO(),
+        )
+
+    def test_generates_all_entities(self):
+        """Crea usuarios con método de pago, rifas, tickets e interacciones"""
+        self.generate("--batch-size", "7")
+
+        users = User.objects.filter(email__startswith="load.")
+        self.assertEqual(users.count(), 30)
+        self.assertEqual(PaymentMethod.objects.filter(user__in=users).count(), 30)
+        self.assertEqual(
+            Raffle.objects.filter(raffle_name__startswith="Rifa load").count(), 20
+        )
+        self.assertTrue(Ticket.objects.exists())
+        self.assertTrue(Interaction.objects.exists())
+        self.assertTrue(users.filter(rating__isnull=False).exists())
+
+        # Sin números repetidos ni fuera de rango
+        for raffle in Raffle.objects.annotate(sold=Count("sold_tickets")):
+            self.assertLessEqual(raffle.sold, raffle.raffle_number_amount)
+
+    def test_decimals_fit_their_columns(self):
+        """Precios, premios y saldos caben en max_digits de su columna"""
+        # Con precios altos precio x mínimo supera raffle_prize_amount
+        with mock.patch(
+            "core.management.commands.generate_load_data.NUMBER_PRICES", (5000000,)
+        ):
+            self.generate()
+
+        for model in (Raffle, PaymentMethod):
+            for field in model._meta.get_fields():
+                if not isinstance(field, DecimalField):
+                    continue
+                limit = Decimal(10) ** (field.max_digits - field.decimal_places)
+                values = model.objects.values_list(field.name, flat=True)
+                self.assertLess(max(values), limit, f"{model.__name__}.{field.name}")
+
+    def test_sorted_raffles_have_winner(self):
+        """Las rifas sorteadas tienen ganador y ticket ganador; las canceladas no tienen tickets"""
+        self.generate("--raffles", "40")
+
+        sorted_raffles = Raffle.objects.filter(
+            raffle_state__state_raffle_name="Sorteada"
+        )
+        self.assertTrue(sorted_raffles.exists())
+        for raffle in sorted_raffles:
+            self.assertIsNotNone(raffle.raffle_winner_ticket)
+            self.assertTrue(raffle.raffle_winner_ticket.is_winner)
+            self.assertEqual(
+                raffle.raffle_winner_id, raffle.raffle_winner_ticket.user_id
+            )
+        self.assertFalse(
+            Ticket.objects.filter(
+                raffle__raffle_state__state_raffle_name="Cancelada"
+            ).exists()
+        )
+
+    def test_same_seed_generates_same_data(self):
+        """Con la misma semilla se generan las mismas rifas y números"""
+
+        def snapshot(prefix):
+            return [
+                (
+                    raffle.raffle_number_amount,
+                    raffle.raffle_state_id,
+                    sorted(raffle.sold_tickets.values_list("number", flat=True)),
+                )
+                for raffle in Raffle.objects.filter(
+                    raffle_name__startswith=f"Rifa {prefix} "
+                ).order_by("pk")
+            ]
+
+        self.generate("--seed", "7", "--prefix", "a")
+        self.generate("--seed", "7", "--prefix", "b")
+        self.assertEqual(snapshot("a"), snapshot("b"))
+
+    def test_existing_prefix_is_rejected(self):
+        """No se generan datos dos veces con el mismo prefijo"""
+        self.generate("--users", "2", "--raffles", "0")
+        with self.assertRaisesMessage(CommandError, "--prefix"):
+            self.generate()
@@ -1,9 +1,13 @@
+from io import StringIO
+
 import pytest
+from django.core.management import call_command
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APITestCase
 
 from interactions.models import Interaction
+from jobs.models import Job
 from location.models import City, Country, State
 from user.models import User
 from userInfo.models import DocumentType, Gender
@@ -209,3 +213,19 @@ class InteractionAPITestCase(APITestCase):
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data["average_rating"], 4.5)
+
+    def test_rating_recomputed_by_worker(self):
+        """El rating del usuario se recalcula en segundo plano, una vez por usuario"""
+        for source, rating in ((self.user1, 4.0), (self.user3, 5.0)):
+            Interaction.objects.create(
+                interaction_source_user=source,
+                interaction_target_user=self.user2,
+                interaction_rating=rating,
+            )
+
+        self.assertEqual(Job.objects.filter(status=Job.PENDING).count(), 1)
+
+        call_command("run_worker", "--once", stdout=StringIO())
+
+        self.user2.refresh_from_db()
+        self.assertEqual(self.user2.rating, 4.5)
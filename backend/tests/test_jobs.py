@@ -0,0 +1,202 @@
+import threading
+import time
+from datetime import timedelta
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management import CommandError, call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from jobs.models import Job
+from jobs.registry import enqueue, job
+from jobs.worker import purge_finished, reclaim_stale, retry_delay, run_job, run_pending
+from userInfo.models import Gender
+
+calls = []
+
+
+@job("tests.record")
+def record(value):
+    calls.append(value)
+
+
+@job("tests.broken", max_attempts=2)
+def broken():
+    Gender.objects.create(gender_name="Parcial", gender_code="P")
+    raise RuntimeError("fallo simulado")
+
+
+class JobQueueTestCase(TestCase):
+    """Tests para la cola de tareas en base de datos"""
+
+    def setUp(self):
+        calls.clear()
+
+    def test_enqueue_and_run(self):
+        """El worker ejecuta la tarea con su payload y la marca terminada"""
+        queued = enqueue("tests.record", {"value": 7})
+
+        self.assertEqual(run_pending(), 1)
+
+        queued.refresh_from_db()
+        self.assertEqual(queued.status, Job.DONE)
+        self.assertEqual(queued.attempts, 1)
+        self.assertEqual(calls, [7])
+
+    def test_idempotency_key(self):
+        """Con la misma clave no se encola dos veces mientras esté activa"""
+        first = enqueue("tests.record", {"value": 1}, key="record:1")
+        second = enqueue("tests.record", {"value": 1}, key="record:1")
+        self.assertEqual(first.pk, second.pk)
+
+        run_pending()
+        third = enqueue("tests.record", {"value": 1}, key="record:1")
+
+        self.assertNotEqual(third.pk, first.pk)
+
+    def test_requeue_running(self):
+        """Encolar con requeue_running mientras corre la repite al terminar"""
+        queued = enqueue("tests.record", {"value": 1}, key="record:1")
+        Job.objects.filter(pk=queued.pk).update(status=Job.RUNNING, attempts=1)
+
+        again = enqueue("tests.record", {"value": 1}, key="record:1")
+        self.assertFalse(Job.objects.get(pk=again.pk).run_again)
+        again = enqueue(
+            "tests.record", {"value": 1}, key="record:1", requeue_running=True
+        )
+        self.assertEqual(again.pk, queued.pk)
+
+        queued.refresh_from_db()
+        self.assertTrue(run_job(queued))
+        self.assertEqual((queued.status, queued.attempts), (Job.PENDING, 0))
+        self.assertEqual(run_pending(), 1)
+        queued.refresh_from_db()
+        self.assertEqual(queued.status, Job.DONE)
+        self.assertEqual(calls, [1, 1])
+
+    def test_unknown_job_name(self):
+        with self.assertRaises(KeyError):
+            enqueue("tests.missing")
+
+    def test_delayed_job(self):
+        """Una tarea programada no se ejecuta antes de su run_at"""
+        queued = enqueue("tests.record", {"value": 3}, delay=60)
+
+        self.assertEqual(run_pending(), 0)
+
+        Job.objects.filter(pk=queued.pk).update(run_at=timezone.now())
+        self.assertEqual(run_pending(), 1)
+        self.assertEqual(calls, [3])
+
+    @override_settings(JOB_RETRY_BACKOFF=10, JOB_RETRY_BACKOFF_MAX=15)
+    def test_retry_with_backoff(self):
+        """La espera entre reintentos se duplica hasta el máximo configurado"""
+        self.assertEqual(retry_delay(1), timedelta(seconds=10))
+        self.assertEqual(retry_delay(2), timedelta(seconds=15))
+
+        queued = enqueue("tests.broken")
+        before = timezone.now()
+        self.assertEqual(run_pending(), 1)
+
+        queued.refresh_from_db()
+        self.assertEqual(queued.status, Job.PENDING)
+        self.assertGreaterEqual(queued.run_at, before + timedelta(seconds=10))
+
+    def test_retry_then_fail_rolls_back(self):
+        """Los fallos se reintentan, se registra el error y se revierten los cambios"""
+        queued = enqueue("tests.broken")
+
+        for _ in range(2):
+            Job.objects.filter(pk=queued.pk).update(run_at=timezone.now())
+            self.assertEqual(run_pending(), 1)
+
+        queued.refresh_from_db()
+        self.assertEqual(queued.status, Job.FAILED)
+        self.assertEqual(queued.attempts, 2)
+        self.assertIn("fallo simulado", queued.last_error)
+        self.assertFalse(Gender.objects.filter(gender_code="P").exists())
+
+    @override_settings(JOB_LEASE_TIMEOUT=60)
+    def test_stale_running_job_is_reclaimed(self):
+        """Una tarea abandonada en ejecución vuelve a la cola y libera su clave"""
+        stale = enqueue("tests.record", {"value": 5}, key="record:5")
+        exhausted = enqueue("tests.record", {"value": 6})
+        recent = enqueue("tests.record", {"value": 7})
+        Job.objects.update(status=Job.RUNNING, attempts=1)
+        Job.objects.filter(pk=exhausted.pk).update(max_attempts=1)
+        Job.objects.exclude(pk=recent.pk).update(
+            updated_at=timezone.now() - timedelta(seconds=61)
+        )
+
+        self.assertEqual(reclaim_stale(), 1)
+        self.assertEqual(run_pending(), 1)
+
+        self.assertEqual(calls, [5])
+        for queued, status in (
+            (stale, Job.DONE),
+            (exhausted, Job.FAILED),
+            (recent, Job.RUNNING),
+        ):
+            queued.refresh_from_db()
+            self.assertEqual(queued.status, status)
+        self.assertIn("lease", exhausted.last_error)
+
+    @override_settings(JOB_RETENTION_DAYS=7)
+    def test_purge_finished(self):
+        """Se borran las tareas terminadas viejas; las fallidas se conservan"""
+        for _ in range(3):
+            enqueue("tests.record", {"value": 1})
+        run_pending()
+        old, _, failed = Job.objects.order_by("id")
+        Job.objects.filter(pk__in=[old.pk, failed.pk]).update(
+            updated_at=timezone.now() - timedelta(days=8)
+        )
+        Job.objects.filter(pk=failed.pk).update(status=Job.FAILED)
+
+        self.assertEqual(purge_finished(), 1)
+        self.assertFalse(Job.objects.filter(pk=old.pk).exists())
+        self.assertEqual(Job.objects.count(), 2)
+
+    def test_run_worker_command(self):
+        enqueue("tests.record", {"value": 1})
+        enqueue("tests.record", {"value": 2})
+        out = StringIO()
+
+        call_command("run_worker", "--once", stdout=out)
+
+        self.assertEqual(calls, [1, 2])
+        self.assertIn("Tareas ejecutadas: 2", out.getvalue())
+
+
+class ConcurrentWorkerTestCase(TestCase):
+    """Tests para run_worker --concurrency"""
+
+    def test_threads_share_the_queue(self):
+        """Cada hilo vacía la cola y el total suma lo ejecutado por todos"""
+        queue = list(range(20))
+        lock = threading.Lock()
+        threads = set()
+
+        def fake_run_pending(limit=None, stop=None):
+            processed = 0
+            while True:
+                with lock:
+                    if not queue:
+                        return processed
+                    queue.pop()
+                    threads.add(threading.current_thread().name)
+                processed += 1
+                time.sleep(0.001)
+
+        out = StringIO()
+        with patch("jobs.management.commands.run_worker.run_pending", fake_run_pending):
+            call_command("run_worker", "--once", "--concurrency", "4", stdout=out)
+
+        self.assertEqual(queue, [])
+        self.assertGreater(len(threads), 1)
+        self.assertIn("Tareas ejecutadas: 20", out.getvalue())
+
+    def test_invalid_concurrency(self):
+        with self.assertRaises(CommandError):
+            call_command("run_worker", "--concurrency", "0")
@@ -0,0 +1,101 @@
+from django.core.cache import cache
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from location.models import City, Country, State
+from location.services import get_location_tree
+
+LOCMEM_CACHE = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+
+class LocationTreeTestCase(APITestCase):
+    """Tests para el árbol de ubicaciones y su endpoint"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.colombia = Country.objects.create(
+            country_name="Colombia", country_code="CO"
+        )
+        cls.valle = State.objects.create(
+            state_name="Valle", state_code="VAL", state_country=cls.colombia
+        )
+        cls.inactive_state = State.objects.create(
+            state_name="Inactivo",
+            state_code="INA",
+            state_country=cls.colombia,
+            state_is_active=False,
+        )
+        cls.cali = City.objects.create(
+            city_name="Cali", city_code="CAL", city_state=cls.valle
+        )
+        cls.url = reverse("location-tree")
+
+    def test_tree_endpoint_returns_active_hierarchy(self):
+        """El endpoint retorna la jerarquía activa anidada"""
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 1)
+        country = response.data[0]
+        self.assertEqual(country["id"], self.colombia.id)
+        self.assertEqual([s["id"] for s in country["states"]], [self.valle.id])
+        self.assertEqual(country["states"][0]["cities"][0]["id"], self.cali.id)
+
+    def test_tree_endpoint_include_inactive(self):
+        """include_inactive=true incluye los nodos inactivos"""
+        response = self.client.get(self.url, {"include_inactive": "true"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data[0]["states"]), 2)
+
+    @override_settings(CACHES=LOCMEM_CACHE)
+    def test_tree_is_cached_and_invalidated(self):
+        """El árbol se sirve desde caché y se invalida al modificar ubicaciones"""
+        cache.clear()
+        get_location_tree()
+
+        with self.assertNumQueries(0):
+            tree = get_location_tree()
+        self.assertIn(self.cali.id, tree["cities"])
+
+        palmira = City.objects.create(
+            city_name="Palmira", city_code="PAL", city_state=self.valle
+        )
+
+        self.assertIn(palmira.id, get_location_tree()["cities"])
+        cache.clear()
+
+    @override_settings(CACHES=LOCMEM_CACHE)
+    def test_state_filter_uses_single_query(self):
+        """Filtrar estados por país no consulta Country por separado"""
+        cache.clear()
+        get_location_tree()
+
+        with self.assertNumQueries(1):
+            response = self.client.get(
+                reverse("state-list"), {"country": self.colombia.id}
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        cache.clear()
+
+    @override_settings(CACHES=LOCMEM_CACHE)
+    def test_filter_accepts_state_missing_from_stale_tree(self):
+        """Un estado creado desde otro proceso se acepta aunque el árbol sea viejo"""
+        cache.clear()
+        get_location_tree()
+        # Sin signals: como si se hubiera creado en otro proceso con su propia caché
+        State.objects.bulk_create(
+            [State(state_name="Cauca", state_code="CAU", state_country=self.colombia)]
+        )
+        cauca = State.objects.get(state_code="CAU")
+
+        response = self.client.get(reverse("city-list"), {"state": cauca.id})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn(cauca.id, get_location_tree()["states"])
+
+        response = self.client.get(reverse("city-list"), {"state": 999999})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        cache.clear()
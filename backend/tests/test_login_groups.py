@@ -0,0 +1,91 @@
+from django.contrib.auth.models import Group
+from django.core.cache import cache
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from location.models import City, Country, State
+from user.models import User
+from userInfo.models import DocumentType, Gender
+
+LOCMEM_CACHE = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+PASSWORD = "ClaveSegura123"
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+class LoginGroupsTestCase(APITestCase):
+    """Tests para los grupos cacheados en la respuesta del login"""
+
+    @classmethod
+    def setUpTestData(cls):
+        country = Country.objects.create(country_name="Colombia", country_code="CO")
+        state = State.objects.create(
+            state_name="Valle", state_code="VAL", state_country=country
+        )
+        city = City.objects.create(city_name="Cali", city_code="CAL", city_state=state)
+        cls.user = User.objects.create_user(
+            email="grupos@test.com",
+            password=PASSWORD,
+            first_name="Grupos",
+            last_name="Test",
+            gender=Gender.objects.create(gender_name="Masculino", gender_code="M"),
+            document_type=DocumentType.objects.create(
+                document_type_name="Cédula", document_type_code="CC"
+            ),
+            document_number="12345678",
+            city=city,
+        )
+        cls.organizers = Group.objects.create(name="Organizadores")
+        cls.support = Group.objects.create(name="Soporte")
+        cls.user.groups.add(cls.organizers)
+
+    def setUp(self):
+        cache.clear()
+
+    def login(self):
+        response = self.client.post(
+            reverse("token_obtain_pair"),
+            {"email": "grupos@test.com", "password": PASSWORD},
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data["user"]["groups"]
+
+    def test_groups_cached_between_logins(self):
+        """El segundo login no consulta los grupos"""
+        self.assertEqual(self.login(), ["Organizadores"])
+
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(self.login(), ["Organizadores"])
+
+        self.assertFalse(
+            any("auth_group" in query["sql"] for query in queries.captured_queries)
+        )
+
+    def test_adding_group_to_user_invalidates(self):
+        """user.groups.add invalida los grupos cacheados del usuario"""
+        self.login()
+        self.user.groups.add(self.support)
+
+        self.assertEqual(self.login(), ["Organizadores", "Soporte"])
+
+    def test_adding_user_from_group_side_invalidates(self):
+        """group.user_set.add/remove también invalida"""
+        self.login()
+        self.support.user_set.add(self.user)
+        self.assertEqual(self.login(), ["Organizadores", "Soporte"])
+
+        self.organizers.user_set.remove(self.user)
+        self.assertEqual(self.login(), ["Soporte"])
+
+    def test_group_rename_and_clear_invalidate(self):
+        """Renombrar un grupo o vaciarlo invalida los grupos de todos"""
+        self.login()
+        self.organizers.name = "Organizadores VIP"
+        self.organizers.save()
+        self.assertEqual(self.login(), ["Organizadores VIP"])
+
+        self.organizers.user_set.clear()
+        self.assertEqual(self.login(), [])
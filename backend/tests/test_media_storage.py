@@ -0,0 +1,163 @@
+import hashlib
+import os
+import shutil
+import tempfile
+from datetime import date, timedelta
+from decimal import Decimal
+from io import StringIO
+
+from django.core.files.base import ContentFile
+from django.core.management import call_command
+from django.test import RequestFactory, TestCase, override_settings
+from django.utils import timezone
+
+from core.storage import IMMUTABLE_CACHE_CONTROL, ContentAddressedStorage, serve_media
+from location.models import City, Country, State
+from raffle.models import Raffle
+from raffleInfo.models import PrizeType, StateRaffle
+from user.models import User
+from userInfo.models import DocumentType, Gender, PaymentMethod, PaymentMethodType
+
+MEDIA_ROOT = tempfile.mkdtemp()
+
+
+@override_settings(MEDIA_ROOT=MEDIA_ROOT)
+class ContentAddressedStorageTestCase(TestCase):
+    """Tests para el almacenamiento direccionado por contenido"""
+
+    def setUp(self):
+        self.storage = ContentAddressedStorage()
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        shutil.rmtree(MEDIA_ROOT, ignore_errors=True)
+
+    def test_name_from_content_hash(self):
+        """El nombre sale del SHA-256 del contenido; se conservan directorio y extensión"""
+        digest = hashlib.sha256(b"imagen").hexdigest()
+
+        name = self.storage.save("raffles/upload.JPG", ContentFile(b"imagen"))
+
+        self.assertEqual(name, f"raffles/{digest[:2]}/{digest}.jpg")
+        with self.storage.open(name) as file:
+            self.assertEqual(file.read(), b"imagen")
+
+    def test_identical_content_stored_once(self):
+        """El mismo contenido no se guarda dos veces; otro contenido sí"""
+        first = self.storage.save("raffles/a.png", ContentFile(b"misma"))
+        second = self.storage.save("raffles/b.png", ContentFile(b"misma"))
+        other = self.storage.save("raffles/c.png", ContentFile(b"otra"))
+
+        self.assertEqual(first, second)
+        self.assertNotEqual(first, other)
+        directory = os.path.dirname(self.storage.path(first))
+        self.assertEqual(os.listdir(directory), [os.path.basename(first)])
+
+    def test_immutable_cache_headers(self):
+        """Los archivos por hash se sirven con caché inmutable; los demás no"""
+        name = self.storage.save("raffles/x.jpg", ContentFile(b"contenido"))
+        with open(os.path.join(MEDIA_ROOT, "legacy.jpg"), "wb") as file:
+            file.write(b"anterior")
+        request = RequestFactory().get("/")
+
+        response = serve_media(request, name, document_root=MEDIA_ROOT)
+        self.assertEqual(response["Cache-Control"], IMMUTABLE_CACHE_CONTROL)
+
+        response = serve_media(request, "legacy.jpg", document_root=MEDIA_ROOT)
+        self.assertNotIn("Cache-Control", response)
+
+
+@override_settings(MEDIA_ROOT=MEDIA_ROOT)
+class GarbageCollectImagesTestCase(TestCase):
+    """Tests para gc_raffle_images"""
+
+    @classmethod
+    def setUpTestData(cls):
+        country = Country.objects.create(country_name="Colombia", country_code="CO")
+        state = State.objects.create(
+            state_name="Valle", state_code="VAL", state_country=country
+        )
+        city = City.objects.create(city_name="Cali", city_code="CAL", city_state=state)
+        organizer = User.objects.create(
+            email="organizador@test.com",
+            first_name="Ana",
+            last_name="Gómez",
+            gender=Gender.objects.create(gender_name="Femenino", gender_code="F"),
+            document_type=DocumentType.objects.create(
+                document_type_name="Cédula", document_type_code="CC"
+            ),
+            document_number="1001",
+            city=city,
+        )
+        payment_method = PaymentMethod.objects.create(
+            user=organizer,
+            payment_method_type=PaymentMethodType.objects.create(
+                payment_method_type_name="Tarjeta", payment_method_type_code="TC"
+            ),
+            paymenth_method_holder_name="Titular",
+            paymenth_method_card_number_hash="hash",
+            paymenth_method_expiration_date=date(2030, 12, 31),
+            last_digits="1234",
+            payment_method_balance=Decimal("100000.00"),
+        )
+        now = timezone.now()
+        cls.raffle = Raffle.objects.create(
+            raffle_name="Moto",
+            raffle_start_date=now - timedelta(days=1),
+            raffle_draw_date=now + timedelta(days=10),
+            raffle_minimum_numbers_sold=4,
+            raffle_number_amount=100,
+            raffle_number_price=Decimal("5000"),
+            raffle_prize_amount=Decimal("100000"),
+            raffle_prize_type=PrizeType.objects.create(
+                prize_type_name="Objeto", prize_type_code="OBJ"
+            ),
+            raffle_state=StateRaffle.objects.create(
+                state_raffle_name="Activa", state_raffle_code="ACT"
+            ),
+            raffle_created_by=organizer,
+            raffle_creator_payment_method=payment_method,
+        )
+
+    def setUp(self):
+        shutil.rmtree(MEDIA_ROOT, ignore_errors=True)
+        self.storage = Raffle._meta.get_field("raffle_image").storage
+        save = self.storage.save
+        self.image = save("raffles/a.jpg", ContentFile(b"original"))
+        self.card = save("raffles/a.webp", ContentFile(b"variante"))
+        self.orphan = save("raffles/b.jpg", ContentFile(b"reemplazada"))
+        self.legacy = "raffles/2025/6/raffle_1_moto.jpg"
+        self.default = "raffles/defaults/default_raffle.jpg"
+        for name in (self.legacy, self.default):
+            os.makedirs(os.path.dirname(self.storage.path(name)), exist_ok=True)
+            with open(self.storage.path(name), "wb") as file:
+                file.write(b"x")
+        Raffle.objects.filter(pk=self.raffle.pk).update(
+            raffle_image=self.image,
+            raffle_image_variants={"source": self.image, "card": self.card},
+        )
+
+    def gc(self, *args):
+        out = StringIO()
+        call_command("gc_raffle_images", *args, stdout=out)
+        return out.getvalue()
+
+    def test_deletes_unreferenced_images(self):
+        """Borra originales y archivos antiguos sin rifa; conserva el resto"""
+        output = self.gc("--min-age", "0")
+
+        self.assertIn("2 archivos sin uso borrados", output)
+        for name in (self.image, self.card, self.default):
+            self.assertTrue(self.storage.exists(name), name)
+        for name in (self.orphan, self.legacy):
+            self.assertFalse(self.storage.exists(name), name)
+
+    def test_dry_run_and_min_age(self):
+        """--dry-run no borra y los archivos recientes se respetan"""
+        output = self.gc("--min-age", "0", "--dry-run")
+        self.assertIn(self.orphan, output)
+        self.assertTrue(self.storage.exists(self.orphan))
+
+        self.assertIn("0 archivos sin uso borrados", self.gc())
+        self.assertTrue(self.storage.exists(self.orphan))
@@ -0,0 +1,94 @@
+from django.contrib.auth.hashers import identify_hasher, make_password
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from location.models import City, Country, State
+from user.models import User
+from userInfo.models import DocumentType, Gender
+
+PASSWORD = "ClaveSegura123"
+PBKDF2_FIRST = [
+    "core.hashers.TunedPBKDF2PasswordHasher",
+    "core.hashers.TunedScryptPasswordHasher",
+]
+
+
+class PasswordHasherTestCase(APITestCase):
+    """Tests para la configuración de hashers y el rehash al iniciar sesión"""
+
+    @classmethod
+    def setUpTestData(cls):
+        country = Country.objects.create(country_name="Colombia", country_code="CO")
+        state = State.objects.create(
+            state_name="Valle", state_code="VAL", state_country=country
+        )
+        cls.city = City.objects.create(
+            city_name="Cali", city_code="CAL", city_state=state
+        )
+        cls.gender = Gender.objects.create(gender_name="Masculino", gender_code="M")
+        cls.document_type = DocumentType.objects.create(
+            document_type_name="Cédula", document_type_code="CC"
+        )
+
+    def create_user(self, password_hash):
+        return User.objects.create(
+            email="login@test.com",
+            password=password_hash,
+            first_name="Login",
+            last_name="Test",
+            document_number="12345678",
+            city=self.city,
+            gender=self.gender,
+            document_type=self.document_type,
+        )
+
+    def login(self):
+        return self.client.post(
+            reverse("token_obtain_pair"),
+            {"email": "login@test.com", "password": PASSWORD},
+        )
+
+    def stored_hash(self, user):
+        user.refresh_from_db()
+        return user.password
+
+    def test_new_passwords_use_scrypt(self):
+        """Por defecto las contraseñas nuevas se hashean con scrypt"""
+        self.assertEqual(identify_hasher(make_password(PASSWORD)).algorithm, "scrypt")
+
+    def test_pbkdf2_hash_is_upgraded_on_login(self):
+        """Un hash PBKDF2 existente se reemplaza por scrypt al iniciar sesión"""
+        with override_settings(PASSWORD_HASHERS=PBKDF2_FIRST):
+            user = self.create_user(make_password(PASSWORD))
+        self.assertTrue(self.stored_hash(user).startswith("pbkdf2_sha256$"))
+
+        response = self.login()
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(self.stored_hash(user).startswith("scrypt$"))
+
+    @override_settings(PASSWORD_SCRYPT_WORK_FACTOR=2**10)
+    def test_retuned_work_factor_is_applied_on_login(self):
+        """Si cambia el costo configurado, el hash se rehashea con el nuevo"""
+        user = self.create_user(make_password(PASSWORD, hasher="scrypt"))
+        self.assertTrue(self.stored_hash(user).startswith("scrypt$1024$"))
+
+        with override_settings(PASSWORD_SCRYPT_WORK_FACTOR=2**11):
+            self.assertEqual(self.login().status_code, status.HTTP_200_OK)
+            self.assertTrue(self.stored_hash(user).startswith("scrypt$2048$"))
+
+    def test_wrong_password_does_not_rehash(self):
+        """Un intento fallido no modifica el hash guardado"""
+        with override_settings(PASSWORD_HASHERS=PBKDF2_FIRST):
+            user = self.create_user(make_password(PASSWORD))
+        original = self.stored_hash(user)
+
+        response = self.client.post(
+            reverse("token_obtain_pair"),
+            {"email": "login@test.com", "password": "Incorrecta123"},
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertEqual(self.stored_hash(user), original)
@@ -0,0 +1,160 @@
+from datetime import date, timedelta
+from decimal import Decimal
+
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIRequestFactory, APITestCase
+
+from location.models import City, Country, State
+from raffle.models import Raffle
+from raffle.serializer import RaffleListSerializer, RafflePlainListSerializer
+from raffleInfo.models import PrizeType, StateRaffle
+from tickets.models import Ticket
+from tickets.serializer import TicketListSerializer, TicketPlainListSerializer
+from user.models import User
+from userInfo.models import DocumentType, Gender, PaymentMethod, PaymentMethodType
+
+
+class PlainListSerializersTestCase(APITestCase):
+    """Los serializadores sobre .values() deben producir el mismo JSON"""
+
+    @classmethod
+    def setUpTestData(cls):
+        country = Country.objects.create(country_name="Colombia", country_code="CO")
+        state = State.objects.create(
+            state_name="Valle", state_code="VAL", state_country=country
+        )
+        city = City.objects.create(city_name="Cali", city_code="CAL", city_state=state)
+        gender = Gender.objects.create(gender_name="Masculino", gender_code="M")
+        document_type = DocumentType.objects.create(
+            document_type_name="Cédula", document_type_code="CC"
+        )
+        payment_type = PaymentMethodType.objects.create(
+            payment_method_type_name="Tarjeta", payment_method_type_code="TC"
+        )
+        prize_type = PrizeType.objects.create(
+            prize_type_name="Dinero", prize_type_code="DIN"
+        )
+        active = StateRaffle.objects.create(
+            state_raffle_name="Activa", state_raffle_code="ACT"
+        )
+
+        cls.organizer = User.objects.create_user(
+            email="organizer@test.com",
+            password="testpass123",
+            first_name="Organizador",
+            last_name="Medellín",
+            gender=gender,
+            document_type=document_type,
+            document_number="11111111",
+            city=city,
+            rating=4.5,
+        )
+        cls.buyer = User.objects.create_user(
+            email="buyer@test.com",
+            password="testpass123",
+            first_name="Comprador",
+            last_name="",
+            gender=gender,
+            document_type=document_type,
+            document_number="22222222",
+            city=city,
+        )
+        organizer_pm, buyer_pm = (
+            PaymentMethod.objects.create(
+                user=user,
+                payment_method_type=payment_type,
+                paymenth_method_holder_name="Titular",
+                paymenth_method_card_number_hash="hash",
+                paymenth_method_expiration_date=date(2030, 12, 31),
+                last_digits="1234",
+                payment_method_balance=Decimal("100000.00"),
+            )
+            for user in (cls.organizer, cls.buyer)
+        )
+
+        raffle_data = {
+            "raffle_description": "Descripción",
+            "raffle_start_date": timezone.now() - timedelta(days=1),
+            "raffle_minimum_numbers_sold": 5,
+            "raffle_number_amount": 100,
+            "raffle_number_price": Decimal("5000.50"),
+            "raffle_prize_amount": Decimal("1000000"),
+            "raffle_prize_type": prize_type,
+            "raffle_state": active,
+            "raffle_created_by": cls.organizer,
+            "raffle_creator_payment_method": organizer_pm,
+        }
+        cls.raffle = Raffle.objects.create(
+            raffle_name="Rifa con imagen",
+            raffle_draw_date=timezone.now() + timedelta(days=10, microseconds=123),
+            **raffle_data,
+        )
+        Raffle.objects.filter(pk=cls.raffle.pk).update(
+            raffle_image="raffles/imagen.jpg", raffle_winner=cls.buyer
+        )
+        cls.other_raffle = Raffle.objects.create(
+            raffle_name="Rifa sin imagen",
+            raffle_draw_date=timezone.now() + timedelta(days=20),
+            **raffle_data,
+        )
+        for number in (1, 2, 3):
+            Ticket.objects.create(
+                raffle=cls.raffle,
+                number=number,
+                user=cls.buyer,
+                payment_method=buyer_pm,
+            )
+
+    def setUp(self):
+        self.context = {"request": APIRequestFactory().get("/")}
+
+    def assertSameJSON(self, plain, expected):
+        self.assertEqual(
+            JSONRenderer().render(plain.data), JSONRenderer().render(expected.data)
+        )
+
+    def test_raffle_plain_serializer_matches(self):
+        """RafflePlainListSerializer produce el mismo JSON que RaffleListSerializer"""
+        queryset = Raffle.objects.order_by("id")
+        plain = RafflePlainListSerializer(
+            RafflePlainListSerializer.values_queryset(queryset),
+            many=True,
+            context=self.context,
+        )
+        expected = RaffleListSerializer(queryset, many=True, context=self.context)
+
+        self.assertSameJSON(plain, expected)
+        self.assertTrue(plain.data[0]["raffle_image"].startswith("http://testserver/"))
+        self.assertIsNone(plain.data[1]["raffle_winner"])
+
+    def test_ticket_plain_serializer_matches(self):
+        """TicketPlainListSerializer produce el mismo JSON que TicketListSerializer"""
+        queryset = Ticket.objects.order_by("number")
+        plain = TicketPlainListSerializer(
+            TicketPlainListSerializer.values_queryset(queryset),
+            many=True,
+            context=self.context,
+        )
+        expected = TicketListSerializer(queryset, many=True, context=self.context)
+
+        self.assertSameJSON(plain, expected)
+
+    def test_raffle_list_query_count(self):
+        """El listado público no hace consultas por fila"""
+        with self.assertNumQueries(3):
+            response = self.client.get(reverse("raffle-list"))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 2)
+
+    def test_raffle_tickets_query_count(self):
+        """Los tickets de una rifa se listan con una sola consulta"""
+        url = reverse("raffle-tickets", kwargs={"raffle_id": self.raffle.id})
+        with self.assertNumQueries(1):
+            response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([t["number"] for t in response.data], [1, 2, 3])
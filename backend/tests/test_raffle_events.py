@@ -0,0 +1,289 @@
+import asyncio
+import json
+from datetime import date, timedelta
+from decimal import Decimal
+from unittest import mock, skipIf
+
+from asgiref.sync import sync_to_async
+from django.test import (
+    AsyncRequestFactory,
+    SimpleTestCase,
+    TestCase,
+    override_settings,
+)
+from django.urls import reverse
+from django.utils import timezone
+
+from location.models import City, Country, State
+from raffle.async_views import RaffleEventsView
+from raffle import events
+from raffle.events import RaffleEventBroker, RedisRelay, broker, format_event_id
+from raffle.models import Raffle
+from raffleInfo.models import PrizeType, StateRaffle
+from tickets.models import Ticket
+from user.models import User
+from userInfo.models import DocumentType, Gender, PaymentMethod, PaymentMethodType
+
+
+class RaffleEventBrokerTestCase(SimpleTestCase):
+    """Tests para el pub/sub en proceso"""
+
+    def setUp(self):
+        self.broker = RaffleEventBroker(history_size=3, queue_size=2)
+
+    async def test_fan_out_to_subscribers(self):
+        """Cada suscriptor de la rifa recibe el evento; los de otras rifas no"""
+        first, _, _ = self.broker.subscribe(1)
+        second, _, _ = self.broker.subscribe(1)
+        other, _, _ = self.broker.subscribe(2)
+
+        self.broker.publish(1, "sold", {"numbers": [5]})
+        await asyncio.sleep(0)
+
+        self.assertEqual(first.queue.get_nowait(), (1, "sold", {"numbers": [5]}))
+        self.assertEqual(second.queue.get_nowait(), (1, "sold", {"numbers": [5]}))
+        self.assertTrue(other.queue.empty())
+
+    async def test_resume_from_last_event_id(self):
+        """Con Last-Event-ID se reenvían solo los eventos posteriores"""
+        self.broker.subscribe(1)
+        for number in (1, 2, 3):
+            self.broker.publish(1, "sold", {"numbers": [number]})
+
+        _, backlog, sequence = self.broker.subscribe(1, format_event_id(1))
+
+        self.assertEqual([record[0] for record in backlog], [2, 3])
+        self.assertEqual(sequence, 3)
+
+    async def test_snapshot_when_history_is_not_enough(self):
+        """Sin historial suficiente o con un ID de otra instancia se pide snapshot"""
+        self.broker.subscribe(1)
+        for number in range(1, 6):
+            self.broker.publish(1, "sold", {"numbers": [number]})
+
+        self.assertIsNone(self.broker.subscribe(1, format_event_id(1))[1])
+        self.assertIsNone(self.broker.subscribe(1, "otro-3")[1])
+        self.assertIsNone(self.broker.subscribe(1)[1])
+        self.assertEqual(self.broker.subscribe(1, format_event_id(5))[1], [])
+
+    async def test_overflow_and_unsubscribe(self):
+        """Un cliente lento se marca para snapshot y al desuscribirse no recibe más"""
+        subscription, _, _ = self.broker.subscribe(1)
+        for number in (1, 2, 3):
+            self.broker.publish(1, "sold", {"numbers": [number]})
+        await asyncio.sleep(0)
+
+        self.assertTrue(subscription.overflowed)
+
+        self.broker.unsubscribe(1, subscription)
+        self.assertEqual(self.broker.subscriber_count(1), 0)
+
+    async def test_resync_marks_all_subscribers(self):
+        """resync() pide un snapshot a los suscriptores de todas las rifas"""
+        first, _, _ = self.broker.subscribe(1)
+        second, _, _ = self.broker.subscribe(2)
+
+        self.broker.resync()
+        await asyncio.sleep(0)
+
+        self.assertTrue(first.overflowed)
+        self.assertTrue(second.overflowed)
+
+    @skipIf(events.redis is None, "requiere el paquete redis")
+    async def test_relay_dispatches_to_local_broker(self):
+        """Los mensajes del canal de Redis se publican en el broker del proceso"""
+        relay = RedisRelay("redis://localhost:6379/0", self.broker)
+        subscription, _, _ = self.broker.subscribe(3)
+
+        relay.dispatch(
+            {
+                "data": json.dumps(
+                    {"raffle": 3, "event": "sold", "data": {"numbers": [1]}}
+                )
+            }
+        )
+        await asyncio.sleep(0)
+
+        self.assertEqual(subscription.queue.get_nowait(), (1, "sold", {"numbers": [1]}))
+
+    async def test_state_evicted_without_subscribers(self):
+        """Sin suscriptores se descarta el historial y un ID viejo pide snapshot"""
+        subscription, _, _ = self.broker.subscribe(1)
+        self.broker.publish(1, "sold", {"numbers": [1]})
+        self.broker.unsubscribe(1, subscription)
+
+        self.assertEqual(self.broker._history, {})
+        self.broker.publish(1, "sold", {"numbers": [2]})
+        self.assertEqual(self.broker._history, {})
+
+        self.broker.subscribe(2)
+        self.broker.subscribe(1)
+        self.broker.publish(2, "sold", {"numbers": [3]})
+        self.broker.publish(1, "sold", {"numbers": [4]})
+        # El evento 2 se publicó sin suscriptores: el ID 1 no puede reanudarse
+        self.assertIsNone(self.broker.subscribe(1, format_event_id(1))[1])
+        self.assertEqual(
+            [record[0] for record in self.broker.subscribe(1, format_event_id(2))[1]],
+            [4],
+        )
+
+
+class RaffleEventsViewTestCase(TestCase):
+    """Tests para el stream SSE /raffle/<pk>/events/"""
+
+    @classmethod
+    def setUpTestData(cls):
+        country = Country.objects.create(country_name="Colombia", country_code="CO")
+        state = State.objects.create(
+            state_name="Valle", state_code="VAL", state_country=country
+        )
+        city = City.objects.create(city_name="Cali", city_code="CAL", city_state=state)
+        gender = Gender.objects.create(gender_name="Masculino", gender_code="M")
+        document_type = DocumentType.objects.create(
+            document_type_name="Cédula", document_type_code="CC"
+        )
+        payment_type = PaymentMethodType.objects.create(
+            payment_method_type_name="Tarjeta", payment_method_type_code="TC"
+        )
+        StateRaffle.objects.create(state_raffle_name="Activa", state_raffle_code="ACT")
+
+        accounts = []
+        for i, document in enumerate(("0000000000", "11111111", "22222222")):
+            user = User.objects.create_user(
+                email=f"user{i}@test.com",
+                password="testpass123",
+                first_name=f"Usuario{i}",
+                last_name="Test",
+                gender=gender,
+                document_type=document_type,
+                document_number=document,
+                city=city,
+            )
+            accounts.append(
+                PaymentMethod.objects.create(
+                    user=user,
+                    payment_method_type=payment_type,
+                    paymenth_method_holder_name="Titular",
+                    paymenth_method_card_number_hash="hash",
+                    paymenth_method_expiration_date=date(2030, 12, 31),
+                    last_digits="1234",
+                    payment_method_balance=Decimal("100000.00"),
+                )
+            )
+        organizer_pm, cls.buyer_pm = accounts[1:]
+
+        cls.raffle = Raffle.objects.create(
+            raffle_name="Rifa en vivo",
+            raffle_description="Descripción",
+            raffle_start_date=timezone.now() - timedelta(days=1),
+            raffle_draw_date=timezone.now() + timedelta(days=10),
+            raffle_minimum_numbers_sold=5,
+            raffle_number_amount=20,
+            raffle_number_price=Decimal("5000"),
+            raffle_prize_amount=Decimal("100000"),
+            raffle_prize_type=PrizeType.objects.create(
+                prize_type_name="Dinero", prize_type_code="DIN"
+            ),
+            raffle_created_by=organizer_pm.user,
+            raffle_creator_payment_method=organizer_pm,
+        )
+        Ticket.objects.create(
+            raffle=cls.raffle,
+            number=4,
+            user=cls.buyer_pm.user,
+            payment_method=cls.buyer_pm,
+        )
+
+    async def open_stream(self, pk, **headers):
+        request = AsyncRequestFactory().get(f"/api/v1/raffle/{pk}/events/", **headers)
+        return await RaffleEventsView.as_view()(request, pk=pk)
+
+    def parse(self, chunk):
+        fields = dict(
+            line.split(": ", 1) for line in chunk.decode().strip().splitlines()
+        )
+        return fields["event"], json.loads(fields["data"])
+
+    async def test_snapshot_then_deltas(self):
+        """Al conectar llega el snapshot y luego los deltas publicados"""
+        response = await self.open_stream(self.raffle.pk)
+        self.assertEqual(response["Content-Type"], "text/event-stream")
+        stream = response.streaming_content
+
+        self.assertEqual(await anext(stream), b"retry: 3000\n\n")
+        event, data = self.parse(await anext(stream))
+        self.assertEqual(event, "snapshot")
+        self.assertEqual(data, {"number_amount": 20, "sold": [4]})
+
+        broker.publish(self.raffle.pk, "sold", {"numbers": [7]})
+        self.assertEqual(
+            self.parse(await asyncio.wait_for(anext(stream), 1)),
+            ("sold", {"numbers": [7]}),
+        )
+        await stream.aclose()
+
+    @override_settings(SSE_SNAPSHOT_INTERVAL=0.1)
+    async def test_periodic_snapshot(self):
+        """Cada SSE_SNAPSHOT_INTERVAL se reenvía el estado, incluso lo que este
+        proceso no publicó (compras en otro worker, reembolsos del worker)"""
+        response = await self.open_stream(self.raffle.pk)
+        stream = response.streaming_content
+        await anext(stream)
+        self.assertEqual(self.parse(await anext(stream))[1]["sold"], [4])
+
+        await sync_to_async(Ticket.objects.create)(
+            raffle=self.raffle,
+            number=8,
+            user=self.buyer_pm.user,
+            payment_method=self.buyer_pm,
+        )
+        chunk = await asyncio.wait_for(anext(stream), 1)
+        while chunk == b": ping\n\n":
+            chunk = await asyncio.wait_for(anext(stream), 1)
+
+        self.assertEqual(
+            self.parse(chunk), ("snapshot", {"number_amount": 20, "sold": [4, 8]})
+        )
+        await stream.aclose()
+
+    async def test_unknown_raffle_returns_404(self):
+        response = await self.open_stream(999)
+
+        self.assertEqual(response.status_code, 404)
+
+    def test_purchase_and_refund_publish_events(self):
+        """Comprar y reembolsar publican los números al confirmar la transacción"""
+        with mock.patch.object(broker, "publish") as publish:
+            with self.captureOnCommitCallbacks(execute=True):
+                ticket = Ticket.purchase_ticket(
+                    self.buyer_pm.user, self.raffle, 9, self.buyer_pm
+                )
+            with self.captureOnCommitCallbacks(execute=True):
+                ticket.refund_ticket()
+
+        self.assertEqual(
+            publish.call_args_list,
+            [
+                mock.call(self.raffle.pk, "sold", {"numbers": [9]}),
+                mock.call(self.raffle.pk, "refunded", {"numbers": [9]}),
+            ],
+        )
+
+    def test_events_go_through_redis_relay(self):
+        """Con SSE_REDIS_URL los eventos se envían al canal y no al broker local"""
+        with mock.patch.object(events, "relay") as relay, mock.patch.object(
+            broker, "publish"
+        ) as publish:
+            with self.captureOnCommitCallbacks(execute=True):
+                Ticket.purchase_ticket(
+                    self.buyer_pm.user, self.raffle, 9, self.buyer_pm
+                )
+
+        relay.publish.assert_called_once_with(self.raffle.pk, "sold", {"numbers": [9]})
+        publish.assert_not_called()
+
+    def test_wsgi_mode_returns_501(self):
+        """Fuera de modo ASGI la ruta responde 501 y el cliente consulta /available/"""
+        response = self.client.get(reverse("raffle-events", args=[self.raffle.pk]))
+
+        self.assertEqual(response.status_code, 501)
@@ -0,0 +1,248 @@
+from datetime import date, timedelta
+from decimal import Decimal
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from core.checks import check_shared_cache
+from interactions.tasks import update_user_rating
+from location.models import City, Country, State
+from raffle.feed import ENTRY_KEY, INDEX_KEY, LOCK_KEY
+from raffle.models import Raffle
+from raffleInfo.models import PrizeType, StateRaffle
+from tickets.models import Ticket
+from user.models import User
+from userInfo.models import DocumentType, Gender, PaymentMethod, PaymentMethodType
+
+LOCMEM_CACHE = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+class RaffleFeedTestCase(APITestCase):
+    """Tests para GET /raffle/feed/ y su actualización incremental"""
+
+    @classmethod
+    def setUpTestData(cls):
+        country = Country.objects.create(country_name="Colombia", country_code="CO")
+        state = State.objects.create(
+            state_name="Valle", state_code="VAL", state_country=country
+        )
+        city = City.objects.create(city_name="Cali", city_code="CAL", city_state=state)
+        gender = Gender.objects.create(gender_name="Masculino", gender_code="M")
+        document_type = DocumentType.objects.create(
+            document_type_name="Cédula", document_type_code="CC"
+        )
+        payment_type = PaymentMethodType.objects.create(
+            payment_method_type_name="Tarjeta", payment_method_type_code="TC"
+        )
+        cls.prize_type = PrizeType.objects.create(
+            prize_type_name="Objeto", prize_type_code="OBJ"
+        )
+        cls.active = StateRaffle.objects.create(
+            state_raffle_name="Activa", state_raffle_code="ACT"
+        )
+        cls.cancelled = StateRaffle.objects.create(
+            state_raffle_name="Cancelada", state_raffle_code="CAN"
+        )
+        cls.organizer = User.objects.create(
+            email="organizador@test.com",
+            first_name="Ana",
+            last_name="Gómez",
+            gender=gender,
+            document_type=document_type,
+            document_number="1001",
+            city=city,
+            rating=4.5,
+        )
+        cls.payment_method = PaymentMethod.objects.create(
+            user=cls.organizer,
+            payment_method_type=payment_type,
+            paymenth_method_holder_name="Titular",
+            paymenth_method_card_number_hash="hash",
+            paymenth_method_expiration_date=date(2030, 12, 31),
+            last_digits="1234",
+            payment_method_balance=Decimal("100000.00"),
+        )
+        cls.moto = cls.create_raffle("Moto", days=10)
+        cls.tv = cls.create_raffle("Televisor", days=3)
+        cls.create_raffle("Cancelada", days=5, state=cls.cancelled)
+        cls.sell(cls.tv, 2)
+
+    @classmethod
+    def create_raffle(cls, name, days, state=None):
+        now = timezone.now()
+        return Raffle.objects.create(
+            raffle_name=name,
+            raffle_description="Descripción",
+            raffle_start_date=now - timedelta(days=1),
+            raffle_draw_date=now + timedelta(days=days),
+            raffle_minimum_numbers_sold=4,
+            raffle_number_amount=100,
+            raffle_number_price=Decimal("5000"),
+            raffle_prize_amount=Decimal("100000"),
+            raffle_prize_type=cls.prize_type,
+            raffle_state=state or cls.active,
+            raffle_created_by=cls.organizer,
+            raffle_creator_payment_method=cls.payment_method,
+        )
+
+    @classmethod
+    def sell(cls, raffle, count, start=1):
+        for number in range(start, start + count):
+            Ticket.objects.create(
+                raffle=raffle,
+                number=number,
+                user=cls.organizer,
+                payment_method=cls.payment_method,
+            )
+
+    def setUp(self):
+        cache.clear()
+
+    def feed(self, **params):
+        response = self.client.get(reverse("raffle-feed"), params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        return response.data
+
+    def entry(self, raffle):
+        return next(item for item in self.feed() if item["id"] == raffle.id)
+
+    def test_feed_fields(self):
+        """Solo rifas activas, más recientes primero, con los campos calculados"""
+        feed = self.feed()
+
+        self.assertEqual([item["raffle_name"] for item in feed], ["Televisor", "Moto"])
+        tv = feed[0]
+        self.assertEqual(tv["numbers_sold"], 2)
+        self.assertEqual(tv["numbers_available"], 98)
+        self.assertEqual(tv["progress"], 50)
+        self.assertFalse(tv["minimum_reached"])
+        self.assertEqual(tv["raffle_number_price"], "5000.00")
+        self.assertEqual(tv["prize_type"], "Objeto")
+        self.assertTrue(tv["image_url"].startswith("http://testserver/"))
+        self.assertAlmostEqual(tv["seconds_remaining"], 3 * 24 * 3600, delta=60)
+        self.assertEqual(
+            tv["organizer"],
+            {"id": self.organizer.id, "full_name": "Ana Gómez", "rating": 4.5},
+        )
+
+    def test_cached_feed_without_queries(self):
+        """Con el feed en la caché la respuesta no consulta la base de datos"""
+        self.feed()
+
+        with self.assertNumQueries(0):
+            feed = self.feed(limit=1)
+        self.assertEqual(len(feed), 1)
+
+    def test_ticket_changes_update_entry(self):
+        """Comprar o borrar tickets actualiza los vendidos de esa rifa"""
+        self.feed()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.sell(self.tv, 3, start=10)
+        self.assertEqual(self.entry(self.tv)["numbers_sold"], 5)
+        self.assertEqual(self.entry(self.tv)["progress"], 100)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.tv.sold_tickets.all().delete()
+        self.assertEqual(self.entry(self.tv)["numbers_sold"], 0)
+
+    def test_raffle_changes_update_feed(self):
+        """Rifas nuevas entran en orden; renombradas o canceladas se actualizan"""
+        self.feed()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.create_raffle("Bicicleta", days=7)
+        self.assertEqual(
+            [item["raffle_name"] for item in self.feed()],
+            ["Bicicleta", "Televisor", "Moto"],
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.moto.raffle_name = "Moto nueva"
+            self.moto.save(update_fields=["raffle_name"])
+            self.tv.raffle_state = self.cancelled
+            self.tv.save(update_fields=["raffle_state"])
+        self.assertEqual(
+            [item["raffle_name"] for item in self.feed()], ["Bicicleta", "Moto nueva"]
+        )
+
+    def test_organizer_rating_update(self):
+        """El recálculo del rating (QuerySet.update) se refleja en el feed"""
+        self.feed()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            update_user_rating(self.organizer.id)
+        self.assertIsNone(self.entry(self.moto)["organizer"]["rating"])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.organizer.first_name = "Ana María"
+            self.organizer.save(update_fields=["first_name"])
+        self.assertEqual(
+            self.entry(self.moto)["organizer"]["full_name"], "Ana María Gómez"
+        )
+
+    def test_ticket_sale_writes_only_its_entry(self):
+        """Vender un ticket reescribe la entrada de la rifa, no el índice"""
+        self.feed()
+
+        with mock.patch.object(
+            cache, "set", wraps=cache.set
+        ) as cache_set, mock.patch.object(
+            cache, "set_many", wraps=cache.set_many
+        ) as cache_set_many:
+            with self.captureOnCommitCallbacks(execute=True):
+                self.sell(self.tv, 1, start=20)
+
+        written = [call.args[0] for call in cache_set.mock_calls]
+        for call in cache_set_many.mock_calls:
+            written.extend(call.args[0])
+        self.assertIn(ENTRY_KEY.format(self.tv.id), written)
+        self.assertNotIn(INDEX_KEY, written)
+        self.assertEqual(self.entry(self.tv)["numbers_sold"], 3)
+
+    def test_busy_lock_serves_stale_feed(self):
+        """Sin lock el feed se marca desactualizado y se reconstruye al leer"""
+        self.feed()
+        cache.add(LOCK_KEY, 1)
+
+        with mock.patch("raffle.feed.LOCK_ATTEMPTS", 1):
+            with self.captureOnCommitCallbacks(execute=True):
+                self.sell(self.tv, 1, start=20)
+            self.assertEqual(self.entry(self.tv)["numbers_sold"], 2)
+
+        cache.delete(LOCK_KEY)
+        self.assertEqual(self.entry(self.tv)["numbers_sold"], 3)
+        with self.assertNumQueries(0):
+            self.feed()
+
+    def test_invalid_limit(self):
+        """limit debe ser un entero positivo"""
+        response = self.client.get(reverse("raffle-feed"), {"limit": "0"})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("limit", response.data)
+
+
+class SharedCacheCheckTestCase(SimpleTestCase):
+    """Tests para el check de despliegue de la caché compartida"""
+
+    def test_per_process_cache_fails_deploy_check(self):
+        with override_settings(CACHES=LOCMEM_CACHE):
+            self.assertEqual(
+                [error.id for error in check_shared_cache(None)], ["core.E001"]
+            )
+
+        redis = {
+            "default": {
+                "BACKEND": "django.core.cache.backends.redis.RedisCache",
+                "LOCATION": "redis://redis:6379/0",
+            }
+        }
+        with override_settings(CACHES=redis):
+            self.assertEqual(check_shared_cache(None), [])
@@ -0,0 +1,219 @@
+import shutil
+import tempfile
+from datetime import date, timedelta
+from decimal import Decimal
+from io import BytesIO, StringIO
+from unittest import mock
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.test import override_settings
+from django.urls import reverse
+from django.utils import timezone
+from PIL import Image
+from rest_framework.test import APITestCase
+
+from jobs.models import Job
+from jobs.worker import run_pending
+from location.models import City, Country, State
+from raffle.models import Raffle
+from raffle.serializer import RaffleUpdateSerializer
+from raffle.tasks import PROCESS_IMAGE
+from raffleInfo.models import PrizeType, StateRaffle
+from user.models import User
+from userInfo.models import DocumentType, Gender, PaymentMethod, PaymentMethodType
+
+MEDIA_ROOT = tempfile.mkdtemp()
+
+
+def make_image(size=(2000, 1000), image_format="JPEG", orientation=None):
+    """Imagen de prueba con EXIF (cámara y, opcionalmente, orientación)"""
+    exif = Image.Exif()
+    exif[0x010F] = "Camara de prueba"  # Make
+    if orientation:
+        exif[0x0112] = orientation
+    buffer = BytesIO()
+    Image.new("RGB", size, (200, 30, 30)).save(buffer, image_format, exif=exif)
+    return buffer.getvalue()
+
+
+def upload(content, name="premio.jpg"):
+    return SimpleUploadedFile(name, content, content_type="image/jpeg")
+
+
+@override_settings(MEDIA_ROOT=MEDIA_ROOT)
+class RaffleImageTestCase(APITestCase):
+    """Tests para las variantes WebP de las imágenes de rifas"""
+
+    @classmethod
+    def setUpTestData(cls):
+        country = Country.objects.create(country_name="Colombia", country_code="CO")
+        state = State.objects.create(
+            state_name="Valle", state_code="VAL", state_country=country
+        )
+        city = City.objects.create(city_name="Cali", city_code="CAL", city_state=state)
+        cls.organizer = User.objects.create(
+            email="organizador@test.com",
+            first_name="Ana",
+            last_name="Gómez",
+            gender=Gender.objects.create(gender_name="Femenino", gender_code="F"),
+            document_type=DocumentType.objects.create(
+                document_type_name="Cédula", document_type_code="CC"
+            ),
+            document_number="1001",
+            city=city,
+        )
+        cls.payment_method = PaymentMethod.objects.create(
+            user=cls.organizer,
+            payment_method_type=PaymentMethodType.objects.create(
+                payment_method_type_name="Tarjeta", payment_method_type_code="TC"
+            ),
+            paymenth_method_holder_name="Titular",
+            paymenth_method_card_number_hash="hash",
+            paymenth_method_expiration_date=date(2030, 12, 31),
+            last_digits="1234",
+            payment_method_balance=Decimal("100000.00"),
+        )
+        cls.prize_type = PrizeType.objects.create(
+            prize_type_name="Objeto", prize_type_code="OBJ"
+        )
+        StateRaffle.objects.create(state_raffle_name="Activa", state_raffle_code="ACT")
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        shutil.rmtree(MEDIA_ROOT, ignore_errors=True)
+
+    def create_raffle(self, image=None):
+        now = timezone.now()
+        return Raffle.objects.create(
+            raffle_name="Moto",
+            raffle_start_date=now - timedelta(days=1),
+            raffle_draw_date=now + timedelta(days=10),
+            raffle_minimum_numbers_sold=4,
+            raffle_number_amount=100,
+            raffle_number_price=Decimal("5000"),
+            raffle_prize_amount=Decimal("100000"),
+            raffle_prize_type=self.prize_type,
+            raffle_created_by=self.organizer,
+            raffle_creator_payment_method=self.payment_method,
+            raffle_image=image,
+        )
+
+    def open_variant(self, raffle, name):
+        with raffle.raffle_image.storage.open(
+            raffle.raffle_image_variants[name]
+        ) as file:
+            image = Image.open(file)
+            image.load()
+        return image
+
+    def test_variants_generated_by_worker(self):
+        """El worker genera las variantes WebP, orientadas y sin EXIF"""
+        raffle = self.create_raffle(upload(make_image(orientation=6)))
+        self.assertTrue(Job.objects.filter(name=PROCESS_IMAGE).exists())
+
+        run_pending()
+        raffle.refresh_from_db()
+
+        self.assertEqual(
+            raffle.raffle_image_variants["source"], raffle.raffle_image.name
+        )
+        # Orientación 6: la imagen de 2000x1000 se muestra vertical
+        for name, size in (("thumbnail", (120, 240)), ("card", (320, 640))):
+            image = self.open_variant(raffle, name)
+            self.assertEqual(image.format, "WEBP")
+            self.assertEqual(image.size, size)
+            self.assertEqual(len(image.getexif()), 0)
+        self.assertEqual(self.open_variant(raffle, "full").size, (800, 1600))
+
+    def test_serializers_expose_variant_urls(self):
+        """Los listados exponen las URLs de las variantes (el original mientras tanto)"""
+        raffle = self.create_raffle(upload(make_image()))
+        detail_url = reverse("raffle-detail", kwargs={"pk": raffle.pk})
+
+        variants = self.client.get(detail_url).data["raffle_image_variants"]
+        self.assertTrue(variants["card"].endswith(".jpg"))
+
+        run_pending()
+        variants = self.client.get(detail_url).data["raffle_image_variants"]
+        listed = self.client.get(reverse("raffle-list")).data[0]
+
+        self.assertEqual(listed["raffle_image_variants"], variants)
+        self.assertEqual(set(variants), {"thumbnail", "card", "full"})
+        self.assertTrue(variants["card"].startswith("http://testserver/media/"))
+        self.assertTrue(variants["card"].endswith(".webp"))
+        self.assertNotEqual(variants["card"], variants["thumbnail"])
+
+    def test_replaced_image_regenerates_variants(self):
+        """Al cambiar la imagen se regeneran las variantes"""
+        raffle = self.create_raffle(upload(make_image()))
+        run_pending()
+        raffle.refresh_from_db()
+        old_card = raffle.raffle_image_variants["card"]
+
+        raffle.raffle_image = upload(make_image((800, 800)), "otra.jpg")
+        raffle.save()
+        run_pending()
+        raffle.refresh_from_db()
+
+        self.assertNotEqual(raffle.raffle_image_variants["card"], old_card)
+        self.assertEqual(self.open_variant(raffle, "full").size, (800, 800))
+
+    def test_same_image_reuses_variants(self):
+        """Otra rifa con la misma imagen reutiliza archivo y variantes"""
+        content = make_image()
+        first = self.create_raffle(upload(content))
+        run_pending()
+        first.refresh_from_db()
+
+        second = self.create_raffle(upload(content, "copia.jpg"))
+        with mock.patch("raffle.images.render_variants") as render:
+            run_pending()
+        second.refresh_from_db()
+
+        render.assert_not_called()
+        self.assertEqual(second.raffle_image.name, first.raffle_image.name)
+        self.assertEqual(second.raffle_image_variants, first.raffle_image_variants)
+
+    def test_upload_validation(self):
+        """La subida valida formato, tamaño y cantidad de píxeles"""
+        raffle = self.create_raffle()
+
+        def errors(file):
+            serializer = RaffleUpdateSerializer(
+                raffle, data={"raffle_image": file}, partial=True
+            )
+            self.assertFalse(serializer.is_valid())
+            return serializer.errors["raffle_image"]
+
+        errors(upload(b"no es una imagen"))
+        buffer = BytesIO()
+        Image.new("RGB", (10, 10)).save(buffer, "BMP")
+        self.assertIn("Formato no permitido", str(errors(upload(buffer.getvalue()))))
+        with override_settings(RAFFLE_IMAGE_MAX_PIXELS=1000):
+            self.assertIn("píxeles", str(errors(upload(make_image()))))
+        with override_settings(RAFFLE_IMAGE_MAX_UPLOAD_SIZE=100):
+            self.assertIn("no puede superar", str(errors(upload(make_image()))))
+
+    def test_unreadable_image_keeps_original(self):
+        """Si el original no se puede decodificar se sigue sirviendo tal cual"""
+        raffle = self.create_raffle(upload(make_image()[:200]))
+
+        run_pending()
+        raffle.refresh_from_db()
+
+        self.assertEqual(raffle.raffle_image_variants, {})
+        self.assertEqual(Job.objects.get(name=PROCESS_IMAGE).status, Job.DONE)
+
+    def test_backfill_command(self):
+        """process_raffle_images genera las variantes que faltan"""
+        raffle = self.create_raffle(upload(make_image()))
+        Job.objects.all().delete()
+
+        out = StringIO()
+        call_command("process_raffle_images", "--now", stdout=out)
+        raffle.refresh_from_db()
+
+        self.assertIn("1 imágenes", out.getvalue())
+        self.assertIn("card", raffle.raffle_image_variants)
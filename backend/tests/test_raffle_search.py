@@ -0,0 +1,210 @@
+from datetime import date, timedelta
+from decimal import Decimal
+from unittest import mock
+
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from core.pagination import CappedPageNumberPagination
+from location.models import City, Country, State
+from raffle.models import Raffle
+from raffleInfo.models import PrizeType, StateRaffle
+from tickets.models import Ticket
+from user.models import User
+from userInfo.models import DocumentType, Gender, PaymentMethod, PaymentMethodType
+
+
+class RaffleSearchTestCase(APITestCase):
+    """Tests para GET /raffle/search/"""
+
+    @classmethod
+    def setUpTestData(cls):
+        country = Country.objects.create(country_name="Colombia", country_code="CO")
+        state = State.objects.create(
+            state_name="Valle", state_code="VAL", state_country=country
+        )
+        city = City.objects.create(city_name="Cali", city_code="CAL", city_state=state)
+        gender = Gender.objects.create(gender_name="Masculino", gender_code="M")
+        document_type = DocumentType.objects.create(
+            document_type_name="Cédula", document_type_code="CC"
+        )
+        payment_type = PaymentMethodType.objects.create(
+            payment_method_type_name="Tarjeta", payment_method_type_code="TC"
+        )
+        cls.money = PrizeType.objects.create(
+            prize_type_name="Dinero", prize_type_code="DIN"
+        )
+        cls.object = PrizeType.objects.create(
+            prize_type_name="Objeto", prize_type_code="OBJ"
+        )
+        active = StateRaffle.objects.create(
+            state_raffle_name="Activa", state_raffle_code="ACT"
+        )
+        cancelled = StateRaffle.objects.create(
+            state_raffle_name="Cancelada", state_raffle_code="CAN"
+        )
+
+        organizers = []
+        for i, rating in enumerate((4.8, 2.5)):
+            organizers.append(
+                User.objects.create(
+                    email=f"organizador{i}@test.com",
+                    first_name="Organizador",
+                    last_name=str(i),
+                    gender=gender,
+                    document_type=document_type,
+                    document_number=f"1000{i}",
+                    city=city,
+                    rating=rating,
+                )
+            )
+        cls.payment_methods = [
+            PaymentMethod.objects.create(
+                user=user,
+                payment_method_type=payment_type,
+                paymenth_method_holder_name="Titular",
+                paymenth_method_card_number_hash="hash",
+                paymenth_method_expiration_date=date(2030, 12, 31),
+                last_digits="1234",
+                payment_method_balance=Decimal("100000.00"),
+            )
+            for user in organizers
+        ]
+
+        now = timezone.now()
+
+        def create(name, description, price, days, prize, organizer, state=active):
+            return Raffle.objects.create(
+                raffle_name=name,
+                raffle_description=description,
+                raffle_start_date=now - timedelta(days=1),
+                raffle_draw_date=now + timedelta(days=days),
+                raffle_minimum_numbers_sold=4,
+                raffle_number_amount=100,
+                raffle_number_price=Decimal(price),
+                raffle_prize_amount=Decimal("100000"),
+                raffle_prize_type=prize,
+                raffle_state=state,
+                raffle_created_by=organizers[organizer],
+                raffle_creator_payment_method=cls.payment_methods[organizer],
+            )
+
+        cls.moto = create("Moto Yamaha 2025", "Moto nueva", "5000", 10, cls.object, 0)
+        cls.tv = create("Televisor", "Pantalla de 55", "2000", 3, cls.object, 1)
+        create("Premio en efectivo", "Un millón", "10000", 20, cls.money, 0)
+        create("Canasta navideña", "Trae una moto de juguete", "1000", 5, cls.object, 1)
+        create("Moto cancelada", "No aparece", "5000", 10, cls.object, 0, cancelled)
+
+        # Televisor: 4 de 4 (100%); Moto: 2 de 4 (50%)
+        buyer_pm = cls.payment_methods[1]
+        for raffle, sold in ((cls.tv, 4), (cls.moto, 2)):
+            Ticket.objects.bulk_create(
+                Ticket(
+                    raffle=raffle,
+                    number=number,
+                    user=buyer_pm.user,
+                    payment_method=buyer_pm,
+                )
+                for number in range(1, sold + 1)
+            )
+
+    def search(self, **params):
+        response = self.client.get(reverse("raffle-search"), params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        return response
+
+    def names(self, **params):
+        return [
+            raffle["raffle_name"] for raffle in self.search(**params).data["results"]
+        ]
+
+    def test_text_search_ranked(self):
+        """Busca en nombre y descripción, primero las que empiezan con el término"""
+        names = self.names(search="MOTO")
+
+        self.assertEqual(names, ["Moto Yamaha 2025", "Canasta navideña"])
+
+    def test_only_active_raffles(self):
+        """Las rifas canceladas no aparecen"""
+        self.assertNotIn("Moto cancelada", self.names())
+        self.assertEqual(self.search().data["count"], 4)
+
+    def test_prize_type_and_price_range(self):
+        """Filtra por tipo de premio y rango de precio"""
+        self.assertEqual(self.names(prize_type=self.money.id), ["Premio en efectivo"])
+        self.assertEqual(
+            self.names(min_price="1500", max_price="5000", ordering="price"),
+            ["Televisor", "Moto Yamaha 2025"],
+        )
+
+    def test_draw_date_window(self):
+        """Filtra por ventana de fecha de sorteo y ordena por fecha"""
+        now = timezone.now()
+        names = self.names(
+            draw_from=(now + timedelta(days=4)).isoformat(),
+            draw_to=(now + timedelta(days=15)).isoformat(),
+            ordering="draw_date",
+        )
+
+        self.assertEqual(names, ["Canasta navideña", "Moto Yamaha 2025"])
+
+    def test_progress_and_organizer_rating(self):
+        """Filtra por avance hacia el mínimo y calificación del organizador"""
+        self.assertEqual(self.names(min_progress=100), ["Televisor"])
+        self.assertEqual(
+            sorted(self.names(min_progress=50)), ["Moto Yamaha 2025", "Televisor"]
+        )
+        self.assertEqual(
+            self.names(min_rating=4, min_progress=50), ["Moto Yamaha 2025"]
+        )
+
+    def test_pagination(self):
+        """Resultados paginados con conteo acotado"""
+        response = self.search(page_size=3, ordering="price")
+
+        self.assertEqual(response.data["count"], 4)
+        self.assertFalse(response.data["count_capped"])
+        self.assertEqual(len(response.data["results"]), 3)
+        self.assertIsNotNone(response.data["next"])
+
+        with mock.patch.object(CappedPageNumberPagination, "max_count", 2):
+            response = self.search(page_size=1)
+            self.assertEqual(response.data["count"], 2)
+            self.assertTrue(response.data["count_capped"])
+
+            # Las páginas después del límite siguen disponibles
+            response = self.search(page_size=1, page=3)
+            self.assertEqual(len(response.data["results"]), 1)
+            self.assertEqual(response.data["count"], 4)
+            self.assertIsNotNone(response.data["next"])
+
+            response = self.search(page_size=1, page=4)
+            self.assertIsNone(response.data["next"])
+            self.assertFalse(response.data["count_capped"])
+            response = self.client.get(
+                reverse("raffle-search"), {"page_size": 1, "page": 5}
+            )
+            self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_invalid_params(self):
+        """Parámetros inválidos responden 400 con el campo del error"""
+        url = reverse("raffle-search")
+
+        response = self.client.get(url, {"min_price": "9000", "max_price": "100"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("min_price", response.data)
+
+        response = self.client.get(url, {"ordering": "raffle_name"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("ordering", response.data)
+
+    def test_search_text_follows_updates(self):
+        """Al renombrar la rifa cambia lo que se encuentra"""
+        raffle = self.tv
+        raffle.raffle_name = "Consola de videojuegos"
+        raffle.save(update_fields=["raffle_name"])
+
+        self.assertEqual(self.names(search="consola"), ["Consola de videojuegos"])
+        self.assertEqual(self.names(search="televisor"), [])
@@ -194,6 +194,7 @@ class RefundFunctionalityTestCase(TestCase):
         raffle.raffle_draw_date = past_draw_date
         raffle._allow_past_date = True
         raffle.save()
+        call_command("run_worker", "--once", stdout=StringIO())
 
         raffle.refresh_from_db()
         self.assertEqual(raffle.raffle_state, self.cancelled_state)
@@ -250,6 +251,7 @@ class RefundFunctionalityTestCase(TestCase):
         raffle.raffle_draw_date = past_draw_date
         raffle._allow_past_date = True
         raffle.save()
+        call_command("run_worker", "--once", stdout=StringIO())
 
         # Verificar estado y reembolsos tras el signal
         raffle.refresh_from_db()
@@ -305,6 +307,7 @@ class RefundFunctionalityTestCase(TestCase):
         raffle.raffle_draw_date = past_draw_date
         raffle._allow_past_date = True
         raffle.save()
+        call_command("run_worker", "--once", stdout=StringIO())
 
         # Verificar estado y reembolsos tras el signal
         raffle.refresh_from_db()
@@ -346,6 +349,7 @@ class RefundFunctionalityTestCase(TestCase):
         raffle.raffle_draw_date = past_draw_date
         raffle._allow_past_date = True
         raffle.save()
+        call_command("run_worker", "--once", stdout=StringIO())
 
         # Guardar balances iniciales
         initial_balance_1 = self.payment_method.payment_method_balance
@@ -0,0 +1,137 @@
+from unittest import mock
+
+from django.db import IntegrityError, connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.exceptions import ValidationError
+from rest_framework.test import APITestCase
+
+from location.models import City, Country, State
+from user.models import User
+from user.serializer import RegisterUserSerializer
+from userInfo.models import DocumentType, Gender
+
+
+class RegisterQueriesTestCase(APITestCase):
+    """Tests para las consultas del registro de usuarios"""
+
+    @classmethod
+    def setUpTestData(cls):
+        country = Country.objects.create(country_name="Colombia", country_code="CO")
+        state = State.objects.create(
+            state_name="Valle", state_code="VAL", state_country=country
+        )
+        cls.city = City.objects.create(
+            city_name="Cali", city_code="CAL", city_state=state
+        )
+        cls.gender = Gender.objects.create(gender_name="Masculino", gender_code="M")
+        cls.document_type = DocumentType.objects.create(
+            document_type_name="Cédula", document_type_code="CC"
+        )
+        cls.existing = User.objects.create_user(
+            email="existente@test.com",
+            password="ClaveSegura123",
+            first_name="Existente",
+            last_name="Test",
+            gender=cls.gender,
+            document_type=cls.document_type,
+            document_number="12345678",
+            city=cls.city,
+        )
+
+    def payload(self, **overrides):
+        data = {
+            "email": "nuevo@test.com",
+            "password": "ClaveSegura123",
+            "confirm_password": "ClaveSegura123",
+            "first_name": "Nuevo",
+            "last_name": "Usuario",
+            "gender": self.gender.id,
+            "document_type": self.document_type.id,
+            "document_number": "87654321",
+            "city": self.city.id,
+        }
+        data.update(overrides)
+        return data
+
+    def register(self, **overrides):
+        return self.client.post(
+            reverse("user_register"), self.payload(**overrides), format="json"
+        )
+
+    def test_single_probe_and_insert(self):
+        """El registro hace una consulta de unicidad y un solo INSERT"""
+        with CaptureQueriesContext(connection) as queries:
+            response = self.register()
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        sql = [q["sql"] for q in queries.captured_queries]
+        user_table = User._meta.db_table
+        probes = [
+            s for s in sql if s.startswith("SELECT") and f'FROM "{user_table}"' in s
+        ]
+        self.assertEqual(len(probes), 1)
+        self.assertEqual(sum(s.startswith("INSERT") for s in sql), 1)
+        self.assertFalse(any(s.startswith("UPDATE") for s in sql))
+        self.assertTrue(
+            User.objects.get(email="nuevo@test.com").check_password("ClaveSegura123")
+        )
+
+    def test_duplicate_email_and_document(self):
+        """Email y documento en uso se informan a la vez, cada uno en su campo"""
+        response = self.register(email="existente@test.com", document_number="12345678")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            response.data["email"], ["El correo electrónico ya está en uso."]
+        )
+        self.assertEqual(
+            response.data["document_number"], ["El número de documento ya está en uso."]
+        )
+
+    def test_duplicate_reported_before_password_mismatch(self):
+        """Un dato en uso se informa antes que las contraseñas distintas"""
+        response = self.register(
+            document_number="12345678", confirm_password="OtraClave123"
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("document_number", response.data)
+        self.assertNotIn("non_field_errors", response.data)
+
+    def test_inactive_account_conflicts(self):
+        """Los datos de una cuenta desactivada tampoco se pueden reutilizar"""
+        User.objects.filter(pk=self.existing.pk).update(is_active=False)
+
+        response = self.register(email="existente@test.com")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("email", response.data)
+        self.assertEqual(User.objects.count(), 1)
+
+    def test_race_on_insert_returns_field_error(self):
+        """Si otro registro gana la carrera, se responde 400 y no 500"""
+        serializer = RegisterUserSerializer(data=self.payload())
+        self.assertTrue(serializer.is_valid())
+        # Simula el registro concurrente con el mismo email
+        User.objects.filter(pk=self.existing.pk).update(email="nuevo@test.com")
+
+        with self.assertRaises(ValidationError) as context:
+            serializer.save()
+
+        self.assertEqual(
+            context.exception.detail["email"],
+            ["El correo electrónico ya está en uso."],
+        )
+
+    def test_unexpected_integrity_error_propagates(self):
+        """Un IntegrityError sin conflicto de email/documento no se oculta"""
+        serializer = RegisterUserSerializer(data=self.payload())
+        self.assertTrue(serializer.is_valid())
+
+        with mock.patch.object(
+            User.objects, "create", side_effect=IntegrityError("otra restricción")
+        ):
+            with self.assertRaises(IntegrityError):
+                serializer.save()
@@ -0,0 +1,97 @@
+import uuid
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from io import BytesIO
+from unittest import mock
+from zoneinfo import ZoneInfo
+
+from django.test import SimpleTestCase
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from core import parsers, renderers
+from core.parsers import FastJSONParser
+from core.renderers import FastJSONRenderer
+
+
+class FastJSONRendererTestCase(SimpleTestCase):
+    """La salida debe ser idéntica a la del JSONRenderer de DRF"""
+
+    def assertSameOutput(self, data, **kwargs):
+        self.assertEqual(
+            FastJSONRenderer().render(data, **kwargs),
+            JSONRenderer().render(data, **kwargs),
+        )
+
+    def test_decimal_and_dates(self):
+        """Decimal, datetime (UTC y con zona), date, time y timedelta"""
+        self.assertSameOutput(
+            {
+                "price": Decimal("5000.00"),
+                "balance": Decimal("1234567.89"),
+                "utc": datetime(2025, 1, 2, 3, 4, 5, 678901, tzinfo=timezone.utc),
+                "bogota": datetime(
+                    2025, 1, 2, 3, 4, 5, tzinfo=ZoneInfo("America/Bogota")
+                ),
+                "naive": datetime(2025, 1, 2, 3, 4, 5),
+                "day": date(2025, 1, 2),
+                "time": datetime(2025, 1, 2, 3, 4, 5).time(),
+                "delta": timedelta(hours=1, seconds=30),
+            }
+        )
+
+    def test_misc_types(self):
+        """UUID, cadenas perezosas, unicode, claves numéricas y separadores JS"""
+        self.assertSameOutput(
+            {
+                "uuid": uuid.UUID("12345678-1234-5678-1234-567812345678"),
+                "lazy": gettext_lazy("This field is required."),
+                "name": "Rifa de Medellín ñ",
+                "separators": "a\u2028b\u2029c",
+                1: [True, None, 3.75, 10],
+            }
+        )
+
+    def test_big_integer_falls_back(self):
+        """Los enteros de más de 64 bits usan el renderer de DRF"""
+        self.assertSameOutput({"big": 2**70})
+
+    def test_indent_uses_drf_renderer(self):
+        """Las respuestas indentadas se delegan a DRF"""
+        self.assertSameOutput({"a": [1, 2]}, renderer_context={"indent": 4})
+
+    def test_none_renders_empty(self):
+        self.assertEqual(FastJSONRenderer().render(None), b"")
+
+    def test_without_orjson(self):
+        """Sin orjson funciona igual usando el renderer de DRF"""
+        with mock.patch.object(renderers, "orjson", None):
+            self.assertSameOutput({"price": Decimal("1.50")})
+
+
+class FastJSONParserTestCase(SimpleTestCase):
+    """El parser debe aceptar y rechazar lo mismo que JSONParser"""
+
+    def parse(self, parser, body):
+        return parser.parse(BytesIO(body), parser_context={"encoding": "utf-8"})
+
+    def test_parses_like_drf(self):
+        body = '{"name": "Medellín", "numbers": [1, 2], "big": 1180591620717411303424}'.encode()
+        self.assertEqual(
+            self.parse(FastJSONParser(), body), self.parse(JSONParser(), body)
+        )
+
+    def test_same_error_messages(self):
+        """Los errores de sintaxis y las constantes no estrictas dan el mismo mensaje"""
+        for body in (b'{"a": 1,}', b'{"a": NaN}', b"\xff"):
+            with self.assertRaises(ParseError) as expected:
+                self.parse(JSONParser(), body)
+            with self.assertRaises(ParseError) as actual:
+                self.parse(FastJSONParser(), body)
+            self.assertEqual(str(actual.exception), str(expected.exception))
+
+    def test_without_orjson(self):
+        with mock.patch.object(parsers, "orjson", None):
+            self.assertEqual(self.parse(FastJSONParser(), b'{"a": 1}'), {"a": 1})
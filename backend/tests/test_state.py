@@ -87,3 +87,28 @@ class StateViewSetTestCase(BaseApiTest):
 
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertIn("non_field_errors", response.data) 
+
+    def test_filter_by_country(self):
+        """Filtrar estados por país"""
+        State.objects.create(
+            state_name="Zulia", state_code="ZU", state_country=self.other_country
+        )
+
+        response = self.client.get(self.list_url, {"country": self.test_country.id})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([s["id"] for s in response.data], [self.test_object.id])
+
+    def test_filter_by_invalid_country_format(self):
+        """Un ID de país no numérico retorna 400"""
+        response = self.client.get(self.list_url, {"country": "abc"})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data["country"], "Invalid country ID format")
+
+    def test_filter_by_nonexistent_country(self):
+        """Un país inexistente retorna 400"""
+        response = self.client.get(self.list_url, {"country": 99999})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data["country"], "Country not found")
@@ -0,0 +1,126 @@
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIRequestFactory, APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from core.authentication import StatelessJWTAuthentication
+from location.models import City, Country, State
+from user.models import User
+from user.serializer import CustomTokenObtainPairSerializer
+from user.views import UserProfileViewSet
+from userInfo.models import DocumentType, Gender
+
+LOCMEM_CACHE = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+class StatelessJWTAuthenticationTestCase(APITestCase):
+    """Tests para la autenticación JWT con los claims del token"""
+
+    @classmethod
+    def setUpTestData(cls):
+        country = Country.objects.create(country_name="Colombia", country_code="CO")
+        state = State.objects.create(
+            state_name="Valle", state_code="VAL", state_country=country
+        )
+        city = City.objects.create(city_name="Cali", city_code="CAL", city_state=state)
+        cls.user = User.objects.create_user(
+            email="token@test.com",
+            password="testpass123",
+            first_name="Token",
+            last_name="Usuario",
+            gender=Gender.objects.create(gender_name="Masculino", gender_code="M"),
+            document_type=DocumentType.objects.create(
+                document_type_name="Cédula", document_type_code="CC"
+            ),
+            document_number="12345678",
+            city=city,
+            is_admin=True,
+        )
+
+    def setUp(self):
+        cache.clear()
+        self.factory = APIRequestFactory()
+        self.auth = StatelessJWTAuthentication()
+        self.token = str(
+            CustomTokenObtainPairSerializer.get_token(self.user).access_token
+        )
+
+    def authenticate(self, method="get", token=None):
+        request = getattr(self.factory, method)(
+            "/", HTTP_AUTHORIZATION=f"Bearer {token or self.token}"
+        )
+        return self.auth.authenticate(request)[0]
+
+    def test_read_request_uses_token_claims_and_cache(self):
+        """En GET el usuario sale del token y de la caché, sin consultar la base"""
+        self.authenticate()  # Llena la caché
+
+        with CaptureQueriesContext(connection) as queries:
+            user = self.authenticate()
+
+        self.assertEqual(len(queries), 0)
+        self.assertEqual(user.pk, self.user.pk)
+        self.assertEqual(user.email, "token@test.com")
+        self.assertTrue(user.is_admin)
+        self.assertTrue(user.is_authenticated)
+
+    def test_deferred_fields_load_in_one_query(self):
+        """Los campos fuera del token se cargan juntos al usar el primero"""
+        user = self.authenticate()
+
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(user.last_name, "Usuario")
+            self.assertEqual(user.document_number, "12345678")
+            self.assertEqual(user.city_id, self.user.city_id)
+
+        self.assertEqual(len(queries), 1)
+
+    def test_mutations_load_user_from_database(self):
+        """POST usa JWTAuthentication y carga la fila completa"""
+        user = self.authenticate("post")
+
+        self.assertEqual(user.get_deferred_fields(), set())
+        self.assertEqual(user.last_name, "Usuario")
+
+    def test_token_without_claims_falls_back_to_database(self):
+        """Un token sin email/first_name se resuelve con la base"""
+        token = str(RefreshToken.for_user(self.user).access_token)
+
+        user = self.authenticate(token=token)
+
+        self.assertEqual(user.get_deferred_fields(), set())
+
+    def test_deactivation_invalidates_cache(self):
+        """Desactivar al usuario revoca el acceso aunque el token siga vigente"""
+        self.authenticate()
+        self.user.is_active = False
+        self.user.save()
+
+        with self.assertRaisesMessage(Exception, "inactivo"):
+            self.authenticate()
+
+    def test_permissions_come_from_cache_not_token(self):
+        """is_admin se toma del estado cacheado de la base, no del claim"""
+        User.objects.filter(pk=self.user.pk).update(is_admin=False)
+
+        self.assertFalse(self.authenticate().is_admin)
+
+    def test_profile_view_with_stateless_auth(self):
+        """GET /me/ responde el perfil completo con el usuario del token"""
+        with patch.object(
+            UserProfileViewSet, "authentication_classes", [StatelessJWTAuthentication]
+        ):
+            response = self.client.get(
+                reverse("user_profile"), HTTP_AUTHORIZATION=f"Bearer {self.token}"
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["last_name"], "Usuario")
+        self.assertEqual(response.data["document_number"], "12345678")
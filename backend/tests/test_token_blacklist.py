@@ -0,0 +1,117 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from location.models import City, Country, State
+from user.models import BlacklistedToken, User
+from user.serializer import CustomTokenObtainPairSerializer
+from user.token_blacklist import BloomFilter, blacklist
+from userInfo.models import DocumentType, Gender
+
+
+class BloomFilterTestCase(TestCase):
+    """Tests para el filtro de Bloom de jti revocados"""
+
+    def test_no_false_negatives_and_low_false_positives(self):
+        """Todo lo agregado está; la tasa de falsos positivos es cercana a la pedida"""
+        bloom = BloomFilter(capacity=5000, error_rate=0.01)
+        added = [f"jti-{i}" for i in range(5000)]
+        for value in added:
+            bloom.add(value)
+
+        self.assertTrue(all(value in bloom for value in added))
+        false_positives = sum(f"otro-{i}" in bloom for i in range(10000))
+        self.assertLess(false_positives, 300)
+
+
+class TokenRefreshBlacklistTestCase(APITestCase):
+    """Tests para la rotación y revocación de refresh tokens"""
+
+    @classmethod
+    def setUpTestData(cls):
+        country = Country.objects.create(country_name="Colombia", country_code="CO")
+        state = State.objects.create(
+            state_name="Valle", state_code="VAL", state_country=country
+        )
+        city = City.objects.create(city_name="Cali", city_code="CAL", city_state=state)
+        cls.user = User.objects.create_user(
+            email="refresh@test.com",
+            password="testpass123",
+            first_name="Refresh",
+            last_name="Test",
+            gender=Gender.objects.create(gender_name="Masculino", gender_code="M"),
+            document_type=DocumentType.objects.create(
+                document_type_name="Cédula", document_type_code="CC"
+            ),
+            document_number="12345678",
+            city=city,
+        )
+
+    def setUp(self):
+        blacklist.reset()
+        self.refresh_token = str(CustomTokenObtainPairSerializer.get_token(self.user))
+
+    def refresh(self, token):
+        return self.client.post(reverse("token_refresh"), {"refresh": token})
+
+    def test_refresh_rotates_and_revokes_old_token(self):
+        """El refresh devuelve un token nuevo y el usado queda revocado"""
+        response = self.refresh(self.refresh_token)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn("access", response.data)
+        self.assertNotEqual(response.data["refresh"], self.refresh_token)
+        self.assertEqual(BlacklistedToken.objects.count(), 1)
+
+        reused = self.refresh(self.refresh_token)
+        self.assertEqual(reused.status_code, status.HTTP_401_UNAUTHORIZED)
+
+        rotated = self.refresh(response.data["refresh"])
+        self.assertEqual(rotated.status_code, status.HTTP_200_OK)
+
+    def test_token_revoked_by_other_process_is_rejected(self):
+        """Aunque el filtro local no conozca el jti, la inserción lo rechaza"""
+        self.refresh(self.refresh_token)
+        blacklist.rebuild()
+        blacklist.bloom = BloomFilter(10, 0.01)  # Filtro vacío: sin información
+
+        response = self.refresh(self.refresh_token)
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_inactive_user_cannot_refresh(self):
+        """Un usuario desactivado no obtiene tokens nuevos"""
+        self.user.is_active = False
+        self.user.save()
+
+        response = self.refresh(self.refresh_token)
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertFalse(BlacklistedToken.objects.exists())
+
+    def test_flush_expired_tokens(self):
+        """El comando borra solo los tokens revocados ya vencidos"""
+        now = timezone.now()
+        BlacklistedToken.objects.bulk_create(
+            [
+                BlacklistedToken(
+                    jti=f"vencido-{i}", expires_at=now - timedelta(hours=1)
+                )
+                for i in range(5)
+            ]
+            + [BlacklistedToken(jti="vigente", expires_at=now + timedelta(days=1))]
+        )
+        out = StringIO()
+
+        call_command("flush_expired_tokens", "--batch-size", "2", stdout=out)
+
+        self.assertIn("5", out.getvalue())
+        self.assertEqual(
+            list(BlacklistedToken.objects.values_list("jti", flat=True)), ["vigente"]
+        )
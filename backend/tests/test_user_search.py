@@ -0,0 +1,135 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import connection
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from core.search import normalize
+from location.models import City, Country, State
+from user.models import User, user_search_index
+from userInfo.models import DocumentType, Gender
+
+
+class UserSearchTestCase(APITestCase):
+    """Tests para la búsqueda de usuarios sobre search_text"""
+
+    @classmethod
+    def setUpTestData(cls):
+        country = Country.objects.create(country_name="Colombia", country_code="CO")
+        state = State.objects.create(
+            state_name="Valle", state_code="VAL", state_country=country
+        )
+        city = City.objects.create(city_name="Cali", city_code="CAL", city_state=state)
+        gender = Gender.objects.create(gender_name="Masculino", gender_code="M")
+        document_type = DocumentType.objects.create(
+            document_type_name="Cédula", document_type_code="CC"
+        )
+        people = [
+            ("José", "Pérez", "jose.perez@correo.com", "1001"),
+            ("María", "Pérez Gómez", "maria@empresa.co", "1002"),
+            ("Josefina", "Ortiz", "jortiz@correo.com", "1003"),
+            ("Admin", "Sistema", "admin@rifas.co", "1004"),
+        ]
+        # bulk_create también calcula search_text (CustomUserManager.bulk_create)
+        User.objects.bulk_create(
+            User(
+                first_name=first_name,
+                last_name=last_name,
+                email=email,
+                document_number=document,
+                password="!",
+                city=city,
+                gender=gender,
+                document_type=document_type,
+                is_admin=first_name == "Admin",
+            )
+            for first_name, last_name, email, document in people
+        )
+        cls.jose = User.objects.get(document_number="1001")
+        cls.admin = User.objects.get(document_number="1004")
+
+    def search(self, query, url_name="user_basic_list"):
+        response = self.client.get(reverse(url_name), {"search": query})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [user["email"] for user in response.data]
+
+    def test_normalize(self):
+        """El texto se compara sin tildes, mayúsculas ni espacios repetidos"""
+        self.assertEqual(normalize("  JOSÉ   Pérez Ñandú "), "jose perez nandu")
+        self.assertEqual(self.jose.search_text, "jose perez jose.perez@correo.com")
+
+    def test_sqlite_uses_fts(self):
+        """En SQLite la búsqueda usa la tabla FTS5 creada en post_migrate"""
+        self.assertEqual(user_search_index.backend(connection.alias), "fts")
+
+    def test_accent_insensitive(self):
+        """Buscar sin tildes encuentra nombres con tildes y viceversa"""
+        self.assertEqual(
+            sorted(self.search("perez")),
+            ["jose.perez@correo.com", "maria@empresa.co"],
+        )
+        self.assertEqual(self.search("MARÍA"), ["maria@empresa.co"])
+
+    def test_all_terms_required(self):
+        """Todos los términos deben aparecer, en cualquier campo"""
+        self.assertEqual(self.search("pérez gomez"), ["maria@empresa.co"])
+        self.assertEqual(self.search("josé pérez"), ["jose.perez@correo.com"])
+        self.assertEqual(self.search("perez noexiste"), [])
+
+    def test_short_terms(self):
+        """Los términos de menos de 3 letras también filtran"""
+        self.assertEqual(
+            sorted(self.search("jo")),
+            sorted(["jose.perez@correo.com", "jortiz@correo.com"]),
+        )
+        self.assertEqual(self.search("jo pe"), ["jose.perez@correo.com"])
+
+    def test_ranked_by_relevance(self):
+        """Las coincidencias más cercanas aparecen primero"""
+        results = self.search("jose perez")
+        self.assertEqual(results[0], "jose.perez@correo.com")
+
+    def test_search_follows_updates(self):
+        """Al editar el nombre se actualiza el índice"""
+        self.jose.first_name = "Joaquín"
+        self.jose.save(update_fields=["first_name"])
+
+        self.assertEqual(self.search("joaquin"), ["jose.perez@correo.com"])
+        self.assertNotIn("jose.perez@correo.com", self.search("josefina"))
+
+    def test_admin_search_by_id_and_document(self):
+        """El admin busca por id exacto o por número de documento"""
+        self.client.force_authenticate(self.admin)
+
+        self.assertIn(
+            self.jose.email, self.search(str(self.jose.pk), url_name="admin_list")
+        )
+        self.assertEqual(
+            self.search("1003", url_name="admin_list"), ["jortiz@correo.com"]
+        )
+
+    def test_non_ascii_and_huge_numbers(self):
+        """Dígitos Unicode o números enormes no rompen la búsqueda por id"""
+        for query in ("፩", "𐩀", "٣", "9" * 30):
+            response = self.client.get(reverse("user_basic_list"), {"search": query})
+            self.assertEqual(response.status_code, 200, query)
+
+    def test_public_search_ignores_document(self):
+        """La lista pública no encuentra usuarios por número de documento"""
+        self.assertEqual(self.search("1003"), [])
+
+    def test_rebuild_command(self):
+        """rebuild_search_index llena search_text en filas existentes"""
+        User.objects.filter(pk=self.jose.pk).update(search_text="")
+        self.assertEqual(self.search("perez"), ["maria@empresa.co"])
+
+        out = StringIO()
+        call_command("rebuild_search_index", "user.User", stdout=out)
+
+        self.assertIn("1 filas actualizadas", out.getvalue())
+        self.assertEqual(
+            sorted(self.search("perez")),
+            ["jose.perez@correo.com", "maria@empresa.co"],
+        )
@@ -6,6 +6,7 @@ from django.core.validators import MinValueValidator
 from django.db import models
 from django.utils import timezone
 
+from raffle.events import publish_numbers
 from user.models import User
 from userInfo.models import PaymentMethod
 
@@ -105,6 +106,8 @@ class Ticket(models.Model):
         ticket = cls.objects.create(
             user=user, raffle=raffle, number=number, payment_method=payment_method
         )
+        # Notificar a los clientes conectados al stream de la rifa
+        publish_numbers(raffle.id, "sold", [number])
         return ticket
 
     def refund_ticket(self):
@@ -131,5 +134,6 @@ class Ticket(models.Model):
             raise ValidationError(f"Error en cuenta conjunta admin: {e}")
         # Eliminar ticket de la base de datos
         self.delete()
+        publish_numbers(self.raffle_id, "refunded", [self.number])
 
         return True
@@ -1,10 +1,11 @@
 from django.core.exceptions import ValidationError as DjangoValidationError
 from rest_framework import serializers
 
+from core.serializers import PlainSerializer, format_datetime
 from raffle.models import Raffle
-from user.serializer import UserBasicSerializer
+from user.serializer import UserBasicPlainSerializer, UserBasicSerializer
 from userInfo.models import PaymentMethod
-from userInfo.serializer import PaymentMethodSerializer
+from userInfo.serializer import PaymentMethodPlainSerializer, PaymentMethodSerializer
 
 from .models import Ticket
 
@@ -101,6 +102,40 @@ class TicketListSerializer(
         ]
 
 
+class TicketPlainListSerializer(
+    PlainSerializer
+):  # Misma salida que TicketListSerializer, construida desde .values()
+    values_fields = (
+        "id",
+        "number",
+        "is_winner",
+        "created_at",
+        *UserBasicPlainSerializer.prefixed_fields("user__"),
+        *PaymentMethodPlainSerializer.prefixed_fields("payment_method__"),
+        "raffle_id",
+        "raffle__raffle_name",
+    )
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.user = UserBasicPlainSerializer()
+        self.payment_method = PaymentMethodPlainSerializer()
+
+    def to_representation(self, row):
+        return {
+            "id": row["id"],
+            "number": row["number"],
+            "is_winner": row["is_winner"],
+            "created_at": format_datetime(row["created_at"]),
+            "user": self.user.to_representation(row, "user__"),
+            "payment_method": self.payment_method.to_representation(
+                row, "payment_method__"
+            ),
+            "raffle_id": row["raffle_id"],
+            "raffle_name": row["raffle__raffle_name"],
+        }
+
+
 class TicketRefundSerializer(
     serializers.ModelSerializer
 ):  # Serializer para reembolsar tickets individuales
@@ -2,6 +2,7 @@ from django.urls import path
 
 from .views import (
     RaffleTicketsView,
+    TicketExportView,
     TicketListView,
     TicketPurchaseView,
     TicketRefundView,
@@ -33,4 +34,7 @@ urlpatterns = [
         UserTicketHistoryView.as_view(),
         name="user-ticket-history",
     ),  # GET - Historial de un usuario
+    path(
+        "export/<str:fmt>/", TicketExportView.as_view(), name="ticket-export"
+    ),  # GET - Exportar tickets CSV/JSONL (admin)
 ]
@@ -1,8 +1,10 @@
 from django.shortcuts import get_object_or_404
 from rest_framework import generics, status
+from rest_framework.exceptions import ValidationError
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 
+from core.exports import StreamingExportView
 from permissions.permissions import IsAdminUser
 from raffle.models import Raffle
 
@@ -10,6 +12,7 @@ from .models import Ticket
 from .serializer import (
     TicketCreateSerializer,
     TicketListSerializer,
+    TicketPlainListSerializer,
     TicketRefundSerializer,
 )
 
@@ -55,15 +58,13 @@ class TicketListView(generics.ListAPIView):
     Vista para listar tickets del usuario autenticado
     """
 
-    serializer_class = TicketListSerializer
+    serializer_class = TicketPlainListSerializer
     permission_classes = [IsAuthenticated]
 
     def get_queryset(self):
         """Retorna solo los tickets del usuario autenticado"""
-        return (
-            Ticket.objects.filter(user=self.request.user)
-            .select_related("raffle", "payment_method")
-            .order_by("-created_at")
+        return TicketPlainListSerializer.values_queryset(
+            Ticket.objects.filter(user=self.request.user).order_by("-created_at")
         )
 
 
@@ -72,16 +73,14 @@ class RaffleTicketsView(generics.ListAPIView):
     Vista pública para ver todos los tickets de una rifa específica
     """
 
-    serializer_class = TicketListSerializer
+    serializer_class = TicketPlainListSerializer
     permission_classes = [AllowAny]
 
     def get_queryset(self):
         """Retorna tickets de una rifa específica"""
         raffle_id = self.kwargs.get("raffle_id")
-        return (
-            Ticket.objects.filter(raffle_id=raffle_id)
-            .select_related("user", "payment_method")
-            .order_by("number")
+        return TicketPlainListSerializer.values_queryset(
+            Ticket.objects.filter(raffle_id=raffle_id).order_by("number")
         )
 
 
@@ -251,3 +250,33 @@ class UserTicketHistoryView(generics.ListAPIView):
             },
             status=status.HTTP_200_OK,
         )
+
+
+class TicketExportView(StreamingExportView):
+    """
+    Exportación de tickets para administradores (CSV o JSONL en streaming).
+    Filtros opcionales: ?raffle=<id> y ?user=<id>
+    """
+
+    filename = "tickets"
+    export_fields = (
+        ("id", "id"),
+        ("raffle_id", "raffle_id"),
+        ("raffle_name", "raffle__raffle_name"),
+        ("number", "number"),
+        ("user_id", "user_id"),
+        ("user_email", "user__email"),
+        ("payment_method_id", "payment_method_id"),
+        ("is_winner", "is_winner"),
+        ("created_at", "created_at"),
+    )
+
+    def get_queryset(self):
+        queryset = Ticket.objects.order_by("pk")
+        for param, field in (("raffle", "raffle_id"), ("user", "user_id")):
+            value = self.request.query_params.get(param)
+            if value:
+                if not value.isdigit():
+                    raise ValidationError({param: "Debe ser un ID numérico"})
+                queryset = queryset.filter(**{field: value})
+        return queryset
@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand
+
+from user.token_blacklist import flush_expired
+
+
+class Command(BaseCommand):
+    help = "Borrar de la lista de revocados los refresh tokens ya vencidos"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=10000,
+            help="Filas borradas por consulta (default: 10000)",
+        )
+
+    def handle(self, *args, **options):
+        deleted = flush_expired(batch_size=options["batch_size"])
+        self.stdout.write(
+            self.style.SUCCESS(f"✅ Tokens revocados vencidos eliminados: {deleted}")
+        )
@@ -7,8 +7,19 @@ from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import models
 from django.utils import timezone
 
+from core.search import SearchIndex
+
 # Create your models here.
 
+# Búsqueda de usuarios por nombre, email o id (core/search.py). El documento
+# no va en search_text: la lista pública usa este índice; el admin lo busca
+# por coincidencia exacta (AdminListViewSet.search_match_fields)
+user_search_index = SearchIndex(
+    "user.User",
+    ("first_name", "last_name", "email"),
+    match_pk=True,
+)
+
 
 class CustomUserManager(BaseUserManager):
     def create_user(self, email, password=None, **extra_fields):
@@ -45,6 +56,11 @@ class CustomUserManager(BaseUserManager):
     def get_by_natural_key(self, email):
         return self.get(email=email)
 
+    def bulk_create(self, objs, *args, **kwargs):
+        # bulk_create no llama a save(): search_text se calcula aquí
+        objs = user_search_index.fill(objs)
+        return super().bulk_create(objs, *args, **kwargs)
+
 
 class User(AbstractBaseUser, PermissionsMixin):
     # Información de autenticación
@@ -88,6 +104,10 @@ class User(AbstractBaseUser, PermissionsMixin):
         validators=[MinValueValidator(1), MaxValueValidator(5)],
         help_text="Promedio de calificaciones recibidas",
     )
+    # Nombre y email normalizados para la búsqueda (ver save)
+    search_text = models.TextField(
+        blank=True, default="", editable=False, verbose_name="Texto de búsqueda"
+    )
 
     objects = CustomUserManager()
     # Configuración de autenticación
@@ -103,3 +123,36 @@ class User(AbstractBaseUser, PermissionsMixin):
 
     def get_short_name(self):
         return self.first_name
+
+    def save(self, *args, **kwargs):
+        kwargs["update_fields"] = user_search_index.prepare_save(
+            self, kwargs.get("update_fields")
+        )
+        super().save(*args, **kwargs)
+
+    def refresh_from_db(self, using=None, fields=None, from_queryset=None):
+        # Usuarios armados con los claims del JWT (core.authentication): al
+        # usar el primer campo diferido se cargan todos en una sola consulta
+        if fields is not None and getattr(self, "_from_token", False):
+            fields = set(fields) | self.get_deferred_fields()
+        super().refresh_from_db(using, fields, from_queryset)
+
+
+class BlacklistedToken(models.Model):
+    """
+    Refresh token revocado (ver user/token_blacklist.py). Solo guarda el jti
+    y la expiración; las filas vencidas se borran con flush_expired_tokens.
+    """
+
+    jti = models.CharField(max_length=64, primary_key=True)
+    expires_at = models.DateTimeField(db_index=True, verbose_name="Expira")
+    created_at = models.DateTimeField(
+        auto_now_add=True, db_index=True, verbose_name="Revocado"
+    )
+
+    class Meta:
+        verbose_name = "Token revocado"
+        verbose_name_plural = "Tokens revocados"
+
+    def __str__(self):
+        return self.jti
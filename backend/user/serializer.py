@@ -1,15 +1,33 @@
+from django.contrib.auth.hashers import make_password
+from django.db import IntegrityError, transaction
+from django.db.models import Q
 from rest_framework import serializers
-from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
-
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.serializers import (
+    TokenObtainPairSerializer,
+    TokenRefreshSerializer,
+)
+from rest_framework_simplejwt.settings import api_settings
+
+from core.authentication import get_group_names, get_user_state
+from core.serializers import PlainSerializer
 from location.models import City
 from location.serializer import CitySerializer
 from userInfo.serializer import DocumentTypeSerializer, GenderSerializer
 
 from .models import User
+from .token_blacklist import blacklist, token_expiration
 
 
 # Serializador para el registro de usuarios
 class RegisterUserSerializer(serializers.ModelSerializer):
+    """
+    Registro con una sola consulta de unicidad (email o documento) y un
+    solo INSERT con la contraseña ya hasheada. Los UniqueValidator que
+    ModelSerializer agrega a email y document_number se quitan porque los
+    reemplaza la consulta de validate().
+    """
+
     confirm_password = serializers.CharField(write_only=True, min_length=8)
 
     class Meta:
@@ -29,36 +47,39 @@ class RegisterUserSerializer(serializers.ModelSerializer):
         )
         extra_kwargs = {
             "password": {"write_only": True, "min_length": 8},
+            "email": {"validators": []},
+            "document_number": {"validators": []},
         }
 
     def validate(self, data):
+        # Los datos en uso se informan por campo, antes que las contraseñas
+        conflicts = self.find_conflicts(data.get("email"), data.get("document_number"))
+        if conflicts:
+            raise serializers.ValidationError(conflicts)
+
         # Validar que las contraseñas coincidan
-        password = data.get("password")
-        confirm_password = data.get("confirm_password")
-        if password != confirm_password:
+        if data.get("password") != data.get("confirm_password"):
             raise serializers.ValidationError("Las contraseñas no coinciden.")
 
-        # Verificar si el email pertenece a un usuario inactivo
-        email = data.get("email")
-        if email and User.objects.filter(email=email, is_active=False).exists():
-            raise serializers.ValidationError(
-                "Esta cuenta está desactivada. Por favor, contacta al soporte para reactivar tu cuenta."
-            )
-
-        # Verificar si el documento pertenece a un usuario inactivo
-        document_number = data.get("document_number")
-        if (
-            document_number
-            and User.objects.filter(
-                document_number=document_number, is_active=False
-            ).exists()
-        ):
-            raise serializers.ValidationError(
-                "Este número de documento pertenece a una cuenta desactivada. Por favor, contacta al soporte para reactivar tu cuenta."
-            )
-
         return data
 
+    @staticmethod
+    def find_conflicts(email, document_number):
+        """
+        Errores por campo si el email o el documento ya están registrados,
+        en una sola consulta. Las cuentas desactivadas también cuentan.
+        """
+        rows = User.objects.filter(
+            Q(email=email) | Q(document_number=document_number)
+        ).values_list("email", "document_number")[:2]
+        errors = {}
+        for row_email, row_document in rows:
+            if row_email == email:
+                errors["email"] = ["El correo electrónico ya está en uso."]
+            if row_document == document_number:
+                errors["document_number"] = ["El número de documento ya está en uso."]
+        return errors
+
     def validate_phone_number(self, value):
         if value:
             if len(value) != 10:
@@ -72,32 +93,29 @@ class RegisterUserSerializer(serializers.ModelSerializer):
         return value
 
     def validate_document_number(self, value):
-        # Verificar que sea numérico
+        # Verificar que sea numérico (la unicidad se revisa en validate)
         if not str(value).isdigit():
             raise serializers.ValidationError(
                 "El número de documento debe ser un valor numérico."
             )
-
-        # Verificar que no esté en uso
-        if User.objects.filter(document_number=value).exists():
-            raise serializers.ValidationError("El número de documento ya está en uso.")
-
-        return value
-
-    def validate_email(self, value):
-        if User.objects.filter(email=value).exists():
-            raise serializers.ValidationError("El correo electrónico ya está en uso.")
         return value
 
     def create(self, validated_data):
-        # Eliminar confirm_password de validated_data
         validated_data.pop("confirm_password", None)
-        # Extraer password y crear el usuario
-        password = validated_data.pop("password")
-        user = User.objects.create(**validated_data)
-        user.set_password(password)
-        user.save()
-        return user
+        # Hashear antes de insertar: un solo INSERT, sin UPDATE posterior
+        validated_data["password"] = make_password(validated_data["password"])
+        try:
+            with transaction.atomic():
+                return User.objects.create(**validated_data)
+        except IntegrityError:
+            # Otro registro con el mismo email/documento entró entre la
+            # validación y el INSERT
+            conflicts = self.find_conflicts(
+                validated_data["email"], validated_data["document_number"]
+            )
+            if not conflicts:
+                raise
+            raise serializers.ValidationError(conflicts)
 
     def to_representation(self, instance):
         representation = super().to_representation(instance)
@@ -126,6 +144,28 @@ class UserBasicSerializer(serializers.ModelSerializer):
         )
 
 
+class UserBasicPlainSerializer(PlainSerializer):
+    """UserBasicSerializer sobre filas de .values() (None si la relación es nula)"""
+
+    values_fields = ("id", "email", "first_name", "last_name", "phone_number", "rating")
+
+    def to_representation(self, row, prefix=""):
+        if row[prefix + "id"] is None:
+            return None
+        first_name = row[prefix + "first_name"]
+        last_name = row[prefix + "last_name"]
+        rating = row[prefix + "rating"]
+        return {
+            "id": row[prefix + "id"],
+            "email": row[prefix + "email"],
+            "first_name": first_name,
+            "last_name": last_name,
+            "full_name": f"{first_name} {last_name}".strip(),
+            "phone_number": row[prefix + "phone_number"],
+            "rating": None if rating is None else float(rating),
+        }
+
+
 # Serializador para mostrar información del perfil de usuario
 class UserProfileSerializer(serializers.ModelSerializer):
     full_name = serializers.CharField(source="get_full_name", read_only=True)
@@ -303,6 +343,41 @@ class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
             "last_name": self.user.last_name,
             "is_staff": self.user.is_staff,
             "is_admin": self.user.is_admin,
-            "groups": [group.name for group in self.user.groups.all()],
+            "groups": get_group_names(self.user.pk),
         }
         return data
+
+
+class BlacklistTokenRefreshSerializer(TokenRefreshSerializer):
+    """
+    Refresh con rotación y revocación del token usado (user/token_blacklist.py).
+    El estado del usuario sale de la caché de core.authentication.
+    """
+
+    def validate(self, attrs):
+        refresh = self.token_class(attrs["refresh"])
+        jti = refresh[api_settings.JTI_CLAIM]
+        if blacklist.is_blacklisted(jti):
+            raise InvalidToken("El token fue revocado")
+
+        user_id = refresh.payload.get(api_settings.USER_ID_CLAIM)
+        if user_id:
+            state = get_user_state(User._meta.pk.to_python(user_id))
+            if not state or not state["is_active"]:
+                raise AuthenticationFailed(
+                    self.error_messages["no_active_account"], "no_active_account"
+                )
+
+        data = {"access": str(refresh.access_token)}
+
+        if api_settings.ROTATE_REFRESH_TOKENS:
+            if api_settings.BLACKLIST_AFTER_ROTATION:
+                # La inserción decide si dos peticiones usan el mismo token a la vez
+                if not blacklist.add(jti, token_expiration(refresh)):
+                    raise InvalidToken("El token fue revocado")
+            refresh.set_jti()
+            refresh.set_exp()
+            refresh.set_iat()
+            data["refresh"] = str(refresh)
+
+        return data
@@ -0,0 +1,160 @@
+"""
+Lista de refresh tokens revocados.
+
+Cada refresh token rotado se revoca insertando su jti en BlacklistedToken
+(clave primaria). La inserción es la que decide: si el jti ya estaba, el
+token se usó antes y se rechaza, también cuando dos peticiones lo usan a la
+vez. Solo se guarda hasta la expiración del token; flush_expired_tokens
+borra las filas vencidas, así que la tabla no crece sin límite.
+
+Delante de la base hay un filtro de Bloom en memoria de cada proceso con los
+jti revocados. Si el filtro dice que un jti no está, no hace falta consultar
+antes de insertar; si dice que puede estar, se confirma con la base (puede
+haber falsos positivos, nunca falsos negativos de lo que ya conoce). El
+filtro se actualiza cada TOKEN_BLACKLIST_SYNC_INTERVAL segundos con lo que
+revocaron otros procesos y se reconstruye cada TOKEN_BLACKLIST_REBUILD_INTERVAL
+para descartar los jti purgados. Un filtro desactualizado no compromete la
+seguridad, porque la inserción en la base sigue siendo la verificación final.
+"""
+
+import hashlib
+import math
+import threading
+import time
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+
+from .models import BlacklistedToken
+
+
+class BloomFilter:
+    """Filtro de Bloom sobre un bytearray, con k posiciones derivadas de blake2b"""
+
+    def __init__(self, capacity, error_rate):
+        capacity = max(1, capacity)
+        self.size = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, value):
+        digest = hashlib.blake2b(value.encode(), digest_size=16).digest()
+        # Doble hashing (Kirsch-Mitzenmacher): h1 + i·h2
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hashes))
+
+    def add(self, value):
+        for position in self._positions(value):
+            self.bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, value):
+        return all(
+            self.bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(value)
+        )
+
+
+class TokenBlacklist:
+    """Filtro de Bloom del proceso sincronizado con BlacklistedToken"""
+
+    # Margen al sincronizar por created_at, por transacciones que confirmaron tarde
+    SYNC_OVERLAP = timedelta(seconds=5)
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.bloom = None
+        self.built_at = 0.0
+        self.synced_at = 0.0
+        self.last_seen = None
+
+    def rebuild(self):
+        """Carga todos los jti vigentes en un filtro nuevo"""
+        now = timezone.now()
+        queryset = BlacklistedToken.objects.filter(expires_at__gt=now)
+        count = queryset.count()
+        bloom = BloomFilter(
+            max(settings.TOKEN_BLACKLIST_BLOOM_CAPACITY, count * 2),
+            settings.TOKEN_BLACKLIST_BLOOM_ERROR_RATE,
+        )
+        for jti in queryset.values_list("jti", flat=True).iterator(chunk_size=5000):
+            bloom.add(jti)
+        with self.lock:
+            self.bloom = bloom
+            self.last_seen = now
+            self.built_at = self.synced_at = time.monotonic()
+
+    def sync(self):
+        """Agrega los jti revocados por otros procesos desde la última sincronización"""
+        since = self.last_seen - self.SYNC_OVERLAP
+        rows = BlacklistedToken.objects.filter(created_at__gt=since).values_list(
+            "jti", "created_at"
+        )
+        with self.lock:
+            for jti, created_at in rows:
+                self.bloom.add(jti)
+                self.last_seen = max(self.last_seen, created_at)
+            self.synced_at = time.monotonic()
+
+    def refresh(self):
+        now = time.monotonic()
+        if (
+            self.bloom is None
+            or now - self.built_at >= settings.TOKEN_BLACKLIST_REBUILD_INTERVAL
+        ):
+            self.rebuild()
+        elif now - self.synced_at >= settings.TOKEN_BLACKLIST_SYNC_INTERVAL:
+            self.sync()
+
+    def might_contain(self, jti):
+        self.refresh()
+        return jti in self.bloom
+
+    def is_blacklisted(self, jti):
+        if not self.might_contain(jti):
+            return False
+        return BlacklistedToken.objects.filter(pk=jti).exists()
+
+    def add(self, jti, expires_at):
+        """
+        Revoca el jti. Retorna False si ya estaba revocado (token reutilizado).
+        """
+        try:
+            with transaction.atomic():
+                BlacklistedToken.objects.create(jti=jti, expires_at=expires_at)
+        except IntegrityError:
+            return False
+        finally:
+            if self.bloom is not None:
+                with self.lock:
+                    self.bloom.add(jti)
+        return True
+
+    def reset(self):
+        with self.lock:
+            self.bloom = None
+
+
+blacklist = TokenBlacklist()
+
+
+def token_expiration(token):
+    """Fecha de expiración (claim exp) del token"""
+    return datetime.fromtimestamp(token["exp"], tz=dt_timezone.utc)
+
+
+def flush_expired(batch_size=10000):
+    """Borra por lotes los tokens revocados ya vencidos. Retorna cuántos"""
+    deleted = 0
+    now = timezone.now()
+    while True:
+        pks = list(
+            BlacklistedToken.objects.filter(expires_at__lte=now).values_list(
+                "pk", flat=True
+            )[:batch_size]
+        )
+        if not pks:
+            return deleted
+        deleted += BlacklistedToken.objects.filter(pk__in=pks).delete()[0]
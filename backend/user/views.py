@@ -1,12 +1,13 @@
 from django.shortcuts import render
-from rest_framework import filters, generics, status
+from rest_framework import generics, status
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework_simplejwt.views import TokenObtainPairView
 
+from core.search import SearchIndexFilter
 from permissions.permissions import IsAdminUser, IsNotAdminUser, IsNotAuthenticated
 
-from .models import User
+from .models import User, user_search_index
 from .serializer import (
     AdminUpdateSerializer,
     ChangePasswordSerializer,
@@ -51,13 +52,8 @@ class UserBasicListViewSet(generics.ListAPIView):
     queryset = User.objects.filter(is_active=True)  # Solo usuarios activos
     serializer_class = UserBasicSerializer
     permission_classes = [AllowAny]  # Acceso público
-    filter_backends = [filters.SearchFilter]
-    search_fields = [
-        "first_name",
-        "last_name",
-        "email",
-        "id",
-    ]  # Búsqueda por nombre o email
+    filter_backends = [SearchIndexFilter]
+    search_index = user_search_index  # Búsqueda por nombre, email o id
 
     def get_queryset(self):
         """
@@ -98,8 +94,9 @@ class AdminListViewSet(generics.ListAPIView):
     queryset = User.objects.all()
     serializer_class = AdminUpdateSerializer
     permission_classes = [IsAuthenticated, IsAdminUser]
-    filter_backends = [filters.SearchFilter]
-    search_fields = ["email", "id", "document_number"]
+    filter_backends = [SearchIndexFilter]
+    search_index = user_search_index  # email, id o nombre
+    search_match_fields = ("document_number",)  # documento exacto, solo admin
 
     def get_queryset(self):
         return User.objects.all().order_by("id")
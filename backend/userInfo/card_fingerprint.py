@@ -0,0 +1,56 @@
+"""
+Huella de números de tarjeta con HMAC-SHA256.
+
+El número de tarjeta no se guarda: se guarda `hmac$<versión>$<hex>`, el
+HMAC del número con la clave de esa versión. Calcularlo toma microsegundos,
+frente a los cientos de milisegundos de make_password (PBKDF2), y sin la
+clave no se puede recorrer el espacio de números de tarjeta.
+
+Las claves se configuran en CARD_FINGERPRINT_KEYS ({versión: clave}) y las
+nuevas huellas usan CARD_FINGERPRINT_VERSION. Para rotar la clave se agrega
+una versión nueva y se deja la anterior hasta que las huellas se migren.
+
+Los hashes anteriores (make_password) y las huellas de versiones viejas se
+siguen aceptando; cuando se verifican con el número correcto se reemplazan
+por una huella con la versión vigente (ver PaymentMethod.check_card_number).
+"""
+
+from django.conf import settings
+from django.contrib.auth.hashers import check_password
+from django.utils.crypto import constant_time_compare, salted_hmac
+
+PREFIX = "hmac"
+KEY_SALT = "userInfo.PaymentMethod.card_number"
+
+
+def _digest(raw_card_number, version):
+    try:
+        key = settings.CARD_FINGERPRINT_KEYS[version]
+    except KeyError:
+        raise ValueError(f"No hay clave de huella de tarjeta para la versión {version}")
+    return salted_hmac(
+        KEY_SALT, raw_card_number, secret=key, algorithm="sha256"
+    ).hexdigest()
+
+
+def card_fingerprint(raw_card_number, version=None):
+    """Huella `hmac$<versión>$<hex>` del número con la clave vigente"""
+    version = version or settings.CARD_FINGERPRINT_VERSION
+    return f"{PREFIX}${version}${_digest(raw_card_number, version)}"
+
+
+def check_card_fingerprint(raw_card_number, stored):
+    """
+    Retorna (coincide, requiere_actualizar). requiere_actualizar es True si
+    el valor guardado es un hash anterior o de otra versión de clave.
+    """
+    prefix, _, rest = (stored or "").partition("$")
+    if prefix != PREFIX:
+        # Hash anterior de make_password
+        return check_password(raw_card_number, stored), True
+
+    version, _, digest = rest.partition("$")
+    if version not in settings.CARD_FINGERPRINT_KEYS:
+        return False, False
+    matches = constant_time_compare(_digest(raw_card_number, version), digest)
+    return matches, version != settings.CARD_FINGERPRINT_VERSION
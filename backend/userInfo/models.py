@@ -1,8 +1,9 @@
-from django.contrib.auth.hashers import check_password, make_password
 from django.db import models
 
 from user.models import User
 
+from .card_fingerprint import card_fingerprint, check_card_fingerprint
+
 
 # Create your models here.
 class DocumentType(models.Model):
@@ -84,9 +85,9 @@ class PaymentMethod(models.Model):
 
     def set_card_number(self, raw_card_number):
         """
-        Hashea el número de tarjeta usando el mismo método que las contraseñas
+        Guarda la huella HMAC del número de tarjeta (ver card_fingerprint.py)
         """
-        self.paymenth_method_card_number_hash = make_password(raw_card_number)
+        self.paymenth_method_card_number_hash = card_fingerprint(raw_card_number)
         # Extraer últimos 4 dígitos antes de hashear
         self.last_digits = (
             raw_card_number[-4:] if len(raw_card_number) >= 4 else raw_card_number
@@ -94,9 +95,21 @@ class PaymentMethod(models.Model):
 
     def check_card_number(self, raw_card_number):
         """
-        Verifica si el número de tarjeta coincide con el hasheado
+        Verifica si el número de tarjeta coincide con el hasheado.
+        Si coincide con un hash anterior o una clave vieja, lo reemplaza por
+        la huella vigente.
         """
-        return check_password(raw_card_number, self.paymenth_method_card_number_hash)
+        matches, upgrade = check_card_fingerprint(
+            raw_card_number, self.paymenth_method_card_number_hash
+        )
+        if matches and upgrade:
+            self.paymenth_method_card_number_hash = card_fingerprint(raw_card_number)
+            if self.pk:
+                # Solo esta columna, para no pisar cambios de saldo concurrentes
+                PaymentMethod.objects.filter(pk=self.pk).update(
+                    paymenth_method_card_number_hash=self.paymenth_method_card_number_hash
+                )
+        return matches
 
     def get_masked_card_number(self):
         """
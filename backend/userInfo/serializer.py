@@ -1,6 +1,8 @@
 from django.utils import timezone
 from rest_framework import serializers
 
+from core.serializers import PlainSerializer, format_date, format_datetime
+
 from .models import DocumentType, Gender, PaymentMethod, PaymentMethodType
 
 
@@ -165,3 +167,39 @@ class PaymentMethodSerializer(serializers.ModelSerializer):
 
         instance.save()
         return instance
+
+
+class PaymentMethodPlainSerializer(PlainSerializer):
+    """Lectura de PaymentMethodSerializer sobre filas de .values()"""
+
+    values_fields = (
+        "id",
+        "payment_method_type",
+        "payment_method_type__payment_method_type_name",
+        "paymenth_method_holder_name",
+        "paymenth_method_expiration_date",
+        "last_digits",
+        "payment_method_is_active",
+        "created_at",
+        "updated_at",
+    )
+
+    def to_representation(self, row, prefix=""):
+        if row[prefix + "id"] is None:
+            return None
+        return {
+            "id": row[prefix + "id"],
+            "payment_method_type": row[prefix + "payment_method_type"],
+            "payment_method_type_name": row[
+                prefix + "payment_method_type__payment_method_type_name"
+            ],
+            "paymenth_method_holder_name": row[prefix + "paymenth_method_holder_name"],
+            "masked_card_number": f"**** **** **** {row[prefix + 'last_digits']}",
+            "paymenth_method_expiration_date": format_date(
+                row[prefix + "paymenth_method_expiration_date"]
+            ),
+            "last_digits": row[prefix + "last_digits"],
+            "payment_method_is_active": row[prefix + "payment_method_is_active"],
+            "created_at": format_datetime(row[prefix + "created_at"]),
+            "updated_at": format_datetime(row[prefix + "updated_at"]),
+        }
@@ -1,3 +1,4 @@
+from django.conf import settings
 from django.urls import include, path
 from rest_framework import routers
 
@@ -19,3 +20,11 @@ router.register(r"payment-methods", PaymentMethodViewSet, basename="payment-meth
 urlpatterns = [
     path("", include(router.urls)),
 ]
+
+if settings.ASYNC_VIEWS:
+    from core.async_views import async_catalog_urls
+
+    urlpatterns = (
+        async_catalog_urls(router, ("document-type", "gender", "payment-method-type"))
+        + urlpatterns
+    )
@@ -2,6 +2,17 @@ import { useState, useEffect } from 'react';
 import { useParams, useNavigate } from 'react-router-dom';
 import { useAuth } from '../contexts/AuthContext';
 import { apiClient } from '../services/authService';
+import { API_BASE_URL } from '../config';
+
+// Normaliza la respuesta de /available/ (lista o { numbers: [...] })
+const extractNumbers = data => {
+  if (Array.isArray(data)) return data;
+  if (data && Array.isArray(data.numbers)) return data.numbers;
+  return [];
+};
+
+// Intervalo (ms) para consultar /available/ cuando no hay eventos en vivo
+const AVAILABLE_POLL_INTERVAL = 10000;
 
 function BuyNumbers() {
   // Hooks para obtener parámetros de la URL y navegación
@@ -28,14 +39,7 @@ function BuyNumbers() {
           apiClient.get(`/raffle/${raffleId}/available/`),
         ]);
         setRifa(rifaResponse.data);
-        // Si la respuesta tiene .numbers, usar ese campo
-        if (Array.isArray(availableNumbersResponse.data)) {
-          setAvailableNumbers(availableNumbersResponse.data);
-        } else if (Array.isArray(availableNumbersResponse.data.numbers)) {
-          setAvailableNumbers(availableNumbersResponse.data.numbers);
-        } else {
-          setAvailableNumbers([]);
-        }
+        setAvailableNumbers(extractNumbers(availableNumbersResponse.data));
       } catch (err) {
         console.error('Error cargando datos:', err);
         setError('Error al cargar la información de la rifa');
@@ -50,6 +54,69 @@ function BuyNumbers() {
     }
   }, [raffleId, authLoading]);
 
+  // Números disponibles en vivo: snapshot al conectar y luego deltas vendido/reembolsado.
+  // Si el servidor no ofrece eventos (modo WSGI responde 501) se consulta /available/
+  useEffect(() => {
+    if (!raffleId) return undefined;
+
+    let pollTimer = null;
+    const startPolling = () => {
+      if (pollTimer) return;
+      pollTimer = setInterval(async () => {
+        try {
+          const response = await apiClient.get(`/raffle/${raffleId}/available/`);
+          const numbers = extractNumbers(response.data);
+          const available = new Set(numbers);
+          setAvailableNumbers(numbers);
+          setSelectedNumbers(prev => prev.filter(n => available.has(n)));
+        } catch (err) {
+          console.error('Error actualizando números disponibles:', err);
+        }
+      }, AVAILABLE_POLL_INTERVAL);
+    };
+
+    if (typeof EventSource === 'undefined') {
+      startPolling();
+      return () => clearInterval(pollTimer);
+    }
+
+    const source = new EventSource(`${API_BASE_URL}/raffle/${raffleId}/events/`);
+
+    // Una respuesta distinta de text/event-stream cierra la conexión sin reintentar
+    source.onerror = () => {
+      if (source.readyState === EventSource.CLOSED) startPolling();
+    };
+
+    source.addEventListener('snapshot', event => {
+      const { number_amount: amount, sold } = JSON.parse(event.data);
+      const soldSet = new Set(sold);
+      const numbers = [];
+      for (let n = 1; n <= amount; n += 1) {
+        if (!soldSet.has(n)) numbers.push(n);
+      }
+      setAvailableNumbers(numbers);
+      setSelectedNumbers(prev => prev.filter(n => !soldSet.has(n)));
+    });
+
+    source.addEventListener('sold', event => {
+      const sold = new Set(JSON.parse(event.data).numbers);
+      setAvailableNumbers(prev => prev.filter(n => !sold.has(n)));
+      setSelectedNumbers(prev => prev.filter(n => !sold.has(n)));
+    });
+
+    source.addEventListener('refunded', event => {
+      const { numbers } = JSON.parse(event.data);
+      setAvailableNumbers(prev =>
+        Array.from(new Set([...prev, ...numbers])).sort((a, b) => a - b)
+      );
+    });
+
+    return () => {
+      source.close();
+      clearInterval(pollTimer);
+    };
+  }, [raffleId]);
+
   // Cargar métodos de pago del usuario
   useEffect(() => {
     const fetchPaymentMethods = async () => {
@@ -87,7 +154,7 @@ function BuyNumbers() {
       ]);
 
       setRifa(rifaResponse.data);
-      setAvailableNumbers(availableNumbersResponse.data);
+      setAvailableNumbers(extractNumbers(availableNumbersResponse.data));
     } catch (error) {
       console.error('Error recargando datos:', error);
     }